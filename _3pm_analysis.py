@@ -16,7 +16,7 @@ Outputs: Email + Telegram + X/Twitter
 import os, sys, json, time, logging, re, smtplib, ssl, requests
 from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
@@ -34,6 +34,7 @@ logging.basicConfig(level=logging.INFO,
 logger = logging.getLogger("3PM_Analysis")
 
 from config import MetaConfig
+from analysis.indicators import ema_last, rsi_simple_last
 
 # ═══════════════════════════════════════════════════════
 # DATA LOADING
@@ -74,38 +75,24 @@ def load_all_data():
         data["final_recs"] = {}
 
     # 4. Today's cross-analysis
+    from artifact_store import ArtifactStore
+    store = ArtifactStore(Path("output"))
     today_str = datetime.now(EST).strftime('%Y%m%d')
-    cross_path = Path("output") / f"cross_analysis_{today_str}.json"
-    if cross_path.exists():
-        with open(cross_path) as f:
-            data["cross"] = json.load(f)
+    data["cross"] = store.read("cross_analysis", stamp=today_str)
+    if data["cross"] is not None:
         logger.info(f"  ✅ Cross Analysis: loaded ({today_str})")
     else:
-        cross_latest = Path("output") / "cross_analysis_latest.json"
-        if cross_latest.exists():
-            with open(cross_latest) as f:
-                data["cross"] = json.load(f)
+        data["cross"] = store.read("cross_analysis", default={})
+        if data["cross"]:
             logger.info(f"  ✅ Cross Analysis: loaded (latest)")
-        else:
-            data["cross"] = {}
 
     # 5. Puts Top 10
-    puts_path = Path("output") / f"puts_top10_{today_str}.json"
-    if puts_path.exists():
-        with open(puts_path) as f:
-            pd = json.load(f)
-        data["puts_top10"] = pd.get("picks", []) if isinstance(pd, dict) else pd
-    else:
-        data["puts_top10"] = []
+    pd = store.read("puts_top10", stamp=today_str, default=[])
+    data["puts_top10"] = pd.get("picks", []) if isinstance(pd, dict) else pd
 
     # 6. Moonshot Top 10
-    moon_path = Path("output") / f"moonshot_top10_{today_str}.json"
-    if moon_path.exists():
-        with open(moon_path) as f:
-            md = json.load(f)
-        data["moon_top10"] = md.get("picks", []) if isinstance(md, dict) else md
-    else:
-        data["moon_top10"] = []
+    md = store.read("moonshot_top10", stamp=today_str, default=[])
+    data["moon_top10"] = md.get("picks", []) if isinstance(md, dict) else md
 
     # 7. Real-time mover injection — catch movers that appeared after the
     #    morning scan, or when output files are empty/stale.
@@ -192,28 +179,12 @@ def fetch_daily_bars(symbol: str, days: int = 30) -> List[Dict]:
 
 def calc_rsi(bars: List[Dict], period: int = 14) -> float:
     """Calculate RSI from daily bars."""
-    if len(bars) < period + 1:
-        return 50.0
-    closes = [b.get("c", 0) for b in bars]
-    deltas = [closes[i] - closes[i-1] for i in range(1, len(closes))]
-    gains = [d for d in deltas[-period:] if d > 0]
-    losses = [-d for d in deltas[-period:] if d < 0]
-    avg_gain = sum(gains) / period if gains else 0.001
-    avg_loss = sum(losses) / period if losses else 0.001
-    rs = avg_gain / avg_loss
-    return 100 - (100 / (1 + rs))
+    return rsi_simple_last([b.get("c", 0) for b in bars], period)
 
 
 def calc_ema(bars: List[Dict], period: int = 20) -> float:
     """Calculate EMA from daily bars."""
-    closes = [b.get("c", 0) for b in bars]
-    if len(closes) < period:
-        return closes[-1] if closes else 0
-    multiplier = 2 / (period + 1)
-    ema = sum(closes[:period]) / period
-    for price in closes[period:]:
-        ema = (price - ema) * multiplier + ema
-    return ema
+    return ema_last([b.get("c", 0) for b in bars], period)
 
 
 # ═══════════════════════════════════════════════════════
@@ -1262,8 +1233,14 @@ def send_telegram(calls: List[Dict], puts: List[Dict],
 
 def post_to_x(calls: List[Dict], puts: List[Dict],
               session_label: str = "",
-              quote_tweet_id: Optional[str] = None) -> bool:
-    """Post analysis as X thread (or quote-tweet of Step 8's thread)."""
+              quote_tweet_id: Optional[str] = None,
+              on_first_tweet: Optional[Callable[[str], None]] = None) -> bool:
+    """
+    Post analysis as X thread (or quote-tweet of Step 8's thread).
+
+    on_first_tweet is called with the first tweet ID as soon as it is
+    posted (the outbox records it so a retry never re-posts the thread).
+    """
     try:
         import tweepy
     except ImportError:
@@ -1360,6 +1337,8 @@ def post_to_x(calls: List[Dict], puts: List[Dict],
                 elif isinstance(resp, dict) and "data" in resp:
                     tweet_id = resp["data"]["id"]
             if tweet_id:
+                if prev_id is None and on_first_tweet:
+                    on_first_tweet(str(tweet_id))
                 prev_id = tweet_id
                 logger.info(f"  ✅ Tweet {i+1}/{len(tweets)} posted (ID: {tweet_id})")
             else:
@@ -1379,7 +1358,9 @@ def post_to_x(calls: List[Dict], puts: List[Dict],
 # ═══════════════════════════════════════════════════════
 
 def run_3pm_analysis(session_label: str = "",
-                     step8_tweet_id: Optional[str] = None):
+                     step8_tweet_id: Optional[str] = None,
+                     deliver_async: bool = False,
+                     step8_outbox_key: Optional[str] = None):
     """
     Full institutional-grade options analysis pipeline.
     
@@ -1391,6 +1372,10 @@ def run_3pm_analysis(session_label: str = "",
         session_label: "AM" or "PM" — auto-detected from current time if empty.
         step8_tweet_id: If provided, the X post will quote-tweet the Step 8
             alert thread instead of creating a separate standalone thread.
+        deliver_async: Queue Email/Telegram/X in the notification outbox
+            instead of sending inline (used by meta_engine.py).
+        step8_outbox_key: Outbox key of the Step 8 X thread. The queued X
+            post waits for it and quote-tweets its first tweet.
     """
     now = datetime.now(EST)
     if not session_label:
@@ -1435,30 +1420,54 @@ def run_3pm_analysis(session_label: str = "",
             logger.error(f"  Failed to save report: {e}")
             report_path = None
 
-        # 4. Send Email
-        logger.info("\n📧 STEP 4: Sending Email...")
-        email_ok = send_email(report, calls, puts, session_label=session_label)
-
-        # 5. Send Telegram
-        logger.info("\n📱 STEP 5: Sending Telegram...")
-        tg_ok = send_telegram(calls, puts, session_label=session_label)
-
-        # 6. Post to X (quote-tweet Step 8's alert if available)
-        logger.info(f"\n🐦 STEP 6: Posting to X ({session_label})...")
-        if step8_tweet_id:
-            logger.info(f"  Linking to Step 8 alert thread (ID: {step8_tweet_id})")
-        x_ok = post_to_x(
-            calls, puts,
-            session_label=session_label,
-            quote_tweet_id=step8_tweet_id,
-        )
+        if deliver_async:
+            # 4-6. Queue Email / Telegram / X (delivered by the outbox dispatcher)
+            logger.info("\n📤 STEPS 4-6: Queueing Email, Telegram, X...")
+            from notifications.outbox import channel_configured, get_outbox, start_dispatcher
+            outbox = get_outbox()
+            start_dispatcher()
+            run_key = f"{session_label}:{now.strftime('%Y%m%d_%H%M')}"
+            deep_payload = {"calls": calls, "puts": puts, "session_label": session_label}
+            # Unconfigured channels are skipped here rather than queued —
+            # a queued job would only fail, retry and raise a health alert.
+            email_ok = tg_ok = x_ok = "skipped"
+            if channel_configured("email"):
+                outbox.enqueue("deep_email", {**deep_payload, "report_md": report},
+                               key=f"deep_email:{run_key}")
+                email_ok = "queued"
+            if channel_configured("telegram"):
+                outbox.enqueue("deep_telegram", deep_payload, key=f"deep_telegram:{run_key}")
+                tg_ok = "queued"
+            if channel_configured("x_twitter"):
+                outbox.enqueue("deep_x_thread", {**deep_payload, "quote_tweet_id": step8_tweet_id},
+                               key=f"deep_x_thread:{run_key}", depends_on=step8_outbox_key)
+                x_ok = "queued"
+        else:
+            # 4. Send Email
+            logger.info("\n📧 STEP 4: Sending Email...")
+            email_ok = send_email(report, calls, puts, session_label=session_label)
+
+            # 5. Send Telegram
+            logger.info("\n📱 STEP 5: Sending Telegram...")
+            tg_ok = send_telegram(calls, puts, session_label=session_label)
+
+            # 6. Post to X (quote-tweet Step 8's alert if available)
+            logger.info(f"\n🐦 STEP 6: Posting to X ({session_label})...")
+            if step8_tweet_id:
+                logger.info(f"  Linking to Step 8 alert thread (ID: {step8_tweet_id})")
+            x_ok = post_to_x(
+                calls, puts,
+                session_label=session_label,
+                quote_tweet_id=step8_tweet_id,
+            )
 
         # Summary
+        _icon = {"queued": "📤 queued", "skipped": "⏭️ not configured", True: "✅", False: "❌"}
         logger.info("\n" + "=" * 70)
         logger.info("  RESULTS SUMMARY")
-        logger.info(f"  Email:    {'✅' if email_ok else '❌'}")
-        logger.info(f"  Telegram: {'✅' if tg_ok else '❌'}")
-        logger.info(f"  X/Twitter:{'✅' if x_ok else '❌'}")
+        logger.info(f"  Email:    {_icon.get(email_ok, '❌')}")
+        logger.info(f"  Telegram: {_icon.get(tg_ok, '❌')}")
+        logger.info(f"  X/Twitter:{_icon.get(x_ok, '❌')}")
         logger.info(f"  Report:   {report_path}")
         logger.info("=" * 70)
 
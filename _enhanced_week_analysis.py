@@ -18,7 +18,6 @@ No fixes applied — recommendations only.
 """
 
 import sys
-import json
 import requests
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -147,14 +146,15 @@ def get_analysis_period():
 
 def load_all_top10_picks(monday: datetime.date, thursday: datetime.date) -> List[Dict]:
     """Load all Top 10 picks from cross_analysis files in the period."""
-    output_dir = Path("output")
+    from artifact_store import ArtifactStore
+    store = ArtifactStore(Path("output"))
     all_picks = []
     
-    # Load all cross_analysis files
-    for cross_file in sorted(output_dir.glob("cross_analysis_*.json")):
+    # Load only the cross_analysis files the catalog places in the period
+    for entry in store.catalog("cross_analysis", since=monday, until=thursday):
+        cross_file = entry["path"]
         try:
-            with open(cross_file) as f:
-                data = json.load(f)
+            data = store.read(entry["name"], entry["stamp"], default={})
             
             ts = data.get("timestamp", "")
             if not ts:
@@ -36,12 +36,9 @@ def load_actual_movements(filepath: Path) -> Dict[str, Any]:
     return {}
 
 def load_cross_analysis(date_str: str) -> Optional[Dict[str, Any]]:
-    """Load cross_analysis file for a given date."""
-    cross_file = OUTPUT_DIR / f"cross_analysis_{date_str}.json"
-    if cross_file.exists():
-        with open(cross_file) as f:
-            return json.load(f)
-    return None
+    """Load cross_analysis (live or archived) for a given date."""
+    from artifact_store import ArtifactStore
+    return ArtifactStore(OUTPUT_DIR).read("cross_analysis", date_str)
 
 def _next_trading_day(d: date) -> date:
     """Get next trading day (skip weekends)."""
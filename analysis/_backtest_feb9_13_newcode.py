@@ -46,39 +46,29 @@ def load_scan_data(scan_date: date, session: str) -> Optional[Dict[str, Any]]:
     """
     Load scan data for a specific date and session (AM/PM).
     
-    Looks for files:
-      - output/meta_engine_run_YYYYMMDD_HHMM.json
-      - output/cross_analysis_YYYYMMDD_HHMM.json
+    Looks for artifacts (live or archived):
+      - meta_engine_run_YYYYMMDD_HHMM
     """
+    from artifact_store import ArtifactStore
+    store = ArtifactStore(OUTPUT_DIR)
     date_str = scan_date.strftime("%Y%m%d")
     hour = 9 if session == "AM" else 15
     minute = 35 if session == "AM" else 15
+    entries = store.catalog("meta_engine_run", since=scan_date, until=scan_date, newest_first=True)
     
     # Try exact match first
-    pattern = f"meta_engine_run_{date_str}_{hour:02d}{minute:02d}*.json"
-    files = list(OUTPUT_DIR.glob(pattern))
-    
-    if not files:
-        # Try any file from that date
-        pattern = f"meta_engine_run_{date_str}_*.json"
-        files = list(OUTPUT_DIR.glob(pattern))
-        # Filter by approximate time
-        if session == "AM":
-            files = [f for f in files if "09" in f.name or "10" in f.name]
-        else:
-            files = [f for f in files if "15" in f.name or "14" in f.name]
-    
-    if not files:
-        return None
+    runs = [e for e in entries if e["stamp"].startswith(f"{date_str}_{hour:02d}{minute:02d}")]
     
-    # Use most recent file for that date/session
-    files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-    try:
-        with open(files[0]) as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"  ⚠️ Failed to load {files[0]}: {e}")
+    if not runs:
+        # Any run from that date, filtered by approximate time
+        hours = ("09", "10") if session == "AM" else ("15", "14")
+        runs = [e for e in entries if e["stamp"][9:11] in hours]
+    
+    if not runs:
         return None
+    
+    # Use most recent run for that date/session
+    return store.read(runs[0]["name"], runs[0]["stamp"])
 
 
 def get_polygon_client():
@@ -67,32 +67,20 @@ def _next_trading_day(d: date) -> date:
 
 def load_cross_analysis(scan_date: date) -> Optional[Dict[str, Any]]:
     """Load cross_analysis file for a specific date."""
-    date_str = scan_date.strftime("%Y%m%d")
-    file_path = OUTPUT_DIR / f"cross_analysis_{date_str}.json"
-    if not file_path.exists():
-        return None
-    try:
-        with open(file_path) as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"  ⚠️ Failed to load {file_path}: {e}")
-        return None
+    from artifact_store import ArtifactStore
+    return ArtifactStore(OUTPUT_DIR).read("cross_analysis", scan_date.strftime("%Y%m%d"))
 
 
 def load_meta_engine_runs(scan_date: date) -> List[Dict[str, Any]]:
-    """Load all meta_engine_run files for a specific date to get session info."""
-    date_str = scan_date.strftime("%Y%m%d")
-    pattern = f"meta_engine_run_{date_str}_*.json"
-    files = sorted(OUTPUT_DIR.glob(pattern), key=lambda x: x.name)
+    """Load all meta_engine_run artifacts for a specific date to get session info."""
+    from artifact_store import ArtifactStore
+    store = ArtifactStore(OUTPUT_DIR)
     runs = []
-    for f in files:
-        try:
-            with open(f) as fh:
-                data = json.load(fh)
-                data["_source_file"] = f.name
-                runs.append(data)
-        except Exception:
-            pass
+    for entry in store.catalog("meta_engine_run", since=scan_date, until=scan_date):
+        data = store.read(entry["name"], entry["stamp"])
+        if isinstance(data, dict):
+            data["_source_file"] = entry["path"].name
+            runs.append(data)
     return runs
 
 
@@ -98,15 +98,8 @@ def load_tradenova_data(symbol: str, scan_date: date) -> Dict[str, Any]:
 
 def load_cross_analysis(scan_date: date) -> Optional[Dict[str, Any]]:
     """Load cross_analysis file for a specific date."""
-    date_str = scan_date.strftime("%Y%m%d")
-    file_path = OUTPUT_DIR / f"cross_analysis_{date_str}.json"
-    if not file_path.exists():
-        return None
-    try:
-        with open(file_path) as f:
-            return json.load(f)
-    except Exception:
-        return None
+    from artifact_store import ArtifactStore
+    return ArtifactStore(OUTPUT_DIR).read("cross_analysis", scan_date.strftime("%Y%m%d"))
 
 
 def _next_trading_day(d: date) -> date:
@@ -86,14 +86,13 @@ NYSE_HOLIDAYS = {"2026-02-16"}  # Presidents Day
 
 def load_session_picks(scan_date: str, scan_time: str) -> Dict[str, List[Dict]]:
     """Load puts and moonshot picks from a historical meta_engine_run file."""
-    fname = OUTPUT / f"meta_engine_run_{scan_date.replace('-', '')}_{scan_time}.json"
-    if not fname.exists():
-        log.warning(f"  ⚠️ File not found: {fname}")
+    from artifact_store import ArtifactStore
+    stamp = f"{scan_date.replace('-', '')}_{scan_time}"
+    data = ArtifactStore(OUTPUT).read("meta_engine_run", stamp)
+    if data is None:
+        log.warning(f"  ⚠️ Artifact not found: meta_engine_run_{stamp}")
         return {"puts": [], "moonshots": []}
     
-    with open(fname) as f:
-        data = json.load(f)
-    
     puts = data.get("puts_top10", [])
     moons = data.get("moonshot_top10", [])
     
@@ -16,6 +16,7 @@
 
 import json
 import statistics
+import sys
 from pathlib import Path
 from collections import defaultdict
 from typing import List, Dict, Any, Tuple, Optional
@@ -23,6 +24,7 @@ from typing import List, Dict, Any, Tuple, Optional
 ROOT = Path("/Users/chavala/Meta Engine")
 OUTPUT = ROOT / "output"
 TN_DATA = Path("/Users/chavala/TradeNova/data")
+sys.path.insert(0, str(ROOT))
 
 # ══════════════════════════════════════════════════════════════════════════════
 # ALL ≥5x MOVERS FROM USER'S TABLE
@@ -128,13 +130,13 @@ def load_uw_flow():
 
 
 def load_cross_analyses():
+    from artifact_store import ArtifactStore
+    store = ArtifactStore(OUTPUT)
     results = []
-    for cf in sorted(OUTPUT.glob("cross_analysis_*.json")):
-        if "latest" in cf.name:
-            continue
-        with open(cf) as f:
-            data = json.load(f)
-        results.append(data)
+    for entry in store.catalog("cross_analysis"):
+        data = store.read(entry["name"], entry["stamp"])
+        if data is not None:
+            results.append(data)
     return results
 
 
@@ -133,16 +133,14 @@ def load_uw_flow() -> Dict:
 
 
 def load_session_runs() -> Dict[str, Dict]:
-    """Load all meta_engine_run JSON files to get original pick details."""
+    """Load all meta_engine_run artifacts (live or archived) to get original pick details."""
+    from artifact_store import ArtifactStore
+    store = ArtifactStore(OUTPUT)
     runs = {}
-    for f in sorted(OUTPUT.glob("meta_engine_run_*.json")):
-        try:
-            with open(f) as fh:
-                data = json.load(fh)
-            key = f.stem.replace("meta_engine_run_", "")
-            runs[key] = data
-        except Exception:
-            pass
+    for entry in store.catalog("meta_engine_run"):
+        data = store.read(entry["name"], entry["stamp"])
+        if data is not None:
+            runs[entry["stamp"]] = data
     return runs
 
 
@@ -12,12 +12,14 @@ Uses matplotlib for chart generation and saves as PNG for email attachment.
 
 import os
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 from pathlib import Path
 import logging
 
 import requests
 
+from analysis.indicators import compute_all
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,39 +42,42 @@ def _fetch_price_history(symbol: str, api_key: str, days: int = 30) -> List[Dict
     return []
 
 
-def _calculate_rsi(prices: List[float], period: int = 14) -> List[float]:
-    """Calculate RSI from a list of closing prices."""
-    if len(prices) < period + 1:
-        return [50.0] * len(prices)
-    
-    rsi_values = [50.0] * period  # Pad initial values
-    
-    deltas = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-    
-    # Initial average gain/loss
-    gains = [max(d, 0) for d in deltas[:period]]
-    losses = [abs(min(d, 0)) for d in deltas[:period]]
-    
-    avg_gain = sum(gains) / period
-    avg_loss = sum(losses) / period
-    
-    for i in range(period, len(deltas)):
-        delta = deltas[i]
-        gain = max(delta, 0)
-        loss = abs(min(delta, 0))
-        
-        avg_gain = (avg_gain * (period - 1) + gain) / period
-        avg_loss = (avg_loss * (period - 1) + loss) / period
-        
-        if avg_loss == 0:
-            rsi = 100.0
-        else:
-            rs = avg_gain / avg_loss
-            rsi = 100.0 - (100.0 / (1.0 + rs))
-        
-        rsi_values.append(rsi)
-    
-    return rsi_values
+def _rsi_panel(rsi14: Sequence[float], period: int = 14) -> List[float]:
+    """
+    RSI panel values from a shared Wilder RSI series (one value per bar,
+    NaN during warm-up): 50.0 for the first `period` bars, then one value
+    per bar from bar period+1 — the layout this chart has always drawn.
+    """
+    if len(rsi14) < period + 1:
+        return [50.0] * len(rsi14)
+    return [50.0] * period + [float(v) for v in rsi14[period + 1:]]
+
+
+def _chart_bars(all_picks: List[Dict[str, Any]], api_key: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Bars and indicator series per charted symbol. Reuses what cross-analysis
+    already fetched and computed (market_data daily_bars / indicator_series);
+    only symbols without them are fetched here, and their indicators come
+    from a single compute_all() call.
+    """
+    out: Dict[str, Dict[str, Any]] = {}
+    fetched: Dict[str, List[Dict]] = {}
+    for pick in all_picks:
+        symbol = pick["symbol"]
+        if symbol in out or symbol in fetched:
+            continue
+        mkt = pick.get("market_data") or {}
+        if mkt.get("daily_bars") and mkt.get("indicator_series"):
+            out[symbol] = {"bars": mkt["daily_bars"], "series": mkt["indicator_series"]}
+            continue
+        bars = _fetch_price_history(symbol, api_key, days=30)
+        if bars:
+            fetched[symbol] = bars
+    if fetched:
+        iset = compute_all(fetched)
+        for symbol, bars in fetched.items():
+            out[symbol] = {"bars": bars, "series": iset.series(symbol)}
+    return out
 
 
 def generate_meta_chart(
@@ -113,15 +118,18 @@ def generate_meta_chart(
     
     all_picks = []
     for p in puts_picks:
-        all_picks.append({"symbol": p["symbol"], "engine": "PutsEngine", "score": p.get("score", 0)})
+        all_picks.append({"symbol": p["symbol"], "engine": "PutsEngine", "score": p.get("score", 0),
+                          "market_data": p.get("market_data")})
     for m in moon_picks:
-        all_picks.append({"symbol": m["symbol"], "engine": "Moonshot", "score": m.get("score", 0)})
+        all_picks.append({"symbol": m["symbol"], "engine": "Moonshot", "score": m.get("score", 0),
+                          "market_data": m.get("market_data")})
     
     if not all_picks:
         logger.warning("No picks to chart")
         return None
     
     n = len(all_picks)
+    chart_data = _chart_bars(all_picks, polygon_api_key)
     
     # Create figure with subplots: 2 rows per ticker (price + RSI)
     fig, axes = plt.subplots(n * 2, 1, figsize=(14, 4 * n), 
@@ -154,8 +162,9 @@ def generate_meta_chart(
         ax_price = axes[i * 2]
         ax_rsi = axes[i * 2 + 1]
         
-        # Fetch price data
-        bars = _fetch_price_history(symbol, polygon_api_key, days=30)
+        # Price data (shared with cross-analysis when it has the bars)
+        data = chart_data.get(symbol)
+        bars = data["bars"] if data else []
         
         if not bars:
             ax_price.text(0.5, 0.5, f"{symbol} — No price data available",
@@ -209,7 +218,7 @@ def generate_meta_chart(
         ax_price.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
         
         # RSI subplot
-        rsi_values = _calculate_rsi(closes)
+        rsi_values = _rsi_panel(data["series"]["rsi14"])
         ax_rsi.set_facecolor('#16213e')
         ax_rsi.plot(dates[-len(rsi_values):], rsi_values, color=color_set["main"], linewidth=1.5)
         ax_rsi.axhline(y=70, color='#ff6b6b', linestyle='--', alpha=0.5, linewidth=0.8)
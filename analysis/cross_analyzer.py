@@ -27,6 +27,8 @@ import logging
 
 import requests
 
+from analysis.indicators import atr_wilder_last, bollinger_last, compute_all, ema_last, rsi_last
+
 logger = logging.getLogger(__name__)
 
 
@@ -119,14 +121,7 @@ def _get_market_data(symbol: str, api_key: str) -> Dict[str, Any]:
                     data["avg_volume_20d"] = avg_vol
                     data["rvol"] = latest["v"] / avg_vol if avg_vol > 0 else 1.0
 
-                # --- Calculate EMA-20 ---
-                closes = [b["c"] for b in bars]
-                if len(closes) >= 20:
-                    data["ema20"] = _calc_ema(closes, 20)
-
-                # --- Calculate RSI-14 ---
-                if len(closes) >= 15:
-                    data["rsi"] = _calc_rsi(closes, 14)
+                # EMA-20 / RSI-14 / full indicator series: _attach_indicators()
 
     except Exception as e:
         logger.debug(f"Failed to get 30-day bars for {symbol}: {e}")
@@ -157,36 +152,62 @@ def _get_market_data(symbol: str, api_key: str) -> Dict[str, Any]:
 # Technical Indicator Helpers
 # ---------------------------------------------------------------------------
 
-def _calc_ema(prices: List[float], period: int) -> float:
-    """Calculate Exponential Moving Average."""
-    if len(prices) < period:
-        return prices[-1] if prices else 0
-    multiplier = 2 / (period + 1)
-    ema = sum(prices[:period]) / period  # SMA seed
-    for p in prices[period:]:
-        ema = (p - ema) * multiplier + ema
-    return ema
+# RSI / EMA / Bollinger / ATR live in analysis.indicators (shared with the
+# direction predictor, chart generator and move-potential scorer).
+_calc_ema = ema_last
+_calc_rsi = rsi_last
+_calc_bollinger = bollinger_last
+_calc_atr = atr_wilder_last
 
 
-def _calc_rsi(prices: List[float], period: int = 14) -> float:
-    """Calculate RSI (Relative Strength Index) — returns last value."""
-    if len(prices) < period + 1:
-        return 50.0
-    deltas = [prices[i] - prices[i - 1] for i in range(1, len(prices))]
-    gains = [d if d > 0 else 0 for d in deltas]
-    losses = [-d if d < 0 else 0 for d in deltas]
+def _attach_indicators(markets: List[Dict[str, Any]]):
+    """
+    Indicators for every fetched symbol from one compute_all() call.
 
-    avg_gain = sum(gains[:period]) / period
-    avg_loss = sum(losses[:period]) / period
+    Latest readings go to market_data["indicators"] (plus the ema20 / rsi
+    fields); the full series stay on market_data["indicator_series"] for
+    the chart. storable() drops the series before results are written.
+    """
+    with_bars = {m["symbol"]: m for m in markets if m.get("daily_bars")}
+    if not with_bars:
+        return
+    iset = compute_all({sym: m["daily_bars"] for sym, m in with_bars.items()})
+    for sym, m in with_bars.items():
+        ind = iset.at(sym)
+        m["indicators"] = ind
+        m["indicator_series"] = {k: v.tolist() for k, v in iset.series(sym).items()}
+        if ind["bars"] >= 20:
+            m["ema20"] = ind["ema20"]
+        if ind["bars"] >= 15:
+            m["rsi"] = ind["rsi14"]
+
+
+# In-memory only: dropped from market_data wherever cross results are written.
+# The bars and series feed this run's analysis, summaries and chart; on disk
+# they would be repeated in every cross result, meta_engine_run and outbox job.
+_RUNTIME_MARKET_KEYS = ("daily_bars", "indicator_series")
+
+
+def storable(cross_results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of cross-analysis results for writing to disk / the outbox:
+    market_data loses its in-memory-only keys (_RUNTIME_MARKET_KEYS —
+    the 30-day bars and indicator series). Items are copied shallowly;
+    the input is not modified.
+    """
+    out = dict(cross_results)
+    for key in ("puts_through_moonshot", "moonshot_through_puts"):
+        items = cross_results.get(key)
+        if isinstance(items, list):
+            out[key] = [_storable_item(item) for item in items]
+    return out
 
-    for i in range(period, len(deltas)):
-        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
 
-    if avg_loss == 0:
-        return 100.0
-    rs = avg_gain / avg_loss
-    return 100 - (100 / (1 + rs))
+def _storable_item(item: Any) -> Any:
+    mkt = item.get("market_data") if isinstance(item, dict) else None
+    if not isinstance(mkt, dict) or not any(k in mkt for k in _RUNTIME_MARKET_KEYS):
+        return item
+    return {**item, "market_data": {k: v for k, v in mkt.items() if k not in _RUNTIME_MARKET_KEYS}}
 
 
 def _load_puts_cached_data() -> Dict[str, Dict]:
@@ -821,7 +842,12 @@ def _get_uw_cache(cache_name: str) -> Dict[str, Any]:
 
 
 def _calc_macd(prices: List[float]) -> Dict[str, float]:
-    """Calculate MACD (12, 26, 9) — returns dict with macd, signal, histogram."""
+    """
+    Calculate MACD (12, 26, 9) — returns dict with macd, signal, histogram.
+
+    Not indicators.macd_last: this signal line is built from an EMA-12 that
+    skips bars 12-25; kept as-is so cross-engine scores don't shift.
+    """
     if len(prices) < 26:
         return {"macd": 0, "signal": 0, "histogram": 0}
     ema12 = _calc_ema(prices, 12)
@@ -851,38 +877,6 @@ def _calc_macd(prices: List[float]) -> Dict[str, float]:
     return {"macd": macd_line, "signal": signal, "histogram": histogram}
 
 
-def _calc_bollinger(prices: List[float], period: int = 20, std_mult: float = 2.0) -> Dict[str, float]:
-    """Calculate Bollinger Bands — returns upper, middle, lower, width, position."""
-    if len(prices) < period:
-        return {"upper": 0, "middle": 0, "lower": 0, "width": 0, "position": 0.5}
-    window = prices[-period:]
-    middle = sum(window) / period
-    variance = sum((p - middle) ** 2 for p in window) / period
-    std_dev = variance ** 0.5
-    upper = middle + std_mult * std_dev
-    lower = middle - std_mult * std_dev
-    width = (upper - lower) / middle if middle > 0 else 0
-    pos = (prices[-1] - lower) / (upper - lower) if (upper - lower) > 0 else 0.5
-    return {"upper": upper, "middle": middle, "lower": lower, "width": width, "position": pos}
-
-
-def _calc_atr(bars: List[Dict], period: int = 14) -> float:
-    """Calculate Average True Range."""
-    if len(bars) < period + 1:
-        return 0.0
-    trs = []
-    for i in range(1, len(bars)):
-        h, l, pc = bars[i]["h"], bars[i]["l"], bars[i - 1]["c"]
-        tr = max(h - l, abs(h - pc), abs(l - pc))
-        trs.append(tr)
-    if len(trs) < period:
-        return sum(trs) / len(trs) if trs else 0
-    atr = sum(trs[:period]) / period
-    for tr in trs[period:]:
-        atr = (atr * (period - 1) + tr) / period
-    return atr
-
-
 def _analyze_with_moonshot_lens(symbol: str, market_data: Dict) -> Dict[str, Any]:
     """
     Run a symbol through the Moonshot/TradeNova analytical lens.
@@ -1234,7 +1228,8 @@ def _standalone_moonshot_analysis(
         signals_detected.append(f"MACD_converging (hist {macd_data['histogram']:.3f})")
 
     # A3. Bollinger Band position
-    bb = _calc_bollinger(closes)
+    ind = market_data.get("indicators") or {}
+    bb = ind.get("bollinger") or _calc_bollinger(closes)
     if bb["position"] <= 0.15:
         tech_score += 0.25  # near lower BB — bounce setup
         signals_detected.append(f"BB_lower_band_bounce (pos {bb['position']:.2f})")
@@ -1446,10 +1441,12 @@ def _standalone_moonshot_analysis(
         elif bb["width"] < 0.12:
             sq_score += 0.10
 
-    # E2. ATR compression (contracting range)
-    atr = _calc_atr(bars)
+    # E2. ATR compression (contracting range): today's ATR vs 5 bars ago,
+    # both read off the same Wilder ATR series over this window
+    atr_series = (market_data.get("indicator_series") or {}).get("atr14")
+    atr = ind["atr14"] if atr_series else _calc_atr(bars)
     if len(bars) >= 20 and atr > 0:
-        atr_prev = _calc_atr(bars[:-5])
+        atr_prev = atr_series[len(bars) - 6] if atr_series else _calc_atr(bars[:-5])
         if atr_prev > 0:
             atr_ratio = atr / atr_prev
             if atr_ratio < 0.7:
@@ -1654,6 +1651,7 @@ def cross_analyze(
     puts_top10: List[Dict[str, Any]],
     moonshot_top10: List[Dict[str, Any]],
     polygon_api_key: str = "",
+    incremental: bool = False,
 ) -> Dict[str, Any]:
     """
     Cross-analyze Top 10 picks from each engine through the opposite engine.
@@ -1662,6 +1660,10 @@ def cross_analyze(
         puts_top10: Top 10 picks from PutsEngine
         moonshot_top10: Top 10 picks from Moonshot Engine
         polygon_api_key: Polygon API key for market data
+        incremental: Reuse the previous scan's per-symbol results for
+            symbols whose pick, lens sources and price haven't changed
+            (see analysis/incremental_scan.py). Full scans still record
+            state so the next incremental scan can reuse them.
         
     Returns:
         Dict with:
@@ -1691,12 +1693,45 @@ def cross_analyze(
             logger.info(f"  📅 Earnings calendar loaded: {len(earnings_set)} tickers with upcoming earnings")
     except Exception as e:
         logger.debug(f"Earnings calendar load failed: {e}")
+
+    # 0b. Incremental planning — which symbols can reuse the last scan's result
+    inc = None
+    try:
+        from analysis.incremental_scan import IncrementalScan
+        inc = IncrementalScan(reuse=incremental)
+        inc.plan(puts_top10, moonshot_top10)
+    except Exception as e:
+        logger.debug(f"Incremental scan state unavailable: {e}")
+        inc = None
     
+    # One Polygon fetch per symbol per scan: a symbol on both lists shares
+    # the same market_data (and its daily_bars list) by reference in both
+    # cross results instead of carrying two fetched copies.
+    market_cache: Dict[str, Dict[str, Any]] = {}
+
+    def _market(symbol: str) -> Dict[str, Any]:
+        if symbol not in market_cache:
+            market_cache[symbol] = _get_market_data(symbol, polygon_api_key)
+        return market_cache[symbol]
+
+    # Fetch every symbol that needs a fresh analysis up front so the whole
+    # candidate set's indicators come from a single compute_all() call
+    for side, picks in (("put", puts_top10), ("call", moonshot_top10)):
+        for pick in picks:
+            if not (inc and inc.reusable(side, pick)):
+                _market(pick["symbol"])
+    _attach_indicators(list(market_cache.values()))
+
     # 1. Run PutsEngine Top 10 through Moonshot lens
     logger.info("\n📊 Running PutsEngine picks through Moonshot analysis...")
     for pick in puts_top10:
         symbol = pick["symbol"]
-        market_data = _get_market_data(symbol, polygon_api_key)
+        cached = inc.lookup("put", pick) if inc else None
+        if cached is not None:
+            results["puts_through_moonshot"].append(cached)
+            logger.info(f"  {symbol}: ♻️ unchanged — reused previous analysis")
+            continue
+        market_data = _market(symbol)
         moonshot_view = _analyze_with_moonshot_lens(symbol, market_data)
         
         cross_result = {
@@ -1729,13 +1764,20 @@ def cross_analyze(
             logger.info(f"  📅 {symbol}: EARNINGS within 2 days — special handling")
 
         results["puts_through_moonshot"].append(cross_result)
+        if inc:
+            inc.record("put", pick, _storable_item(cross_result))
         logger.info(f"  {symbol}: Puts={_to_float(pick.get('score', 0)):.2f} | Moonshot={moonshot_view['opportunity_level']}")
     
     # 2. Run Moonshot Top 10 through PutsEngine lens
     logger.info("\n📊 Running Moonshot picks through PutsEngine analysis...")
     for pick in moonshot_top10:
         symbol = pick["symbol"]
-        market_data = _get_market_data(symbol, polygon_api_key)
+        cached = inc.lookup("call", pick) if inc else None
+        if cached is not None:
+            results["moonshot_through_puts"].append(cached)
+            logger.info(f"  {symbol}: ♻️ unchanged — reused previous analysis")
+            continue
+        market_data = _market(symbol)
         puts_view = _analyze_with_puts_lens(symbol, market_data)
         
         cross_result = {
@@ -1771,6 +1813,14 @@ def cross_analyze(
 
         results["moonshot_through_puts"].append(cross_result)
         logger.info(f"  {symbol}: Moonshot={_to_float(pick.get('score', 0)):.2f} | Puts Risk={puts_view['risk_level']}")
+        if inc:
+            inc.record("call", pick, _storable_item(cross_result))
+
+    if inc:
+        inc.save()
+        results["incremental"] = {"enabled": incremental, **inc.stats}
+        if incremental:
+            logger.info(f"  ♻️ Incremental scan: {inc.summary()}")
     
     # 2b. NEGATIVE RECURRENCE FILTER — exclude 2+ consecutive failures
     # Backtest finding: AMZN 0/5, GOOGL 2/5 — repeated losers waste capital
@@ -1932,32 +1982,23 @@ def cross_analyze(
 
     # 3. Track picks for recurrence analysis and apply boost
     try:
-        from analysis.recurrence_tracker import track_pick, apply_recurrence_boost
+        from analysis.recurrence_tracker import track_picks, apply_recurrence_boost
         scan_date = datetime.now().strftime("%Y-%m-%d")
         scan_timestamp = results["timestamp"]
         
-        # Track all picks
-        for i, pick in enumerate(results["puts_through_moonshot"], 1):
-            track_pick(
-                symbol=pick.get("symbol", ""),
-                option_type="put",
-                scan_date=scan_date,
-                scan_timestamp=scan_timestamp,
-                rank=i,
-                engine="PutsEngine",
-                score=_to_float(pick.get("score", 0)),
-            )
-        
-        for i, pick in enumerate(results["moonshot_through_puts"], 1):
-            track_pick(
-                symbol=pick.get("symbol", ""),
-                option_type="call",
-                scan_date=scan_date,
-                scan_timestamp=scan_timestamp,
-                rank=i,
-                engine="Moonshot",
-                score=_to_float(pick.get("score", 0)),
-            )
+        # Track all picks (one transaction)
+        tracked = [
+            {"symbol": pick.get("symbol", ""), "option_type": "put", "scan_date": scan_date,
+             "scan_timestamp": scan_timestamp, "rank": i, "engine": "PutsEngine",
+             "score": _to_float(pick.get("score", 0))}
+            for i, pick in enumerate(results["puts_through_moonshot"], 1)
+        ] + [
+            {"symbol": pick.get("symbol", ""), "option_type": "call", "scan_date": scan_date,
+             "scan_timestamp": scan_timestamp, "rank": i, "engine": "Moonshot",
+             "score": _to_float(pick.get("score", 0))}
+            for i, pick in enumerate(results["moonshot_through_puts"], 1)
+        ]
+        track_picks(tracked)
         
         # Apply recurrence boost (2x = 15% boost, 3x+ = 30% boost)
         # This ensures recurring picks rank in Top 3 for X posts
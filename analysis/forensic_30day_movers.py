@@ -196,14 +196,13 @@ def load_insider_cache() -> dict:
 
 
 def load_cross_analysis_for_date(d: str) -> dict:
-    """Load Meta cross_analysis for a date."""
-    p = META_DIR / "output" / f"cross_analysis_{d.replace('-','')}.json"
+    """Load Meta cross_analysis for a date (live or archived)."""
     try:
-        if p.exists():
-            return json.load(open(p))
+        from artifact_store import ArtifactStore
+        store = ArtifactStore(META_DIR / "output")
+        return store.read("cross_analysis", d.replace('-', ''), default={}) or {}
     except Exception:
-        pass
-    return {}
+        return {}
 
 
 def get_pre_move_bars(all_bars: list, move_bar_idx: int, days_back: int) -> list:
@@ -108,11 +108,12 @@ def main():
 
     # ── Load all Meta cross_analysis files ────────────────────────────
     meta_picks_by_date = {}
-    ca_files = sorted(META_OUTPUT.glob("cross_analysis_2026*.json"))
-    for cf in ca_files:
+    from artifact_store import ArtifactStore
+    store = ArtifactStore(META_OUTPUT)
+    for entry in store.catalog("cross_analysis", since=date(2026, 1, 1)):
         try:
-            ca = json.load(open(cf))
-            datestr = cf.stem.split("_")[-1]  # 20260227
+            ca = store.read(entry["name"], entry["stamp"], default={})
+            datestr = entry["stamp"][:8]  # 20260227
             dt = date(int(datestr[:4]), int(datestr[4:6]), int(datestr[6:8]))
             puts = [p.get("symbol","") for p in ca.get("puts_through_moonshot", [])]
             calls = [c.get("symbol","") for c in ca.get("moonshot_through_puts", [])]
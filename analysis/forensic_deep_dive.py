@@ -84,10 +84,12 @@ def main():
 
     # Meta picks
     meta_picks = {}
-    for cf in sorted(META_OUT.glob("cross_analysis_2026*.json")):
+    from artifact_store import ArtifactStore
+    store = ArtifactStore(META_OUT)
+    for entry in store.catalog("cross_analysis", since=date(2026, 1, 1)):
         try:
-            ca = json.load(open(cf))
-            ds = cf.stem.split("_")[-1]
+            ca = store.read(entry["name"], entry["stamp"], default={})
+            ds = entry["stamp"][:8]
             dt = date(int(ds[:4]), int(ds[4:6]), int(ds[6:8]))
             puts = [p.get("symbol","") for p in ca.get("puts_through_moonshot",[])]
             calls = [c.get("symbol","") for c in ca.get("moonshot_through_puts",[])]
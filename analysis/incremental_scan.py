@@ -0,0 +1,369 @@
+"""
+Incremental Scan: Reuse per-symbol results for unchanged symbols
+================================================================
+The expensive part of a scan is per-symbol: 30-day Polygon bars plus the
+opposite-engine lens (MWS forecast, final recs, UW caches, PutsEngine
+cache). On an intraday re-scan most symbols haven't changed, so we keep
+the previous result per (side, symbol) together with fingerprints of
+everything it was derived from:
+
+  - PICK      — the upstream pick itself (score, signals, ORM fields…)
+  - SOURCES   — the symbol's slice of the lens source files. Files are
+                first compared by (mtime, size); only when a file changed
+                are per-symbol slices re-hashed, so a touched file whose
+                AAPL record didn't change doesn't dirty AAPL.
+  - MOVERS    — last price from the Polygon snapshot (one call for the
+                whole universe). A move ≥ MOVER_PRICE_DELTA_PCT since the
+                cached result marks the symbol dirty.
+
+Anything dirty, new, older than MAX_ENTRY_AGE_MIN, or from a previous
+trading day is recomputed; the rest is reused. Cross-sectional steps
+(sector concentration, recurrence boost, conflict matrix, ranking) are
+cheap and always re-run over the merged set.
+
+Smart Money gets the same treatment one step upstream (SmartMoneyReuse):
+a symbol's raw multi-source analysis is a pure function of its records
+in the loaded sources, so it is reused while every slice digests the
+same. The direct picks are plain reads of the engines' Top 10 files;
+META-SCORE / ORM only run in the adapters' fallback pipelines and are
+not reused.
+
+State: data/incremental_scan_state.json and
+data/incremental_smart_money_state.json (rewritten atomically per scan).
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = Path(__file__).parent.parent / "data" / "incremental_scan_state.json"
+SMART_MONEY_STATE_FILE = Path(__file__).parent.parent / "data" / "incremental_smart_money_state.json"
+STATE_VERSION = 1
+
+MOVER_PRICE_DELTA_PCT = 0.5   # Price move since cached result that forces recompute
+MAX_ENTRY_AGE_MIN = 90        # Hard ceiling on reuse, even for quiet symbols
+
+# Lens → source files it reads (relative to the engine roots in cross_analyzer).
+# Put picks go through the Moonshot lens; call picks through the Puts lens.
+_LENS_SOURCES = {
+    "put": [
+        ("tradenova", "data/tomorrows_forecast.json"),
+        ("tradenova", "data/final_recommendations.json"),
+        ("tradenova", "data/final_recommendations_history.json"),
+        ("tradenova", "data/darkpool_cache.json"),
+        ("tradenova", "data/uw_gex_cache.json"),
+        ("tradenova", "data/uw_iv_term_cache.json"),
+        ("tradenova", "data/uw_oi_change_cache.json"),
+        ("tradenova", "data/uw_skew_cache.json"),
+        ("tradenova", "data/uw_flow_cache.json"),
+    ],
+    "call": [
+        ("putsengine", "scheduled_scan_results.json"),
+    ],
+}
+
+_UW_CACHES = ("darkpool", "gex", "iv_term", "oi_change", "skew", "flow")
+
+
+def _digest(obj: Any) -> str:
+    raw = json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _slice_digest(obj: Any) -> str:
+    """Short digest of one symbol's source record (insertion order, orjson-fast)."""
+    from artifact_store import dumps
+    return hashlib.blake2b(dumps(obj), digest_size=8).hexdigest()
+
+
+def _file_fp(path: Path) -> List[int]:
+    try:
+        st = path.stat()
+        return [st.st_mtime_ns, st.st_size]
+    except OSError:
+        return [0, 0]
+
+
+def _load_state(state_file: Path, day: str) -> Dict:
+    """Today's state from `state_file`, or {} (missing, stale, other version)."""
+    from artifact_store import loads
+    try:
+        if state_file.exists():
+            state = loads(state_file.read_bytes())
+            if state.get("version") == STATE_VERSION and state.get("day") == day:
+                return state
+    except Exception as e:
+        logger.debug(f"Incremental scan state unreadable — full recompute: {e}")
+    return {}
+
+
+def _save_state(state_file: Path, state: Dict):
+    from artifact_store import dumps
+    try:
+        state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = state_file.with_name(state_file.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(dumps(state))
+        os.replace(tmp, state_file)
+    except Exception as e:
+        logger.warning(f"Failed to save incremental scan state: {e}")
+
+
+def _source_paths(side: str) -> List[Path]:
+    from analysis.cross_analyzer import PUTSENGINE_PATH, TRADENOVA_PATH
+    roots = {"putsengine": Path(PUTSENGINE_PATH), "tradenova": Path(TRADENOVA_PATH)}
+    return [roots[root] / rel for root, rel in _LENS_SOURCES[side]]
+
+
+def file_fingerprints() -> Dict[str, List[int]]:
+    """(mtime_ns, size) for every lens source file; missing files → [0, 0]."""
+    fps = {}
+    for side in _LENS_SOURCES:
+        for path in _source_paths(side):
+            fps[str(path)] = _file_fp(path)
+    return fps
+
+
+def _source_slice(side: str, symbol: str) -> Tuple:
+    """The symbol's records in every source its lens reads."""
+    from analysis import cross_analyzer as ca
+    if side == "put":
+        return (
+            ca._get_mws_forecast_cache().get(symbol),
+            ca._get_final_recs_cache().get(symbol),
+        ) + tuple(ca._get_uw_cache(name).get(symbol) for name in _UW_CACHES)
+    return (ca._get_puts_cache().get(symbol),)
+
+
+def mover_prices() -> Dict[str, float]:
+    """Last price per symbol from the (5-min cached) Polygon snapshot."""
+    try:
+        from engine_adapters.realtime_mover_scanner import scan_realtime_movers
+        all_prices = scan_realtime_movers().get("all_prices", {}) or {}
+        return {
+            sym: float(info.get("price", 0) or 0)
+            for sym, info in all_prices.items()
+            if isinstance(info, dict)
+        }
+    except Exception as e:
+        logger.debug(f"Mover snapshot unavailable for incremental scan: {e}")
+        return {}
+
+
+class IncrementalScan:
+    """
+    Per-scan reuse planner for cross_analyze().
+
+    Usage:
+        inc = IncrementalScan(reuse=True)
+        inc.plan(puts_top10, moonshot_top10)
+        cached = inc.lookup("put", pick)       # deep copy or None
+        inc.record("put", pick, cross_result)  # after a fresh compute
+        inc.save()
+    """
+
+    def __init__(self, reuse: bool = True, state_file: Optional[Path] = None):
+        self.reuse = reuse
+        self.state_file = Path(state_file) if state_file else STATE_FILE
+        self.today = datetime.now().strftime("%Y-%m-%d")
+        self.prev = self._load()
+        self.entries: Dict[str, Dict] = {}
+        self.files = file_fingerprints()
+        self.prices: Dict[str, float] = {}
+        self._changed_files = {
+            path for path, fp in self.files.items()
+            if self.prev.get("files", {}).get(path) != fp
+        }
+        self._plan: Dict[str, Dict] = {}
+        self.stats = {"reused": 0, "recomputed": 0, "reasons": {}}
+
+    # ── State I/O ──────────────────────────────────────
+
+    def _load(self) -> Dict:
+        return _load_state(self.state_file, self.today)
+
+    def save(self):
+        """Persist fingerprints + results for the next scan (atomic)."""
+        _save_state(self.state_file, {
+            "version": STATE_VERSION,
+            "day": self.today,
+            "saved_at": datetime.now().isoformat(),
+            "files": self.files,
+            "entries": self.entries,
+        })
+
+    # ── Fingerprints ───────────────────────────────────
+
+    def _source_fp(self, side: str, symbol: str, prev_entry: Optional[Dict]) -> str:
+        # Files untouched since the cached result → its slice can't have changed
+        side_paths = {str(p) for p in _source_paths(side)}
+        if prev_entry and not (side_paths & self._changed_files):
+            return prev_entry.get("source_fp", "")
+        return _digest(_source_slice(side, symbol))
+
+    # ── Planning ───────────────────────────────────────
+
+    def plan(self, puts_top10: List[Dict], moonshot_top10: List[Dict]):
+        """Decide, per (side, symbol), whether the cached result is reusable."""
+        self.prices = mover_prices()
+        prev_entries = self.prev.get("entries", {})
+        now = datetime.now()
+        for side, picks in (("put", puts_top10), ("call", moonshot_top10)):
+            for pick in picks:
+                symbol = pick.get("symbol", "")
+                key = f"{side}:{symbol}"
+                prev_entry = prev_entries.get(key)
+                fp = {
+                    "pick_fp": _digest(pick),
+                    "source_fp": self._source_fp(side, symbol, prev_entry),
+                    "price": self.prices.get(symbol, 0.0),
+                }
+                reason = self._dirty_reason(prev_entry, fp, now)
+                self._plan[key] = {"fp": fp, "reason": reason}
+
+    def _dirty_reason(self, prev_entry: Optional[Dict], fp: Dict, now: datetime) -> Optional[str]:
+        if not self.reuse:
+            return "full_scan"
+        if not prev_entry:
+            return "new"
+        try:
+            age_min = (now - datetime.fromisoformat(prev_entry["computed_at"])).total_seconds() / 60
+        except (KeyError, ValueError):
+            return "new"
+        if age_min > MAX_ENTRY_AGE_MIN:
+            return "expired"
+        if prev_entry.get("pick_fp") != fp["pick_fp"]:
+            return "pick_changed"
+        if prev_entry.get("source_fp") != fp["source_fp"]:
+            return "source_changed"
+        old_price, new_price = prev_entry.get("price", 0), fp["price"]
+        if old_price <= 0 or new_price <= 0:
+            return "no_snapshot"
+        if abs(new_price - old_price) / old_price * 100 >= MOVER_PRICE_DELTA_PCT:
+            return "price_moved"
+        return None
+
+    def reusable(self, side: str, pick: Dict) -> bool:
+        """Whether lookup() will return a cached result (no stats side effects)."""
+        planned = self._plan.get(f"{side}:{pick.get('symbol', '')}")
+        return planned is not None and planned["reason"] is None
+
+    def lookup(self, side: str, pick: Dict) -> Optional[Dict]:
+        """Cached cross-result for a clean symbol (fresh copy), else None."""
+        key = f"{side}:{pick.get('symbol', '')}"
+        planned = self._plan.get(key)
+        if planned is None:
+            return None
+        if planned["reason"] is not None:
+            self.stats["recomputed"] += 1
+            reasons = self.stats["reasons"]
+            reasons[planned["reason"]] = reasons.get(planned["reason"], 0) + 1
+            return None
+        prev_entry = self.prev["entries"][key]
+        self.entries[key] = prev_entry
+        self.stats["reused"] += 1
+        return json.loads(json.dumps(prev_entry["result"]))
+
+    def record(self, side: str, pick: Dict, cross_result: Dict):
+        """Remember a freshly computed cross-result (snapshot before later mutation)."""
+        key = f"{side}:{pick.get('symbol', '')}"
+        planned = self._plan.get(key)
+        if planned is None:
+            return
+        self.entries[key] = {
+            **planned["fp"],
+            "computed_at": datetime.now().isoformat(),
+            "result": json.loads(json.dumps(cross_result, default=str)),
+        }
+
+    def summary(self) -> str:
+        reasons = ", ".join(f"{k}={v}" for k, v in sorted(self.stats["reasons"].items()))
+        return (
+            f"reused {self.stats['reused']}, recomputed {self.stats['recomputed']}"
+            + (f" ({reasons})" if reasons else "")
+        )
+
+
+class SmartMoneyReuse:
+    """
+    Per-symbol reuse planner for scan_smart_money().
+
+    Every source record is digested per symbol; sources whose file
+    (mtime, size) is unchanged keep the last scan's digests without
+    re-hashing. A symbol is re-analysed when it is new to the ticker
+    superset or any of its slices changed; the others reuse their stored
+    analysis. Only analyses that passed the conviction threshold are
+    stored — a clean symbol without one didn't pass last time either.
+
+    Usage:
+        sm = SmartMoneyReuse(source_files, reuse=True)
+        todo = sm.plan(all_tickers, sources)   # symbols to analyse
+        passed = sm.merge(fresh_passed)        # + reused (fresh copies)
+        sm.save()
+    """
+
+    def __init__(self, source_files: Dict[str, Path], reuse: bool = True,
+                 state_file: Optional[Path] = None):
+        self.reuse = reuse
+        self.state_file = Path(state_file) if state_file else SMART_MONEY_STATE_FILE
+        self.today = datetime.now().strftime("%Y-%m-%d")
+        self.prev = _load_state(self.state_file, self.today)
+        self.files = {name: _file_fp(Path(path)) for name, path in source_files.items()}
+        self.digests: Dict[str, Dict[str, str]] = {}
+        self.tickers: List[str] = []
+        self.analyses: Dict[str, Dict] = {}
+        self._todo: set = set()
+        self.stats = {"reused": 0, "recomputed": 0}
+
+    def plan(self, tickers: Iterable[str], sources: Dict[str, Dict]) -> List[str]:
+        """Symbols of `tickers` whose analysis can't be reused, in input order."""
+        self.tickers = list(tickers)
+        prev_files = self.prev.get("files", {})
+        prev_digests = self.prev.get("digests", {})
+        dirty = set()
+        for name, records in sources.items():
+            old = prev_digests.get(name)
+            if old is not None and name in self.files and prev_files.get(name) == self.files[name]:
+                self.digests[name] = old
+                continue
+            new = {sym: _slice_digest(rec) for sym, rec in records.items()}
+            self.digests[name] = new
+            old = old or {}
+            dirty.update(sym for sym in old.keys() | new.keys() if old.get(sym) != new.get(sym))
+
+        if not self.reuse or not self.prev:
+            todo = self.tickers
+        else:
+            seen = set(self.prev.get("tickers", []))
+            todo = [sym for sym in self.tickers if sym in dirty or sym not in seen]
+        self._todo = set(todo)
+        self.stats["recomputed"] = len(todo)
+        self.stats["reused"] = len(self.tickers) - len(todo)
+        return todo
+
+    def merge(self, fresh: List[Dict]) -> List[Dict]:
+        """`fresh` (analyses of plan()'s symbols that passed) plus reused copies."""
+        prev_analyses = self.prev.get("analyses", {}) if self.reuse else {}
+        from artifact_store import dumps, loads
+        clean = [sym for sym in self.tickers if sym not in self._todo and sym in prev_analyses]
+        # Snapshot before the caller's flip penalties mutate them
+        self.analyses = {a["symbol"]: a for a in loads(dumps(fresh))}
+        self.analyses.update((sym, prev_analyses[sym]) for sym in clean)
+        return fresh + loads(dumps([prev_analyses[sym] for sym in clean]))
+
+    def save(self):
+        _save_state(self.state_file, {
+            "version": STATE_VERSION,
+            "day": self.today,
+            "saved_at": datetime.now().isoformat(),
+            "files": self.files,
+            "tickers": self.tickers,
+            "digests": self.digests,
+            "analyses": self.analyses,
+        })
@@ -0,0 +1,452 @@
+"""
+Streaming Indicator State
+=========================
+Per-symbol running state for the latest EMA(9/12/20/26), Wilder RSI-14,
+MACD(12,26,9), Bollinger(20), Wilder ATR-14, SMA ATR-14 and ATR%-14, so a
+rescan folds in only what changed instead of replaying 30-70 bars.
+
+Each symbol has one state, seeded from the first bar of the window the
+caller fetched, so its readings are exactly those of that window (the
+same values the per-window *_last() helpers return). It is split into:
+
+  - COMMITTED  — every bar but the last, folded into Wilder averages, EMA
+                 values and ATR accumulators (append_bar, O(1)).
+  - PROVISIONAL — the last bar (today's, still moving intraday). It is
+                 never folded in; readings() applies it to a scratch copy,
+                 so replace_provisional() is O(1) and repeatable.
+
+sync(symbol, bars) reconciles a freshly fetched window with the stored
+state. Intraday rescans fetch the same window, so only the provisional
+bar is replaced; a window that keeps its start and grows by a bar commits
+one bar. The state resumes after its last committed bar, found in the
+window by timestamp, and rebuilds from the window when the window starts
+at a different bar (a sliding window moved on a day: EMA/Wilder seeds
+depend on the first bar), or the last committed bar is missing or was
+revised (different t/o/h/l/c).
+
+Readings are bit-identical to the analysis.indicators *_last() helpers
+over the synced window (same values summed in the same order, same
+recursions). Verify with:
+
+    python3 -m analysis.indicator_state --verify
+
+State: data/indicator_state.json (rewritten atomically by save()).
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from analysis.indicators import bollinger_last
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = Path(__file__).parent.parent / "data" / "indicator_state.json"
+STATE_VERSION = 2
+MAX_IDLE_DAYS = 5        # Windows not synced for this long are dropped on save
+
+EMA_PERIODS = (9, 12, 20, 26)
+RSI_PERIOD = 14
+ATR_PERIOD = 14
+BB_PERIOD = 20
+MACD_SIGNAL = 9
+
+
+class _Smoother:
+    """SMA-seeded EMA or Wilder average, fed one value at a time."""
+
+    __slots__ = ("kind", "period", "seed", "value", "count")
+
+    def __init__(self, kind: str, period: int):
+        self.kind = kind
+        self.period = period
+        self.seed: List[float] = []
+        self.value: Optional[float] = None
+        self.count = 0
+
+    def push(self, x: float):
+        self.count += 1
+        if self.value is None:
+            self.seed.append(x)
+            if len(self.seed) == self.period:
+                self.value = sum(self.seed) / self.period
+                self.seed = []
+        elif self.kind == "ema":
+            self.value = (x - self.value) * (2 / (self.period + 1)) + self.value
+        else:
+            self.value = (self.value * (self.period - 1) + x) / self.period
+
+    def copy(self) -> "_Smoother":
+        s = _Smoother(self.kind, self.period)
+        s.seed, s.value, s.count = list(self.seed), self.value, self.count
+        return s
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"kind": self.kind, "period": self.period, "seed": self.seed,
+                "value": self.value, "count": self.count}
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "_Smoother":
+        s = cls(d["kind"], d["period"])
+        s.seed, s.value, s.count = list(d["seed"]), d["value"], d["count"]
+        return s
+
+
+def _bar_fp(bar: Dict) -> List:
+    return [bar.get("t", 0), bar.get("o", 0), bar.get("h", 0), bar.get("l", 0), bar.get("c", 0)]
+
+
+class IndicatorState:
+    """
+    Running indicators over one bar window.
+
+    Usage:
+        st = IndicatorState()
+        for bar in bars[:-1]:
+            st.append_bar(bar)
+        st.replace_provisional(bars[-1])
+        st.readings()["rsi14"]
+    """
+
+    def __init__(self):
+        self.n = 0                         # committed bars
+        self.first_t = None                # timestamp of the first committed bar
+        self.last_fp: Optional[List] = None
+        self.prev_close: Optional[float] = None
+        self.closes_tail: List[float] = []  # last BB_PERIOD closes
+        self.tr_tail: List[float] = []      # last ATR_PERIOD true ranges
+        self.ema = {p: _Smoother("ema", p) for p in EMA_PERIODS}
+        self.macd_signal = _Smoother("ema", MACD_SIGNAL)
+        self.rsi_gain = _Smoother("wilder", RSI_PERIOD)
+        self.rsi_loss = _Smoother("wilder", RSI_PERIOD)
+        self.atr = _Smoother("wilder", ATR_PERIOD)
+        self.atr_pct = _Smoother("wilder", ATR_PERIOD)   # skips bars with prev close <= 0
+        self.provisional: Optional[Dict] = None
+        self.synced = ""
+
+    # ── Updates ────────────────────────────────────────
+
+    def append_bar(self, bar: Dict):
+        """Commit a finished bar (O(1))."""
+        c = bar.get("c", 0)
+        if self.first_t is None:
+            self.first_t = bar.get("t", 0)
+        if self.prev_close is not None:
+            h, l, pc = bar.get("h", 0), bar.get("l", 0), self.prev_close
+            d = c - pc
+            self.rsi_gain.push(d if d > 0 else 0)
+            self.rsi_loss.push(-d if d < 0 else 0)
+            tr = max(h - l, abs(h - pc), abs(l - pc))
+            self.atr.push(tr)
+            if pc > 0:
+                self.atr_pct.push(tr)
+            self.tr_tail = (self.tr_tail + [tr])[-ATR_PERIOD:]
+        for s in self.ema.values():
+            s.push(c)
+        self.n += 1
+        if self.n >= 26:
+            self.macd_signal.push(self.ema[12].value - self.ema[26].value)
+        self.closes_tail = (self.closes_tail + [c])[-BB_PERIOD:]
+        self.prev_close = c
+        self.last_fp = _bar_fp(bar)
+
+    def replace_provisional(self, bar: Optional[Dict]):
+        """Set / replace today's in-progress bar (O(1), nothing is folded in)."""
+        self.provisional = bar
+
+    # ── Readings ───────────────────────────────────────
+
+    def readings(self) -> Dict[str, Any]:
+        """Latest values over committed bars + the provisional bar."""
+        st = self
+        if self.provisional is not None:
+            st = self._scratch()
+            st.append_bar(self.provisional)
+        n = st.n
+        last_close = st.prev_close if n else 0
+        out: Dict[str, Any] = {"bars": n}
+        for p in (9, 20):
+            out[f"ema{p}"] = st.ema[p].value if n >= p else last_close
+
+        if n < RSI_PERIOD + 1:
+            out["rsi14"] = 50.0
+        elif st.rsi_loss.value == 0:
+            out["rsi14"] = 100.0
+        else:
+            out["rsi14"] = 100 - (100 / (1 + st.rsi_gain.value / st.rsi_loss.value))
+
+        if n < 26:
+            out["macd"] = {"macd": 0, "signal": 0, "histogram": 0}
+        else:
+            line = st.ema[12].value - st.ema[26].value
+            sig = st.macd_signal.value
+            out["macd"] = ({"macd": line, "signal": 0, "histogram": 0} if sig is None
+                           else {"macd": line, "signal": sig, "histogram": line - sig})
+
+        out["bollinger"] = bollinger_last(st.closes_tail, BB_PERIOD)
+
+        short = n < ATR_PERIOD + 1
+        out["atr14"] = 0.0 if short else st.atr.value
+        out["atr_sma14"] = 0 if short else sum(st.tr_tail[-ATR_PERIOD:]) / ATR_PERIOD
+        if short or st.atr_pct.value is None or last_close <= 0:
+            out["atr_pct14"] = 0.0
+        else:
+            out["atr_pct14"] = st.atr_pct.value / last_close
+        return out
+
+    def _scratch(self) -> "IndicatorState":
+        # Tails are replaced, never mutated, by append_bar → sharing them is safe
+        st = IndicatorState.__new__(IndicatorState)
+        st.__dict__.update(self.__dict__)
+        st.ema = {p: s.copy() for p, s in self.ema.items()}
+        for name in ("macd_signal", "rsi_gain", "rsi_loss", "atr", "atr_pct"):
+            setattr(st, name, getattr(self, name).copy())
+        return st
+
+    # ── Serialization ──────────────────────────────────
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "n": self.n,
+            "first_t": self.first_t,
+            "last_fp": self.last_fp,
+            "prev_close": self.prev_close,
+            "closes_tail": self.closes_tail,
+            "tr_tail": self.tr_tail,
+            "ema": {str(p): s.to_dict() for p, s in self.ema.items()},
+            "macd_signal": self.macd_signal.to_dict(),
+            "rsi_gain": self.rsi_gain.to_dict(),
+            "rsi_loss": self.rsi_loss.to_dict(),
+            "atr": self.atr.to_dict(),
+            "atr_pct": self.atr_pct.to_dict(),
+            "provisional": self.provisional,
+            "synced": self.synced,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "IndicatorState":
+        st = cls()
+        st.n, st.last_fp, st.prev_close = d["n"], d["last_fp"], d["prev_close"]
+        st.first_t = d.get("first_t")
+        st.closes_tail, st.tr_tail = list(d["closes_tail"]), list(d["tr_tail"])
+        st.ema = {int(p): _Smoother.from_dict(s) for p, s in d["ema"].items()}
+        for name in ("macd_signal", "rsi_gain", "rsi_loss", "atr", "atr_pct"):
+            setattr(st, name, _Smoother.from_dict(d[name]))
+        st.provisional = d.get("provisional")
+        st.synced = d.get("synced", "")
+        return st
+
+
+def _resume_index(st: IndicatorState, bars: List[Dict], committed: int) -> Optional[int]:
+    """Index of the first bar after the state's last committed bar, or None to rebuild."""
+    if committed < 0:
+        return None
+    if st.n == 0:
+        return 0
+    if bars[0].get("t", 0) != st.first_t:
+        return None                        # different window → different seeds
+    last_t = st.last_fp[0]
+    for i in range(committed - 1, -1, -1):
+        t = bars[i].get("t", 0)
+        if t == last_t:
+            return i + 1 if _bar_fp(bars[i]) == st.last_fp else None
+        if t < last_t:
+            break
+    return None
+
+
+class IndicatorStore:
+    """
+    Persisted IndicatorState per symbol (thread-safe).
+
+    Usage:
+        store = indicator_store()
+        ind = store.sync("AAPL", bars).readings()
+        store.save()    # once per scan
+    """
+
+    def __init__(self, state_file: Optional[Path] = None):
+        self.state_file = Path(state_file) if state_file else STATE_FILE
+        self.states: Dict[str, IndicatorState] = {}
+        self.stats = {"reused": 0, "appended": 0, "rebuilt": 0}
+        self._dirty = False
+        self._lock = threading.RLock()
+        self._load()
+
+    def _load(self):
+        try:
+            if self.state_file.exists():
+                with open(self.state_file) as f:
+                    data = json.load(f)
+                if data.get("version") == STATE_VERSION:
+                    self.states = {k: IndicatorState.from_dict(v)
+                                   for k, v in data.get("states", {}).items()}
+        except Exception as e:
+            logger.debug(f"Indicator state unreadable — rebuilding from bars: {e}")
+            self.states = {}
+
+    def save(self):
+        """Persist all states (atomic); drops windows idle for MAX_IDLE_DAYS."""
+        with self._lock:
+            self._save()
+
+    def _save(self):
+        if not self._dirty:
+            return
+        cutoff = (datetime.now() - timedelta(days=MAX_IDLE_DAYS)).strftime("%Y-%m-%d")
+        self.states = {k: st for k, st in self.states.items() if st.synced >= cutoff}
+        payload = {
+            "version": STATE_VERSION,
+            "saved_at": datetime.now().isoformat(),
+            "states": {k: st.to_dict() for k, st in self.states.items()},
+        }
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.state_file.with_name(self.state_file.name + ".tmp")
+            with open(tmp, "w") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp, self.state_file)
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"Failed to save indicator state: {e}")
+
+    def sync(self, symbol: str, bars: List[Dict]) -> IndicatorState:
+        """
+        State for `bars` (oldest first; the last bar is treated as
+        provisional). Folds in only bars committed since the last sync.
+        """
+        committed = len(bars) - 1
+        with self._lock:
+            st = self.states.get(symbol)
+            start = _resume_index(st, bars, committed) if st is not None else None
+            if start is None:
+                st = IndicatorState()
+                self.states[symbol] = st
+                self.stats["rebuilt"] += 1
+                start = 0
+            elif start < committed:
+                self.stats["appended"] += 1
+            else:
+                self.stats["reused"] += 1
+            for bar in bars[start:committed]:
+                st.append_bar(bar)
+            st.replace_provisional(bars[-1] if bars else None)
+            st.synced = datetime.now().strftime("%Y-%m-%d")
+            self._dirty = True
+            return st
+
+    def summary(self) -> str:
+        return ", ".join(f"{k} {v}" for k, v in self.stats.items())
+
+
+_store: Optional[IndicatorStore] = None
+_store_lock = threading.Lock()
+
+
+def indicator_store() -> IndicatorStore:
+    """Process-wide store (loaded on first use)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = IndicatorStore()
+        return _store
+
+
+# ═══════════════════════════════════════════════════════
+# Parity check / benchmark
+# ═══════════════════════════════════════════════════════
+
+def _full_recompute(bars: List[Dict]) -> Dict[str, Any]:
+    from analysis.indicators import (
+        atr_pct_last, atr_sma_last, atr_wilder_last, ema_last, macd_last, rsi_last,
+    )
+    closes = [b.get("c", 0) for b in bars]
+    return {
+        "bars": len(bars),
+        "ema9": ema_last(closes, 9),
+        "ema20": ema_last(closes, 20),
+        "rsi14": rsi_last(closes, 14),
+        "macd": macd_last(closes),
+        "bollinger": bollinger_last(closes, 20),
+        "atr14": atr_wilder_last(bars, 14),
+        "atr_sma14": atr_sma_last(bars, 14),
+        "atr_pct14": atr_pct_last(bars, 14),
+    }
+
+
+def run_verification(n: int = 200, rescans_per_day: int = 6, window: int = 30) -> Dict[str, Any]:
+    """
+    Replay each synthetic symbol day by day through a sliding `window`-bar
+    fetch with intraday provisional updates, checking every reading
+    against a full recompute over the fetched window; then time a
+    steady-state intraday rescan (store sync) vs full recompute.
+    """
+    import random
+    import tempfile
+    import time
+    from analysis.indicators import _synthetic_bars
+
+    rng = random.Random(3)
+    data = _synthetic_bars(n)
+    checks = mismatches = rebuilt = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "state.json"
+        for day in range(1, max(len(b) for b in data.values()) + 1):
+            store = IndicatorStore(path)             # reload from disk every "day"
+            for sym, bars in data.items():
+                if day > len(bars):
+                    continue
+                lo = max(0, day - window)
+                for _ in range(rescans_per_day):
+                    live = dict(bars[day - 1])
+                    live["c"] = live.get("c", 0) * (1 + rng.gauss(0, 0.005))
+                    fetched = bars[lo:day - 1] + [live]
+                    got = store.sync(sym, fetched).readings()
+                    checks += 1
+                    mismatches += got != _full_recompute(fetched)
+                store.sync(sym, bars[lo:day])        # close: final bar
+            store.save()
+            rebuilt += store.stats["rebuilt"]
+
+        store = IndicatorStore(path)
+        windows = {s: b for s, b in data.items() if b}
+        for s, b in windows.items():
+            store.sync(s, b)
+        t0 = time.perf_counter()
+        for s, b in windows.items():
+            store.sync(s, b).readings()
+        t_stream = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for b in windows.values():
+            _full_recompute(b)
+        t_full = time.perf_counter() - t0
+    return {
+        "checks": checks,
+        "mismatches": mismatches,
+        "rebuilt": rebuilt,
+        "symbols": len(windows),
+        "full_ms": round(t_full * 1000, 2),
+        "stream_ms": round(t_stream * 1000, 2),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Streaming indicator state parity check")
+    parser.add_argument("--verify", action="store_true", help="Replay windows vs full recompute")
+    parser.add_argument("--symbols", type=int, default=200)
+    args = parser.parse_args()
+
+    r = run_verification(n=args.symbols)
+    ok = r["mismatches"] == 0
+    print(f"{'✅' if ok else '❌'} {r['checks']} readings checked, {r['mismatches']} mismatches, "
+          f"{r['rebuilt']} rebuilds for {r['symbols']} symbols")
+    print(f"Intraday rescan, {r['symbols']} symbols: full recompute {r['full_ms']:.2f} ms, "
+          f"streaming state {r['stream_ms']:.2f} ms")
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,702 @@
+"""
+Shared Technical Indicators
+===========================
+One NumPy implementation of RSI, EMA, MACD, Bollinger Bands and ATR for
+the modules that used to hand-roll them (cross_analyzer,
+MarketDirectionPredictor, move_potential, _3pm_analysis).
+
+Layout: a candidate set is a 2-D float matrix (symbols × bars), each row
+LEFT-aligned (oldest bar in column 0) and NaN-padded on the right, plus a
+`lengths` vector with the number of real bars per row. Every series
+function returns a matrix of the same shape holding the FULL indicator
+series — NaN before warm-up and past each row's length.
+
+compute_all(bars_by_symbol) runs every indicator over a whole candidate
+set in one call and returns an IndicatorSet: cross_analyzer reads its
+latest readings and keeps the series on market_data, and chart_generator
+plots those same series instead of recomputing them.
+move_potential.compute_raw_components uses atr_pct() directly.
+
+Recursive indicators (EMA, Wilder RSI/ATR) loop over bar columns only;
+all symbols advance together in one vector op per bar. Seed averages and
+rolling window sums reproduce Python's sum() and Bollinger's square /
+square root go through Python's ** so the results are bit-identical to
+the scalar helpers they replace (same float ops, same order, on any
+interpreter version). Verify with:
+
+    python3 -m analysis.indicators --verify
+
+The *_last() helpers are the single-series loops (old signatures and
+fallbacks: 50.0 RSI on short input, prices[-1] EMA, 0 ATR) for callers
+that only need one symbol's latest reading; a 1-row matrix is slower
+than a plain loop at that size.
+"""
+
+import sys
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+_PLAIN_SUM = sys.version_info < (3, 12)
+
+
+# ═══════════════════════════════════════════════════════
+# Matrix construction
+# ═══════════════════════════════════════════════════════
+
+def to_matrix(series: Sequence[Sequence[float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pack ragged per-symbol series into a left-aligned, NaN-padded matrix.
+
+    Returns:
+        (matrix, lengths) — matrix is float64 (symbols × max_len).
+    """
+    lengths = np.array([len(s) for s in series], dtype=np.int64)
+    width = int(lengths.max()) if len(series) else 0
+    mat = np.full((len(series), width), np.nan)
+    for i, s in enumerate(series):
+        if len(s):
+            mat[i, :len(s)] = s
+    return mat, lengths
+
+
+def bars_to_matrices(
+    bars_list: Sequence[Sequence[Dict[str, Any]]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """(high, low, close, lengths) matrices from Polygon-style bar dicts."""
+    lengths = np.array([len(bars) for bars in bars_list], dtype=np.int64)
+    width = int(lengths.max()) if len(bars_list) else 0
+    out = np.full((3, len(bars_list), width), np.nan)
+    # One pass over the dicts, then a single scatter into the padded matrices
+    flat = [(b.get("h", 0), b.get("l", 0), b.get("c", 0)) for bars in bars_list for b in bars]
+    if flat:
+        rows = np.repeat(np.arange(len(bars_list)), lengths)
+        cols = np.arange(len(flat)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        out[:, rows, cols] = np.array(flat, dtype=float).T
+    return out[0], out[1], out[2], lengths
+
+
+def last(series: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Value at each row's final real bar (NaN for empty rows)."""
+    out = np.full(len(lengths), np.nan)
+    has = lengths > 0
+    rows = np.nonzero(has)[0]
+    out[has] = series[rows, lengths[has] - 1]
+    return out
+
+
+def _row_sums(mat: np.ndarray) -> np.ndarray:
+    """
+    sum() of each row along the last axis, matching Python's builtin exactly.
+
+    Up to 3.11 sum() is plain left-to-right addition, which a column loop
+    reproduces vectorized; 3.12+ compensates float sums, so there we call
+    the builtin per row.
+    """
+    if _PLAIN_SUM:
+        acc = 0.0 + mat[..., 0]
+        for k in range(1, mat.shape[-1]):
+            acc = acc + mat[..., k]
+        return acc
+    flat = mat.reshape(-1, mat.shape[-1]).tolist()
+    return np.array([sum(r) for r in flat], dtype=float).reshape(mat.shape[:-1])
+
+
+def _py_pow(mat: np.ndarray, exp: float) -> np.ndarray:
+    """Elementwise Python float ** — libm pow is not always the correctly
+    rounded x*x / sqrt NumPy uses, and the scalar code used **."""
+    return np.array([v ** exp for v in mat.ravel().tolist()], dtype=float).reshape(mat.shape)
+
+
+def _window_sums(mat: np.ndarray, period: int) -> np.ndarray:
+    """Rolling `period` sums; column j holds sum(mat[:, j-period+1 : j+1])."""
+    out = np.full(mat.shape, np.nan)
+    if mat.shape[1] >= period:
+        windows = np.lib.stride_tricks.sliding_window_view(mat, period, axis=1)
+        out[:, period - 1:] = _row_sums(windows)
+    return out
+
+
+def _mask(series: np.ndarray, lengths: np.ndarray, first: int) -> np.ndarray:
+    """NaN out columns before `first` and past each row's length."""
+    cols = np.arange(series.shape[1])
+    valid = (cols >= first) & (cols[None, :] < lengths[:, None])
+    return np.where(valid, series, np.nan)
+
+
+# ═══════════════════════════════════════════════════════
+# Series (symbols × bars → symbols × bars)
+# ═══════════════════════════════════════════════════════
+
+def _ema_from(x: np.ndarray, lengths: np.ndarray, period: int, start: int) -> np.ndarray:
+    """EMA seeded with the SMA of x[:, start:start+period]."""
+    end = start + period
+    out = np.full(x.shape, np.nan)
+    if x.shape[1] < end:
+        return out
+    mult = 2 / (period + 1)
+    val = _row_sums(x[:, start:end]) / period
+    out[:, end - 1] = val
+    for j in range(end, x.shape[1]):
+        val = (x[:, j] - val) * mult + val
+        out[:, j] = val
+    return _mask(out, lengths, end - 1)
+
+
+def ema(closes: np.ndarray, lengths: np.ndarray, period: int) -> np.ndarray:
+    """EMA series (SMA seed at column period-1)."""
+    return _ema_from(closes, lengths, period, 0)
+
+
+def rsi_wilder(closes: np.ndarray, lengths: np.ndarray, period: int = 14) -> np.ndarray:
+    """Wilder-smoothed RSI series, first value at column `period`."""
+    out = np.full(closes.shape, np.nan)
+    if closes.shape[1] < period + 1:
+        return out
+    deltas = closes[:, 1:] - closes[:, :-1]          # delta for column j is deltas[:, j-1]
+    gains = np.where(deltas > 0, deltas, 0.0)
+    losses = np.where(deltas < 0, -deltas, 0.0)
+    avg_gain = _row_sums(gains[:, :period]) / period
+    avg_loss = _row_sums(losses[:, :period]) / period
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[:, period] = _rsi(avg_gain, avg_loss)
+        for i in range(period, deltas.shape[1]):
+            avg_gain = (avg_gain * (period - 1) + gains[:, i]) / period
+            avg_loss = (avg_loss * (period - 1) + losses[:, i]) / period
+            out[:, i + 1] = _rsi(avg_gain, avg_loss)
+    return _mask(out, lengths, period)
+
+
+def _rsi(avg_gain: np.ndarray, avg_loss: np.ndarray) -> np.ndarray:
+    return np.where(avg_loss == 0, 100.0, 100 - (100 / (1 + avg_gain / avg_loss)))
+
+
+def rsi_simple(closes: np.ndarray, lengths: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    RSI from plain averages of the last `period` deltas (the _3pm_analysis
+    variant): no smoothing, 0.001 floor when a side has no moves.
+    """
+    out = np.full(closes.shape, np.nan)
+    if closes.shape[1] < period + 1:
+        return out
+    deltas = closes[:, 1:] - closes[:, :-1]
+    gain_sum = _window_sums(np.where(deltas > 0, deltas, 0.0), period)
+    loss_sum = _window_sums(np.where(deltas < 0, -deltas, 0.0), period)
+    has_gain = _window_sums((deltas > 0).astype(float), period) > 0
+    has_loss = _window_sums((deltas < 0).astype(float), period) > 0
+    avg_gain = np.where(has_gain, gain_sum / period, 0.001)
+    avg_loss = np.where(has_loss, loss_sum / period, 0.001)
+    out[:, 1:] = 100 - (100 / (1 + avg_gain / avg_loss))
+    return _mask(out, lengths, period)
+
+
+def macd(
+    closes: np.ndarray, lengths: np.ndarray,
+    fast: int = 12, slow: int = 26, signal: int = 9,
+) -> Dict[str, np.ndarray]:
+    """
+    MACD line, signal line and histogram series.
+
+    The MACD line starts at column slow-1; the signal line is an EMA of the
+    MACD line seeded over its first `signal` values.
+    """
+    line = ema(closes, lengths, fast) - ema(closes, lengths, slow)
+    sig = _ema_from(line, lengths, signal, slow - 1)
+    return {"macd": line, "signal": sig, "histogram": line - sig}
+
+
+_BB_KEYS = ("upper", "middle", "lower", "width", "position")
+
+
+def _bands(windows: np.ndarray, price: np.ndarray, period: int, std_mult: float) -> Dict[str, np.ndarray]:
+    """Bollinger readings for stacked (..., period) windows ending at `price`."""
+    middle = _row_sums(windows) / period
+    dev = _py_pow(windows - middle[..., None], 2)
+    std_dev = _py_pow(_row_sums(dev) / period, 0.5)
+    upper = middle + std_mult * std_dev
+    lower = middle - std_mult * std_dev
+    band = upper - lower
+    with np.errstate(divide="ignore", invalid="ignore"):
+        width = np.where(middle > 0, band / middle, 0.0)
+        position = np.where(band > 0, (price - lower) / band, 0.5)
+    return dict(zip(_BB_KEYS, (upper, middle, lower, width, position)))
+
+
+def bollinger(
+    closes: np.ndarray, lengths: np.ndarray, period: int = 20, std_mult: float = 2.0,
+) -> Dict[str, np.ndarray]:
+    """Bollinger upper/middle/lower/width/position series (population std)."""
+    out = {k: np.full(closes.shape, np.nan) for k in _BB_KEYS}
+    if closes.shape[1] < period:
+        return out
+    windows = np.lib.stride_tricks.sliding_window_view(closes, period, axis=1)
+    for k, v in _bands(windows, closes[:, period - 1:], period, std_mult).items():
+        out[k][:, period - 1:] = v
+    return {k: _mask(v, lengths, period - 1) for k, v in out.items()}
+
+
+def bollinger_latest(
+    closes: np.ndarray, lengths: np.ndarray, period: int = 20, std_mult: float = 2.0,
+) -> Dict[str, np.ndarray]:
+    """
+    Bollinger readings at each row's final bar only (vectors, NaN when the
+    row is shorter than `period`). Much cheaper than the full series when
+    only the latest band is needed.
+    """
+    ok = lengths >= period
+    out = {k: np.full(len(lengths), np.nan) for k in _BB_KEYS}
+    if not ok.any():
+        return out
+    rows = np.nonzero(ok)[0]
+    idx = (lengths[ok] - period)[:, None] + np.arange(period)
+    windows = closes[rows[:, None], idx]
+    for k, v in _bands(windows, windows[:, -1], period, std_mult).items():
+        out[k][ok] = v
+    return out
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """True range series; column 0 is NaN (no previous close)."""
+    tr = np.full(close.shape, np.nan)
+    pc = close[:, :-1]
+    h, l = high[:, 1:], low[:, 1:]
+    tr[:, 1:] = np.maximum(np.maximum(h - l, np.abs(h - pc)), np.abs(l - pc))
+    return tr
+
+
+def _wilder_from(x: np.ndarray, lengths: np.ndarray, period: int, start: int) -> np.ndarray:
+    """Wilder smoothing of x seeded with the SMA of x[:, start:start+period]."""
+    end = start + period
+    out = np.full(x.shape, np.nan)
+    if x.shape[1] < end:
+        return out
+    val = _row_sums(x[:, start:end]) / period
+    out[:, end - 1] = val
+    for j in range(end, x.shape[1]):
+        val = (val * (period - 1) + x[:, j]) / period
+        out[:, j] = val
+    return _mask(out, lengths, end - 1)
+
+
+def atr_wilder(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, lengths: np.ndarray, period: int = 14,
+) -> np.ndarray:
+    """Wilder ATR series, first value at column `period`."""
+    return _wilder_from(true_range(high, low, close), lengths, period, 1)
+
+
+def atr_sma(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, lengths: np.ndarray, period: int = 14,
+) -> np.ndarray:
+    """Simple-average ATR over the trailing `period` true ranges."""
+    return _mask(_window_sums(true_range(high, low, close), period) / period, lengths, period)
+
+
+def atr_pct(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, lengths: np.ndarray, period: int = 14,
+) -> np.ndarray:
+    """
+    Latest Wilder ATR as a fraction of the latest close, per symbol
+    (move_potential semantics: bars whose previous close is <= 0 are
+    skipped; 0.0 when fewer than `period` usable true ranges remain).
+
+    Returns a vector, not a series — skipped bars leave no bar-aligned
+    ATR to report.
+    """
+    n = len(lengths)
+    result = np.zeros(n)
+    if close.shape[1] < 2:
+        return result
+    tr = true_range(high, low, close)[:, 1:]
+    cols = np.arange(tr.shape[1])
+    usable = (close[:, :-1] > 0) & (cols[None, :] < (lengths - 1)[:, None])
+    # Compact usable TRs to the left of each row (stable keeps bar order)
+    order = np.argsort(~usable, axis=1, kind="stable")
+    compact = np.take_along_axis(np.where(usable, tr, np.nan), order, axis=1)
+    counts = usable.sum(axis=1)
+    atr = last(_wilder_from(compact, counts, period, 0), counts)
+    latest_close = last(close, lengths)
+    ok = (lengths >= period + 1) & (counts >= period) & (latest_close > 0)
+    result[ok] = atr[ok] / latest_close[ok]
+    return result
+
+
+# ═══════════════════════════════════════════════════════
+# Candidate set (every indicator, one call)
+# ═══════════════════════════════════════════════════════
+
+_NEUTRAL_BB = {"upper": 0, "middle": 0, "lower": 0, "width": 0, "position": 0.5}
+
+
+class IndicatorSet:
+    """
+    Full EMA(9/12/20/26), Wilder RSI-14, MACD(12,26,9), Bollinger(20),
+    Wilder / SMA ATR-14 series for a candidate set, built by compute_all().
+
+    series(symbol) is what a chart plots; at(symbol, n) reads the series at
+    bar n-1 with the *_last() fallbacks, so at(symbol) equals the *_last()
+    helpers over the whole window and at(symbol, len(bars) - 5) equals them
+    over bars[:-5].
+    """
+
+    def __init__(self, bars_by_symbol: Dict[str, Sequence[Dict[str, Any]]]):
+        self.symbols = list(bars_by_symbol)
+        self._row = {s: i for i, s in enumerate(self.symbols)}
+        self._bars = [bars_by_symbol[s] for s in self.symbols]
+        high, low, close, lengths = bars_to_matrices(self._bars)
+        self.lengths = lengths
+        s = {f"ema{p}": ema(close, lengths, p) for p in (9, 12, 20, 26)}
+        s["rsi14"] = rsi_wilder(close, lengths, 14)
+        m = macd(close, lengths)
+        s["macd"], s["macd_signal"], s["macd_histogram"] = m["macd"], m["signal"], m["histogram"]
+        for k, v in bollinger(close, lengths, 20).items():
+            s[f"bb_{k}"] = v
+        s["atr14"] = atr_wilder(high, low, close, lengths, 14)
+        s["atr_sma14"] = atr_sma(high, low, close, lengths, 14)
+        self._series = s
+        self._atr_pct = atr_pct(high, low, close, lengths, 14)
+
+    def series(self, symbol: str) -> Dict[str, np.ndarray]:
+        """Every series for one symbol, one value per bar (NaN during warm-up)."""
+        i = self._row[symbol]
+        n = int(self.lengths[i])
+        return {k: v[i, :n] for k, v in self._series.items()}
+
+    def at(self, symbol: str, n: int = None) -> Dict[str, Any]:
+        """Readings over the symbol's first `n` bars (default: all of them)."""
+        i = self._row[symbol]
+        full = int(self.lengths[i])
+        n = full if n is None else n
+
+        def v(name):
+            return float(self._series[name][i, n - 1])
+
+        out: Dict[str, Any] = {"bars": n}
+        last_close = self._bars[i][n - 1].get("c", 0) if n else 0
+        for p in (9, 20):
+            out[f"ema{p}"] = v(f"ema{p}") if n >= p else last_close
+        out["rsi14"] = v("rsi14") if n >= 15 else 50.0
+        if n < 26:
+            out["macd"] = {"macd": 0, "signal": 0, "histogram": 0}
+        elif n < 34:
+            out["macd"] = {"macd": v("macd"), "signal": 0, "histogram": 0}
+        else:
+            out["macd"] = {"macd": v("macd"), "signal": v("macd_signal"),
+                           "histogram": v("macd_histogram")}
+        out["bollinger"] = ({k: v(f"bb_{k}") for k in _BB_KEYS} if n >= 20
+                            else dict(_NEUTRAL_BB))
+        out["atr14"] = v("atr14") if n >= 15 else 0.0
+        out["atr_sma14"] = v("atr_sma14") if n >= 15 else 0
+        out["atr_pct14"] = (float(self._atr_pct[i]) if n == full
+                            else atr_pct_last(self._bars[i][:n]))
+        return out
+
+
+def compute_all(bars_by_symbol: Dict[str, Sequence[Dict[str, Any]]]) -> IndicatorSet:
+    """
+    Every indicator for a whole candidate set in one vectorized pass.
+
+    Args:
+        bars_by_symbol: symbol → Polygon-style bar dicts, oldest first
+
+    Returns:
+        IndicatorSet — full series per symbol plus *_last()-equivalent readings
+    """
+    return IndicatorSet(bars_by_symbol)
+
+
+# ═══════════════════════════════════════════════════════
+# Single-series helpers (latest value only)
+# ═══════════════════════════════════════════════════════
+# Plain loops: for one short series they beat a 1-row matrix by ~20x.
+# These are the former per-module helpers verbatim, and --verify proves
+# the batch series above match them bit-for-bit on every bar.
+
+def ema_last(prices: List[float], period: int) -> float:
+    """Latest EMA; prices[-1] (or 0) when shorter than the period."""
+    if not prices or len(prices) < period:
+        return prices[-1] if prices else 0
+    multiplier = 2 / (period + 1)
+    ema_ = sum(prices[:period]) / period  # SMA seed
+    for price in prices[period:]:
+        ema_ = (price - ema_) * multiplier + ema_
+    return ema_
+
+
+def rsi_last(prices: List[float], period: int = 14) -> float:
+    """Latest Wilder RSI; 50.0 when there are not enough prices."""
+    if len(prices) < period + 1:
+        return 50.0
+    deltas = [prices[i] - prices[i - 1] for i in range(1, len(prices))]
+    gains = [d if d > 0 else 0 for d in deltas]
+    losses = [-d if d < 0 else 0 for d in deltas]
+
+    avg_gain = sum(gains[:period]) / period
+    avg_loss = sum(losses[:period]) / period
+
+    for i in range(period, len(deltas)):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+
+    if avg_loss == 0:
+        return 100.0
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+
+def rsi_simple_last(prices: List[float], period: int = 14) -> float:
+    """Latest simple-average RSI over the last `period` deltas; 50.0 when too short."""
+    if len(prices) < period + 1:
+        return 50.0
+    deltas = [prices[i] - prices[i - 1] for i in range(1, len(prices))]
+    gains = [d for d in deltas[-period:] if d > 0]
+    losses = [-d for d in deltas[-period:] if d < 0]
+    avg_gain = sum(gains) / period if gains else 0.001
+    avg_loss = sum(losses) / period if losses else 0.001
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+
+def macd_last(prices: List[float]) -> Dict[str, float]:
+    """Latest MACD (12, 26, 9); signal/histogram are 0 until the signal line exists."""
+    if len(prices) < 26:
+        return {"macd": 0, "signal": 0, "histogram": 0}
+
+    def ema_series(data, period):
+        result = [sum(data[:period]) / period]
+        mult = 2 / (period + 1)
+        for val in data[period:]:
+            result.append((val - result[-1]) * mult + result[-1])
+        return result
+
+    ema12 = ema_series(prices, 12)
+    ema26 = ema_series(prices, 26)
+
+    # Align lengths
+    diff = len(ema12) - len(ema26)
+    ema12 = ema12[diff:]
+
+    macd_line = [a - b for a, b in zip(ema12, ema26)]
+    if len(macd_line) >= 9:
+        signal_line = ema_series(macd_line, 9)
+        histogram = macd_line[-1] - signal_line[-1]
+        return {"macd": macd_line[-1], "signal": signal_line[-1], "histogram": histogram}
+    return {"macd": macd_line[-1] if macd_line else 0, "signal": 0, "histogram": 0}
+
+
+def bollinger_last(prices: List[float], period: int = 20, std_mult: float = 2.0) -> Dict[str, float]:
+    """Latest Bollinger upper, middle, lower, width, position; neutral values when too short."""
+    if len(prices) < period:
+        return {"upper": 0, "middle": 0, "lower": 0, "width": 0, "position": 0.5}
+    window = prices[-period:]
+    middle = sum(window) / period
+    variance = sum((p - middle) ** 2 for p in window) / period
+    std_dev = variance ** 0.5
+    upper = middle + std_mult * std_dev
+    lower = middle - std_mult * std_dev
+    width = (upper - lower) / middle if middle > 0 else 0
+    pos = (prices[-1] - lower) / (upper - lower) if (upper - lower) > 0 else 0.5
+    return {"upper": upper, "middle": middle, "lower": lower, "width": width, "position": pos}
+
+
+def _true_ranges(bars: List[Dict], skip_bad_close: bool = False) -> List[float]:
+    trs = []
+    for i in range(1, len(bars)):
+        h, l, pc = bars[i].get("h", 0), bars[i].get("l", 0), bars[i - 1].get("c", 0)
+        if skip_bad_close and pc <= 0:
+            continue
+        trs.append(max(h - l, abs(h - pc), abs(l - pc)))
+    return trs
+
+
+def atr_wilder_last(bars: List[Dict], period: int = 14) -> float:
+    """Latest Wilder ATR; 0.0 when there are fewer than period+1 bars."""
+    if len(bars) < period + 1:
+        return 0.0
+    trs = _true_ranges(bars)
+    atr = sum(trs[:period]) / period
+    for tr in trs[period:]:
+        atr = (atr * (period - 1) + tr) / period
+    return atr
+
+
+def atr_sma_last(bars: List[Dict], period: int = 14) -> float:
+    """Mean of the last `period` true ranges; 0 when there are fewer than period+1 bars."""
+    if len(bars) < period + 1:
+        return 0
+    return sum(_true_ranges(bars)[-period:]) / period
+
+
+def atr_pct_last(bars: List[Dict], period: int = 14) -> float:
+    """
+    Wilder ATR as a fraction of the latest close (0.0 when unavailable).
+    Bars whose previous close is <= 0 are skipped.
+    """
+    if len(bars) < period + 1:
+        return 0.0
+    trs = _true_ranges(bars, skip_bad_close=True)
+    if len(trs) < period:
+        return 0.0
+    atr = sum(trs[:period]) / period
+    for tr in trs[period:]:
+        atr = (atr * (period - 1) + tr) / period
+    latest_close = bars[-1].get("c", 0)
+    if latest_close <= 0:
+        return 0.0
+    return atr / latest_close
+
+
+# ═══════════════════════════════════════════════════════
+# Parity check / benchmark
+# ═══════════════════════════════════════════════════════
+
+def _rsi_chart_ref(prices, period=14):
+    """The padded RSI loop chart_generator ran before it plotted the shared series."""
+    if len(prices) < period + 1:
+        return [50.0] * len(prices)
+    rsi_values = [50.0] * period
+    deltas = [prices[i] - prices[i - 1] for i in range(1, len(prices))]
+    gains = [max(d, 0) for d in deltas[:period]]
+    losses = [abs(min(d, 0)) for d in deltas[:period]]
+    avg_gain = sum(gains) / period
+    avg_loss = sum(losses) / period
+    for i in range(period, len(deltas)):
+        delta = deltas[i]
+        avg_gain = (avg_gain * (period - 1) + max(delta, 0)) / period
+        avg_loss = (avg_loss * (period - 1) + abs(min(delta, 0))) / period
+        if avg_loss == 0:
+            rsi = 100.0
+        else:
+            rs = avg_gain / avg_loss
+            rsi = 100.0 - (100.0 / (1.0 + rs))
+        rsi_values.append(rsi)
+    return rsi_values
+
+
+def _synthetic_bars(n: int, seed: int = 11, max_len: int = 70) -> Dict[str, List[Dict]]:
+    import random
+    rng = random.Random(seed)
+    out = {}
+    for i in range(n):
+        length = rng.choice([0, 1, 5, 14, 15, 20, 26, 33, 34, 35]) if i % 10 == 0 else rng.randint(36, max_len)
+        price = rng.uniform(3, 600)
+        bars = []
+        for k in range(length):
+            o = price
+            price = max(0.5, price * (1 + rng.gauss(0, 0.03)))
+            hi = max(o, price) * (1 + abs(rng.gauss(0, 0.01)))
+            lo = min(o, price) * (1 - abs(rng.gauss(0, 0.01)))
+            if rng.random() < 0.1:
+                price = round(price)               # flat runs / integer closes
+            bars.append({"t": 1_700_000_000_000 + k * 86_400_000, "o": o, "h": hi, "l": lo,
+                         "c": price if (i % 17 or k != 3) else 0})
+        out[f"S{i:04d}"] = bars
+    return out
+
+
+def _same(a, b) -> bool:
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_same(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    return a == b or (a != a and b != b)
+
+
+def run_verification(n: int = 500, repeats: int = 3) -> List[Dict[str, Any]]:
+    """Bit-for-bit parity of the batch series vs the scalar loops, plus timings."""
+    import time
+
+    data = _synthetic_bars(n)
+    symbols = list(data)
+    closes_list = [[b["c"] for b in data[s]] for s in symbols]
+    high, low, close, lengths = bars_to_matrices([data[s] for s in symbols])
+
+    rows = []
+
+    def check(name, scalar_fn, batch_fn, pick):
+        t_scalar = t_batch = float("inf")
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            ref = [scalar_fn(i) for i in range(n)]
+            t_scalar = min(t_scalar, time.perf_counter() - t0)
+            t0 = time.perf_counter()
+            res = batch_fn()
+            t_batch = min(t_batch, time.perf_counter() - t0)
+        got = [pick(res, i) for i in range(n)]
+        rows.append({
+            "indicator": name,
+            "scalar_ms": round(t_scalar * 1000, 2),
+            "batch_ms": round(t_batch * 1000, 2),
+            "identical": all(_same(r, g) for r, g in zip(ref, got)),
+        })
+
+    # Series are checked against the scalar helper on every prefix, so each
+    # bar of the full series is verified, not just the last one
+    def per_prefix(fn):
+        return lambda i: [fn(closes_list[i][:k]) for k in range(1, len(closes_list[i]) + 1)]
+
+    def per_prefix_bars(fn):
+        return lambda i: [fn(data[symbols[i]][:k]) for k in range(1, len(data[symbols[i]]) + 1)]
+
+    def pick_series(fallback_short, min_len):
+        def pick(series, i):
+            return [fallback_short(i, k) if k < min_len else float(series[i, k - 1])
+                    for k in range(1, lengths[i] + 1)]
+        return pick
+
+    for period in (9, 20):
+        check(f"ema{period}", per_prefix(lambda p, period=period: ema_last(p, period)),
+              lambda period=period: ema(close, lengths, period),
+              pick_series(lambda i, k: closes_list[i][k - 1], period))
+    check("rsi14 (wilder)", per_prefix(rsi_last), lambda: rsi_wilder(close, lengths),
+          pick_series(lambda i, k: 50.0, 15))
+    check("rsi14 (chart)", lambda i: _rsi_chart_ref(closes_list[i]),
+          lambda: rsi_wilder(close, lengths),
+          lambda s, i: ([50.0] * lengths[i] if lengths[i] < 15 else
+                        [50.0] * 14 + [float(v) for v in s[i, 15:lengths[i]]]))
+    check("rsi14 (simple)", per_prefix(rsi_simple_last), lambda: rsi_simple(close, lengths),
+          pick_series(lambda i, k: 50.0, 15))
+
+    def pick_macd(m, i):
+        out = []
+        for k in range(1, lengths[i] + 1):
+            if k < 26:
+                out.append({"macd": 0, "signal": 0, "histogram": 0})
+            elif k < 34:
+                out.append({"macd": float(m["macd"][i, k - 1]), "signal": 0, "histogram": 0})
+            else:
+                out.append({"macd": float(m["macd"][i, k - 1]),
+                            "signal": float(m["signal"][i, k - 1]),
+                            "histogram": float(m["histogram"][i, k - 1])})
+        return out
+    check("macd", per_prefix(macd_last), lambda: macd(close, lengths), pick_macd)
+
+    def pick_bb(b, i):
+        return [{"upper": 0, "middle": 0, "lower": 0, "width": 0, "position": 0.5} if k < 20
+                else {key: float(v[i, k - 1]) for key, v in b.items()}
+                for k in range(1, lengths[i] + 1)]
+    check("bollinger", per_prefix(bollinger_last), lambda: bollinger(close, lengths), pick_bb)
+    check("atr14 (wilder)", per_prefix_bars(atr_wilder_last),
+          lambda: atr_wilder(high, low, close, lengths), pick_series(lambda i, k: 0.0, 15))
+    check("atr14 (sma)", per_prefix_bars(atr_sma_last),
+          lambda: atr_sma(high, low, close, lengths), pick_series(lambda i, k: 0, 15))
+    check("atr% (latest)", lambda i: atr_pct_last(data[symbols[i]]),
+          lambda: atr_pct(high, low, close, lengths), lambda v, i: float(v[i]))
+    return rows
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Indicator library parity check / benchmark")
+    parser.add_argument("--verify", action="store_true", help="Bit-for-bit parity vs scalar loops")
+    parser.add_argument("--symbols", type=int, default=500)
+    args = parser.parse_args()
+
+    rows = run_verification(n=args.symbols)
+    print(f"{'indicator':<26} {'scalar ms':>10} {'batch ms':>10}  parity")
+    for r in rows:
+        print(f"{r['indicator']:<26} {r['scalar_ms']:>10.2f} {r['batch_ms']:>10.2f}  "
+              f"{'✅' if r['identical'] else '❌'}")
+    sys.exit(0 if all(r["identical"] for r in rows) else 1)
@@ -29,15 +29,22 @@ Indicators consumed (all read-only — zero new UW API calls):
 30+ years trading + PhD quant + institutional microstructure lens
 """
 
+import copy
 import json
 import math
 import logging
+import os
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 import requests
 import pytz
 
+from analysis.indicator_state import indicator_store
+from analysis.indicators import atr_sma_last, ema_last, macd_last, rsi_last
+
 logger = logging.getLogger(__name__)
 
 EST = pytz.timezone("US/Eastern")
@@ -60,6 +67,88 @@ CONFIDENCE_LEVELS = {
     "LOW":    "🌫️ Low Confidence",
 }
 
+# UW cache files (TradeNova/data)
+UW_CACHE_FILES = {
+    "darkpool": "darkpool_cache.json",
+    "gex": "uw_gex_cache.json",
+    "iv_term": "uw_iv_term_cache.json",
+    "oi_change": "uw_oi_change_cache.json",
+    "skew": "uw_skew_cache.json",
+    "flow": "uw_flow_cache.json",
+}
+
+BAR_SYMBOLS = ("SPY", "QQQ", "VIX")
+
+# Inputs each sub-score reads — a sub-score is recomputed only when one of
+# these changes (bars by content, files by mtime/size)
+SUBSCORE_INPUTS = {
+    "spy_technicals": ("SPY",),
+    "qqq_technicals": ("QQQ",),
+    "vix": ("VIX",),
+    "gex_regime": ("pe_direction", "gex"),
+    "futures": ("pe_direction",),
+    "breadth": ("pe_direction",),
+    "put_call_ratio": ("oi_change",),
+    "dark_pool": ("darkpool",),
+    "iv_structure": ("iv_term",),
+    "options_flow": ("flow",),
+}
+
+# Bars are re-fetched after this many seconds (AM/PM scans, email, Telegram
+# and X all ask for a prediction within a few seconds of each other)
+MD_BARS_TTL_SEC = float(os.getenv("MD_BARS_TTL_SEC", "60"))
+
+
+class _PredictionSession:
+    """
+    Process-wide memo shared by every MarketDirectionPredictor instance.
+
+      files       — parsed JSON per path, re-parsed only on (mtime, size) change
+      bars        — Polygon daily bars per symbol, kept MD_BARS_TTL_SEC
+      subscores   — sub-score name → (input fingerprint, result)
+      predictions — timeframe → (fingerprint of all inputs, prediction)
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.files: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        self.bars: Dict[str, Tuple[float, List[Dict]]] = {}
+        self.subscores: Dict[str, Tuple[Any, Dict]] = {}
+        self.predictions: Dict[str, Tuple[Any, Dict]] = {}
+
+    def read_json(self, path: Path) -> Tuple[Optional[Tuple[int, int]], Any]:
+        """(stat fingerprint, parsed JSON); (None, None) if the file is missing."""
+        try:
+            st = path.stat()
+        except OSError:
+            return None, None
+        key = (st.st_mtime_ns, st.st_size)
+        with self.lock:
+            hit = self.files.get(str(path))
+            if hit and hit[0] == key:
+                return key, hit[1]
+        with open(path) as f:
+            data = json.load(f)
+        with self.lock:
+            self.files[str(path)] = (key, data)
+        return key, data
+
+
+_session_instance: Optional[_PredictionSession] = None
+_session_lock = threading.Lock()
+
+
+def _session() -> _PredictionSession:
+    global _session_instance
+    with _session_lock:
+        if _session_instance is None:
+            _session_instance = _PredictionSession()
+        return _session_instance
+
+
+def _bars_fingerprint(bars: List[Dict]) -> Tuple:
+    return tuple((b["t"], b["o"], b["h"], b["l"], b["c"], b["v"], b["vw"]) for b in bars)
+
 
 class MarketDirectionPredictor:
     """
@@ -137,35 +226,32 @@ class MarketDirectionPredictor:
             logger.debug(f"Polygon snapshot failed for {symbol}: {e}")
         return {}
 
+    def _putsengine_direction_path(self) -> Path:
+        return self.putsengine_path / "logs" / "market_direction.json"
+
     def _read_putsengine_direction(self) -> Dict:
         """Read PutsEngine market_direction.json."""
-        md_path = self.putsengine_path / "logs" / "market_direction.json"
+        md_path = self._putsengine_direction_path()
         try:
-            if md_path.exists():
-                with open(md_path) as f:
-                    return json.load(f)
+            _, data = _session().read_json(md_path)
+            if data is not None:
+                return data
         except Exception as e:
             logger.debug(f"PutsEngine direction read failed: {e}")
         return {}
 
+    def _uw_cache_path(self, cache_name: str) -> Optional[Path]:
+        fname = UW_CACHE_FILES.get(cache_name)
+        return self.tradenova_path / "data" / fname if fname else None
+
     def _read_uw_cache(self, cache_name: str) -> Dict:
-        """Read UW cache file from TradeNova."""
-        cache_map = {
-            "darkpool": "darkpool_cache.json",
-            "gex": "uw_gex_cache.json",
-            "iv_term": "uw_iv_term_cache.json",
-            "oi_change": "uw_oi_change_cache.json",
-            "skew": "uw_skew_cache.json",
-            "flow": "uw_flow_cache.json",
-        }
-        fname = cache_map.get(cache_name)
-        if not fname:
+        """Read UW cache file from TradeNova (parsed once per file change)."""
+        fpath = self._uw_cache_path(cache_name)
+        if not fpath:
             return {}
         try:
-            fpath = self.tradenova_path / "data" / fname
-            if fpath.exists():
-                with open(fpath) as f:
-                    data = json.load(f)
+            _, data = _session().read_json(fpath)
+            if data is not None:
                 # Some caches have inner "data" or "flow_data" key
                 if cache_name == "flow":
                     return data.get("flow_data", data)
@@ -176,80 +262,82 @@ class MarketDirectionPredictor:
             logger.debug(f"UW cache read failed for {cache_name}: {e}")
         return {}
 
-    # ─── TECHNICAL CALCULATIONS ────────────────────────────────────────
+    def _session_bars(self, symbol: str) -> List[Dict]:
+        """Daily bars for symbol, shared across instances for MD_BARS_TTL_SEC."""
+        sess = _session()
+        with sess.lock:
+            hit = sess.bars.get(symbol)
+        if hit and time.time() - hit[0] < MD_BARS_TTL_SEC:
+            return hit[1]
+        if self.polygon_key:
+            from rate_limiter import polygon_limiter
+            polygon_limiter().acquire()
+        bars = self._fetch_polygon_bars(symbol, days=30)
+        if bars:
+            with sess.lock:
+                sess.bars[symbol] = (time.time(), bars)
+        return bars
+
+    def _gather_inputs(self) -> Tuple[Dict[str, List[Dict]], Dict[str, Any]]:
+        """
+        Fetch every prediction input at once.
 
-    @staticmethod
-    def _calc_rsi(closes: List[float], period: int = 14) -> float:
-        """Calculate RSI."""
-        if len(closes) < period + 1:
-            return 50.0
-        deltas = [closes[i] - closes[i - 1] for i in range(1, len(closes))]
-        gains = [d if d > 0 else 0 for d in deltas]
-        losses = [-d if d < 0 else 0 for d in deltas]
-
-        avg_gain = sum(gains[:period]) / period
-        avg_loss = sum(losses[:period]) / period
-
-        for i in range(period, len(deltas)):
-            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-
-        if avg_loss == 0:
-            return 100.0
-        rs = avg_gain / avg_loss
-        return 100 - (100 / (1 + rs))
+        SPY/QQQ/VIX bars and all JSON inputs are requested concurrently, so a
+        cold prediction costs one network round trip and a warm one none.
+        Returns (bars by symbol, fingerprint by input name).
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        sess = _session()
+        paths = {"pe_direction": self._putsengine_direction_path()}
+        for name in {n for deps in SUBSCORE_INPUTS.values() for n in deps} - set(BAR_SYMBOLS):
+            if name != "pe_direction":
+                paths[name] = self._uw_cache_path(name)
+
+        def _file_fp(path: Path):
+            try:
+                return sess.read_json(path)[0]
+            except Exception:
+                return ("unreadable", time.time())   # never matches → rescored
+
+        with ThreadPoolExecutor(max_workers=len(BAR_SYMBOLS) + len(paths)) as pool:
+            bar_futs = {sym: pool.submit(self._session_bars, sym) for sym in BAR_SYMBOLS}
+            file_futs = {name: pool.submit(_file_fp, path) for name, path in paths.items()}
+            bars = {sym: fut.result() for sym, fut in bar_futs.items()}
+            fingerprints = {name: fut.result() for name, fut in file_futs.items()}
+        for sym, sym_bars in bars.items():
+            fingerprints[sym] = _bars_fingerprint(sym_bars)
+        return bars, fingerprints
+
+    def _subscore(self, name: str, fingerprint: Tuple, compute) -> Dict:
+        """Cached sub-score, recomputed only when its inputs' fingerprint moved."""
+        sess = _session()
+        with sess.lock:
+            hit = sess.subscores.get(name)
+        if hit and hit[0] == fingerprint:
+            return hit[1]
+        result = compute()
+        with sess.lock:
+            sess.subscores[name] = (fingerprint, result)
+        return result
 
-    @staticmethod
-    def _calc_ema(prices: List[float], period: int) -> float:
-        """Calculate EMA."""
-        if not prices or len(prices) < period:
-            return prices[-1] if prices else 0
-        multiplier = 2 / (period + 1)
-        ema = sum(prices[:period]) / period
-        for price in prices[period:]:
-            ema = (price - ema) * multiplier + ema
-        return ema
+    # ─── TECHNICAL CALCULATIONS ────────────────────────────────────────
 
-    @staticmethod
-    def _calc_macd(closes: List[float]) -> Dict:
-        """Calculate MACD (12, 26, 9)."""
-        if len(closes) < 26:
-            return {"macd": 0, "signal": 0, "histogram": 0}
-
-        def ema_series(data, period):
-            result = [sum(data[:period]) / period]
-            mult = 2 / (period + 1)
-            for val in data[period:]:
-                result.append((val - result[-1]) * mult + result[-1])
-            return result
-
-        ema12 = ema_series(closes, 12)
-        ema26 = ema_series(closes, 26)
-
-        # Align lengths
-        diff = len(ema12) - len(ema26)
-        ema12 = ema12[diff:]
-
-        macd_line = [a - b for a, b in zip(ema12, ema26)]
-        if len(macd_line) >= 9:
-            signal_line = ema_series(macd_line, 9)
-            histogram = macd_line[-1] - signal_line[-1]
-            return {"macd": macd_line[-1], "signal": signal_line[-1], "histogram": histogram}
-        return {"macd": macd_line[-1] if macd_line else 0, "signal": 0, "histogram": 0}
+    # Shared implementations (analysis.indicators)
+    _calc_rsi = staticmethod(rsi_last)
+    _calc_ema = staticmethod(ema_last)
+    _calc_macd = staticmethod(macd_last)
+    _calc_atr = staticmethod(atr_sma_last)
 
-    @staticmethod
-    def _calc_atr(bars: List[Dict], period: int = 14) -> float:
-        """Calculate Average True Range."""
-        if len(bars) < period + 1:
-            return 0
-        trs = []
-        for i in range(1, len(bars)):
-            h, l, prev_c = bars[i]["h"], bars[i]["l"], bars[i - 1]["c"]
-            tr = max(h - l, abs(h - prev_c), abs(l - prev_c))
-            trs.append(tr)
-        if len(trs) < period:
-            return sum(trs) / len(trs) if trs else 0
-        return sum(trs[-period:]) / period
+    def _live_indicators(self, symbol: str, bars: List[Dict]) -> Dict[str, Any]:
+        """RSI / EMA / MACD / ATR for the bars via the persisted streaming state."""
+        try:
+            return indicator_store().sync(symbol, bars).readings()
+        except Exception as e:
+            logger.debug(f"Indicator state unavailable for {symbol}: {e}")
+            closes = [b["c"] for b in bars]
+            return {"rsi14": self._calc_rsi(closes), "ema9": self._calc_ema(closes, 9),
+                    "ema20": self._calc_ema(closes, 20), "macd": self._calc_macd(closes),
+                    "atr_sma14": self._calc_atr(bars)}
 
     @staticmethod
     def _find_support_resistance(bars: List[Dict], n: int = 5) -> Dict:
@@ -275,13 +363,14 @@ class MarketDirectionPredictor:
         closes = [b["c"] for b in bars]
         latest = bars[-1]
         prev = bars[-2] if len(bars) >= 2 else latest
+        ind = self._live_indicators("SPY", bars)
 
         signals = []
         details = {}
         score = 0.0
 
         # 1. RSI
-        rsi = self._calc_rsi(closes)
+        rsi = ind["rsi14"]
         details["rsi"] = rsi
         if rsi > 70:
             score -= 0.15
@@ -299,15 +388,15 @@ class MarketDirectionPredictor:
             signals.append(f"SPY RSI neutral ({rsi:.0f})")
 
         # 2. EMA trend
-        ema9 = self._calc_ema(closes, 9)
-        ema20 = self._calc_ema(closes, 20)
+        ema9 = ind["ema9"]
+        ema20 = ind["ema20"]
         ema50 = self._calc_ema(closes, min(50, len(closes)))
         details["ema9"] = ema9
         details["ema20"] = ema20
         details["ema50"] = ema50
 
         # 3. MACD (compute FIRST, used for EMA momentum decay)
-        macd = self._calc_macd(closes)
+        macd = ind["macd"]
         details["macd"] = macd
 
         # ── EMA scoring with MOMENTUM DECAY ──
@@ -434,7 +523,7 @@ class MarketDirectionPredictor:
                 signals.append(f"SPY near support (${sr['support']:.2f})")
 
         # 8. ATR for choppiness
-        atr = self._calc_atr(bars)
+        atr = ind["atr_sma14"]
         details["atr"] = atr
         if price > 0 and atr > 0:
             atr_pct = atr / price * 100
@@ -866,23 +955,23 @@ class MarketDirectionPredictor:
         if not bars or len(bars) < 15:
             return {"score": 0.0, "signals": ["Insufficient QQQ data"], "details": {}}
 
-        closes = [b["c"] for b in bars]
         latest = bars[-1]
+        ind = self._live_indicators("QQQ", bars)
         signals = []
         details = {}
         score = 0.0
 
         # RSI
-        rsi = self._calc_rsi(closes)
+        rsi = ind["rsi14"]
         details["qqq_rsi"] = rsi
 
         # MACD for momentum decay
-        macd = self._calc_macd(closes)
+        macd = ind["macd"]
         macd_weakening = macd["histogram"] < 0
 
         # EMA alignment with momentum decay
-        ema9 = self._calc_ema(closes, 9)
-        ema20 = self._calc_ema(closes, 20)
+        ema9 = ind["ema9"]
+        ema20 = ind["ema20"]
         ema_decay = 0.40 if macd_weakening else 1.0
         if ema9 > ema20:
             ema_contrib = 0.10 * ema_decay
@@ -1039,64 +1128,47 @@ class MarketDirectionPredictor:
         """
         logger.info(f"🌤️ Predicting market direction ({timeframe})...")
 
-        # 1. Fetch all data
-        spy_bars = self._fetch_polygon_bars("SPY", days=30)
-        qqq_bars = self._fetch_polygon_bars("QQQ", days=30)
-        vix_bars = self._fetch_polygon_bars("VIX", days=30)
+        # 1. Fetch all data (concurrently; memoized across instances)
+        bars, input_fps = self._gather_inputs()
+        spy_bars, qqq_bars, vix_bars = bars["SPY"], bars["QQQ"], bars["VIX"]
+        sub_fps = {name: tuple(input_fps[dep] for dep in deps)
+                   for name, deps in SUBSCORE_INPUTS.items()}
+        prediction_fp = tuple(sub_fps[name] for name in SUBSCORE_INPUTS)
+
+        sess = _session()
+        with sess.lock:
+            cached = sess.predictions.get(timeframe)
+        if cached and cached[0] == prediction_fp:
+            logger.info(f"  ♻️ Inputs unchanged since {cached[1]['timestamp']} — reusing prediction")
+            return copy.deepcopy(cached[1])
+
         pe_direction = self._read_putsengine_direction()
 
-        # 2. Score each indicator
+        # 2. Score each indicator (only sub-scores whose inputs changed are recomputed)
+        scorers = {
+            "spy_technicals": lambda: self._score_spy_technicals(spy_bars),   # weight: 25%
+            "qqq_technicals": lambda: self._score_qqq_technicals(qqq_bars),   # weight: 10%
+            "vix": lambda: self._score_vix(vix_bars),                         # weight: 15%
+            "gex_regime": lambda: self._score_gex_regime(pe_direction),       # weight: 15%
+            "futures": lambda: self._score_futures_premarket(pe_direction),   # 10% today, 5% tomorrow
+            "breadth": lambda: self._score_sector_breadth(pe_direction),      # weight: 10%
+            "put_call_ratio": self._score_put_call_ratio,                     # weight: 5%
+            "dark_pool": self._score_dark_pool,                               # weight: 5%
+            "iv_structure": self._score_iv_structure,                         # weight: 5%
+            "options_flow": self._score_options_flow,                         # 5% today, 10% tomorrow
+        }
+        log_labels = {
+            "spy_technicals": "SPY", "qqq_technicals": "QQQ", "vix": "VIX",
+            "gex_regime": "GEX", "futures": "Futures", "breadth": "Breadth",
+            "put_call_ratio": "P/C", "dark_pool": "DP", "iv_structure": "IV",
+            "options_flow": "Flow",
+        }
         scores = {}
-
-        # SPY Technicals (weight: 25%)
-        spy_score = self._score_spy_technicals(spy_bars)
-        scores["spy_technicals"] = spy_score
-        logger.info(f"  SPY: {spy_score['score']:+.3f} ({len(spy_score['signals'])} signals)")
-
-        # QQQ Technicals (weight: 10%)
-        qqq_score = self._score_qqq_technicals(qqq_bars)
-        scores["qqq_technicals"] = qqq_score
-        logger.info(f"  QQQ: {qqq_score['score']:+.3f}")
-
-        # VIX (weight: 15%)
-        vix_score = self._score_vix(vix_bars)
-        scores["vix"] = vix_score
-        logger.info(f"  VIX: {vix_score['score']:+.3f}")
-
-        # GEX Regime (weight: 15%)
-        gex_score = self._score_gex_regime(pe_direction)
-        scores["gex_regime"] = gex_score
-        logger.info(f"  GEX: {gex_score['score']:+.3f}")
-
-        # Futures Pre-Market (weight: 10% for today, 5% for tomorrow)
-        futures_score = self._score_futures_premarket(pe_direction)
-        scores["futures"] = futures_score
-        logger.info(f"  Futures: {futures_score['score']:+.3f}")
-
-        # Sector Breadth (weight: 10%)
-        breadth_score = self._score_sector_breadth(pe_direction)
-        scores["breadth"] = breadth_score
-        logger.info(f"  Breadth: {breadth_score['score']:+.3f}")
-
-        # Put/Call Ratio (weight: 5%)
-        pc_score = self._score_put_call_ratio()
-        scores["put_call_ratio"] = pc_score
-        logger.info(f"  P/C: {pc_score['score']:+.3f}")
-
-        # Dark Pool (weight: 5%)
-        dp_score = self._score_dark_pool()
-        scores["dark_pool"] = dp_score
-        logger.info(f"  DP: {dp_score['score']:+.3f}")
-
-        # IV Structure (weight: 5%)
-        iv_score = self._score_iv_structure()
-        scores["iv_structure"] = iv_score
-        logger.info(f"  IV: {iv_score['score']:+.3f}")
-
-        # Options Flow (weight: 5% today, 10% tomorrow)
-        flow_score = self._score_options_flow()
-        scores["options_flow"] = flow_score
-        logger.info(f"  Flow: {flow_score['score']:+.3f}")
+        for name, compute in scorers.items():
+            scores[name] = self._subscore(name, sub_fps[name], compute)
+            extra = f" ({len(scores[name]['signals'])} signals)" if name == "spy_technicals" else ""
+            logger.info(f"  {log_labels[name]}: {scores[name]['score']:+.3f}{extra}")
+        spy_score, vix_score, gex_score = scores["spy_technicals"], scores["vix"], scores["gex_regime"]
 
         # 3. Weighted composite
         if timeframe == "today":
@@ -1177,10 +1249,13 @@ class MarketDirectionPredictor:
         logger.info(f"  🌤️ Prediction: {direction_label} ({confidence_level}, {confidence_pct:.0f}%)")
         logger.info(f"  📊 Composite: {composite:+.4f} | Choppy: {is_choppy}")
 
-        # Save prediction
+        # Save prediction (+ SPY/QQQ indicator state for the next rescan)
         self._save_prediction(prediction)
+        indicator_store().save()
 
-        return prediction
+        with sess.lock:
+            sess.predictions[timeframe] = (prediction_fp, prediction)
+        return copy.deepcopy(prediction)
 
     def _generate_rationale(
         self,
@@ -1221,19 +1296,14 @@ class MarketDirectionPredictor:
     def _save_prediction(self, prediction: Dict):
         """Save prediction to file."""
         try:
-            output_dir = Path(__file__).parent.parent / "output"
-            output_dir.mkdir(exist_ok=True)
-            
-            fname = f"market_direction_{prediction['timeframe']}_{datetime.now(EST).strftime('%Y%m%d_%H%M%S')}.json"
-            with open(output_dir / fname, "w") as f:
-                json.dump(prediction, f, indent=2, default=str)
-            
-            # Also save as "latest"
-            latest_path = output_dir / f"market_direction_{prediction['timeframe']}_latest.json"
-            with open(latest_path, "w") as f:
-                json.dump(prediction, f, indent=2, default=str)
-            
-            logger.info(f"  💾 Saved: {fname}")
+            from artifact_store import get_store
+            # Written once; market_direction_{timeframe}_latest links to it
+            path = get_store().write(
+                f"market_direction_{prediction['timeframe']}",
+                prediction,
+                stamp=datetime.now(EST).strftime('%Y%m%d_%H%M%S'),
+            )
+            logger.info(f"  💾 Saved: {path.name}")
         except Exception as e:
             logger.debug(f"Failed to save prediction: {e}")
 
@@ -8,44 +8,236 @@ recurrence boost to ranking algorithm.
 """
 
 import json
+import logging
+import os
 import sqlite3
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set
+from typing import Dict, List, Any, Optional, Set, Tuple
 from collections import defaultdict, Counter
 import pytz
 
+logger = logging.getLogger(__name__)
+
 EST = pytz.timezone("US/Eastern")
 
-# Path to recurrence tracking database
-RECURRENCE_DB = Path(__file__).parent.parent / "data" / "recurrence_tracker.db"
+# Recurrence tables live in the shared analytics store (data/meta_engine.db);
+# a legacy data/recurrence_tracker.db is imported on first open
+RECURRENCE_DB = Path(__file__).parent.parent / "data" / "meta_engine.db"
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS pick_recurrence (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        symbol TEXT NOT NULL,
+        option_type TEXT NOT NULL,
+        scan_date TEXT NOT NULL,
+        scan_timestamp TEXT NOT NULL,
+        rank INTEGER NOT NULL,
+        engine TEXT NOT NULL,
+        score REAL DEFAULT 0,
+        created_at TEXT DEFAULT (datetime('now')),
+        UNIQUE(symbol, option_type, scan_date)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_symbol_type ON pick_recurrence(symbol, option_type)",
+    "CREATE INDEX IF NOT EXISTS idx_scan_date ON pick_recurrence(scan_date)",
+    """
+    CREATE TABLE IF NOT EXISTS pick_outcomes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        symbol TEXT NOT NULL,
+        option_type TEXT NOT NULL,
+        scan_date TEXT NOT NULL,
+        pick_price REAL DEFAULT 0,
+        outcome_price REAL DEFAULT 0,
+        direction_correct INTEGER DEFAULT 0,
+        pnl_pct REAL DEFAULT 0,
+        recorded_at TEXT DEFAULT (datetime('now')),
+        UNIQUE(symbol, option_type, scan_date)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_outcome_symbol ON pick_outcomes(symbol, option_type)",
+)
+
+_TRACK_SQL = """
+    INSERT OR REPLACE INTO pick_recurrence
+    (symbol, option_type, scan_date, scan_timestamp, rank, engine, score)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_OUTCOME_SQL = """
+    INSERT OR REPLACE INTO pick_outcomes
+    (symbol, option_type, scan_date, pick_price, outcome_price,
+     direction_correct, pnl_pct)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Counts per (symbol, type) over the recurrence window, and the run of
+# failures since the most recent success per (symbol, type) over the
+# outcome window — one statement, one pass over each table.
+_SNAPSHOT_SQL = """
+    WITH counts AS (
+        SELECT symbol, option_type, COUNT(*) AS n
+        FROM pick_recurrence
+        WHERE scan_date >= :recurrence_cutoff
+        GROUP BY symbol, option_type
+    ),
+    ordered AS (
+        SELECT symbol, option_type, direction_correct,
+               ROW_NUMBER() OVER (
+                   PARTITION BY symbol, option_type ORDER BY scan_date DESC
+               ) AS rn
+        FROM pick_outcomes
+        WHERE scan_date >= :outcome_cutoff
+    ),
+    streaks AS (
+        SELECT symbol, option_type,
+               COALESCE(MIN(CASE WHEN direction_correct IS NOT 0 THEN rn END) - 1,
+                        COUNT(*)) AS streak
+        FROM ordered
+        GROUP BY symbol, option_type
+    )
+    SELECT symbol, option_type, n, NULL FROM counts
+    UNION ALL
+    SELECT symbol, option_type, NULL, streak FROM streaks
+"""
+
+
+def _stars_for(count: int) -> int:
+    if count >= 3:
+        return 3
+    elif count == 2:
+        return 2
+    return 0
+
+
+class RecurrenceSnapshot:
+    """Counts, stars and failure streaks for every symbol, from one query."""
+
+    def __init__(self, counts: Dict[str, Dict[str, int]], streaks: Dict[Tuple[str, str], int]):
+        self.counts = counts
+        self.streaks = streaks
+
+    def count(self, symbol: str, option_type: str) -> int:
+        return self.counts.get(symbol, {}).get(option_type, 0)
+
+    def stars(self, symbol: str, option_type: str) -> int:
+        return _stars_for(self.count(symbol, option_type))
+
+    def failures(self, symbol: str, option_type: str) -> int:
+        return self.streaks.get((symbol, option_type), 0)
+
+
+class RecurrenceEngine:
+    """
+    Long-lived access to the recurrence tables (pick_recurrence, pick_outcomes).
+
+      - one connection per process (schema DDL runs once, sqlite3 keeps
+        the INSERT / snapshot statements prepared)
+      - track_picks(): bulk insert in a single transaction
+      - snapshot(): counts + stars + failure streaks for all symbols via
+        one window-function query, memoized until this engine writes,
+        another connection commits (PRAGMA data_version) or the date rolls
+    """
+
+    def __init__(self, db_path: Path = RECURRENCE_DB):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        with self._conn:
+            for ddl in _SCHEMA:
+                self._conn.execute(ddl)
+        # (days, lookback_days) -> (cutoff dates, snapshot); a rolled date
+        # replaces the entry, so stale cutoffs never accumulate
+        self._snapshots: Dict[Tuple[int, int], Tuple[Tuple[str, str], RecurrenceSnapshot]] = {}
+        self._data_version: Optional[int] = None
+
+    # ── writes ──────────────────────────────────────────────────────
+
+    def track_picks(self, picks: List[Dict[str, Any]]) -> int:
+        """Insert/replace many pick rows in one transaction. Returns rows written."""
+        rows = [
+            (p.get("symbol", ""), p.get("option_type", ""), p.get("scan_date", ""),
+             p.get("scan_timestamp", ""), int(p.get("rank", 0)), p.get("engine", ""),
+             float(p.get("score", 0.0) or 0.0))
+            for p in picks
+        ]
+        if not rows:
+            return 0
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(_TRACK_SQL, rows)
+            self._snapshots.clear()
+        return len(rows)
+
+    def record_outcomes(self, rows: List[Tuple]) -> int:
+        """Insert/replace many pick_outcomes rows (_OUTCOME_SQL order) in one transaction."""
+        if not rows:
+            return 0
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(_OUTCOME_SQL, rows)
+            self._snapshots.clear()
+        return len(rows)
+
+    def execute(self, sql: str, params: Tuple = ()) -> List[sqlite3.Row]:
+        """Read query on the shared connection (rows support name access)."""
+        with self._lock:
+            cur = self._conn.execute(sql, params)
+            cur.row_factory = sqlite3.Row
+            return cur.fetchall()
+
+    # ── reads ───────────────────────────────────────────────────────
+
+    def snapshot(self, days: int = 7, lookback_days: int = 14) -> RecurrenceSnapshot:
+        """Counts over `days`, failure streaks over `lookback_days` (memoized)."""
+        recurrence_cutoff = (datetime.now(EST) - timedelta(days=days)).date().isoformat()
+        outcome_cutoff = (datetime.now(EST) - timedelta(days=lookback_days)).date().isoformat()
+        key, cutoffs = (days, lookback_days), (recurrence_cutoff, outcome_cutoff)
+        with self._lock:
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if version != self._data_version:
+                self._snapshots.clear()
+                self._data_version = version
+            cached = self._snapshots.get(key)
+            if cached is not None and cached[0] == cutoffs:
+                return cached[1]
+
+            counts: Dict[str, Dict[str, int]] = defaultdict(lambda: {"put": 0, "call": 0, "total": 0})
+            streaks: Dict[Tuple[str, str], int] = {}
+            rows = self._conn.execute(_SNAPSHOT_SQL, {
+                "recurrence_cutoff": recurrence_cutoff,
+                "outcome_cutoff": outcome_cutoff,
+            }).fetchall()
+            for symbol, option_type, n, streak in rows:
+                if n is not None:
+                    counts[symbol][option_type] = n
+                    counts[symbol]["total"] += n
+                else:
+                    streaks[(symbol, option_type)] = streak
+            snap = RecurrenceSnapshot(dict(counts), streaks)
+            self._snapshots[key] = (cutoffs, snap)
+            return snap
+
+
+_engine: Optional[RecurrenceEngine] = None
+_engine_lock = threading.Lock()
+
+
+def recurrence_engine() -> RecurrenceEngine:
+    """Process-wide RecurrenceEngine (opened on first use)."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            from analytics_store import analytics_store
+            _engine = RecurrenceEngine(analytics_store().path)
+        return _engine
 
 
 def _ensure_recurrence_db():
     """Create recurrence tracking database if it doesn't exist."""
-    RECURRENCE_DB.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(str(RECURRENCE_DB)) as conn:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS pick_recurrence (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT NOT NULL,
-                option_type TEXT NOT NULL,
-                scan_date TEXT NOT NULL,
-                scan_timestamp TEXT NOT NULL,
-                rank INTEGER NOT NULL,
-                engine TEXT NOT NULL,
-                score REAL DEFAULT 0,
-                created_at TEXT DEFAULT (datetime('now')),
-                UNIQUE(symbol, option_type, scan_date)
-            )
-        """)
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_symbol_type ON pick_recurrence(symbol, option_type)
-        """)
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_scan_date ON pick_recurrence(scan_date)
-        """)
-        conn.commit()
+    recurrence_engine()
 
 
 def track_pick(
@@ -58,14 +250,20 @@ def track_pick(
     score: float = 0.0,
 ):
     """Track a pick in the recurrence database."""
-    _ensure_recurrence_db()
-    with sqlite3.connect(str(RECURRENCE_DB)) as conn:
-        conn.execute("""
-            INSERT OR REPLACE INTO pick_recurrence 
-            (symbol, option_type, scan_date, scan_timestamp, rank, engine, score)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (symbol, option_type, scan_date, scan_timestamp, rank, engine, score))
-        conn.commit()
+    track_picks([{
+        "symbol": symbol, "option_type": option_type, "scan_date": scan_date,
+        "scan_timestamp": scan_timestamp, "rank": rank, "engine": engine, "score": score,
+    }])
+
+
+def track_picks(picks: List[Dict[str, Any]]) -> int:
+    """
+    Track many picks in one transaction.
+
+    Each dict carries symbol, option_type, scan_date, scan_timestamp,
+    rank, engine and (optionally) score. Returns rows written.
+    """
+    return recurrence_engine().track_picks(picks)
 
 
 def get_recurrence_counts(days: int = 7) -> Dict[str, Dict[str, int]]:
@@ -75,29 +273,8 @@ def get_recurrence_counts(days: int = 7) -> Dict[str, Dict[str, int]]:
     Returns:
         Dict: {symbol: {"put": count, "call": count, "total": count}}
     """
-    _ensure_recurrence_db()
-    cutoff = (datetime.now(EST) - timedelta(days=days)).date().isoformat()
-    
-    recurrence_counts = defaultdict(lambda: {"put": 0, "call": 0, "total": 0})
-    
-    with sqlite3.connect(str(RECURRENCE_DB)) as conn:
-        conn.row_factory = sqlite3.Row
-        rows = conn.execute("""
-            SELECT symbol, option_type, COUNT(*) as count
-            FROM pick_recurrence
-            WHERE scan_date >= ?
-            GROUP BY symbol, option_type
-        """, (cutoff,)).fetchall()
-        
-        for row in rows:
-            symbol = row["symbol"]
-            option_type = row["option_type"]
-            count = row["count"]
-            
-            recurrence_counts[symbol][option_type] = count
-            recurrence_counts[symbol]["total"] += count
-    
-    return dict(recurrence_counts)
+    counts = recurrence_engine().snapshot(days=days).counts
+    return {symbol: dict(c) for symbol, c in counts.items()}
 
 
 def get_recurrence_stars(symbol: str, option_type: str, days: int = 7) -> int:
@@ -109,16 +286,7 @@ def get_recurrence_stars(symbol: str, option_type: str, days: int = 7) -> int:
         2: Appeared 2 times (⭐⭐)
         3: Appeared 3+ times (⭐⭐⭐)
     """
-    counts = get_recurrence_counts(days)
-    symbol_data = counts.get(symbol, {})
-    count = symbol_data.get(option_type, 0)
-    
-    if count >= 3:
-        return 3
-    elif count == 2:
-        return 2
-    else:
-        return 0
+    return recurrence_engine().snapshot(days=days).stars(symbol, option_type)
 
 
 def apply_recurrence_boost(
@@ -147,7 +315,7 @@ def apply_recurrence_boost(
     if not picks:
         return picks
     
-    counts = get_recurrence_counts(days)
+    snap = recurrence_engine().snapshot(days=days)
     
     # Apply boost to each pick
     boosted_picks = []
@@ -157,18 +325,15 @@ def apply_recurrence_boost(
         base_score = float(pick.get("score", 0) or 0)
         
         # Get recurrence count
-        symbol_data = counts.get(symbol, {})
-        count = symbol_data.get(option_type, 0)
+        count = snap.count(symbol, option_type)
         
         # Calculate boost
-        stars = 0
+        stars = _stars_for(count)
         boost_multiplier = 1.0
         
-        if count >= 3:
-            stars = 3
+        if stars == 3:
             boost_multiplier = 1.0 + boost_3x
-        elif count == 2:
-            stars = 2
+        elif stars == 2:
             boost_multiplier = 1.0 + boost_2x
         
         # Apply boost
@@ -210,46 +375,22 @@ def format_stars(stars: int) -> str:
 
 def _ensure_outcome_table():
     """Create pick outcome tracking table if not exists."""
-    _ensure_recurrence_db()
-    with sqlite3.connect(str(RECURRENCE_DB)) as conn:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS pick_outcomes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT NOT NULL,
-                option_type TEXT NOT NULL,
-                scan_date TEXT NOT NULL,
-                pick_price REAL DEFAULT 0,
-                outcome_price REAL DEFAULT 0,
-                direction_correct INTEGER DEFAULT 0,
-                pnl_pct REAL DEFAULT 0,
-                recorded_at TEXT DEFAULT (datetime('now')),
-                UNIQUE(symbol, option_type, scan_date)
-            )
-        """)
-        conn.execute("""
-            CREATE INDEX IF NOT EXISTS idx_outcome_symbol
-            ON pick_outcomes(symbol, option_type)
-        """)
-        conn.commit()
+    recurrence_engine()
 
 
-def record_pick_outcome(
+def _outcome_row(
     symbol: str,
     option_type: str,
     scan_date: str,
     pick_price: float,
     outcome_price: float,
-):
+) -> Tuple:
     """
-    Record the outcome of a previous pick.
+    pick_outcomes row for a pick/outcome price pair.
 
     For puts: stock going DOWN is correct (positive pnl for put holder).
     For calls: stock going UP is correct (positive pnl for call holder).
     """
-    _ensure_outcome_table()
-    if pick_price <= 0 or outcome_price <= 0:
-        return
-
     pnl_pct = ((outcome_price - pick_price) / pick_price) * 100
 
     # Direction correctness depends on option type
@@ -258,15 +399,28 @@ def record_pick_outcome(
     else:
         direction_correct = 1 if pnl_pct > 0.5 else 0    # Stock rose > 0.5%
 
-    with sqlite3.connect(str(RECURRENCE_DB)) as conn:
-        conn.execute("""
-            INSERT OR REPLACE INTO pick_outcomes
-            (symbol, option_type, scan_date, pick_price, outcome_price,
-             direction_correct, pnl_pct)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (symbol, option_type, scan_date, pick_price, outcome_price,
-              direction_correct, pnl_pct))
-        conn.commit()
+    return (symbol, option_type, scan_date, pick_price, outcome_price,
+            direction_correct, pnl_pct)
+
+
+def record_pick_outcome(
+    symbol: str,
+    option_type: str,
+    scan_date: str,
+    pick_price: float,
+    outcome_price: float,
+):
+    """
+    Record the outcome of a previous pick.
+
+    For puts: stock going DOWN is correct (positive pnl for put holder).
+    For calls: stock going UP is correct (positive pnl for call holder).
+    """
+    if pick_price <= 0 or outcome_price <= 0:
+        return
+    recurrence_engine().record_outcomes(
+        [_outcome_row(symbol, option_type, scan_date, pick_price, outcome_price)]
+    )
 
 
 def get_consecutive_failures(symbol: str, option_type: str, lookback_days: int = 14) -> int:
@@ -274,29 +428,7 @@ def get_consecutive_failures(symbol: str, option_type: str, lookback_days: int =
     Get the number of consecutive recent failures for a symbol+type.
     Returns 0 if no failures or no data.
     """
-    _ensure_outcome_table()
-    cutoff = (datetime.now(EST) - timedelta(days=lookback_days)).date().isoformat()
-
-    with sqlite3.connect(str(RECURRENCE_DB)) as conn:
-        rows = conn.execute("""
-            SELECT direction_correct
-            FROM pick_outcomes
-            WHERE symbol = ? AND option_type = ? AND scan_date >= ?
-            ORDER BY scan_date DESC
-        """, (symbol, option_type, cutoff)).fetchall()
-
-    if not rows:
-        return 0
-
-    # Count consecutive failures from most recent
-    failures = 0
-    for row in rows:
-        if row[0] == 0:  # failure
-            failures += 1
-        else:
-            break  # streak broken
-
-    return failures
+    return recurrence_engine().snapshot(lookback_days=lookback_days).failures(symbol, option_type)
 
 
 def get_excluded_symbols(min_consecutive_failures: int = 2, lookback_days: int = 14) -> set:
@@ -306,39 +438,100 @@ def get_excluded_symbols(min_consecutive_failures: int = 2, lookback_days: int =
     Returns:
         Set of (symbol, option_type) tuples to exclude.
     """
-    _ensure_outcome_table()
-    cutoff = (datetime.now(EST) - timedelta(days=lookback_days)).date().isoformat()
-
-    excluded = set()
-
-    with sqlite3.connect(str(RECURRENCE_DB)) as conn:
-        # Get all unique symbol/type pairs with outcomes in the lookback period
-        pairs = conn.execute("""
-            SELECT DISTINCT symbol, option_type
-            FROM pick_outcomes
-            WHERE scan_date >= ?
-        """, (cutoff,)).fetchall()
-
-        for symbol, option_type in pairs:
-            rows = conn.execute("""
-                SELECT direction_correct
-                FROM pick_outcomes
-                WHERE symbol = ? AND option_type = ? AND scan_date >= ?
-                ORDER BY scan_date DESC
-            """, (symbol, option_type, cutoff)).fetchall()
-
-            # Count consecutive failures from most recent
-            failures = 0
-            for row in rows:
-                if row[0] == 0:
-                    failures += 1
-                else:
-                    break
+    streaks = recurrence_engine().snapshot(lookback_days=lookback_days).streaks
+    return {pair for pair, failures in streaks.items() if failures >= min_consecutive_failures}
+
+
+_PENDING_SQL = """
+    SELECT r.symbol, r.option_type, r.scan_date, r.score
+    FROM pick_recurrence r
+    LEFT JOIN pick_outcomes o
+      ON r.symbol = o.symbol
+      AND r.option_type = o.option_type
+      AND r.scan_date = o.scan_date
+    WHERE r.scan_date >= ? AND r.scan_date < ?
+      AND o.id IS NULL
+"""
 
-            if failures >= min_consecutive_failures:
-                excluded.add((symbol, option_type))
+OUTCOME_LOOKBACK_DAYS = 7
+OUTCOME_FETCH_WORKERS = int(os.getenv("RECURRENCE_FETCH_WORKERS", "8"))
 
-    return excluded
+
+def _fetch_session_bars(
+    symbols: List[str],
+    start: str,
+    end: str,
+    api_key: str,
+) -> Dict[Tuple[str, str], Tuple[float, float]]:
+    """
+    Daily (open, close) per (symbol, session date) over [start, end].
+
+    One Polygon range request per symbol covers every scan date in the
+    window; requests run concurrently under the shared Polygon limiter.
+    """
+    import requests
+    from concurrent.futures import ThreadPoolExecutor
+    from rate_limiter import polygon_limiter
+
+    limiter = polygon_limiter()
+
+    def _one(symbol: str) -> Tuple[str, list]:
+        limiter.acquire()
+        try:
+            resp = requests.get(
+                f"https://api.polygon.io/v2/aggs/ticker/{symbol}/range/1/day/{start}/{end}",
+                params={"adjusted": "true", "sort": "asc", "limit": 50, "apiKey": api_key},
+                timeout=10,
+            )
+            if resp.status_code == 200:
+                return symbol, resp.json().get("results", []) or []
+        except Exception as e:
+            logger.debug(f"  Outcome bars fetch failed for {symbol}: {e}")
+        return symbol, []
+
+    sessions: Dict[Tuple[str, str], Tuple[float, float]] = {}
+    if not symbols:
+        return sessions
+    with ThreadPoolExecutor(max_workers=max(1, min(OUTCOME_FETCH_WORKERS, len(symbols)))) as pool:
+        for symbol, bars in pool.map(_one, symbols):
+            for bar in bars:
+                t = bar.get("t")
+                if t is None:
+                    continue
+                # Daily aggregate timestamps are the session's midnight ET
+                day = datetime.fromtimestamp(t / 1000, EST).date().isoformat()
+                sessions[(symbol, day)] = (float(bar.get("o", 0) or 0), float(bar.get("c", 0) or 0))
+    return sessions
+
+
+def _outcome_rows(
+    picks: List[Tuple[str, str, str]],
+    prices: List[Tuple[float, float]],
+) -> List[Tuple]:
+    """
+    pick_outcomes rows for many (symbol, option_type, scan_date) picks and
+    their (pick_price, outcome_price) pairs in one vectorized pass.
+    Same arithmetic and thresholds as _outcome_row; non-positive prices
+    are dropped (as record_pick_outcome does).
+    """
+    import numpy as np
+
+    if not picks:
+        return []
+    px = np.asarray(prices, dtype=float).reshape(-1, 2)
+    pick_px, out_px = px[:, 0], px[:, 1]
+    valid = (pick_px > 0) & (out_px > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pnl = ((out_px - pick_px) / pick_px) * 100
+    is_put = np.array([p[1] == "put" for p in picks], dtype=bool)
+    correct = np.where(is_put, pnl < -0.5, pnl > 0.5).astype(int)
+
+    return [
+        (symbol, option_type, scan_date, float(pick_px[i]), float(out_px[i]),
+         int(correct[i]), float(pnl[i]))
+        for i, (symbol, option_type, scan_date) in enumerate(picks)
+        if valid[i]
+    ]
 
 
 def record_outcomes_from_previous_scan(polygon_api_key: str = ""):
@@ -348,46 +541,39 @@ def record_outcomes_from_previous_scan(polygon_api_key: str = ""):
 
     ENHANCED (FEB 15, 2026): Uses a 3-tier strategy:
       1. TRADE DB: Check actual closed trades for real P&L (most accurate)
-      2. POLYGON API: Fetch next-day price for direction check (moderate)
+      2. POLYGON API: Daily bar of each pick's own scan date, open → close
       3. CACHED PRICES: Use saved price data from scan results (fallback)
 
     Also extends lookback from 3 → 7 days for more aggressive tracking.
-    """
-    import os
-    import requests
 
-    _ensure_outcome_table()
+    Batched: the pending picks are read once, Tier 2 fetches each symbol's
+    bars once for the whole window (concurrently), outcomes are computed in
+    one vectorized pass and every row is written in a single transaction.
+    """
+    engine = recurrence_engine()
     if not polygon_api_key:
         polygon_api_key = os.getenv("POLYGON_API_KEY", "")
 
     # Extended lookback: 7 days (was 3) for more aggressive outcome tracking
-    cutoff = (datetime.now(EST) - timedelta(days=7)).date().isoformat()
+    cutoff = (datetime.now(EST) - timedelta(days=OUTCOME_LOOKBACK_DAYS)).date().isoformat()
     today_str = datetime.now(EST).strftime("%Y-%m-%d")
 
-    with sqlite3.connect(str(RECURRENCE_DB)) as conn:
-        conn.row_factory = sqlite3.Row
-        # Picks tracked but not yet evaluated
-        picks = conn.execute("""
-            SELECT r.symbol, r.option_type, r.scan_date, r.score
-            FROM pick_recurrence r
-            LEFT JOIN pick_outcomes o
-              ON r.symbol = o.symbol
-              AND r.option_type = o.option_type
-              AND r.scan_date = o.scan_date
-            WHERE r.scan_date >= ? AND r.scan_date < ?
-              AND o.id IS NULL
-        """, (cutoff, today_str)).fetchall()
-
-    if not picks:
+    # Picks tracked but not yet evaluated
+    pending = [
+        (row["symbol"], row["option_type"], row["scan_date"])
+        for row in engine.execute(_PENDING_SQL, (cutoff, today_str))
+    ]
+    if not pending:
         return
 
-    recorded = 0
+    rows: List[Tuple] = []
 
     # ── TIER 1: Check trade database for actual closed trades ──────────
+    remaining = pending
     try:
         from trading.trade_db import TradeDB
         trade_db = TradeDB()
-        closed_trades = trade_db.get_closed_trades(days=7)
+        closed_trades = trade_db.get_closed_trades(days=OUTCOME_LOOKBACK_DAYS)
         # Build lookup: (symbol, scan_date) → trade
         trade_lookup = {}
         for t in closed_trades:
@@ -395,64 +581,36 @@ def record_outcomes_from_previous_scan(polygon_api_key: str = ""):
             if key not in trade_lookup:
                 trade_lookup[key] = t
 
-        for pick in picks:
-            symbol = pick["symbol"]
-            option_type = pick["option_type"]
-            scan_date = pick["scan_date"]
-            trade = trade_lookup.get((symbol, scan_date))
-            if trade:
-                entry_px = float(trade.get("entry_price", 0) or 0)
-                exit_px = float(trade.get("exit_price", 0) or 0)
-                if entry_px > 0 and exit_px > 0:
-                    record_pick_outcome(
-                        symbol=symbol,
-                        option_type=option_type,
-                        scan_date=scan_date,
-                        pick_price=entry_px,
-                        outcome_price=exit_px,
-                    )
-                    recorded += 1
+        tier1_picks, tier1_prices, remaining = [], [], []
+        for pick in pending:
+            trade = trade_lookup.get((pick[0], pick[2]))
+            entry_px = float(trade.get("entry_price", 0) or 0) if trade else 0.0
+            exit_px = float(trade.get("exit_price", 0) or 0) if trade else 0.0
+            if entry_px > 0 and exit_px > 0:
+                tier1_picks.append(pick)
+                tier1_prices.append((entry_px, exit_px))
+            else:
+                remaining.append(pick)
+        rows.extend(_outcome_rows(tier1_picks, tier1_prices))
     except Exception:
-        pass  # Trade DB not available — continue with Polygon
-
-    # ── TIER 2: Polygon API for remaining unevaluated picks ────────────
-    if polygon_api_key:
-        # Refresh the list of unevaluated picks (some may have been recorded in Tier 1)
-        with sqlite3.connect(str(RECURRENCE_DB)) as conn:
-            conn.row_factory = sqlite3.Row
-            remaining = conn.execute("""
-                SELECT r.symbol, r.option_type, r.scan_date, r.score
-                FROM pick_recurrence r
-                LEFT JOIN pick_outcomes o
-                  ON r.symbol = o.symbol
-                  AND r.option_type = o.option_type
-                  AND r.scan_date = o.scan_date
-                WHERE r.scan_date >= ? AND r.scan_date < ?
-                  AND o.id IS NULL
-            """, (cutoff, today_str)).fetchall()
-
-        for pick in remaining:
-            symbol = pick["symbol"]
-            scan_date = pick["scan_date"]
-            try:
-                url = f"https://api.polygon.io/v2/aggs/ticker/{symbol}/prev"
-                resp = requests.get(url, params={"apiKey": polygon_api_key}, timeout=10)
-                if resp.status_code == 200:
-                    results = resp.json().get("results", [])
-                    if results:
-                        outcome_price = results[0].get("c", 0)
-                        pick_price = results[0].get("o", 0)
-                        if pick_price > 0 and outcome_price > 0:
-                            record_pick_outcome(
-                                symbol=symbol,
-                                option_type=pick["option_type"],
-                                scan_date=scan_date,
-                                pick_price=pick_price,
-                                outcome_price=outcome_price,
-                            )
-                            recorded += 1
-            except Exception:
-                pass  # Non-critical — skip silently
-
+        remaining = pending  # Trade DB not available — continue with Polygon
+
+    # ── TIER 2: Polygon daily bars for remaining unevaluated picks ─────
+    if polygon_api_key and remaining:
+        symbols = list(dict.fromkeys(p[0] for p in remaining))
+        start = min(p[2] for p in remaining)
+        end = max(p[2] for p in remaining)
+        try:
+            sessions = _fetch_session_bars(symbols, start, end, polygon_api_key)
+        except Exception as e:
+            logger.debug(f"  Outcome bars unavailable: {e}")
+            sessions = {}
+        # Picks whose scan date has no session bar (holiday, halted,
+        # not yet published) stay pending for the next run
+        tier2_picks = [p for p in remaining if (p[0], p[2]) in sessions]
+        rows.extend(_outcome_rows(tier2_picks, [sessions[(p[0], p[2])] for p in tier2_picks]))
+
+    recorded = engine.record_outcomes(rows)
     if recorded > 0:
-        logger.info(f"  📊 Recurrence outcomes: {recorded} pick outcomes recorded")
+        logger.info(f"  📊 Recurrence outcomes: {recorded} pick outcomes recorded "
+                    f"({len(pending)} pending)")
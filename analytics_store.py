@@ -0,0 +1,586 @@
+"""
+Meta Engine Analytics Store
+===========================
+One embedded SQLite file (data/meta_engine.db) for the state that used
+to be spread over separate databases and JSON files:
+
+    trades, daily_summary, trade_stats_daily   ← trades.db      (TradeDB)
+    pick_recurrence, pick_outcomes             ← recurrence_tracker.db
+    x_posts, milestone_posts                   ← x_posts.db     (x_poster)
+    kv_state('safeguards'), prediction_ledger  ← output/safeguard_state.json
+    kv_state('health_alert_throttle')          ← output/.health_alert_throttle.json
+    smart_money_scans                          ← output/smart_money_scan_history.jsonl
+
+Because every entity lives in the same file, cross-cutting questions
+("P&L of recurrence-boosted picks that were posted to X") are one
+indexed SQL join instead of multi-file Python merges.
+
+  - schema migrations are versioned with PRAGMA user_version
+    (_MIGRATIONS, applied in order, each in its own transaction)
+  - legacy files are imported once on first open (recorded in
+    legacy_imports; the old files are left in place as a backup)
+  - one shared connection per process (analytics_store()) guarded by an
+    RLock; TradeDB and RecurrenceEngine keep their own connections to the
+    same file (WAL lets them read while another writes)
+
+Usage:
+    from analytics_store import analytics_store
+    store = analytics_store()
+    store.set_state("safeguards", state)
+    rows = store.execute("SELECT ... FROM trades JOIN pick_recurrence ...")
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("AnalyticsStore")
+
+_META_DIR = Path(__file__).parent
+_DATA_DIR = _META_DIR / "data"
+ANALYTICS_DB = Path(os.getenv("META_ANALYTICS_DB", str(_DATA_DIR / "meta_engine.db")))
+
+# Files folded into the store by import_legacy()
+_LEGACY_OUTPUT_DIR = Path.home() / "Meta Engine" / "output"
+LEGACY_SQLITE = {
+    _DATA_DIR / "trades.db": ("trades",),
+    _DATA_DIR / "recurrence_tracker.db": ("pick_recurrence", "pick_outcomes"),
+    _DATA_DIR / "x_posts.db": ("x_posts", "milestone_posts"),
+}
+LEGACY_STATE = {
+    "safeguards": _LEGACY_OUTPUT_DIR / "safeguard_state.json",
+    "health_alert_throttle": _LEGACY_OUTPUT_DIR / ".health_alert_throttle.json",
+}
+LEGACY_SCAN_HISTORY = _LEGACY_OUTPUT_DIR / "smart_money_scan_history.jsonl"
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=30000",
+)
+
+# Move a legacy safeguards `prediction_results` list (JSON in kv_state)
+# into the ledger. Runs in migration 3 and after a legacy state import.
+_FOLD_PREDICTIONS_SQL = """
+    INSERT INTO prediction_ledger
+        (timestamp, symbol, direction, conviction, actual_move_pct, correct)
+    SELECT COALESCE(json_extract(j.value, '$.timestamp'), ''),
+           COALESCE(json_extract(j.value, '$.symbol'), ''),
+           COALESCE(json_extract(j.value, '$.direction'), ''),
+           COALESCE(json_extract(j.value, '$.conviction'), 0),
+           COALESCE(json_extract(j.value, '$.actual_move_pct'), 0),
+           COALESCE(json_extract(j.value, '$.correct'), 0) != 0
+    FROM kv_state k, json_each(k.value) j
+    WHERE k.namespace = 'safeguards' AND k.key = 'prediction_results'
+    ORDER BY j.key;
+    DELETE FROM kv_state WHERE namespace = 'safeguards' AND key = 'prediction_results';
+"""
+
+# ═══════════════════════════════════════════════════════
+# Schema migrations (append only — never edit a shipped step)
+# ═══════════════════════════════════════════════════════
+_MIGRATIONS: List[Tuple[int, str, str]] = [
+    (1, "state, scan history and legacy import log", """
+        CREATE TABLE IF NOT EXISTS kv_state (
+            namespace   TEXT NOT NULL,
+            key         TEXT NOT NULL,
+            value       TEXT NOT NULL,                 -- JSON
+            updated_at  TEXT DEFAULT (datetime('now')),
+            PRIMARY KEY (namespace, key)
+        ) WITHOUT ROWID;
+
+        CREATE TABLE IF NOT EXISTS smart_money_scans (
+            id          INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp   TEXT NOT NULL,
+            scan_date   TEXT NOT NULL,
+            fingerprint TEXT DEFAULT '',
+            n_bullish   INTEGER DEFAULT 0,
+            n_bearish   INTEGER DEFAULT 0,
+            top5_bull   TEXT DEFAULT '[]',             -- JSON array
+            top5_bear   TEXT DEFAULT '[]'              -- JSON array
+        );
+        CREATE INDEX IF NOT EXISTS idx_sm_scans_date ON smart_money_scans(scan_date);
+
+        CREATE TABLE IF NOT EXISTS legacy_imports (
+            source      TEXT PRIMARY KEY,
+            rows        INTEGER DEFAULT 0,
+            imported_at TEXT DEFAULT (datetime('now'))
+        );
+    """),
+    (2, "x posts (moved from x_posts.db)", """
+        CREATE TABLE IF NOT EXISTS x_posts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            scan_timestamp TEXT NOT NULL,
+            scan_date TEXT NOT NULL,
+            session_label TEXT NOT NULL,
+            first_tweet_id TEXT NOT NULL,
+            posted_at TEXT DEFAULT (datetime('now')),
+            winner_posted INTEGER DEFAULT 0,
+            winner_posted_at TEXT,
+            UNIQUE(scan_timestamp, session_label)
+        );
+        CREATE INDEX IF NOT EXISTS idx_x_posts_date ON x_posts(scan_date, session_label);
+
+        CREATE TABLE IF NOT EXISTS milestone_posts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            trade_id TEXT NOT NULL,
+            milestone_pct INTEGER NOT NULL,
+            posted_at TEXT DEFAULT (datetime('now')),
+            tweet_id TEXT,
+            UNIQUE(trade_id, milestone_pct)
+        );
+    """),
+    (3, "append-only prediction ledger", """
+        CREATE TABLE IF NOT EXISTS prediction_ledger (
+            id              INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp       TEXT NOT NULL,              -- local isoformat
+            symbol          TEXT NOT NULL,
+            direction       TEXT NOT NULL,              -- BULLISH / BEARISH
+            conviction      REAL DEFAULT 0,
+            actual_move_pct REAL DEFAULT 0,
+            correct         INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_pred_ts ON prediction_ledger(timestamp);
+        CREATE INDEX IF NOT EXISTS idx_pred_dir_ts ON prediction_ledger(direction, timestamp);
+
+        -- Rolling-window building block: one row per (day, direction)
+        CREATE TABLE IF NOT EXISTS prediction_daily (
+            day             TEXT NOT NULL,
+            direction       TEXT NOT NULL,
+            total           INTEGER DEFAULT 0,
+            correct         INTEGER DEFAULT 0,
+            losers          INTEGER DEFAULT 0,      -- wrong with |move| > 1%
+            winner_conv_sum REAL DEFAULT 0,
+            loser_conv_sum  REAL DEFAULT 0,
+            PRIMARY KEY (day, direction)
+        ) WITHOUT ROWID;
+
+        CREATE TRIGGER IF NOT EXISTS trg_pred_daily AFTER INSERT ON prediction_ledger
+        BEGIN
+            INSERT INTO prediction_daily
+                (day, direction, total, correct, losers, winner_conv_sum, loser_conv_sum)
+            VALUES (substr(NEW.timestamp, 1, 10), NEW.direction, 1, NEW.correct,
+                    NOT NEW.correct AND abs(NEW.actual_move_pct) > 1,
+                    CASE WHEN NEW.correct THEN NEW.conviction ELSE 0 END,
+                    CASE WHEN NOT NEW.correct AND abs(NEW.actual_move_pct) > 1
+                         THEN NEW.conviction ELSE 0 END)
+            ON CONFLICT (day, direction) DO UPDATE SET
+                total           = total + 1,
+                correct         = correct + excluded.correct,
+                losers          = losers + excluded.losers,
+                winner_conv_sum = winner_conv_sum + excluded.winner_conv_sum,
+                loser_conv_sum  = loser_conv_sum + excluded.loser_conv_sum;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_pred_no_update BEFORE UPDATE ON prediction_ledger
+        BEGIN SELECT RAISE(ABORT, 'prediction_ledger is append-only'); END;
+        CREATE TRIGGER IF NOT EXISTS trg_pred_no_delete BEFORE DELETE ON prediction_ledger
+        BEGIN SELECT RAISE(ABORT, 'prediction_ledger is append-only'); END;
+    """ + _FOLD_PREDICTIONS_SQL),
+]
+
+SCHEMA_VERSION = _MIGRATIONS[-1][0]
+
+# ═══════════════════════════════════════════════════════
+# Cross-entity queries
+# ═══════════════════════════════════════════════════════
+# Trades of scan dates in [:start, :end) with status / return buckets —
+# the validation monitor's execution and performance sections.
+_TRADE_OUTCOMES_SQL = """
+    SELECT
+        COUNT(*)                                                        AS total_trades,
+        SUM(status = 'filled')                                          AS filled,
+        SUM(status = 'pending')                                         AS pending,
+        SUM(status = 'cancelled')                                       AS cancelled,
+        SUM(LOWER(COALESCE(exit_reason, '')) LIKE '%retry%'
+            OR LOWER(COALESCE(exit_reason, '')) LIKE '%attempt%')       AS retry_attempts,
+        SUM(status IN ('filled', 'open', 'closed'))                     AS executed_trades,
+        SUM(status IN ('filled', 'open', 'closed') AND COALESCE(pnl_pct, 0) >= 50) AS winners,
+        SUM(status IN ('filled', 'open', 'closed') AND COALESCE(pnl_pct, 0) < 0)   AS losers,
+        AVG(CASE WHEN status IN ('filled', 'open', 'closed') AND COALESCE(pnl_pct, 0) >= 50
+                 THEN COALESCE(pnl_pct, 0) END)                         AS avg_winner_return,
+        AVG(CASE WHEN status IN ('filled', 'open', 'closed') AND COALESCE(pnl_pct, 0) < 0
+                 THEN COALESCE(pnl_pct, 0) END)                         AS avg_loser_return
+    FROM trades
+    WHERE scan_date >= :start AND scan_date < :end
+"""
+
+# Closed-trade P&L split by whether the pick had recurred (2+ appearances
+# in the recurrence window ending on its scan date, i.e. it received the
+# recurrence boost) and whether that scan was posted to X.
+_PICK_ATTRIBUTION_SQL = """
+    SELECT recurrence_boosted, posted_to_x,
+           COUNT(*)                 AS trades,
+           SUM(pnl > 0)             AS wins,
+           SUM(pnl <= 0)            AS losses,
+           ROUND(SUM(pnl), 2)       AS total_pnl,
+           ROUND(AVG(pnl_pct), 1)   AS avg_pnl_pct
+    FROM (
+        SELECT t.pnl, t.pnl_pct,
+               (SELECT COUNT(*) FROM pick_recurrence r
+                 WHERE r.symbol = t.symbol AND r.option_type = t.option_type
+                   AND r.scan_date >= date(t.scan_date, :recurrence_window)
+                   AND r.scan_date <= t.scan_date) >= 2          AS recurrence_boosted,
+               EXISTS (SELECT 1 FROM x_posts p
+                        WHERE p.scan_date = t.scan_date
+                          AND p.session_label = t.session)       AS posted_to_x
+        FROM trades t
+        WHERE t.status = 'closed' AND t.scan_date >= :start
+    )
+    GROUP BY 1, 2
+    ORDER BY 1 DESC, 2 DESC
+"""
+
+
+class AnalyticsStore:
+    """Shared connection to the consolidated analytics database."""
+
+    def __init__(self, db_path: Path = ANALYTICS_DB, import_legacy: bool = True):
+        self.path = Path(db_path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            self._conn.execute(pragma)
+        self.migrate()
+        if import_legacy:
+            self.import_legacy()
+
+    # ── schema ─────────────────────────────────────────────────────
+
+    @property
+    def schema_version(self) -> int:
+        with self._lock:
+            return self._conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def migrate(self) -> int:
+        """Apply pending _MIGRATIONS in order. Returns the resulting version."""
+        with self._lock:
+            current = self.schema_version
+            for version, label, sql in _MIGRATIONS:
+                if version <= current:
+                    continue
+                self._conn.executescript(
+                    f"BEGIN IMMEDIATE;\n{sql}\nPRAGMA user_version = {version};\nCOMMIT;"
+                )
+                logger.info(f"  🗄️ Analytics store migrated to v{version} ({label})")
+                current = version
+            return current
+
+    # ── legacy import ──────────────────────────────────────────────
+
+    def _imported(self, source: str) -> bool:
+        return self._conn.execute(
+            "SELECT 1 FROM legacy_imports WHERE source = ?", (source,)
+        ).fetchone() is not None
+
+    def _copy_legacy_tables(self, path: Path, tables: Tuple[str, ...]) -> int:
+        """Copy `tables` (schema if missing, then rows) from a legacy SQLite file."""
+        copied = 0
+        self._conn.execute("ATTACH DATABASE ? AS legacy", (str(path),))
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            for table in tables:
+                src = self._conn.execute(
+                    "SELECT sql FROM legacy.sqlite_master WHERE type = 'table' AND name = ?",
+                    (table,),
+                ).fetchone()
+                if src is None:
+                    continue
+                exists = self._conn.execute(
+                    "SELECT 1 FROM main.sqlite_master WHERE type = 'table' AND name = ?",
+                    (table,),
+                ).fetchone()
+                if not exists:
+                    self._conn.execute(src["sql"])
+                    for (index_sql,) in self._conn.execute(
+                        "SELECT sql FROM legacy.sqlite_master "
+                        "WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+                        (table,),
+                    ).fetchall():
+                        self._conn.execute(index_sql)
+
+                main_cols = [r[1] for r in self._conn.execute(f"PRAGMA main.table_info({table})")]
+                legacy_cols = {r[1] for r in self._conn.execute(f"PRAGMA legacy.table_info({table})")}
+                empty = self._conn.execute(f"SELECT 1 FROM main.{table} LIMIT 1").fetchone() is None
+                # Keep row ids only when nothing was written here yet
+                cols = [c for c in main_cols if c in legacy_cols and (empty or c != "id")]
+                col_list = ", ".join(cols)
+                cur = self._conn.execute(
+                    f"INSERT OR IGNORE INTO main.{table} ({col_list}) "
+                    f"SELECT {col_list} FROM legacy.{table}"
+                )
+                copied += max(cur.rowcount, 0)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO legacy_imports (source, rows) VALUES (?, ?)",
+                (str(path), copied),
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        finally:
+            self._conn.execute("DETACH DATABASE legacy")
+        return copied
+
+    def import_legacy(self) -> Dict[str, int]:
+        """
+        Fold every legacy file that exists and has not been imported yet
+        into the store. Idempotent; returns {source: rows imported}.
+        """
+        imported: Dict[str, int] = {}
+        with self._lock:
+            for path, tables in LEGACY_SQLITE.items():
+                if path.resolve() == self.path.resolve() or not path.exists() or self._imported(str(path)):
+                    continue
+                try:
+                    imported[str(path)] = self._copy_legacy_tables(path, tables)
+                except sqlite3.Error as e:
+                    logger.warning(f"  ⚠️ Legacy import failed for {path.name}: {e}")
+
+            for namespace, path in LEGACY_STATE.items():
+                if not path.exists() or self._imported(str(path)):
+                    continue
+                try:
+                    state = json.loads(path.read_text())
+                except (json.JSONDecodeError, IOError) as e:
+                    logger.warning(f"  ⚠️ Legacy state unreadable ({path.name}): {e}")
+                    state = {}
+                with self.transaction():
+                    self._put_state(namespace, state if isinstance(state, dict) else {})
+                    if namespace == "safeguards":
+                        for stmt in _FOLD_PREDICTIONS_SQL.split(";"):
+                            if stmt.strip():
+                                self._conn.execute(stmt)
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO legacy_imports (source, rows) VALUES (?, ?)",
+                        (str(path), len(state) if isinstance(state, dict) else 0),
+                    )
+                imported[str(path)] = len(state) if isinstance(state, dict) else 0
+
+            path = LEGACY_SCAN_HISTORY
+            if path.exists() and not self._imported(str(path)):
+                entries = []
+                with open(path) as f:
+                    for line in f:
+                        try:
+                            entries.append(json.loads(line))
+                        except json.JSONDecodeError:
+                            continue
+                with self.transaction():
+                    self._insert_scans(entries)
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO legacy_imports (source, rows) VALUES (?, ?)",
+                        (str(path), len(entries)),
+                    )
+                imported[str(path)] = len(entries)
+
+        if imported:
+            logger.info("  🗄️ Analytics store imported legacy files: "
+                        + ", ".join(f"{Path(k).name}={v}" for k, v in imported.items()))
+        return imported
+
+    # ── generic access ─────────────────────────────────────────────
+
+    @contextmanager
+    def transaction(self):
+        """BEGIN IMMEDIATE … COMMIT on the shared connection (re-entrant per thread)."""
+        with self._lock:
+            if self._conn.in_transaction:
+                yield self._conn
+                return
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def execute(self, sql: str, params: Any = ()) -> List[sqlite3.Row]:
+        """Run one statement on the shared connection and return all rows."""
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def executemany(self, sql: str, rows: List[Tuple]) -> int:
+        """Run `sql` for every row in one transaction. Returns rows affected."""
+        with self.transaction() as conn:
+            return conn.executemany(sql, rows).rowcount
+
+    # ── key/value state (safeguards, alert throttle) ───────────────
+
+    def _put_state(self, namespace: str, state: Dict[str, Any]):
+        self._conn.execute("DELETE FROM kv_state WHERE namespace = ?", (namespace,))
+        self._conn.executemany(
+            "INSERT INTO kv_state (namespace, key, value) VALUES (?, ?, ?)",
+            [(namespace, str(k), json.dumps(v, default=str)) for k, v in state.items()],
+        )
+
+    def get_state(self, namespace: str) -> Dict[str, Any]:
+        """Whole state dict stored under `namespace` ({} if none)."""
+        rows = self.execute("SELECT key, value FROM kv_state WHERE namespace = ?", (namespace,))
+        return {r["key"]: json.loads(r["value"]) for r in rows}
+
+    def set_state(self, namespace: str, state: Dict[str, Any]):
+        """Replace the state dict stored under `namespace`."""
+        with self.transaction():
+            self._put_state(namespace, state)
+
+    def update_state(self, namespace: str, changes: Dict[str, Any]):
+        """Upsert only the given keys of `namespace` (no full rewrite)."""
+        with self.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO kv_state (namespace, key, value) VALUES (?, ?, ?) "
+                "ON CONFLICT (namespace, key) DO UPDATE SET "
+                "value = excluded.value, updated_at = datetime('now')",
+                [(namespace, str(k), json.dumps(v, default=str)) for k, v in changes.items()],
+            )
+
+    # ── prediction ledger (safeguards accuracy tracking) ───────────
+
+    def append_prediction(self, timestamp: str, symbol: str, direction: str,
+                          conviction: float, actual_move_pct: float, correct: bool,
+                          state_changes: Optional[Dict[str, Any]] = None):
+        """
+        Append one prediction outcome (prediction_daily is updated by
+        trigger); optional safeguards state keys are written in the same
+        transaction.
+        """
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO prediction_ledger "
+                "(timestamp, symbol, direction, conviction, actual_move_pct, correct) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (timestamp, symbol, direction, float(conviction), float(actual_move_pct),
+                 int(bool(correct))),
+            )
+            if state_changes:
+                self.update_state("safeguards", state_changes)
+
+    def prediction_window(self, since: str, until: Optional[str] = None,
+                          direction: Optional[str] = None) -> Tuple[int, int]:
+        """
+        (total, correct) for predictions with since <= timestamp < until.
+
+        Whole days inside the window come from prediction_daily; only the
+        partial first/last day touch the ledger (an indexed range), so the
+        cost is bounded by the window length in days, not by history.
+        """
+        first_day = since[:10]
+        last_day = until[:10] if until else None
+        next_day = (datetime.fromisoformat(first_day) + timedelta(days=1)).strftime("%Y-%m-%d")
+        dir_sql, dir_args = ("AND direction = ?", (direction,)) if direction else ("", ())
+
+        def _ledger(lo: str, hi: Optional[str]) -> Tuple[int, int]:
+            sql = ("SELECT COUNT(*), COALESCE(SUM(correct), 0) FROM prediction_ledger "
+                   f"WHERE timestamp >= ? {'AND timestamp < ?' if hi else ''} {dir_sql}")
+            row = self._conn.execute(sql, (lo,) + ((hi,) if hi else ()) + dir_args).fetchone()
+            return row[0], row[1]
+
+        with self._lock:
+            if last_day is not None and last_day == first_day:
+                return _ledger(since, until)
+            total, correct = _ledger(since, next_day)
+            sql = ("SELECT COALESCE(SUM(total), 0), COALESCE(SUM(correct), 0) "
+                   f"FROM prediction_daily WHERE day > ? {'AND day < ?' if last_day else ''} {dir_sql}")
+            row = self._conn.execute(
+                sql, (first_day,) + ((last_day,) if last_day else ()) + dir_args
+            ).fetchone()
+            total, correct = total + row[0], correct + row[1]
+            if last_day is not None:
+                t, c = _ledger(last_day, until)
+                total, correct = total + t, correct + c
+            return total, correct
+
+    def prediction_totals(self) -> Dict[str, Dict[str, float]]:
+        """All-history totals per direction (summed from prediction_daily)."""
+        rows = self.execute(
+            "SELECT direction, SUM(total) AS total, SUM(correct) AS correct, "
+            "SUM(losers) AS losers, SUM(winner_conv_sum) AS winner_conv_sum, "
+            "SUM(loser_conv_sum) AS loser_conv_sum "
+            "FROM prediction_daily GROUP BY direction"
+        )
+        return {r["direction"]: dict(r) for r in rows}
+
+    # ── smart money scan history ───────────────────────────────────
+
+    def _insert_scans(self, entries: List[Dict[str, Any]]):
+        self._conn.executemany(
+            "INSERT INTO smart_money_scans "
+            "(timestamp, scan_date, fingerprint, n_bullish, n_bearish, top5_bull, top5_bear) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (str(e.get("timestamp", "")), str(e.get("timestamp", ""))[:10],
+                 e.get("fingerprint", ""), int(e.get("n_bullish", 0) or 0),
+                 int(e.get("n_bearish", 0) or 0),
+                 json.dumps(e.get("top5_bull", [])), json.dumps(e.get("top5_bear", [])))
+                for e in entries
+            ],
+        )
+
+    def append_smart_money_scan(self, entry: Dict[str, Any]):
+        """Audit-trail row for one Smart Money scan."""
+        with self.transaction():
+            self._insert_scans([entry])
+
+    # ── cross-entity reports ───────────────────────────────────────
+
+    def trade_outcomes(self, start: str, end: str) -> Dict[str, Any]:
+        """Status counts and return buckets for trades with start <= scan_date < end."""
+        row = self.execute(_TRADE_OUTCOMES_SQL, {"start": start, "end": end})[0]
+        out = {k: (row[k] or 0) for k in row.keys()}
+        out["avg_winner_return"] = float(row["avg_winner_return"] or 0.0)
+        out["avg_loser_return"] = float(row["avg_loser_return"] or 0.0)
+        return out
+
+    def pick_attribution(self, days: int = 30, recurrence_days: int = 7) -> List[Dict[str, Any]]:
+        """Closed-trade P&L by (recurrence_boosted, posted_to_x) over the last `days`."""
+        rows = self.execute(_PICK_ATTRIBUTION_SQL, {
+            "start": (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d"),
+            "recurrence_window": f"-{int(recurrence_days)} days",
+        })
+        return [dict(r) for r in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_store: Optional[AnalyticsStore] = None
+_store_lock = threading.Lock()
+
+
+def analytics_store() -> AnalyticsStore:
+    """Process-wide AnalyticsStore (migrated and legacy-imported on first use)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = AnalyticsStore()
+        return _store
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Analytics store maintenance")
+    parser.add_argument("--attribution", type=int, default=0, metavar="DAYS",
+                        help="Print closed-trade P&L by recurrence boost / X post")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    store = analytics_store()
+    print(f"{store.path} — schema v{store.schema_version}")
+    for r in store.execute("SELECT source, rows, imported_at FROM legacy_imports ORDER BY source"):
+        print(f"  imported {Path(r['source']).name}: {r['rows']} rows ({r['imported_at']})")
+    if args.attribution:
+        for r in store.pick_attribution(days=args.attribution):
+            print(f"  boosted={r['recurrence_boosted']} x={r['posted_to_x']} "
+                  f"trades={r['trades']} pnl=${r['total_pnl'] or 0:,.2f}")
@@ -0,0 +1,765 @@
+"""
+Meta Engine Artifact Store
+===========================
+Single writer/reader for run artifacts in output/.
+
+Every artifact is serialized ONCE per write:
+  - Compact encoding (orjson when installed, stdlib json otherwise)
+  - Optional zstd compression (META_ARTIFACT_COMPRESS=zstd, needs `zstandard`)
+  - Atomic: written to a temp file, then os.replace()'d into place
+  - `{name}_latest.json` is an atomic symlink to the newest dated file,
+    so "latest" costs zero extra serialization. With zstd enabled it is
+    a plain-JSON copy instead, so `json.load` readers keep working
+
+Intermediate mutations (e.g. market direction / 5x injection into the
+cross analysis) are recorded as small versioned deltas in
+`{name}_{stamp}.deltas.jsonl` instead of re-serializing the whole
+document. read() applies pending deltas; compact() folds them into the
+base file once the run is done mutating it.
+
+Every write also upserts one row into the artifact catalog
+(`output/artifact_catalog.db`, SQLite): name, stamp, run ID, session,
+timestamp, file and summary stats (list lengths, status). Consumers ask
+catalog() for the artifacts in a time range and load only those files,
+so day-range lookups are an index seek regardless of how many months of
+files sit in output/. The first catalog access on an existing directory
+backfills it once (reindex()).
+
+Cold artifacts (older than N days) are moved by archive() into one zip
+per day under output/archive/; the catalog records the archive, and
+read()/catalog() keep working on them — only hot files stay plain JSON.
+
+File layout (unchanged for plain-JSON consumers):
+    output/cross_analysis_20260305.json
+    output/cross_analysis_latest.json -> cross_analysis_20260305.json
+
+Usage:
+    from artifact_store import get_store
+    store = get_store()
+    store.write("cross_analysis", cross_results, stamp="20260305")
+    store.patch("cross_analysis", "20260305", set_keys={"market_direction": md})
+    store.compact("cross_analysis", "20260305")
+    data = store.read("cross_analysis")            # latest
+    for entry in store.catalog("cross_analysis", since=date(2026, 3, 2)):
+        data = store.read(entry["name"], entry["stamp"])
+
+    python artifact_store.py --reindex             # rebuild the catalog
+    python artifact_store.py --archive 14          # zip artifacts older than 14 days
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import shutil
+import sqlite3
+import threading
+import zipfile
+from contextlib import closing
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import pytz
+
+logger = logging.getLogger("ArtifactStore")
+
+_META_DIR = Path(__file__).parent
+DEFAULT_OUTPUT_DIR = _META_DIR / "output"
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover — optional dependency
+    _orjson = None
+
+_ZSTD_SUFFIX = ".json.zst"
+_JSON_SUFFIX = ".json"
+_DELTA_SUFFIX = ".deltas.jsonl"
+
+EST = pytz.timezone("US/Eastern")
+
+CATALOG_FILE = "artifact_catalog.db"
+ARCHIVE_DIR = "archive"
+_CATALOG_VERSION = 2  # v2: archive column
+
+# {name}_{stamp}.json[.zst] where stamp is %Y%m%d with optional _%H%M[%S]
+_ARTIFACT_RE = re.compile(r"^(?P<name>.+?)_(?P<stamp>\d{8}(?:_\d{4}(?:\d{2})?)?)(?P<suffix>\.json(?:\.zst)?)$")
+_STAMP_FORMATS = ("%Y%m%d_%H%M%S", "%Y%m%d_%H%M", "%Y%m%d")
+
+_CATALOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    name        TEXT NOT NULL,
+    stamp       TEXT NOT NULL,
+    run_id      TEXT,
+    session     TEXT,
+    ts          TEXT NOT NULL,      -- artifact timestamp, US/Eastern ISO-8601
+    day         TEXT NOT NULL,      -- YYYY-MM-DD of ts
+    path        TEXT NOT NULL,      -- file name relative to the output dir
+    bytes       INTEGER,
+    summary     TEXT,               -- JSON: list lengths, status
+    written_at  TEXT,
+    archive     TEXT,               -- day zip holding `path` once archived, else NULL
+    PRIMARY KEY (name, stamp)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_artifacts_name_ts ON artifacts(name, ts);
+CREATE INDEX IF NOT EXISTS idx_artifacts_day ON artifacts(day, name);
+"""
+
+_CATALOG_UPSERT = """
+INSERT INTO artifacts (name, stamp, run_id, session, ts, day, path, bytes, summary, written_at, archive)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(name, stamp) DO UPDATE SET
+    run_id = excluded.run_id, session = excluded.session, ts = excluded.ts,
+    day = excluded.day, path = excluded.path, bytes = excluded.bytes,
+    summary = excluded.summary, written_at = excluded.written_at,
+    archive = excluded.archive
+"""
+
+
+# ═══════════════════════════════════════════════════════
+# Serialization
+# ═══════════════════════════════════════════════════════
+
+def _default(obj: Any) -> Any:
+    """Non-JSON types: numpy arrays/scalars as numbers, everything else str()."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    return str(obj)
+
+
+def _finite(obj: Any) -> Any:
+    """Copy of `obj` with NaN / ±Infinity floats replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(v) for v in obj]
+    if hasattr(obj, "tolist"):
+        return _finite(obj.tolist())
+    return obj
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Compact JSON encoding, identical with or without orjson.
+
+    NaN / ±Infinity are written as null (JSON has no literal for them).
+    Datetimes and other non-JSON types are written as str(), numpy values
+    as plain numbers.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(
+            data,
+            default=_default,
+            option=(_orjson.OPT_NON_STR_KEYS | _orjson.OPT_SERIALIZE_NUMPY
+                    | _orjson.OPT_PASSTHROUGH_DATETIME | _orjson.OPT_PASSTHROUGH_DATACLASS),
+        )
+    try:
+        raw = json.dumps(data, separators=(",", ":"), default=_default, allow_nan=False)
+    except ValueError:
+        raw = json.dumps(_finite(data), separators=(",", ":"), default=_default, allow_nan=False)
+    return raw.encode("utf-8")
+
+
+def loads(raw: bytes) -> Any:
+    if _orjson is not None:
+        try:
+            return _orjson.loads(raw)
+        except _orjson.JSONDecodeError:
+            pass  # NaN / Infinity literals in older files — stdlib json accepts them
+    return json.loads(raw)
+
+
+def _zstd():
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
+
+
+def _decode(raw: bytes, name: str) -> Any:
+    """Decode artifact bytes; `name` decides whether they are zstd-compressed."""
+    if name.endswith(_ZSTD_SUFFIX):
+        zstd = _zstd()
+        if zstd is None:
+            raise RuntimeError(f"zstandard not installed — cannot read {name}")
+        raw = zstd.ZstdDecompressor().decompress(raw)
+    return loads(raw)
+
+
+def _compress_enabled() -> bool:
+    return os.getenv("META_ARTIFACT_COMPRESS", "").lower() == "zstd"
+
+
+# ═══════════════════════════════════════════════════════
+# Catalog helpers
+# ═══════════════════════════════════════════════════════
+
+def _to_est(dt: datetime) -> datetime:
+    return dt.astimezone(EST) if dt.tzinfo else EST.localize(dt)
+
+
+def _artifact_time(data: Any, stamp: str) -> datetime:
+    """Payload "timestamp" when present, else the file stamp, in US/Eastern."""
+    ts = data.get("timestamp") if isinstance(data, dict) else None
+    if isinstance(ts, str) and ts:
+        try:
+            return _to_est(datetime.fromisoformat(ts.replace("Z", "+00:00")))
+        except ValueError:
+            pass
+    for fmt in _STAMP_FORMATS:
+        try:
+            return EST.localize(datetime.strptime(stamp, fmt))
+        except ValueError:
+            continue
+    return datetime.now(EST)
+
+
+def _summarize(data: Any) -> Dict[str, Any]:
+    """Cheap summary stats: length of every top-level list plus status/mode."""
+    if isinstance(data, list):
+        return {"items": len(data)}
+    if not isinstance(data, dict):
+        return {}
+    summary: Dict[str, Any] = {k: len(v) for k, v in data.items() if isinstance(v, list)}
+    for key in ("status", "mode"):
+        if isinstance(data.get(key), str):
+            summary[key] = data[key]
+    return summary
+
+
+def _ts_bound(value: Union[date, datetime, str], upper: bool) -> str:
+    """Catalog ts bound; a plain date covers that whole day."""
+    if isinstance(value, datetime):
+        return _to_est(value).isoformat()
+    if isinstance(value, date):
+        return (value + timedelta(days=1) if upper else value).isoformat()
+    return str(value)
+
+
+# ═══════════════════════════════════════════════════════
+# Store
+# ═══════════════════════════════════════════════════════
+
+class ArtifactStore:
+    """Atomic, write-once artifact store rooted at an output directory."""
+
+    def __init__(self, output_dir: Optional[Path] = None, compress: Optional[bool] = None,
+                 run_id: Optional[str] = None):
+        self.output_dir = Path(output_dir) if output_dir else DEFAULT_OUTPUT_DIR
+        if compress is None:
+            compress = _compress_enabled()
+        if compress and _zstd() is None:
+            logger.warning("META_ARTIFACT_COMPRESS=zstd but zstandard not installed — writing plain JSON")
+            compress = False
+        self.compress = compress
+        self.bytes_written = 0
+        self.writes = 0
+        self.run_id = run_id  # catalog run ID for writes that don't pass one
+        self.catalog_path = self.output_dir / CATALOG_FILE
+        self._catalog_ready = False
+        self._catalog_lock = threading.Lock()
+
+    # ── Paths ──────────────────────────────────────────
+
+    @property
+    def suffix(self) -> str:
+        return _ZSTD_SUFFIX if self.compress else _JSON_SUFFIX
+
+    def path_for(self, name: str, stamp: str) -> Path:
+        """Existing file for (name, stamp) in either encoding, else the path we'd write."""
+        for suffix in (self.suffix, _JSON_SUFFIX, _ZSTD_SUFFIX):
+            p = self.output_dir / f"{name}_{stamp}{suffix}"
+            if p.exists():
+                return p
+        return self.output_dir / f"{name}_{stamp}{self.suffix}"
+
+    def latest_path(self, name: str) -> Optional[Path]:
+        for suffix in (_JSON_SUFFIX, _ZSTD_SUFFIX):
+            p = self.output_dir / f"{name}_latest{suffix}"
+            if p.exists():
+                return p
+        return None
+
+    def _delta_path(self, name: str, stamp: str) -> Path:
+        return self.output_dir / f"{name}_{stamp}{_DELTA_SUFFIX}"
+
+    # ── Low-level I/O ──────────────────────────────────
+
+    def _compress(self, raw: bytes) -> bytes:
+        if self.compress:
+            raw = _zstd().ZstdCompressor(level=3).compress(raw)
+        return raw
+
+    @staticmethod
+    def read_path(path: Path) -> Any:
+        """Decode a single artifact file (plain or zstd), following symlinks."""
+        return _decode(Path(path).read_bytes(), str(path))
+
+    def _atomic_write_bytes(self, path: Path, raw: bytes):
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(raw)
+        os.replace(tmp, path)
+        self.bytes_written += len(raw)
+        self.writes += 1
+
+    def _link_latest(self, name: str, target: Path, plain: bytes):
+        """
+        Atomically point {name}_latest.json at target.
+
+        The latest name is always plain JSON (`plain` = uncompressed bytes):
+        a symlink for plain artifacts, an atomic copy of `plain` when the
+        artifact itself is zstd-compressed.
+        """
+        latest = self.output_dir / f"{name}_latest{_JSON_SUFFIX}"
+        tmp = latest.with_name(latest.name + ".tmp")
+        if tmp.is_symlink() or tmp.exists():
+            tmp.unlink()
+        if target.name.endswith(_ZSTD_SUFFIX):
+            with open(tmp, "wb") as f:
+                f.write(plain)
+            os.replace(tmp, latest)
+            self.bytes_written += len(plain)
+        else:
+            try:
+                os.symlink(target.name, tmp)
+                os.replace(tmp, latest)
+            except OSError:
+                # Filesystems without symlinks: fall back to an atomic copy
+                shutil.copyfile(target, tmp)
+                os.replace(tmp, latest)
+        # Earlier versions linked {name}_latest.json.zst — drop it
+        stale = self.output_dir / f"{name}_latest{_ZSTD_SUFFIX}"
+        if stale.is_symlink() or stale.exists():
+            stale.unlink()
+
+    # ── Catalog ────────────────────────────────────────
+
+    def _catalog_conn(self, backfill: bool = True) -> sqlite3.Connection:
+        """Open the catalog; the first open on an unindexed directory backfills it."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.catalog_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        if not self._catalog_ready:
+            with self._catalog_lock:
+                if not self._catalog_ready:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    version = conn.execute("PRAGMA user_version").fetchone()[0]
+                    conn.executescript(_CATALOG_SCHEMA)
+                    if version == 1:
+                        conn.execute("ALTER TABLE artifacts ADD COLUMN archive TEXT")
+                        conn.execute(f"PRAGMA user_version = {_CATALOG_VERSION}")
+                        conn.commit()
+                    elif backfill and version < _CATALOG_VERSION:
+                        count = self._reindex(conn)
+                        logger.info(f"📇 Artifact catalog backfilled: {count} files in {self.output_dir}")
+                    self._catalog_ready = True
+        return conn
+
+    def _record(self, conn: sqlite3.Connection, name: str, stamp: str, path: Path,
+                data: Any, size: int, run_id: Optional[str] = None,
+                archive: Optional[str] = None):
+        when = _artifact_time(data, stamp)
+        conn.execute(_CATALOG_UPSERT, (
+            name, stamp, run_id or stamp, "AM" if when.hour < 12 else "PM",
+            when.isoformat(), when.date().isoformat(), path.name, size,
+            json.dumps(_summarize(data)), datetime.now(EST).isoformat(), archive,
+        ))
+
+    def _reindex(self, conn: sqlite3.Connection) -> int:
+        """Catalog every dated artifact (loose or archived) and drop rows for missing ones."""
+        run_ids = {(row["name"], row["stamp"]): row["run_id"]
+                   for row in conn.execute("SELECT name, stamp, run_id FROM artifacts")}
+        seen = set()
+        archive_dir = self.output_dir / ARCHIVE_DIR
+        for zip_path in sorted(archive_dir.glob("*.zip")) if archive_dir.is_dir() else []:
+            try:
+                with zipfile.ZipFile(zip_path) as zf:
+                    for info in zf.infolist():
+                        match = _ARTIFACT_RE.match(info.filename)
+                        if not match:
+                            continue
+                        key = (match["name"], match["stamp"])
+                        data = _decode(zf.read(info), info.filename)
+                        self._record(conn, *key, Path(info.filename), data, info.file_size,
+                                     run_ids.get(key), f"{ARCHIVE_DIR}/{zip_path.name}")
+                        seen.add(key)
+            except Exception as e:
+                logger.warning(f"Catalog skipped unreadable archive {zip_path.name}: {e}")
+        # Loose files win over an archived copy of the same artifact
+        for path in sorted(self.output_dir.iterdir()):
+            match = _ARTIFACT_RE.match(path.name)
+            if not match or path.is_symlink():
+                continue
+            try:
+                data = self.read_path(path)
+            except Exception as e:
+                logger.warning(f"Catalog skipped unreadable {path.name}: {e}")
+                continue
+            key = (match["name"], match["stamp"])
+            self._record(conn, *key, path, data, path.stat().st_size, run_ids.get(key))
+            seen.add(key)
+        stale = [key for key in run_ids if key not in seen]
+        conn.executemany("DELETE FROM artifacts WHERE name = ? AND stamp = ?", stale)
+        conn.execute(f"PRAGMA user_version = {_CATALOG_VERSION}")
+        conn.commit()
+        return len(seen)
+
+    def reindex(self) -> int:
+        """Rebuild the catalog from the files in output/. Returns files indexed."""
+        with closing(self._catalog_conn(backfill=False)) as conn:
+            return self._reindex(conn)
+
+    def catalog(
+        self,
+        name: Optional[str] = None,
+        since: Union[date, datetime, str, None] = None,
+        until: Union[date, datetime, str, None] = None,
+        session: Optional[str] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Catalog entries in timestamp order, without opening any artifact.
+
+        Args:
+            name: Artifact type, e.g. "cross_analysis" (None = all types)
+            since / until: Inclusive bounds; a date covers the whole day
+            session: "AM" or "PM"
+            limit: Max entries returned
+            newest_first: Descending timestamp order
+
+        Returns:
+            [{"name", "stamp", "run_id", "session", "timestamp", "day",
+              "path", "bytes", "summary", "archive"}, ...] — load with
+            read(name, stamp); "archive" is the day zip for cold artifacts.
+        """
+        clauses, params = [], []
+        if name is not None:
+            clauses.append("name = ?")
+            params.append(name)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(_ts_bound(since, upper=False))
+        if until is not None:
+            clauses.append("ts <= ?" if isinstance(until, datetime) else "ts < ?")
+            params.append(_ts_bound(until, upper=True))
+        if session is not None:
+            clauses.append("session = ?")
+            params.append(session)
+        sql = "SELECT * FROM artifacts"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY ts DESC" if newest_first else " ORDER BY ts"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with closing(self._catalog_conn()) as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [{
+            "name": row["name"],
+            "stamp": row["stamp"],
+            "run_id": row["run_id"],
+            "session": row["session"],
+            "timestamp": row["ts"],
+            "day": row["day"],
+            "path": self.output_dir / row["path"],
+            "bytes": row["bytes"],
+            "summary": json.loads(row["summary"] or "{}"),
+            "archive": self.output_dir / row["archive"] if row["archive"] else None,
+        } for row in rows]
+
+    # ── Retention ──────────────────────────────────────
+
+    def _read_archived(self, name: str, stamp: str) -> Any:
+        with closing(self._catalog_conn()) as conn:
+            row = conn.execute(
+                "SELECT path, archive FROM artifacts WHERE name = ? AND stamp = ? AND archive IS NOT NULL",
+                (name, stamp),
+            ).fetchone()
+        if row is None:
+            return None
+        with zipfile.ZipFile(self.output_dir / row["archive"]) as zf:
+            return _decode(zf.read(row["path"]), row["path"])
+
+    def _latest_targets(self) -> set:
+        targets = set()
+        for link in self.output_dir.glob("*_latest.json*"):
+            if link.is_symlink():
+                targets.add(os.readlink(link))
+        return targets
+
+    def archive(self, older_than_days: int, dry_run: bool = False) -> Dict[str, int]:
+        """
+        Move artifacts whose day is older than `older_than_days` into one zip
+        per day (output/archive/artifacts_{YYYYMMDD}.zip).
+
+        Pending deltas are folded in first; files a *_latest link points at
+        stay loose. Each day's zip is rebuilt atomically and catalogued
+        before the loose files are removed, so a crash leaves duplicates,
+        never gaps. `dry_run` applies the same selection and only reports.
+
+        Returns:
+            {"files": archived, "days": zips written, "bytes_before": loose
+             bytes archived, "bytes_after": size of the zips written}
+        """
+        cutoff = (datetime.now(EST).date() - timedelta(days=older_than_days)).isoformat()
+        with closing(self._catalog_conn()) as conn:
+            rows = conn.execute(
+                "SELECT name, stamp, day, path, bytes FROM artifacts "
+                "WHERE archive IS NULL AND day < ? ORDER BY day, name, stamp",
+                (cutoff,),
+            ).fetchall()
+        keep = self._latest_targets()
+        by_day: Dict[str, List[sqlite3.Row]] = {}
+        for row in rows:
+            if row["path"] not in keep:
+                by_day.setdefault(row["day"], []).append(row)
+
+        stats = {"files": 0, "days": 0, "bytes_before": 0, "bytes_after": 0}
+        if dry_run:
+            day_rows = [row for rows in by_day.values() for row in rows]
+            stats.update(files=len(day_rows), days=len(by_day),
+                         bytes_before=sum(row["bytes"] or 0 for row in day_rows))
+            return stats
+        if not by_day:
+            return stats
+        archive_dir = self.output_dir / ARCHIVE_DIR
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        for day, day_rows in by_day.items():
+            for row in day_rows:
+                self.compact(row["name"], row["stamp"], latest=False)
+            members = [(row, self.path_for(row["name"], row["stamp"])) for row in day_rows]
+            members = [(row, path) for row, path in members if path.exists()]
+            if not members:
+                continue
+            zip_path = archive_dir / f"artifacts_{day.replace('-', '')}.zip"
+            tmp = zip_path.with_name(zip_path.name + ".tmp")
+            with zipfile.ZipFile(tmp, "w") as out:
+                if zip_path.exists():
+                    with zipfile.ZipFile(zip_path) as old:
+                        fresh = {path.name for _, path in members}
+                        for info in old.infolist():
+                            if info.filename not in fresh:
+                                out.writestr(info, old.read(info))
+                for _, path in members:
+                    # zstd files are already compressed — store them as-is
+                    compress = zipfile.ZIP_STORED if path.name.endswith(_ZSTD_SUFFIX) else zipfile.ZIP_DEFLATED
+                    out.write(path, path.name, compress_type=compress)
+            os.replace(tmp, zip_path)
+            with closing(self._catalog_conn()) as conn, conn:
+                conn.executemany(
+                    "UPDATE artifacts SET archive = ?, path = ? WHERE name = ? AND stamp = ?",
+                    [(f"{ARCHIVE_DIR}/{zip_path.name}", path.name, row["name"], row["stamp"])
+                     for row, path in members],
+                )
+            for _, path in members:
+                stats["bytes_before"] += path.stat().st_size
+                path.unlink()
+            stats["files"] += len(members)
+            stats["days"] += 1
+            stats["bytes_after"] += zip_path.stat().st_size
+        logger.info(
+            f"🗄️ Archived {stats['files']} artifacts into {stats['days']} day zips "
+            f"({stats['bytes_before'] / 1e6:.1f} MB → {stats['bytes_after'] / 1e6:.1f} MB)"
+        )
+        return stats
+
+    # ── Public API ─────────────────────────────────────
+
+    def write(self, name: str, data: Any, stamp: str = None, latest: bool = True,
+              run_id: Optional[str] = None) -> Path:
+        """
+        Serialize `data` once and store it as {name}_{stamp}.
+
+        Args:
+            name: Artifact type, e.g. "cross_analysis"
+            data: JSON-serializable payload
+            stamp: File stamp (e.g. "20260305" or "20260305_0935");
+                   defaults to now as %Y%m%d_%H%M
+            latest: Also repoint {name}_latest.json at this file
+            run_id: Run that produced it, for the catalog
+                    (defaults to the store's run_id, then the stamp)
+
+        Returns:
+            Path of the written file.
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if stamp is None:
+            stamp = datetime.now().strftime("%Y%m%d_%H%M")
+        path = self.output_dir / f"{name}_{stamp}{self.suffix}"
+        plain = dumps(data)
+        raw = self._compress(plain)
+        self._atomic_write_bytes(path, raw)
+        # A full write supersedes any pending deltas for this artifact
+        self._delta_path(name, stamp).unlink(missing_ok=True)
+        if latest:
+            self._link_latest(name, path, plain)
+        try:
+            with closing(self._catalog_conn()) as conn, conn:
+                self._record(conn, name, stamp, path, data, len(raw), run_id or self.run_id)
+        except sqlite3.Error as e:
+            logger.warning(f"Artifact catalog update failed for {path.name}: {e}")
+        return path
+
+    def patch(
+        self,
+        name: str,
+        stamp: str,
+        set_keys: Optional[Dict[str, Any]] = None,
+        merge_items: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Record a small versioned mutation instead of rewriting the artifact.
+
+        Args:
+            set_keys: Top-level keys to replace, {key: value}
+            merge_items: Per-item field updates inside a list of dicts:
+                {"key": "combined_ranking", "match": "symbol",
+                 "updates": {"AAPL": {"five_x_score": 71.2}}}
+
+        Returns:
+            Delta version number (1-based).
+        """
+        delta_path = self._delta_path(name, stamp)
+        version = 1
+        if delta_path.exists():
+            with open(delta_path, "rb") as f:
+                version = sum(1 for _ in f) + 1
+        delta = {"v": version, "ts": datetime.now().isoformat()}
+        if set_keys:
+            delta["set"] = set_keys
+        if merge_items:
+            delta["merge_items"] = merge_items
+        raw = dumps(delta) + b"\n"
+        with open(delta_path, "ab") as f:
+            f.write(raw)
+        self.bytes_written += len(raw)
+        return version
+
+    @staticmethod
+    def _apply_delta(data: Any, delta: Dict) -> Any:
+        if not isinstance(data, dict):
+            return data
+        for key, value in (delta.get("set") or {}).items():
+            data[key] = value
+        merge = delta.get("merge_items")
+        if merge:
+            match = merge.get("match", "symbol")
+            updates = merge.get("updates", {})
+            for item in data.get(merge.get("key", ""), []) or []:
+                if isinstance(item, dict) and item.get(match) in updates:
+                    item.update(updates[item[match]])
+        return data
+
+    def _read_deltas(self, name: str, stamp: str) -> List[Dict]:
+        delta_path = self._delta_path(name, stamp)
+        if not delta_path.exists():
+            return []
+        deltas = []
+        with open(delta_path, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        deltas.append(loads(line))
+                    except ValueError:
+                        logger.warning(f"Corrupt delta line in {delta_path.name} — skipped")
+        return deltas
+
+    def compact(self, name: str, stamp: str, latest: bool = True) -> Optional[Path]:
+        """Fold pending deltas into the base artifact (one full write)."""
+        if not self._delta_path(name, stamp).exists():
+            return None
+        data = self.read(name, stamp)
+        if data is None:
+            return None
+        run_id = None
+        try:
+            # Keep the run that produced the base artifact
+            with closing(self._catalog_conn()) as conn:
+                row = conn.execute(
+                    "SELECT run_id FROM artifacts WHERE name = ? AND stamp = ?", (name, stamp)
+                ).fetchone()
+            run_id = row["run_id"] if row is not None else None
+        except sqlite3.Error:
+            pass
+        return self.write(name, data, stamp=stamp, latest=latest, run_id=run_id)
+
+    def read(self, name: str, stamp: str = None, default: Any = None) -> Any:
+        """
+        Load an artifact with pending deltas applied.
+
+        Args:
+            stamp: Specific file stamp; None reads {name}_latest. A latest
+                   copy (zstd mode, no symlinks) carries no stamp, so
+                   deltas recorded after that write are not applied.
+        """
+        if stamp is None:
+            path = self.latest_path(name)
+            if path is None:
+                return default
+            # Resolve the link so deltas for the underlying stamp apply
+            resolved = path.resolve()
+            base = resolved.name
+            for suffix in (_ZSTD_SUFFIX, _JSON_SUFFIX):
+                if base.endswith(suffix):
+                    base = base[: -len(suffix)]
+                    break
+            prefix = f"{name}_"
+            stamp = base[len(prefix):] if base.startswith(prefix) and base != f"{name}_latest" else None
+        else:
+            path = self.path_for(name, stamp)
+            if not path.exists():
+                # Cold artifact: deltas were folded in before archiving
+                try:
+                    data = self._read_archived(name, stamp)
+                except Exception as e:
+                    logger.warning(f"Failed to read archived artifact {name}_{stamp}: {e}")
+                    return default
+                return default if data is None else data
+        try:
+            data = self.read_path(path)
+        except Exception as e:
+            logger.warning(f"Failed to read artifact {path.name}: {e}")
+            return default
+        if stamp:
+            for delta in self._read_deltas(name, stamp):
+                data = self._apply_delta(data, delta)
+        return data
+
+
+_store: Optional[ArtifactStore] = None
+
+
+def get_store() -> ArtifactStore:
+    """Process-wide store for the default output directory."""
+    global _store
+    if _store is None:
+        _store = ArtifactStore()
+    return _store
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Meta Engine artifact store")
+    parser.add_argument("--reindex", action="store_true", help="Rebuild the artifact catalog from output/")
+    parser.add_argument("--archive", type=int, metavar="DAYS", help="Archive artifacts older than DAYS")
+    parser.add_argument("--list", metavar="NAME", help="List catalog entries for an artifact type")
+    parser.add_argument("--days", type=int, default=7, help="Window for --list (default 7)")
+    args = parser.parse_args()
+
+    store = get_store()
+    if args.reindex:
+        print(f"📇 Indexed {store.reindex()} artifacts in {store.catalog_path}")
+    if args.archive is not None:
+        print(f"🗄️ {store.archive(args.archive)}")
+    if args.list:
+        since = datetime.now(EST).date() - timedelta(days=args.days)
+        for entry in store.catalog(args.list, since=since):
+            print(f"  {entry['timestamp']}  {entry['session']}  {entry['path'].name}  {entry['summary']}")
@@ -61,6 +61,26 @@ class MetaConfig:
     RUN_TIME_ET = os.getenv("META_RUN_TIME", "09:35")  # Morning (post-open)
     RUN_TIME_PM_ET = os.getenv("META_RUN_TIME_PM", "15:15")  # Afternoon
     RUN_TIMES_ET = [RUN_TIME_PREMARKET_ET, RUN_TIME_ET, RUN_TIME_PM_ET]
+    # Wall-clock limit for one scheduled pipeline run (the scheduler kills
+    # the subprocess after this); the notification drain fits inside it.
+    RUN_TIMEOUT_SEC = int(os.getenv("META_RUN_TIMEOUT_SEC", "900"))
+    # Incremental intraday rescan cadence (minutes, market hours; 0 = off).
+    # Only symbols whose inputs changed are recomputed — see
+    # analysis/incremental_scan.py.
+    RESCAN_INTERVAL_MIN = int(os.getenv("META_RESCAN_INTERVAL_MIN", "0"))
+    # Resident mover monitor poll interval (seconds, market hours; 0 = off).
+    # See engine_adapters/mover_monitor.py.
+    MOVER_MONITOR_POLL_SEC = int(os.getenv("META_MOVER_MONITOR_SEC", "30"))
+    # Nightly retention (retention.py): artifacts older than this many days
+    # move into per-day zips under output/archive/; logs untouched this
+    # long are gzip-compressed.
+    ARTIFACT_HOT_DAYS = int(os.getenv("META_ARTIFACT_HOT_DAYS", "14"))
+    LOG_HOT_DAYS = int(os.getenv("META_LOG_HOT_DAYS", "7"))
+    RETENTION_TIME_ET = os.getenv("META_RETENTION_TIME", "01:30")
+    # Nightly pick warehouse ETL (warehouse.py, needs pyarrow). Months
+    # touched in the lookback window are rebuilt so late outcomes land.
+    WAREHOUSE_TIME_ET = os.getenv("META_WAREHOUSE_TIME", "01:00")
+    WAREHOUSE_LOOKBACK_DAYS = int(os.getenv("META_WAREHOUSE_LOOKBACK_DAYS", "10"))
     TIMEZONE = "US/Eastern"
 
     # ========== ENGINE SETTINGS ==========
@@ -100,6 +100,21 @@ def _price_volatility_weight(price: float) -> float:
     return 1.0         # Mega-caps: UNH, NVDA, etc.
 
 
+# Same ladder as _price_volatility_weight, as (upper bound, weight) columns
+_VOL_PRICE_BREAKS = (5, 15, 30, 50, 100, 200, 400)
+_VOL_WEIGHTS = (4.0, 3.5, 3.0, 2.5, 2.0, 1.5, 1.2, 1.0)
+
+
+def _price_volatility_weights(prices):
+    """Vectorized _price_volatility_weight over an array of prices."""
+    import numpy as np
+    prices = np.asarray(prices, dtype=float)
+    idx = np.searchsorted(np.asarray(_VOL_PRICE_BREAKS, dtype=float), prices, side="left")
+    weights = np.asarray(_VOL_WEIGHTS)[idx]
+    weights[prices <= 0] = 2.0
+    return weights
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # SECTOR WAVE DETECTION
 # ═══════════════════════════════════════════════════════════════════════════
@@ -134,16 +149,39 @@ def _detect_sector_waves(candidates: List[Dict]) -> Dict[str, Dict]:
 # MULTI-DAY PERSISTENCE TRACKING
 # ═══════════════════════════════════════════════════════════════════════════
 
+_tri_memo: Dict[str, Any] = {}
+
+
+def _load_trinity_scans() -> Dict:
+    """
+    Parsed trinity_interval_scans.json, memoized on (mtime, size).
+
+    Both the persistence counter and the latest-scan loader read this file;
+    with the full history it is the slowest part of a 5x run, so it is
+    parsed once per change instead of twice per call.
+    """
+    path = TN_DATA / "trinity_interval_scans.json"
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    if _tri_memo.get("key") != key:
+        with open(path) as f:
+            tri = json.load(f)
+        _tri_memo.clear()
+        _tri_memo.update({"key": key, "data": tri})
+    return _tri_memo["data"]
+
+
 def _load_persistence_data() -> Dict[str, int]:
     """
     Load multi-day persistence from trinity_interval_scans.json.
     Returns: {symbol: num_days_appeared}
     """
-    persistence = defaultdict(set)
     try:
-        with open(TN_DATA / "trinity_interval_scans.json") as f:
-            tri = json.load(f)
-        
+        tri = _load_trinity_scans()
+        cached = _tri_memo.get("persistence")
+        if cached is not None:
+            return dict(cached)
+        persistence = defaultdict(set)
         for d in sorted(tri.keys()):
             try:
                 day_data = tri[d]
@@ -156,10 +194,13 @@ def _load_persistence_data() -> Dict[str, int]:
                                 persistence[sym].add(d)
             except (TypeError, AttributeError):
                 continue
+        counts = {sym: len(days) for sym, days in persistence.items()}
+        _tri_memo["persistence"] = counts
+        return dict(counts)
     except Exception as e:
         logger.warning(f"5x Potential: Failed to load persistence data: {e}")
     
-    return {sym: len(days) for sym, days in persistence.items()}
+    return {}
 
 
 def _persistence_boost(days: int) -> float:
@@ -230,11 +271,8 @@ PREMIUM_PUT_SIGNALS = {
     "repeated_sell_blocks", "distribution",
 }
 
-def _signal_quality_score(signals: list, catalysts: list, direction: str) -> float:
-    """
-    Score signal quality for a specific direction (CALL or PUT).
-    Premium signals get higher scores.
-    """
+def _signal_text(signals: list, catalysts: list) -> str:
+    """Lower-cased, de-duplicated signal + catalyst text used for keyword matching."""
     sig_set = set()
     for s in (signals or []):
         sig_set.add(str(s).lower())
@@ -242,7 +280,15 @@ def _signal_quality_score(signals: list, catalysts: list, direction: str) -> flo
         sig_set.add(str(c).lower())
     
     # Join all for keyword matching
-    sig_str = " ".join(sig_set)
+    return " ".join(sig_set)
+
+
+def _signal_quality_score(signals: list, catalysts: list, direction: str) -> float:
+    """
+    Score signal quality for a specific direction (CALL or PUT).
+    Premium signals get higher scores.
+    """
+    sig_str = _signal_text(signals, catalysts)
     
     premium_hits = 0
     if direction == "CALL":
@@ -263,6 +309,32 @@ def _signal_quality_score(signals: list, catalysts: list, direction: str) -> flo
     return min(quality, 1.0)
 
 
+def _signal_quality_from_hits(premium_hits, total_signals):
+    """Array form of the _signal_quality_score formula (hits/counts → quality)."""
+    import numpy as np
+    density = np.minimum(np.asarray(total_signals) / 8.0, 1.0)
+    quality = np.minimum(np.asarray(premium_hits) * 0.20, 0.60) + density * 0.40
+    return np.minimum(quality, 1.0)
+
+
+def _signal_quality_scores(texts: List[str], total_signals, direction: str):
+    """
+    Vectorized _signal_quality_score.
+
+    `texts` are _signal_text() strings and `total_signals` the matching
+    len(signals) counts; each premium keyword is matched across the whole
+    batch with one np.char.find call instead of once per candidate.
+    """
+    import numpy as np
+    arr = np.asarray(texts, dtype=str)
+    hits = np.zeros(len(arr), dtype=int)
+    if len(arr):
+        premium = PREMIUM_CALL_SIGNALS if direction == "CALL" else PREMIUM_PUT_SIGNALS
+        for ps in premium:
+            hits += np.char.find(arr, ps) >= 0
+    return _signal_quality_from_hits(hits, total_signals)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # MARKET REGIME (informational only — NOT used for blocking)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -471,49 +543,16 @@ def compute_5x_potential(
         for sector, wave in sorted(sector_waves.items(), key=lambda x: -x[1]["count"]):
             logger.info(f"    {sector}: {wave['count']} stocks ({', '.join(wave['symbols'][:5])})")
     
-    # Score CALL candidates
-    call_scored = []
-    for sym, c in all_call_candidates.items():
-        score_5x = _compute_5x_score(
-            sym, c, "CALL", persistence, uw_flow, forecasts, sector_waves, regime
-        )
-        c["_5x_score"] = round(score_5x, 4)
-        c["_5x_direction"] = "CALL"
-        c["_5x_persistence_days"] = persistence.get(sym, 0)
-        c["_5x_sector"] = _SECTOR_MAP.get(sym, c.get("sector", ""))
-        
-        # Flow alignment info
-        flow = uw_flow.get(sym, {})
-        c["_5x_call_pct"] = flow.get("call_pct", 0.5)
-        c["_5x_total_premium"] = flow.get("total_premium", 0)
-        
-        if score_5x >= 0.30:  # Minimum threshold
-            call_scored.append(c)
-    
-    # Score PUT candidates
-    put_scored = []
-    for sym, c in all_put_candidates.items():
-        score_5x = _compute_5x_score(
-            sym, c, "PUT", persistence, uw_flow, forecasts, sector_waves, regime
-        )
-        c["_5x_score"] = round(score_5x, 4)
-        c["_5x_direction"] = "PUT"
-        c["_5x_persistence_days"] = persistence.get(sym, 0)
-        c["_5x_sector"] = _SECTOR_MAP.get(sym, c.get("sector", ""))
-        
-        flow = uw_flow.get(sym, {})
-        c["_5x_put_pct"] = flow.get("put_pct", 0.5)
-        c["_5x_total_premium"] = flow.get("total_premium", 0)
-        
-        if score_5x >= 0.30:
-            put_scored.append(c)
-    
-    # Sort by 5x_score and take top N
-    call_scored.sort(key=lambda x: x["_5x_score"], reverse=True)
-    put_scored.sort(key=lambda x: x["_5x_score"], reverse=True)
-    
-    call_top = call_scored[:top_n]
-    put_top = put_scored[:top_n]
+    # Score + rank (pruned: only candidates that can matter are fully scored)
+    wave_symbols = {sym for wave in sector_waves.values() for sym in wave["symbols"]}
+    call_top, call_scored, call_above = _rank_5x(
+        all_call_candidates, "CALL", persistence, uw_flow, forecasts, sector_waves,
+        top_n, wave_symbols,
+    )
+    put_top, put_scored, put_above = _rank_5x(
+        all_put_candidates, "PUT", persistence, uw_flow, forecasts, sector_waves,
+        top_n, wave_symbols,
+    )
     
     # Add regime warnings (NOT blocks)
     regime_warning = None
@@ -623,8 +662,8 @@ def compute_5x_potential(
         "stats": {
             "call_pool_size": len(all_call_candidates),
             "put_pool_size": len(all_put_candidates),
-            "call_above_threshold": len(call_scored),
-            "put_above_threshold": len(put_scored),
+            "call_above_threshold": call_above,
+            "put_above_threshold": put_above,
             "sector_waves_count": len(sector_waves),
             "persistence_symbols": sum(1 for v in persistence.values() if v >= 3),
         },
@@ -654,21 +693,38 @@ def _compute_5x_score(
       base_quality = 0.40 × base_score + 0.30 × signal_quality + 0.30 × flow_alignment
       boosts = sector_wave_boost + persistence_boost + forecast_boost
     """
-    def _parse_price(val) -> float:
-        """Safely parse price from various formats (float, str, range)."""
-        if isinstance(val, (int, float)):
-            return float(val)
-        if isinstance(val, str):
-            # Handle "$1.56 - $1.90" → take first number
-            nums = re.findall(r'[\d.]+', val)
-            if nums:
-                try:
-                    return float(nums[0])
-                except ValueError:
-                    pass
-        return 0.0
+    price, base_score, signals, catalysts, flow_alignment, institutional_score = _score_parts(
+        sym, candidate, direction, persistence, uw_flow, forecasts, sector_waves
+    )
     
-    price = _parse_price(candidate.get("price") or candidate.get("current_price") or candidate.get("entry_price") or 0)
+    # ── Layer 1: BASE QUALITY ──────────────────────────────────────
+    # Signal quality (premium signals for the specific direction)
+    sig_quality = _signal_quality_score(signals, catalysts, direction)
+    
+    # ── Layer 2: VOLATILITY WEIGHT ─────────────────────────────────
+    vol_weight = _price_volatility_weight(price)
+    
+    return _combine_5x(base_score, sig_quality, flow_alignment, institutional_score, vol_weight)
+
+
+def _score_parts(
+    sym: str,
+    candidate: Dict,
+    direction: str,
+    persistence: Dict[str, int],
+    uw_flow: Dict[str, Dict],
+    forecasts: Dict[str, Dict],
+    sector_waves: Dict[str, Dict],
+) -> Tuple[float, float, list, list, float, float]:
+    """
+    Everything in the 5x score except signal quality and volatility weight.
+
+    Returns (price, base_score, signals, catalysts, flow_alignment,
+    institutional_score). These are dict lookups and a handful of
+    comparisons; the keyword matching is left to the caller so the ranker
+    can bound it instead of paying for it.
+    """
+    price = _safe_price(candidate.get("price") or candidate.get("current_price") or candidate.get("entry_price") or 0)
     base_score_raw = candidate.get("score") or candidate.get("_base_score") or 0
     base_score = float(base_score_raw) if isinstance(base_score_raw, (int, float)) else 0.0
     signals = candidate.get("signals", [])
@@ -681,10 +737,6 @@ def _compute_5x_score(
     if not isinstance(catalysts, list):
         catalysts = [str(catalysts)] if catalysts else []
     
-    # ── Layer 1: BASE QUALITY ──────────────────────────────────────
-    # Signal quality (premium signals for the specific direction)
-    sig_quality = _signal_quality_score(signals, catalysts, direction)
-    
     # Flow alignment (does UW flow confirm the direction?)
     flow = uw_flow.get(sym, {})
     flow_alignment = 0.0
@@ -710,18 +762,6 @@ def _compute_5x_score(
             else:
                 flow_alignment = 0.2
     
-    # ── Layer 1: BASE QUALITY (additive, not multiplicative) ──────
-    # Changed from multiplicative to additive to prevent zero-signal candidates
-    # from scoring near zero despite having strong flow/persistence/sector data.
-    base_quality = (
-        0.25 * min(base_score, 1.0)
-        + 0.25 * sig_quality
-        + 0.25 * max(flow_alignment, 0)  # Don't let negative flow kill the score
-    )
-    
-    # ── Layer 2: VOLATILITY WEIGHT ─────────────────────────────────
-    vol_weight = _price_volatility_weight(price)
-    
     # ── Layer 3: INSTITUTIONAL INTEREST SIGNALS ────────────────────
     # These are treated as ADDITIVE components (not just multiplier boosts)
     # because persistence + sector wave + flow = institutional conviction
@@ -770,6 +810,26 @@ def _compute_5x_score(
     if flow_alignment < 0:
         institutional_score += flow_alignment * 0.3  # Small reduction
     
+    return price, base_score, signals, catalysts, flow_alignment, institutional_score
+
+
+def _combine_5x(
+    base_score: float,
+    sig_quality: float,
+    flow_alignment: float,
+    institutional_score: float,
+    vol_weight: float,
+) -> float:
+    """Final 5x formula from its layers (monotone in sig_quality)."""
+    # ── Layer 1: BASE QUALITY (additive, not multiplicative) ──────
+    # Changed from multiplicative to additive to prevent zero-signal candidates
+    # from scoring near zero despite having strong flow/persistence/sector data.
+    base_quality = (
+        0.25 * min(base_score, 1.0)
+        + 0.25 * sig_quality
+        + 0.25 * max(flow_alignment, 0)  # Don't let negative flow kill the score
+    )
+    
     # ── Final Score ────────────────────────────────────────────────
     # ADDITIVE formula: base_quality + institutional_score, then scale by vol_weight
     # This ensures persistence + sector wave alone can produce actionable scores
@@ -783,6 +843,259 @@ def _compute_5x_score(
     return normalized
 
 
+def _combine_5x_array(base_score, sig_quality, flow_alignment, institutional_score, vol_weight):
+    """Array twin of _combine_5x — same operation order, so results are bit-identical."""
+    import numpy as np
+    base_quality = (
+        0.25 * np.minimum(base_score, 1.0)
+        + 0.25 * sig_quality
+        + 0.25 * np.maximum(flow_alignment, 0)
+    )
+    combined = base_quality + institutional_score
+    raw = combined * vol_weight
+    return np.minimum(raw / 3.0, 1.0)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PRUNING TOP-K RANKER
+# ═══════════════════════════════════════════════════════════════════════════
+# Signal quality is the only part of the 5x score that needs string work, and
+# the score is monotone in it. So every candidate gets a cheap [lower, upper]
+# bound (0 vs max premium hits), only candidates whose bound straddles the
+# threshold or can still reach the top-k are scored exactly, and the top-k is
+# taken with a bounded heap instead of a full sort.
+#
+# The bounds cost a columnar pass, so pruning only pays off on large pools
+# (--bench: ~1.0x at 100, 1.4-1.6x at 500-2k). The production pool is ~104
+# after the static-universe gate, so smaller pools are scored in full.
+
+FIVE_X_THRESHOLD = 0.30     # Minimum 5x score to be listed
+PRUNE_MIN_POOL = 500        # Pool size from which the pruning ranker is used
+
+
+def _annotate_5x(c: Dict, sym: str, direction: str, score_5x: float,
+                 persistence: Dict[str, int], uw_flow: Dict[str, Dict]):
+    """Attach the _5x_* fields used by the report and serializer."""
+    c["_5x_score"] = round(score_5x, 4)
+    c["_5x_direction"] = direction
+    c["_5x_persistence_days"] = persistence.get(sym, 0)
+    c["_5x_sector"] = _SECTOR_MAP.get(sym, c.get("sector", ""))
+    
+    # Flow alignment info
+    flow = uw_flow.get(sym, {})
+    if direction == "CALL":
+        c["_5x_call_pct"] = flow.get("call_pct", 0.5)
+    else:
+        c["_5x_put_pct"] = flow.get("put_pct", 0.5)
+    c["_5x_total_premium"] = flow.get("total_premium", 0)
+
+
+def _score_columns(
+    pool: Dict[str, Dict],
+    syms: List[str],
+    direction: str,
+    persistence: Dict[str, int],
+    uw_flow: Dict[str, Dict],
+    forecasts: Dict[str, Dict],
+    sector_waves: Dict[str, Dict],
+):
+    """
+    Columnar _score_parts for a whole pool.
+
+    One light pass pulls the raw fields; the flow / persistence / sector
+    ladders then run as array selects. Institutional terms are added in the
+    scalar order (missing terms are exact +0.0), so every value matches
+    _score_parts bit for bit.
+
+    Returns (prices, base_score, signal_counts, has_text, flow_alignment,
+    institutional_score, texts_of) where texts_of(i) builds candidate i's
+    _signal_text on demand.
+    """
+    import numpy as np
+    n = len(syms)
+    cands = [pool[sym] for sym in syms]
+    
+    prices = np.fromiter(
+        (_safe_price(c.get("price") or c.get("current_price") or c.get("entry_price") or 0)
+         for c in cands),
+        float, n)
+    base_raw = [c.get("score") or c.get("_base_score") or 0 for c in cands]
+    base = np.fromiter(
+        (float(b) if isinstance(b, (int, float)) else 0.0 for b in base_raw), float, n)
+    signals = [c.get("signals", []) for c in cands]
+    signals = [sig if isinstance(sig, list) else [] for sig in signals]
+    
+    catalysts: Dict[int, list] = {}
+    forecast_term = np.zeros(n)
+    for i, sym in enumerate(syms):
+        fc = forecasts.get(sym)
+        if not fc:
+            continue
+        cat = fc.get("catalysts", [])
+        if not isinstance(cat, list):
+            cat = [str(cat)] if cat else []
+        catalysts[i] = cat
+        key = "bullish_probability" if direction == "CALL" else "bearish_probability"
+        prob = fc.get(key, 0)
+        if isinstance(prob, str):
+            try:
+                prob = float(prob.strip("%")) / 100
+            except (ValueError, TypeError):
+                prob = 0
+        if prob > 0.55:
+            forecast_term[i] = 0.10
+    
+    counts = np.fromiter((len(sig) for sig in signals), int, n)
+    has_text = np.fromiter((bool(sig) or bool(catalysts.get(i)) for i, sig in enumerate(signals)), bool, n)
+    
+    # Flow alignment ladder
+    pct_key = "call_pct" if direction == "CALL" else "put_pct"
+    flows = [uw_flow.get(sym, {}) for sym in syms]
+    has_flow = np.fromiter((bool(f) for f in flows), bool, n)
+    pct = np.fromiter((f.get(pct_key, 0.5) if f else 0.5 for f in flows), float, n)
+    flow_alignment = np.select(
+        [~has_flow, pct > 0.70, pct > 0.55, pct < 0.40],
+        [0.0, 1.0, 0.6, -0.3],
+        default=0.2,
+    )
+    
+    # Persistence ladder
+    days = np.fromiter((persistence.get(sym, 0) for sym in syms), float, n)
+    persistence_term = np.select(
+        [days >= 5, days >= 4, days >= 3, days >= 2, days >= 1],
+        [0.30, 0.25, 0.20, 0.15, 0.08],
+        default=0.0,
+    )
+    
+    # Sector wave boost
+    wave_boost = {sector: wave["boost"] for sector, wave in sector_waves.items()}
+    sector_term = np.fromiter(
+        (wave_boost.get(_SECTOR_MAP.get(sym, sector) or "", 0.0)
+         for sym, sector in zip(syms, (c.get("sector", "") for c in cands))), float, n)
+    
+    penalty_term = np.where(flow_alignment < 0, flow_alignment * 0.3, 0.0)
+    institutional = 0.0 + persistence_term + sector_term + forecast_term + penalty_term
+    
+    def texts_of(i: int) -> str:
+        return _signal_text(signals[i], catalysts.get(i, []))
+    
+    return prices, base, counts, has_text, flow_alignment, institutional, texts_of
+
+
+def _rank_5x(
+    pool: Dict[str, Dict],
+    direction: str,
+    persistence: Dict[str, int],
+    uw_flow: Dict[str, Dict],
+    forecasts: Dict[str, Dict],
+    sector_waves: Dict[str, Dict],
+    top_n: int,
+    must_score: Set[str] = frozenset(),
+) -> Tuple[List[Dict], List[Dict], int]:
+    """
+    Top-`top_n` of `pool` by 5x score.
+
+    Returns (top, scored, above_threshold):
+      top             — identical to the old "score all, stable sort, slice"
+      scored          — exactly-scored candidates ≥ threshold, pool order
+                        (always covers `top` and every `must_score` symbol)
+      above_threshold — exact count of candidates ≥ threshold
+    """
+    rank = _rank_5x_pruned if len(pool) >= PRUNE_MIN_POOL else _rank_5x_full
+    return rank(pool, direction, persistence, uw_flow, forecasts, sector_waves,
+                top_n, must_score)
+
+
+def _rank_5x_full(
+    pool: Dict[str, Dict],
+    direction: str,
+    persistence: Dict[str, int],
+    uw_flow: Dict[str, Dict],
+    forecasts: Dict[str, Dict],
+    sector_waves: Dict[str, Dict],
+    top_n: int,
+    must_score: Set[str] = frozenset(),
+) -> Tuple[List[Dict], List[Dict], int]:
+    """_rank_5x for small pools: score every candidate, stable sort, slice."""
+    scored = []
+    for sym, c in pool.items():
+        score_5x = _compute_5x_score(sym, c, direction, persistence, uw_flow,
+                                     forecasts, sector_waves, {})
+        if score_5x >= FIVE_X_THRESHOLD:
+            _annotate_5x(c, sym, direction, score_5x, persistence, uw_flow)
+            scored.append(c)
+    top = sorted(scored, key=lambda x: x["_5x_score"], reverse=True)[:top_n] if top_n > 0 else []
+    return top, scored, len(scored)
+
+
+def _rank_5x_pruned(
+    pool: Dict[str, Dict],
+    direction: str,
+    persistence: Dict[str, int],
+    uw_flow: Dict[str, Dict],
+    forecasts: Dict[str, Dict],
+    sector_waves: Dict[str, Dict],
+    top_n: int,
+    must_score: Set[str] = frozenset(),
+) -> Tuple[List[Dict], List[Dict], int]:
+    """_rank_5x for large pools, without scoring every candidate exactly."""
+    import heapq
+    import numpy as np
+    
+    syms = list(pool)
+    n = len(syms)
+    if not n:
+        return [], [], 0
+    
+    cols = _score_columns(pool, syms, direction, persistence, uw_flow, forecasts, sector_waves)
+    prices, base, counts, has_text, flow_alignment, institutional, texts_of = cols
+    vol_weight = _price_volatility_weights(prices)
+    
+    # 3 premium hits already saturates the 0.60 cap
+    lower = _combine_5x_array(base, _signal_quality_from_hits(0, counts),
+                              flow_alignment, institutional, vol_weight)
+    upper = _combine_5x_array(base, _signal_quality_from_hits(np.where(has_text, 3, 0), counts),
+                              flow_alignment, institutional, vol_weight)
+    
+    # k-th best guaranteed score: anything whose (rounded) ceiling is below it
+    # can never make the cut, even on a tie.
+    sure = lower >= FIVE_X_THRESHOLD
+    cutoff = float("-inf")
+    if 0 < top_n <= int(sure.sum()):
+        sure_keys = sorted((round(float(v), 4) for v in lower[sure]), reverse=True)
+        cutoff = sure_keys[top_n - 1]
+    upper_keys = np.array([round(float(v), 4) for v in upper])
+    must = np.fromiter((sym in must_score for sym in syms), bool, n)
+    
+    need = (upper >= FIVE_X_THRESHOLD) & (
+        (lower < FIVE_X_THRESHOLD) | (upper_keys >= cutoff) | must
+    )
+    idx = np.flatnonzero(need)
+    # No signal text → zero premium hits, so the lower bound is already exact
+    exact = lower[idx].copy()
+    matched = has_text[idx]
+    if matched.any():
+        text_idx = idx[matched]
+        texts = [texts_of(i) for i in text_idx]
+        exact[matched] = _combine_5x_array(
+            base[text_idx], _signal_quality_scores(texts, counts[text_idx], direction),
+            flow_alignment[text_idx], institutional[text_idx], vol_weight[text_idx],
+        )
+    
+    scored = []
+    for i, score_5x in zip(idx, exact):
+        score_5x = float(score_5x)
+        if score_5x >= FIVE_X_THRESHOLD:
+            sym = syms[i]
+            c = pool[sym]
+            _annotate_5x(c, sym, direction, score_5x, persistence, uw_flow)
+            scored.append(c)
+    
+    above_threshold = len(scored) + int(np.count_nonzero(sure & ~need))
+    top = heapq.nlargest(top_n, scored, key=lambda x: x["_5x_score"]) if top_n > 0 else []
+    return top, scored, above_threshold
+
+
 def _load_trinity_candidates() -> List[Dict]:
     """
     Load the latest Trinity scan candidates to expand the pool
@@ -790,8 +1103,7 @@ def _load_trinity_candidates() -> List[Dict]:
     """
     candidates = []
     try:
-        with open(TN_DATA / "trinity_interval_scans.json") as f:
-            tri = json.load(f)
+        tri = _load_trinity_scans()
         
         # Get the most recent day's data
         latest_day = max(tri.keys()) if tri else None
@@ -995,3 +1307,107 @@ def get_five_x_potential_picks(
         puts_candidates=puts_candidates,
         top_n=25,
     )
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# BENCHMARK / PARITY CHECK
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _synthetic_pool(n: int, seed: int = 7) -> Tuple[Dict, Dict, Dict, Dict, Dict]:
+    """Trinity-history-sized random pool + enrichment maps for the bench."""
+    import random
+    rng = random.Random(seed)
+    vocab = sorted(PREMIUM_CALL_SIGNALS | PREMIUM_PUT_SIGNALS) + [
+        "volume spike", "breakout", "rsi oversold", "earnings soon", "iv rank high",
+        "momentum", "gap up", "vwap reclaim",
+    ]
+    sectors = [f"sector_{i}" for i in range(12)]
+    pool, persistence, uw_flow, forecasts = {}, {}, {}, {}
+    for i in range(n):
+        sym = f"S{i:05d}"
+        kind = rng.random()
+        if kind < 0.35:    # adapter / Trinity pick with signals
+            sigs = rng.sample(vocab, rng.randint(0, 6))
+            pool[sym] = {"symbol": sym, "score": round(rng.uniform(0.2, 1.0), 3),
+                         "price": round(rng.uniform(2, 900), 2), "signals": sigs,
+                         "sector": rng.choice(sectors) if rng.random() < 0.3 else ""}
+        else:              # persistence / flow / forecast filler
+            pool[sym] = {"symbol": sym, "score": round(rng.uniform(0.1, 0.8), 2),
+                         "price": 0, "signals": [],
+                         "sector": rng.choice(sectors) if rng.random() < 0.1 else ""}
+        if rng.random() < 0.6:
+            persistence[sym] = rng.randint(1, 6)
+        if rng.random() < 0.4:
+            cp = rng.random()
+            uw_flow[sym] = {"call_pct": round(cp, 3), "put_pct": round(1 - cp, 3),
+                            "total_premium": rng.randint(10_000, 5_000_000)}
+        if rng.random() < 0.15:
+            forecasts[sym] = {"bullish_probability": f"{rng.randint(20, 80)}%",
+                              "bearish_probability": rng.uniform(0.2, 0.8),
+                              "catalysts": rng.sample(vocab, rng.randint(0, 2))}
+    waves = _detect_sector_waves(list(pool.values()))
+    return pool, persistence, uw_flow, forecasts, waves
+
+
+def run_benchmark(sizes=(100, 500, 2000, 20000), top_n: int = 25) -> List[Dict[str, Any]]:
+    """Full score + sort vs the pruning ranker, per pool size (both checked for parity)."""
+    import copy
+    import time
+    rows = []
+    warm_pool, *warm_maps = _synthetic_pool(10)
+    _rank_5x_pruned(warm_pool, "CALL", *warm_maps, top_n)   # warm up NumPy
+    for n in sizes:
+        pool, persistence, uw_flow, forecasts, waves = _synthetic_pool(n)
+        wave_symbols = {sym for w in waves.values() for sym in w["symbols"]}
+        row = {"n": n, "identical": True}
+        for direction in ("CALL", "PUT"):
+            ref_pool = copy.deepcopy(pool)
+            t0 = time.perf_counter()
+            ref_scored = []
+            for sym, c in ref_pool.items():
+                score_5x = _compute_5x_score(sym, c, direction, persistence, uw_flow,
+                                             forecasts, waves, {})
+                _annotate_5x(c, sym, direction, score_5x, persistence, uw_flow)
+                if score_5x >= FIVE_X_THRESHOLD:
+                    ref_scored.append(c)
+            ref_scored.sort(key=lambda x: x["_5x_score"], reverse=True)
+            ref_top = ref_scored[:top_n]
+            t_ref = time.perf_counter() - t0
+            
+            ref_waves = {c["symbol"]: c["_5x_score"] for c in ref_scored if c["symbol"] in wave_symbols}
+            for rank in (_rank_5x_full, _rank_5x_pruned):
+                new_pool = copy.deepcopy(pool)
+                t0 = time.perf_counter()
+                top, scored, above = rank(new_pool, direction, persistence, uw_flow,
+                                          forecasts, waves, top_n, wave_symbols)
+                t_new = time.perf_counter() - t0
+                new_waves = {c["symbol"]: c["_5x_score"] for c in scored if c["symbol"] in wave_symbols}
+                row["identical"] = row["identical"] and (
+                    _serialize_picks(top) == _serialize_picks(ref_top)
+                    and above == len(ref_scored)
+                    and new_waves == ref_waves
+                )
+            row[f"{direction.lower()}_full_ms"] = t_ref * 1000
+            row[f"{direction.lower()}_pruned_ms"] = t_new * 1000
+            row[f"{direction.lower()}_exact"] = len(scored)
+        row["full_ms"] = row["call_full_ms"] + row["put_full_ms"]
+        row["pruned_ms"] = row["call_pruned_ms"] + row["put_pruned_ms"]
+        row["speedup"] = row["full_ms"] / row["pruned_ms"] if row["pruned_ms"] else 0.0
+        rows.append(row)
+    return rows
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="5x Potential ranker benchmark / parity check")
+    parser.add_argument("--bench", action="store_true", help="Full sort vs pruning ranker")
+    parser.add_argument("--sizes", type=str, default="100,500,2000,20000")
+    args = parser.parse_args()
+    
+    rows = run_benchmark(sizes=tuple(int(s) for s in args.sizes.split(",")))
+    print(f"{'N':>6} {'full ms':>9} {'pruned ms':>10} {'speedup':>8}  parity")
+    for r in rows:
+        print(f"{r['n']:>6} {r['full_ms']:>9.2f} {r['pruned_ms']:>10.2f} {r['speedup']:>7.1f}x  "
+              f"{'✅' if r['identical'] else '❌'}")
+    sys.exit(0 if all(r["identical"] for r in rows) else 1)
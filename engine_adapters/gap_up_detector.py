@@ -120,12 +120,23 @@ def detect_gap_ups(
     """
     logger.info("🚀 Gap-Up Detector: Scanning for same-day plays...")
 
-    # Load all data sources
-    mws_data = _load_mws_call_buying_signals()
-    sector_hot = _load_sector_sympathy_signals()
-    pred_data = _load_predictive_recurrence_signals()
-    uw_flow_data = _load_uw_flow_bullish_signals()
-    premarket_data = _load_premarket_gaps(polygon_api_key)
+    # Load all data sources concurrently — the Polygon snapshot is the long
+    # pole, the file loaders finish underneath it. The MWS forecast is
+    # parsed once in the pool and shared by the call-buying and sector
+    # loaders (submitted first, so it never waits behind them).
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        f_forecast = pool.submit(_load_forecast)
+        f_premarket = pool.submit(_load_premarket_gaps, polygon_api_key)
+        f_mws = pool.submit(lambda: _load_mws_call_buying_signals(f_forecast.result()))
+        f_sector = pool.submit(lambda: _load_sector_sympathy_signals(f_forecast.result()))
+        f_pred = pool.submit(_load_predictive_recurrence_signals)
+        f_uw = pool.submit(_load_uw_flow_bullish_signals)
+        mws_data = f_mws.result()
+        sector_hot = f_sector.result()
+        pred_data = f_pred.result()
+        uw_flow_data = f_uw.result()
+        premarket_data = f_premarket.result()
 
     # Get universe gate
     universe = static_universe or _get_static_universe()
@@ -152,77 +163,27 @@ def detect_gap_ups(
         f"Universe tickers: {len(all_tickers)}"
     )
 
-    # Score each ticker
-    candidates = []
-    for sym in sorted(all_tickers):
-        signals = []
-        score_parts = {}
-
-        # 1. MWS Heavy Call Buying / +GEX
-        if sym in mws_data:
-            mws_info = mws_data[sym]
-            score_parts["call_buying"] = W_CALL_BUYING
-            signals.append("Heavy call buying")
-            if mws_info.get("bullish_probability", 0) > 65:
-                signals.append(f"BP={mws_info['bullish_probability']:.0f}%")
-            for cat in mws_info.get("catalysts", []):
-                if "positive GEX" in str(cat):
-                    signals.append("+GEX")
-                    break
-
-        # 2. Sector Sympathy
-        ticker_sector = _TICKER_TO_SECTOR.get(sym, "")
-        if ticker_sector and ticker_sector in sector_hot:
-            sec_info = sector_hot[ticker_sector]
-            score_parts["sector_sympathy"] = W_SECTOR_SYMPATHY
-            signals.append(f"Sector sympathy ({ticker_sector})")
-
-        # 3. Predictive Signal Recurrence
-        if sym in pred_data:
-            pred_info = pred_data[sym]
-            score_parts["predictive_signal"] = W_PREDICTIVE_SIGNAL
-            recur = pred_info.get("recurrence_count", 1)
-            cat = pred_info.get("category", "")
-            sig_type = pred_info.get("signal_type", "")
-            if recur >= 3:
-                signals.append(f"{sig_type or cat} ({recur}x recurring)")
-            else:
-                signals.append(sig_type or cat or "Predictive signal")
+    # Score the whole ticker table at once; signal text only for qualifiers
+    tickers = sorted(all_tickers)
+    gap_scores = _gap_score_table(tickers, mws_data, sector_hot, pred_data, uw_flow_data, premarket_data)
 
-        # 4. UW Options Flow Bullish
-        if sym in uw_flow_data:
-            uw_info = uw_flow_data[sym]
-            score_parts["uw_flow"] = W_UW_FLOW
-            ratio = uw_info.get("call_put_ratio", 0)
-            signals.append(f"UW flow (C/P={ratio:.1f}x)")
-
-        # 5. Pre-Market Gap
-        if sym in premarket_data:
-            pm_info = premarket_data[sym]
-            gap_pct = pm_info.get("gap_pct", 0)
-            if gap_pct >= 2.0:
-                score_parts["premarket_gap"] = W_PREMARKET_GAP
-                if gap_pct >= 5.0:
-                    signals.append(f"🔥🔥 MAJOR pre-market gap +{gap_pct:.1f}%")
-                else:
-                    signals.append(f"🔥 Pre-market gap +{gap_pct:.1f}%")
-
-        # Compute gap score
-        gap_score = sum(score_parts.values())
-
-        if gap_score >= MIN_GAP_SCORE:
-            candidates.append({
-                "symbol": sym,
-                "gap_score": gap_score,
-                "signals": signals,
-                "signal_count": len(signals),
-                "sector": ticker_sector,
-                "score_parts": score_parts,
-                "premarket_gap_pct": premarket_data.get(sym, {}).get("gap_pct", 0),
-                "bullish_probability": mws_data.get(sym, {}).get("bullish_probability", 0),
-                "call_put_ratio": uw_flow_data.get(sym, {}).get("call_put_ratio", 0),
-                "recurrence_count": pred_data.get(sym, {}).get("recurrence_count", 0),
-            })
+    candidates = []
+    for sym, gap_score in zip(tickers, gap_scores):
+        if gap_score < MIN_GAP_SCORE:
+            continue
+        signals, score_parts = _gap_signals(sym, mws_data, sector_hot, pred_data, uw_flow_data, premarket_data)
+        candidates.append({
+            "symbol": sym,
+            "gap_score": gap_score,
+            "signals": signals,
+            "signal_count": len(signals),
+            "sector": _TICKER_TO_SECTOR.get(sym, ""),
+            "score_parts": score_parts,
+            "premarket_gap_pct": premarket_data.get(sym, {}).get("gap_pct", 0),
+            "bullish_probability": mws_data.get(sym, {}).get("bullish_probability", 0),
+            "call_put_ratio": uw_flow_data.get(sym, {}).get("call_put_ratio", 0),
+            "recurrence_count": pred_data.get(sym, {}).get("recurrence_count", 0),
+        })
 
     # Sort by gap_score descending
     candidates.sort(key=lambda x: (-x["gap_score"], -x["signal_count"]))
@@ -265,6 +226,102 @@ def detect_gap_ups(
     }
 
 
+def _gap_score_table(
+    tickers: List[str],
+    mws_data: Dict[str, Dict],
+    sector_hot: Dict[str, Dict],
+    pred_data: Dict[str, Dict],
+    uw_flow_data: Dict[str, Dict],
+    premarket_data: Dict[str, Dict],
+) -> List[float]:
+    """
+    gap_score for every ticker in one pass, without building signal text.
+
+    Weights are collected in the same order as _gap_signals' score_parts
+    and summed with sum(), so scores match sum(score_parts.values()) bit
+    for bit.
+    """
+    scores = []
+    for sym in tickers:
+        parts = []
+        if sym in mws_data:
+            parts.append(W_CALL_BUYING)
+        sector = _TICKER_TO_SECTOR.get(sym, "")
+        if sector and sector in sector_hot:
+            parts.append(W_SECTOR_SYMPATHY)
+        if sym in pred_data:
+            parts.append(W_PREDICTIVE_SIGNAL)
+        if sym in uw_flow_data:
+            parts.append(W_UW_FLOW)
+        if premarket_data.get(sym, {}).get("gap_pct", 0) >= 2.0:
+            parts.append(W_PREMARKET_GAP)
+        scores.append(sum(parts))
+    return scores
+
+
+def _gap_signals(
+    sym: str,
+    mws_data: Dict[str, Dict],
+    sector_hot: Dict[str, Dict],
+    pred_data: Dict[str, Dict],
+    uw_flow_data: Dict[str, Dict],
+    premarket_data: Dict[str, Dict],
+) -> Tuple[List[str], Dict[str, float]]:
+    """Human-readable signals + score_parts for one ticker."""
+    signals = []
+    score_parts = {}
+
+    # 1. MWS Heavy Call Buying / +GEX
+    if sym in mws_data:
+        mws_info = mws_data[sym]
+        score_parts["call_buying"] = W_CALL_BUYING
+        signals.append("Heavy call buying")
+        if mws_info.get("bullish_probability", 0) > 65:
+            signals.append(f"BP={mws_info['bullish_probability']:.0f}%")
+        for cat in mws_info.get("catalysts", []):
+            if "positive GEX" in str(cat):
+                signals.append("+GEX")
+                break
+
+    # 2. Sector Sympathy
+    ticker_sector = _TICKER_TO_SECTOR.get(sym, "")
+    if ticker_sector and ticker_sector in sector_hot:
+        score_parts["sector_sympathy"] = W_SECTOR_SYMPATHY
+        signals.append(f"Sector sympathy ({ticker_sector})")
+
+    # 3. Predictive Signal Recurrence
+    if sym in pred_data:
+        pred_info = pred_data[sym]
+        score_parts["predictive_signal"] = W_PREDICTIVE_SIGNAL
+        recur = pred_info.get("recurrence_count", 1)
+        cat = pred_info.get("category", "")
+        sig_type = pred_info.get("signal_type", "")
+        if recur >= 3:
+            signals.append(f"{sig_type or cat} ({recur}x recurring)")
+        else:
+            signals.append(sig_type or cat or "Predictive signal")
+
+    # 4. UW Options Flow Bullish
+    if sym in uw_flow_data:
+        uw_info = uw_flow_data[sym]
+        score_parts["uw_flow"] = W_UW_FLOW
+        ratio = uw_info.get("call_put_ratio", 0)
+        signals.append(f"UW flow (C/P={ratio:.1f}x)")
+
+    # 5. Pre-Market Gap
+    if sym in premarket_data:
+        pm_info = premarket_data[sym]
+        gap_pct = pm_info.get("gap_pct", 0)
+        if gap_pct >= 2.0:
+            score_parts["premarket_gap"] = W_PREMARKET_GAP
+            if gap_pct >= 5.0:
+                signals.append(f"🔥🔥 MAJOR pre-market gap +{gap_pct:.1f}%")
+            else:
+                signals.append(f"🔥 Pre-market gap +{gap_pct:.1f}%")
+
+    return signals, score_parts
+
+
 def format_gap_up_report(gap_data: Dict[str, Any]) -> str:
     """
     Format gap-up alerts as a human-readable text block for
@@ -392,11 +449,24 @@ def format_gap_up_html(gap_data: Dict[str, Any]) -> str:
 # DATA SOURCE LOADERS
 # ═══════════════════════════════════════════════════════════════════
 
-def _load_mws_call_buying_signals() -> Dict[str, Dict[str, Any]]:
+def _load_forecast() -> Optional[Dict[str, Any]]:
+    """Parsed tomorrows_forecast.json (None if missing/unreadable) — shared by sources 1 + 2."""
+    forecast_file = TRADENOVA_DATA / "tomorrows_forecast.json"
+    try:
+        if forecast_file.exists():
+            with open(forecast_file) as f:
+                return json.load(f)
+    except Exception as e:
+        logger.warning(f"  Gap-Up: tomorrows_forecast.json unreadable — {e}")
+    return None
+
+
+def _load_mws_call_buying_signals(data: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
     """
     Source 1: MWS 7-Sensor Forecast — "Heavy call buying / +GEX" catalysts.
 
-    Loads tomorrows_forecast.json and returns tickers where:
+    Loads tomorrows_forecast.json (or uses the already-parsed `data`)
+    and returns tickers where:
       - bullish_probability > 55%
       - catalysts contains "Heavy call buying" or "positive GEX"
 
@@ -404,14 +474,12 @@ def _load_mws_call_buying_signals() -> Dict[str, Dict[str, Any]]:
     """
     result = {}
     try:
-        forecast_file = TRADENOVA_DATA / "tomorrows_forecast.json"
-        if not forecast_file.exists():
+        if data is None:
+            data = _load_forecast()
+        if data is None:
             logger.debug("  Gap-Up MWS: tomorrows_forecast.json not found")
             return result
 
-        with open(forecast_file) as f:
-            data = json.load(f)
-
         # Check freshness (≤ 3 days)
         generated = data.get("generated_at", "")
         if generated:
@@ -454,14 +522,14 @@ def _load_mws_call_buying_signals() -> Dict[str, Dict[str, Any]]:
     return result
 
 
-def _load_sector_sympathy_signals() -> Dict[str, Dict[str, Any]]:
+def _load_sector_sympathy_signals(fc_data: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
     """
     Source 2: Sector Sympathy — detect hot sectors with 3+ bullish stocks.
 
     Combines:
       a) sector_sympathy_alerts.json (TradeNova sector leader/alert data)
       b) Internal sector groupings (_SECTOR_GROUPS)
-      c) MWS forecast sector data
+      c) MWS forecast sector data (`fc_data` if already parsed)
 
     Returns: {sector_name: {count, symbols, leader}}
     """
@@ -506,10 +574,9 @@ def _load_sector_sympathy_signals() -> Dict[str, Dict[str, Any]]:
 
     # ── Step 2: Supplement with MWS forecast bullish tickers ──
     try:
-        forecast_file = TRADENOVA_DATA / "tomorrows_forecast.json"
-        if forecast_file.exists():
-            with open(forecast_file) as f:
-                fc_data = json.load(f)
+        if fc_data is None:
+            fc_data = _load_forecast()
+        if fc_data is not None:
             for fc in fc_data.get("forecasts", []):
                 sym = fc.get("symbol", "")
                 bp = fc.get("bullish_probability", 0) or 0
@@ -1874,7 +1874,7 @@ def _enrich_moonshots_with_orm(
     try:
         from trading.move_potential import batch_compute_move_potential
         
-        mps_candidates = candidates[:min(40, len(candidates))]
+        mps_candidates = candidates
         mps_symbols = [c["symbol"] for c in mps_candidates]
         
         # Check for earnings
@@ -1884,7 +1884,7 @@ def _enrich_moonshots_with_orm(
         except Exception:
             _earnings_for_mps = set()
         
-        logger.info(f"  📐 Computing MOVE POTENTIAL SCORE for top {len(mps_symbols)} candidates...")
+        logger.info(f"  📐 Computing MOVE POTENTIAL SCORE for {len(mps_symbols)} candidates...")
         mps_results = batch_compute_move_potential(
             mps_symbols,
             earnings_set=_earnings_for_mps,
@@ -2518,7 +2518,6 @@ def _apply_regime_shadow_and_hard_block(
     try:
         shadow_path = Path(os.environ.get("META_ENGINE_OUTPUT",
                                           str(Path(__file__).parent.parent / "output")))
-        shadow_file = shadow_path / f"regime_shadow_{datetime.now().strftime('%Y%m%d_%H%M')}.json"
         shadow_data = {
             "timestamp": datetime.now().isoformat(),
             "regime": regime_info,
@@ -2534,8 +2533,10 @@ def _apply_regime_shadow_and_hard_block(
                 "score": c.get("score", 0),
             } for c in passed],
         }
-        with open(shadow_file, "w") as f:
-            json.dump(shadow_data, f, indent=2, default=str)
+        from artifact_store import ArtifactStore
+        shadow_file = ArtifactStore(shadow_path).write(
+            "regime_shadow", shadow_data, stamp=datetime.now().strftime('%Y%m%d_%H%M'), latest=False,
+        )
         logger.info(f"  💾 Regime shadow artifact: {shadow_file}")
     except Exception as e:
         logger.debug(f"  Regime shadow save failed: {e}")
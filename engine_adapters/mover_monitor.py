@@ -0,0 +1,400 @@
+"""
+Intraday Mover Monitor
+======================
+Resident loop on top of the real-time mover scanner. Instead of checking
+coverage only at the three fixed scan times, it polls the Polygon
+snapshot every POLL_SEC seconds during market hours and emits an event
+the moment a symbol crosses a move threshold.
+
+Per tick:
+  - ONE snapshot request, restricted to the universe (`tickers=`), so
+    the work is O(universe) — no parsing of the full US market.
+  - Per-symbol state lives in compact parallel arrays (array('d') /
+    array('b')) indexed by a fixed symbol → slot map; no per-tick dicts.
+  - Threshold crossings are detected incrementally against each
+    symbol's previous band, with hysteresis so a stock hovering at +3%
+    doesn't fire on every tick.
+  - TradeNova files are never re-parsed per tick: UW flow ratios are
+    reloaded only when uw_flow_cache.json's mtime changes, and the Top 10
+    sets only when the day's top10 artifacts are rewritten.
+
+Events are dicts:
+    {"type": "mover_up" | "mover_down" | "mover_faded",
+     "symbol", "change_pct", "price", "band", "prev_band",
+     "volume_ratio", "call_pct", "in_top10", "coverage_gap", "ts"}
+
+Consumers:
+  - In-process: monitor.subscribe() → queue.Queue of events
+  - Other processes (the pipeline): read_mover_events() over the
+    append-only log data/mover_events_YYYYMMDD.jsonl
+  - Alerts: coverage-gap events (≥3% mover not in the Top 10) are
+    forwarded to health_alerts (throttled per symbol)
+
+Usage:
+    from engine_adapters.mover_monitor import start_mover_monitor
+    monitor = start_mover_monitor(poll_sec=30)
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+import pytz
+import requests
+
+from engine_adapters.realtime_mover_scanner import (
+    POLYGON_SNAPSHOT_URL,
+    TRADENOVA_DATA,
+    _get_static_universe,
+    _load_uw_flow_ratios,
+)
+from trading.nyse_calendar import NYSE_EARLY_CLOSE, is_trading_day
+
+logger = logging.getLogger(__name__)
+
+EST = pytz.timezone("US/Eastern")
+
+EVENTS_DIR = Path(__file__).parent.parent / "data"
+
+POLL_SEC = 30
+# Absolute move bands (%). Band k (1-based) = |change| ≥ MOVE_BANDS[k-1].
+# 3% matches validate_scan_coverage's coverage-gap threshold.
+MOVE_BANDS = (2.0, 3.0, 5.0, 10.0)
+COVERAGE_GAP_PCT = 3.0
+HYSTERESIS_PCT = 0.25         # Must fall this far below a band edge to drop a band
+SUBSCRIBER_QUEUE_MAX = 1000
+
+
+def _band_for(change_pct: float, prev_band: int) -> int:
+    """Signed band index for a move, sticky by HYSTERESIS_PCT on the way down."""
+    mag = abs(change_pct)
+    sign = 1 if change_pct >= 0 else -1
+    band = 0
+    for i, edge in enumerate(MOVE_BANDS, 1):
+        # Keep a band we already hold until the move clearly leaves it
+        held = prev_band * sign >= i
+        if mag >= (edge - HYSTERESIS_PCT if held else edge):
+            band = i
+    return sign * band
+
+
+def _events_path(day: Optional[str] = None) -> Path:
+    day = day or datetime.now(EST).strftime("%Y%m%d")
+    return EVENTS_DIR / f"mover_events_{day}.jsonl"
+
+
+def read_mover_events(
+    day: Optional[str] = None,
+    since: Optional[str] = None,
+    types: Optional[Set[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Read mover events from the day's append-only log.
+
+    Args:
+        day: YYYYMMDD (default: today ET)
+        since: ISO timestamp — only events strictly after it
+        types: Restrict to these event types
+    """
+    path = _events_path(day)
+    if not path.exists():
+        return []
+    events = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                ev = json.loads(line)
+            except ValueError:
+                continue
+            if since and ev.get("ts", "") <= since:
+                continue
+            if types and ev.get("type") not in types:
+                continue
+            events.append(ev)
+    return events
+
+
+class MoverMonitor:
+    """Polls the batched snapshot and emits threshold-crossing events."""
+
+    def __init__(
+        self,
+        universe: Optional[Set[str]] = None,
+        poll_sec: float = POLL_SEC,
+        api_key: Optional[str] = None,
+        alerts: bool = True,
+    ):
+        self.api_key = api_key or os.getenv("POLYGON_API_KEY", "") or os.getenv("MASSIVE_API_KEY", "")
+        self.poll_sec = poll_sec
+        self.alerts = alerts
+        self.symbols: List[str] = sorted(universe or _get_static_universe())
+        self.slot: Dict[str, int] = {s: i for i, s in enumerate(self.symbols)}
+        n = len(self.symbols)
+        self.price = array("d", bytes(8 * n))
+        self.prev_close = array("d", bytes(8 * n))
+        self.change_pct = array("d", bytes(8 * n))
+        self.volume_ratio = array("d", bytes(8 * n))
+        self.band = array("b", bytes(n))
+        self._tickers_param = ",".join(self.symbols)
+
+        self._uw_flow: Dict[str, Dict[str, Any]] = {}
+        self._uw_flow_mtime = None
+        self._top10: Set[str] = set()
+        self._top10_mtime = None
+
+        self._subscribers: List[queue.Queue] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._session = requests.Session()
+        self.ticks = 0
+        self.last_tick: Optional[str] = None
+
+    # ── Consumers ──────────────────────────────────────
+
+    def subscribe(self) -> queue.Queue:
+        """Queue that receives every event emitted from now on."""
+        q: queue.Queue = queue.Queue(maxsize=SUBSCRIBER_QUEUE_MAX)
+        with self._lock:
+            self._subscribers.append(q)
+        return q
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Current per-symbol state (same shape as scan_realtime_movers' all_prices)."""
+        return {
+            sym: {
+                "price": round(self.price[i], 2),
+                "change_pct": round(self.change_pct[i], 2),
+                "prev_close": round(self.prev_close[i], 2),
+                "volume_ratio": round(self.volume_ratio[i], 2),
+            }
+            for sym, i in self.slot.items()
+            if self.price[i] > 0
+        }
+
+    # ── Slow-changing inputs (reloaded only on change) ─
+
+    def _refresh_uw_flow(self):
+        path = TRADENOVA_DATA / "uw_flow_cache.json"
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return
+        if mtime != self._uw_flow_mtime:
+            self._uw_flow = _load_uw_flow_ratios()
+            self._uw_flow_mtime = mtime
+
+    def _refresh_top10(self):
+        try:
+            from artifact_store import get_store
+            store = get_store()
+            day = datetime.now(EST).strftime("%Y%m%d")
+            paths = [store.path_for(name, day) for name in ("puts_top10", "moonshot_top10")]
+            mtime = tuple(p.stat().st_mtime_ns if p.exists() else 0 for p in paths)
+            if mtime == self._top10_mtime:
+                return
+            syms = set()
+            for name in ("puts_top10", "moonshot_top10"):
+                data = store.read(name, day, default={}) or {}
+                syms.update(p.get("symbol", "") for p in data.get("picks", []))
+            self._top10 = syms
+            self._top10_mtime = mtime
+        except Exception as e:
+            logger.debug(f"Mover monitor: Top 10 refresh failed: {e}")
+
+    # ── Tick ───────────────────────────────────────────
+
+    def _fetch(self) -> List[Dict[str, Any]]:
+        resp = self._session.get(
+            POLYGON_SNAPSHOT_URL,
+            params={"tickers": self._tickers_param, "apiKey": self.api_key},
+            timeout=10,
+        )
+        if resp.status_code != 200:
+            raise RuntimeError(f"Polygon snapshot returned {resp.status_code}")
+        return resp.json().get("tickers", []) or []
+
+    def process(self, tickers_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Update state from one snapshot payload; returns emitted events."""
+        events = []
+        ts = datetime.now(EST).isoformat()
+        slot = self.slot
+        for td in tickers_data:
+            i = slot.get(td.get("ticker", ""))
+            if i is None:
+                continue
+            day = td.get("day") or {}
+            prev_day = td.get("prevDay") or {}
+            prev_close = prev_day.get("c", 0)
+            current = (td.get("lastTrade") or {}).get("p", 0) or day.get("c", 0) or day.get("o", 0)
+            if not prev_close or prev_close <= 0 or not current:
+                continue
+            change = (current - prev_close) / prev_close * 100
+            reported = td.get("todaysChangePerc", 0)
+            if reported and abs(reported) > abs(change):
+                change = reported
+            prev_volume = prev_day.get("v", 0)
+
+            self.price[i] = current
+            self.prev_close[i] = prev_close
+            self.change_pct[i] = change
+            self.volume_ratio[i] = day.get("v", 0) / prev_volume if prev_volume else 1.0
+
+            old_band = self.band[i]
+            new_band = _band_for(change, old_band)
+            if new_band == old_band:
+                continue
+            self.band[i] = new_band
+            events.append(self._make_event(self.symbols[i], i, new_band, old_band, ts))
+        return events
+
+    def _make_event(self, sym: str, i: int, band: int, prev_band: int, ts: str) -> Dict[str, Any]:
+        if band == 0:
+            ev_type = "mover_faded"
+        elif abs(band) > abs(prev_band) or (band > 0) != (prev_band > 0):
+            ev_type = "mover_up" if band > 0 else "mover_down"
+        else:
+            ev_type = "mover_faded"
+        change = self.change_pct[i]
+        in_top10 = sym in self._top10
+        return {
+            "type": ev_type,
+            "symbol": sym,
+            "change_pct": round(change, 2),
+            "price": round(self.price[i], 2),
+            "band": band,
+            "prev_band": prev_band,
+            "volume_ratio": round(self.volume_ratio[i], 2),
+            "call_pct": round(self._uw_flow.get(sym, {}).get("call_pct", 0.5), 3),
+            "in_top10": in_top10,
+            "coverage_gap": (ev_type != "mover_faded" and abs(change) >= COVERAGE_GAP_PCT
+                             and not in_top10),
+            "ts": ts,
+        }
+
+    def _emit(self, events: List[Dict[str, Any]]):
+        if not events:
+            return
+        path = _events_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a") as f:
+            for ev in events:
+                f.write(json.dumps(ev, separators=(",", ":")) + "\n")
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for ev in events:
+            for q in subscribers:
+                try:
+                    q.put_nowait(ev)
+                except queue.Full:
+                    pass  # Slow consumer — it can catch up from the log
+            if ev["coverage_gap"]:
+                logger.warning(
+                    f"  ⚠️ COVERAGE GAP (live): {ev['symbol']} {ev['change_pct']:+.1f}% "
+                    f"not in Top 10"
+                )
+                if self.alerts:
+                    self._alert(ev)
+            elif ev["type"] != "mover_faded":
+                logger.info(f"  📡 Mover: {ev['symbol']} {ev['change_pct']:+.1f}% (band {ev['band']:+d})")
+
+    @staticmethod
+    def _alert(ev: Dict[str, Any]):
+        try:
+            from monitoring.health_alerts import send_health_alert, AlertLevel
+            side = "PUT" if ev["change_pct"] < 0 else "CALL"
+            send_health_alert(
+                AlertLevel.INFO,
+                f"mover_gap_{ev['symbol']}",
+                f"{ev['symbol']} moving {ev['change_pct']:+.1f}% (${ev['price']:.2f}, "
+                f"{ev['volume_ratio']:.1f}x vol) — not in {side} Top 10",
+            )
+        except Exception as e:
+            logger.debug(f"Mover alert failed: {e}")
+
+    def tick(self) -> List[Dict[str, Any]]:
+        """One poll: fetch, update state, emit events."""
+        self._refresh_uw_flow()
+        self._refresh_top10()
+        events = self.process(self._fetch())
+        self._emit(events)
+        self.ticks += 1
+        self.last_tick = datetime.now(EST).isoformat()
+        return events
+
+    # ── Loop ───────────────────────────────────────────
+
+    @staticmethod
+    def _market_open(now_et: datetime) -> bool:
+        today = now_et.date()
+        if not is_trading_day(today):
+            return False
+        t = now_et.hour * 60 + now_et.minute
+        close = 780 if today in NYSE_EARLY_CLOSE else 960  # 1:00 / 4:00 PM ET
+        return 570 <= t < close
+
+    def _reset_day(self):
+        for arr in (self.price, self.prev_close, self.change_pct, self.volume_ratio):
+            for i in range(len(arr)):
+                arr[i] = 0.0
+        for i in range(len(self.band)):
+            self.band[i] = 0
+
+    def _loop(self):
+        current_day = None
+        while not self._stop.is_set():
+            now_et = datetime.now(EST)
+            if not self._market_open(now_et):
+                self._stop.wait(60)
+                continue
+            if now_et.date() != current_day:
+                self._reset_day()
+                current_day = now_et.date()
+            t0 = time.monotonic()
+            try:
+                self.tick()
+            except Exception as e:
+                logger.warning(f"Mover monitor tick failed: {e}")
+            self._stop.wait(max(0.0, self.poll_sec - (time.monotonic() - t0)))
+
+    def start(self) -> "MoverMonitor":
+        if not self.api_key or not self.symbols:
+            logger.warning("Mover monitor not started — no Polygon API key or empty universe")
+            return self
+        if self._thread and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, daemon=True, name="mover-monitor")
+        self._thread.start()
+        logger.info(f"  📡 Mover monitor: {len(self.symbols)} symbols every {self.poll_sec:.0f}s")
+        return self
+
+    def stop(self, timeout: float = 5):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+
+
+_monitor: Optional[MoverMonitor] = None
+
+
+def start_mover_monitor(poll_sec: float = POLL_SEC) -> MoverMonitor:
+    """Start (or return) the process-wide mover monitor."""
+    global _monitor
+    if _monitor is None:
+        _monitor = MoverMonitor(poll_sec=poll_sec)
+    return _monitor.start()
+
+
+def get_mover_monitor() -> Optional[MoverMonitor]:
+    return _monitor
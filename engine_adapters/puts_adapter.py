@@ -596,6 +596,49 @@ TIER_WEIGHTS = {
     "\u274c BELOW THRESHOLD":     0.40,
 }
 
+# ─── META-SCORE factor weights ────────────────────────────────────
+# Order: (tier, signal, gap, ews, earnings, convergence, priority).
+# Shared by the scalar _compute_meta_score and the columnar engine in
+# engine_adapters/puts_meta_score.py.
+META_SCORE_WEIGHTS_AM = (
+    0.12,   # tier — slightly reduced for AM
+    0.12,   # signal — slightly reduced for AM
+    0.35,   # gap — ↓ from 40% to make room for new factors
+    0.18,   # ews — slightly reduced for AM
+    0.08,   # earnings — still relevant post-earnings
+    0.05,   # convergence — multi-signal convergence
+    0.10,   # priority — unchanged
+)
+META_SCORE_WEIGHTS_PM = (
+    0.20,   # tier — ↑ increased from 15%
+    0.15,   # signal — unchanged
+    0.15,   # gap — ↓ intraday momentum (was 40% for AM gap)
+    0.20,   # ews — unchanged
+    0.15,   # earnings — earnings catalyst
+    0.05,   # convergence — multi-signal convergence
+    0.10,   # priority — unchanged
+)
+
+# Convergence signal classes. dark_pool_violence appears in 95% of ALL
+# candidates, so it has ZERO discriminating power on its own:
+# - HIGH_QUALITY: Rare, specific institutional signals (strongest)
+# - STANDARD: Common signals that add context when combined
+HIGH_QUALITY_SIGNALS = frozenset({
+    "put_buying_at_ask",        # Direct put buying — strongest
+    "call_selling_at_bid",      # Hedging via call selling
+    "multi_day_weakness",       # Multi-day selling pattern
+    "flat_price_rising_volume", # Distribution divergence
+    "gap_down_no_recovery",     # Failed bounce
+})
+STANDARD_SIGNALS = frozenset({
+    "repeated_sell_blocks",     # Block selling
+    "dark_pool_violence",       # Ubiquitous but adds context
+})
+
+# Set META_SCORE_SCALAR=1 to rank with the per-candidate scalar path
+# instead of the columnar engine (parity/debugging).
+META_SCORE_SCALAR = os.getenv("META_SCORE_SCALAR", "") == "1"
+
 
 def _compute_meta_score(
     candidate: Dict[str, Any],
@@ -749,20 +792,8 @@ def _compute_meta_score(
     # GEV had 4 pre-signals + IPI=1.0 and dropped -5.4%.
     #
     # IMPORTANT: dark_pool_violence appears in 95% of ALL candidates,
-    # so it has ZERO discriminating power. We use a tiered approach:
-    # - HIGH_QUALITY: Rare, specific institutional signals (strongest)
-    # - STANDARD: Common signals that add context when combined
-    HIGH_QUALITY_SIGNALS = {
-        "put_buying_at_ask",        # Direct put buying — strongest
-        "call_selling_at_bid",      # Hedging via call selling
-        "multi_day_weakness",       # Multi-day selling pattern
-        "flat_price_rising_volume", # Distribution divergence
-        "gap_down_no_recovery",     # Failed bounce
-    }
-    STANDARD_SIGNALS = {
-        "repeated_sell_blocks",     # Block selling
-        "dark_pool_violence",       # Ubiquitous but adds context
-    }
+    # so it has ZERO discriminating power — see HIGH_QUALITY_SIGNALS /
+    # STANDARD_SIGNALS at module level.
     sigs_list = candidate.get("signals", [])
     if isinstance(sigs_list, list):
         hq_count = sum(1 for s in sigs_list if s in HIGH_QUALITY_SIGNALS)
@@ -784,33 +815,20 @@ def _compute_meta_score(
         convergence_score = 0.3   # Partial: 1 HQ + standard + high IPI
     
     # ── WEIGHTED COMBINATION (Dynamic based on scan time) ─────────
-    if is_pm_scan:
-        # PM SCAN (3:15 PM): No overnight gap available yet.
-        # Redistribute the 40% gap weight to predictive factors.
-        # gap_score here represents INTRADAY momentum (same-day drop),
-        # which is less impactful than overnight gap but still useful.
-        meta = (
-            tier_score          * 0.20 +   # ↑ increased from 15%
-            signal_score        * 0.15 +   # unchanged
-            gap_score           * 0.15 +   # ↓ intraday momentum (was 40% for AM gap)
-            ews_score           * 0.20 +   # unchanged
-            earnings_score      * 0.15 +   # NEW: earnings catalyst
-            convergence_score   * 0.05 +   # NEW: multi-signal convergence
-            priority_score      * 0.10     # unchanged
-        )
-    else:
-        # AM SCAN (9:35 AM): Overnight gap is the strongest signal.
-        # Earnings and convergence still contribute but less weight
-        # since gap data is available and more predictive.
-        meta = (
-            tier_score          * 0.12 +   # slightly reduced for AM
-            signal_score        * 0.12 +   # slightly reduced for AM
-            gap_score           * 0.35 +   # ↓ from 40% to make room for new factors
-            ews_score           * 0.18 +   # slightly reduced for AM
-            earnings_score      * 0.08 +   # NEW: still relevant post-earnings
-            convergence_score   * 0.05 +   # NEW: multi-signal convergence
-            priority_score      * 0.10     # unchanged
-        )
+    # PM SCAN (3:15 PM): No overnight gap available yet — the 40% gap
+    # weight is redistributed to predictive factors and gap_score
+    # represents INTRADAY momentum (same-day drop).
+    # AM SCAN (9:35 AM): Overnight gap is the strongest signal.
+    w = META_SCORE_WEIGHTS_PM if is_pm_scan else META_SCORE_WEIGHTS_AM
+    meta = (
+        tier_score          * w[0] +
+        signal_score        * w[1] +
+        gap_score           * w[2] +
+        ews_score           * w[3] +
+        earnings_score      * w[4] +
+        convergence_score   * w[5] +
+        priority_score      * w[6]
+    )
     
     return max(0.0, min(meta, 1.0))
 
@@ -1940,28 +1958,41 @@ def _enrich_candidates(candidates: List[Dict[str, Any]], top_n: int) -> List[Dic
         else:
             logger.info("  🌅 AM SCAN MODE: Using overnight gap as primary signal")
         
-        meta_scored = 0
-        for c in candidates[:price_fetch_count]:
-            live_price = c.get("_live_price")
-            meta = _compute_meta_score(
-                c, ews_data, live_price, ews_percentiles,
-                sector_boost_set, earnings_set, pm_scan,
-            )
+        # Live prices only inside the price-fetch pool; candidates beyond
+        # it get metadata-only scoring
+        live_prices = [
+            c.get("_live_price") if i < price_fetch_count else None
+            for i, c in enumerate(candidates)
+        ]
+        meta_scores = None
+        if not META_SCORE_SCALAR:
+            try:
+                from engine_adapters.puts_meta_score import compute_meta_scores
+                meta_scores = compute_meta_scores(
+                    candidates, ews_data, live_prices, ews_percentiles,
+                    sector_boost_set, earnings_set, pm_scan,
+                )
+            except ImportError as e:
+                logger.debug(f"  Columnar META-SCORE unavailable ({e}) — scalar path")
+            except Exception as e:
+                # Never let the fast path take scoring down
+                logger.warning(f"  ⚠️ Columnar META-SCORE failed ({e}) — scalar path")
+                meta_scores = None
+        if meta_scores is None:
+            meta_scores = [
+                _compute_meta_score(
+                    c, ews_data, live_price, ews_percentiles,
+                    sector_boost_set, earnings_set, pm_scan,
+                )
+                for c, live_price in zip(candidates, live_prices)
+            ]
+
+        for c, meta in zip(candidates, meta_scores):
             c["meta_score"] = meta
             # Replace raw score with meta-score for ranking
             c["_raw_score"] = c["score"]
             c["score"] = meta
-            meta_scored += 1
-        
-        # For candidates beyond the price-fetch pool, use metadata-only scoring
-        for c in candidates[price_fetch_count:]:
-            meta = _compute_meta_score(
-                c, ews_data, None, ews_percentiles,
-                sector_boost_set, earnings_set, pm_scan,
-            )
-            c["meta_score"] = meta
-            c["_raw_score"] = c["score"]
-            c["score"] = meta
+        meta_scored = min(price_fetch_count, len(candidates))
         
         # Re-sort by meta-score
         candidates.sort(key=lambda x: x["score"], reverse=True)
@@ -2156,12 +2187,13 @@ def _enrich_candidates(candidates: List[Dict[str, Any]], top_n: int) -> List[Dic
     # names most likely to deliver those large moves, using ATR%,
     # historical big-move frequency, and catalyst proximity.
     #
-    # Implementation note: we compute MPS for the TOP candidates only
-    # (not all 200+) to avoid excessive Polygon API calls.
+    # Implementation note: the whole pool is scored. Bars are fetched
+    # concurrently under the shared Polygon limiter and only once per
+    # trading day (trading/move_potential.get_move_potential_table).
     try:
         from trading.move_potential import batch_compute_move_potential
         
-        mps_candidates = candidates[:min(40, len(candidates))]
+        mps_candidates = candidates
         mps_symbols = [c["symbol"] for c in mps_candidates]
         
         # Re-use earnings_set if we computed it earlier
@@ -2170,7 +2202,7 @@ def _enrich_candidates(candidates: List[Dict[str, Any]], top_n: int) -> List[Dic
         except Exception:
             _earnings_for_mps = set()
         
-        logger.info(f"  📐 Computing MOVE POTENTIAL SCORE for top {len(mps_symbols)} candidates...")
+        logger.info(f"  📐 Computing MOVE POTENTIAL SCORE for {len(mps_symbols)} candidates...")
         mps_results = batch_compute_move_potential(
             mps_symbols,
             earnings_set=_earnings_for_mps,
@@ -2838,7 +2870,6 @@ def _apply_puts_regime_gate_v4(
     try:
         shadow_path = Path(os.environ.get("META_ENGINE_OUTPUT",
                                           str(Path(__file__).parent.parent / "output")))
-        shadow_file = shadow_path / f"puts_regime_shadow_{datetime.now().strftime('%Y%m%d_%H%M')}.json"
         shadow_data = {
             "timestamp": datetime.now().isoformat(),
             "regime": regime_info,
@@ -2854,8 +2885,10 @@ def _apply_puts_regime_gate_v4(
                 "call_pct": c.get("_call_pct"),
             } for c in passed],
         }
-        with open(shadow_file, "w") as f:
-            json.dump(shadow_data, f, indent=2, default=str)
+        from artifact_store import ArtifactStore
+        shadow_file = ArtifactStore(shadow_path).write(
+            "puts_regime_shadow", shadow_data, stamp=datetime.now().strftime('%Y%m%d_%H%M'), latest=False,
+        )
         logger.info(f"  💾 PUTS regime shadow: {shadow_file}")
     except Exception as e:
         logger.debug(f"  PUTS regime shadow save failed: {e}")
@@ -0,0 +1,261 @@
+"""
+Columnar META-SCORE Engine (Puts)
+==================================
+Vectorized equivalent of puts_adapter._compute_meta_score for the whole
+candidate pool at once.
+
+Candidates are unpacked ONCE into per-factor columns (a single pass
+over the dicts); every factor — tier, signal quality, gap,
+EWS pressure, priority, earnings catalyst, convergence — is then computed
+as a NumPy column operation and combined with the AM/PM weight vector.
+
+Parity with the scalar path is exact, not approximate: each factor uses
+the same float64 operations in the same order (including the
+left-to-right weighted sum), so scores and the resulting ranking are
+bit-identical. tests/test_puts_meta_score.py checks this in the test
+suite; timings and parity at larger sizes:
+
+    python3 -m engine_adapters.puts_meta_score --bench
+
+The scalar path stays available with META_SCORE_SCALAR=1, and
+puts_adapter falls back to it if this module raises for any reason.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from engine_adapters.puts_adapter import (
+    HIGH_QUALITY_SIGNALS,
+    META_SCORE_WEIGHTS_AM,
+    META_SCORE_WEIGHTS_PM,
+    STANDARD_SIGNALS,
+    TIER_WEIGHTS,
+)
+
+_EARNINGS_SIGNALS = ("dark_pool_violence", "put_buying_at_ask",
+                     "repeated_sell_blocks", "multi_day_weakness")
+
+
+def _list_len(v: Any) -> int:
+    return len(v) if isinstance(v, list) else 0
+
+
+def _num(v: Any) -> float:
+    return v if v else 0
+
+
+def compute_meta_scores(
+    candidates: List[Dict[str, Any]],
+    ews_data: Dict[str, Dict[str, Any]],
+    live_prices: List[Optional[float]],
+    ews_percentiles: Optional[Dict[str, float]] = None,
+    sector_boost_set: Optional[set] = None,
+    earnings_set: Optional[set] = None,
+    is_pm_scan: bool = False,
+) -> List[float]:
+    """
+    META-SCORE for every candidate in one vectorized pass.
+
+    Args mirror _compute_meta_score, except live_prices is a column
+    aligned with candidates (None where no live price is known).
+
+    Returns:
+        List of float scores in [0, 1], aligned with candidates.
+    """
+    n = len(candidates)
+    if n == 0:
+        return []
+    # ── Raw columns: ONE pass over the dicts (the only per-candidate
+    # Python work), then everything below is column arithmetic ───────
+    tier_get = TIER_WEIGHTS.get
+    pct_map = ews_percentiles or {}
+    sector_set = sector_boost_set or ()
+    earn_set = earnings_set or ()
+    rows = []
+    earnings_rows = []
+    for i, (c, lp) in enumerate(zip(candidates, live_prices)):
+        sym = c.get("symbol", "")
+        e = ews_data.get(sym, {})
+        if not isinstance(e, dict):
+            e = {}
+        ipi = e.get("ipi", 0)
+        sigs = c.get("signals", [])
+        if isinstance(sigs, list):
+            hq = sum(1 for s in sigs if s in HIGH_QUALITY_SIGNALS)
+            std = sum(1 for s in sigs if s in STANDARD_SIGNALS)
+        else:
+            hq = std = 0
+        if sym in earn_set:
+            sig_str = str(sigs)
+            earnings_rows.append((i, *(name in sig_str for name in _EARNINGS_SIGNALS)))
+        rows.append((
+            tier_get(c.get("tier", ""), 0.50),
+            _list_len(c.get("pre_signals", [])),
+            _list_len(c.get("post_signals", [])),
+            1.0 if c.get("is_predictive", False) else 0.0,
+            c.get("signal_count", 0),
+            _num(c.get("_cached_price", c.get("price", 0))),
+            _num(lp),
+            ipi,
+            e.get("unique_footprints", 0),
+            pct_map[sym] if sym in pct_map else ipi,
+            0.5 if c.get("is_dui", False) else 0.0,
+            c.get("batch", 5),
+            0.3 if sym in sector_set else 0.0,
+            hq,
+            std,
+        ))
+    cols = np.array(rows, dtype=float).T
+    (tier, pre, post, pred, sig_count, cached, live, ews_ipi, footprints,
+     ipi_pct, is_dui, batch, sector, hq, std) = cols
+
+    # ── 1. Tier / 2. Signal quality ───────────────────────────────
+    signal = np.minimum((pre * 3.0 + post * 1.0 + pred * 2.0 + np.minimum(sig_count, 5)) / 12.0, 1.0)
+
+    # ── 3. Gap (live vs cached scan price) ────────────────────────
+    has_gap = (live != 0) & (cached > 0)
+    safe_cached = np.where(has_gap, cached, 1.0)
+    gap_pct = ((live - safe_cached) / safe_cached) * 100
+    gap = np.where(
+        has_gap & (gap_pct < 0), np.minimum(np.abs(gap_pct) / 8.0, 1.0),
+        np.where(has_gap & (gap_pct > 2), -0.15, 0.0),
+    )
+
+    # ── 4. EWS institutional pressure ─────────────────────────────
+    ews = np.minimum(ipi_pct * 0.6 + (footprints / 8.0) * 0.4, 1.0)
+
+    # ── 5. DUI & batch & sector rotation ──────────────────────────
+    batch_s = np.maximum(0, (5 - batch) / 4.0) * 0.3
+    priority = np.minimum(is_dui + batch_s + sector, 1.0)
+
+    # ── 6. Earnings proximity (conditional on bearish positioning) ─
+    earnings = np.zeros(n)
+    if earnings_rows:
+        erows = np.array(earnings_rows)
+        idx = erows[:, 0]
+        flags = erows[:, 1:].astype(bool)
+        has_dp, has_pb, has_sells = flags[:, 0], flags[:, 1], flags[:, 2]
+        bearish = flags.sum(axis=1)
+        earnings[idx] = np.select(
+            [bearish >= 3, has_pb & (has_dp | has_sells), bearish >= 2,
+             (bearish >= 1) & (tier[idx] >= 0.80)],
+            [1.0, 0.8, 0.6, 0.4],
+            default=0.1,
+        )
+
+    # ── 7. Multi-signal convergence ───────────────────────────────
+    convergence = np.select(
+        [(hq >= 3) & (ews_ipi >= 0.80),
+         (hq >= 2) & (std >= 1) & (ews_ipi >= 0.80),
+         (hq >= 2) & (ews_ipi >= 0.60),
+         hq >= 2,
+         (hq >= 1) & (std >= 1) & (ews_ipi >= 0.90)],
+        [1.0, 0.8, 0.6, 0.4, 0.3],
+        default=0.0,
+    )
+
+    # ── Weighted combination (same summation order as the scalar path) ─
+    w = META_SCORE_WEIGHTS_PM if is_pm_scan else META_SCORE_WEIGHTS_AM
+    meta = tier * w[0]
+    for col, weight in ((signal, w[1]), (gap, w[2]), (ews, w[3]), (earnings, w[4]),
+                        (convergence, w[5]), (priority, w[6])):
+        meta = meta + col * weight
+    return np.maximum(0.0, np.minimum(meta, 1.0)).tolist()
+
+
+def rank_order(scores: List[float]) -> List[int]:
+    """Indices by descending score; ties keep input order (like list.sort)."""
+    return np.argsort(-np.asarray(scores, dtype=float), kind="stable").tolist()
+
+
+# ═══════════════════════════════════════════════════════
+# Benchmark / parity check
+# ═══════════════════════════════════════════════════════
+
+def _synthetic_pool(n: int, seed: int = 7):
+    import random
+    rng = random.Random(seed)
+    tiers = list(TIER_WEIGHTS) + ["", "unknown"]
+    sig_pool = sorted(HIGH_QUALITY_SIGNALS | STANDARD_SIGNALS) + ["vwap_loss", "rsi_div"]
+    candidates, live_prices, ews = [], [], {}
+    for i in range(n):
+        sym = f"T{i:05d}"
+        price = round(rng.uniform(5, 500), 2)
+        c = {
+            "symbol": sym,
+            "score": 0.95,
+            "tier": rng.choice(tiers),
+            "pre_signals": ["x"] * rng.randint(0, 4),
+            "post_signals": ["y"] * rng.randint(0, 3),
+            "is_predictive": rng.random() < 0.4,
+            "signal_count": rng.randint(0, 9),
+            "price": price,
+            "is_dui": rng.random() < 0.2,
+            "batch": rng.randint(1, 6),
+            "signals": rng.sample(sig_pool, rng.randint(0, 5)),
+        }
+        if rng.random() < 0.8:
+            c["_cached_price"] = price
+        candidates.append(c)
+        live_prices.append(round(price * rng.uniform(0.85, 1.06), 2) if rng.random() < 0.5 else None)
+        if rng.random() < 0.9:
+            ews[sym] = {"ipi": round(rng.random(), 3), "unique_footprints": rng.randint(0, 8)}
+    syms = [c["symbol"] for c in candidates]
+    earnings = set(rng.sample(syms, max(1, n // 10)))
+    sector = set(rng.sample(syms, max(1, n // 8)))
+    return candidates, live_prices, ews, earnings, sector
+
+
+def run_benchmark(sizes=(100, 1000, 10000), repeats: int = 3) -> List[Dict[str, Any]]:
+    """Time scalar vs columnar scoring + ranking and check exact parity."""
+    import time
+    from engine_adapters.puts_adapter import _compute_ews_percentiles, _compute_meta_score
+
+    rows = []
+    for n in sizes:
+        candidates, live_prices, ews, earnings, sector = _synthetic_pool(n)
+        pct = _compute_ews_percentiles(ews)
+        for pm in (False, True):
+            t_scalar = t_vec = float("inf")
+            for _ in range(repeats):
+                t0 = time.perf_counter()
+                scalar = [
+                    _compute_meta_score(c, ews, lp, pct, sector, earnings, pm)
+                    for c, lp in zip(candidates, live_prices)
+                ]
+                scalar_order = sorted(range(n), key=lambda i: scalar[i], reverse=True)
+                t_scalar = min(t_scalar, time.perf_counter() - t0)
+
+                t0 = time.perf_counter()
+                vec = compute_meta_scores(candidates, ews, live_prices, pct, sector, earnings, pm)
+                vec_order = rank_order(vec)
+                t_vec = min(t_vec, time.perf_counter() - t0)
+            rows.append({
+                "n": n,
+                "mode": "PM" if pm else "AM",
+                "scalar_ms": round(t_scalar * 1000, 2),
+                "columnar_ms": round(t_vec * 1000, 2),
+                "speedup": round(t_scalar / t_vec, 1) if t_vec > 0 else 0,
+                "identical_scores": scalar == vec,
+                "identical_ranking": scalar_order == vec_order,
+            })
+    return rows
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Columnar META-SCORE benchmark / parity check")
+    parser.add_argument("--bench", action="store_true", help="Run benchmark at 100 / 1k / 10k candidates")
+    parser.add_argument("--sizes", type=str, default="100,1000,10000")
+    args = parser.parse_args()
+
+    rows = run_benchmark(sizes=tuple(int(s) for s in args.sizes.split(",")))
+    print(f"{'N':>7} {'mode':>4} {'scalar ms':>10} {'columnar ms':>12} {'speedup':>8}  parity")
+    for r in rows:
+        ok = "✅" if r["identical_scores"] and r["identical_ranking"] else "❌"
+        print(f"{r['n']:>7} {r['mode']:>4} {r['scalar_ms']:>10.2f} {r['columnar_ms']:>12.2f} "
+              f"{r['speedup']:>7.1f}x  {ok}")
+    sys.exit(0 if all(r["identical_scores"] and r["identical_ranking"] for r in rows) else 1)
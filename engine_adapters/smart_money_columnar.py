@@ -0,0 +1,741 @@
+"""
+Columnar Smart Money Scorer
+===========================
+Vectorized equivalent of smart_money_scanner._analyze_ticker_multi_source
+for the whole ticker superset (universe ∪ flow ∪ OI ∪ GEX — often
+thousands of names).
+
+  1. FEATURE TABLES — each source becomes per-symbol columns. Only the
+     records a source actually has are visited; flow trades and dark-pool
+     prints are folded once per symbol (the only per-record Python work).
+  2. SCORERS — every _score_* function is a NumPy function over those
+     columns returning (score, direction) columns.
+  3. COMBINATION — conviction sums, convergence multipliers, direction
+     tiers, conflict penalties and the LEAPS / high-beta adjustments are
+     array operations.
+
+The columnar pass is a SCREEN: it computes direction and conviction for
+every ticker, then only the survivors (directional, conviction at the
+threshold) are materialized with the scalar _analyze_ticker_multi_source,
+which produces their signal strings. Output records are therefore
+identical to the per-ticker path; the screen itself matches it exactly
+(same float64 operations in the same order). Verify with:
+
+    python3 -m engine_adapters.smart_money_columnar --bench
+
+The screen only pays off when few tickers survive it: survivors are
+scored twice, and their signal strings still come from the scalar
+analyzer. On signal-rich (dense) supersets ~60% of tickers survive, so
+the columnar path is slower there. use_columnar() therefore gates it on
+superset size and source coverage. Synthetic --bench, per-ticker ms /
+columnar ms (speedup), "*" where use_columnar() picks the columnar path:
+
+    density    200 tickers        1000 tickers        5000 tickers
+    1.0      6.4 /  7.8 0.8x    32.0 / 34.7 0.9x    153 / 201  0.8x
+    0.3      3.7 /  3.8 1.0x    12.0 /  9.5 1.3x*    62 /  38  1.6x*
+    0.05     2.0 /  1.6 1.2x     7.0 /  2.3 3.1x*    56 /  11  5.4x*
+
+Parity is checked by tests/test_smart_money_columnar.py.
+
+Very large supersets can be sharded across processes (workers > 1,
+fork start method only); each shard screens and materializes its slice.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from engine_adapters.smart_money_scanner import (
+    HIGH_BETA_TICKERS,
+    MIN_CONVICTION_THRESHOLD,
+    MIN_PREMIUM_INSTITUTIONAL,
+    MIN_TRADES,
+    SHORT_DTE_DAYS,
+    STRONG_DIRECTIONAL_PCT,
+    _analyze_symbol,
+)
+
+logger = logging.getLogger(__name__)
+
+BULL, NEUTRAL, BEAR = 1, 0, -1
+
+# Shard mode only pays for itself on very large supersets
+SHARD_MIN_TICKERS = 20_000
+
+# The screen beats the per-ticker loop only on large, sparsely covered
+# supersets (see the --bench table in the module docstring).
+COLUMNAR_MIN_TICKERS = 1000
+COLUMNAR_MAX_COVERAGE = 0.25
+_COVERAGE_SOURCES = ("flow", "oi", "gex", "iv", "dp")
+
+# Screen margin: survivors are re-scored by the scalar path, which rounds
+# conviction to 4 dp before thresholding — keep anything that could round up.
+_SCREEN_MARGIN = 1e-4
+
+_SHARD_SOURCES: Optional[Dict[str, Dict]] = None
+
+
+def _num(v: Any, default: float = 0) -> float:
+    return v if isinstance(v, (int, float)) else default
+
+
+def _cols(n: int, *names: str) -> Dict[str, np.ndarray]:
+    return {name: np.zeros(n) for name in names}
+
+
+def _records(src: Dict[str, Any], index: Dict[str, int]):
+    """(row, record) for every dict record of a source that is in the superset."""
+    for sym, info in src.items():
+        i = index.get(sym)
+        if i is not None and info and isinstance(info, dict):
+            yield i, info
+
+
+# ═══════════════════════════════════════════════════════
+# Feature tables
+# ═══════════════════════════════════════════════════════
+
+def _flow_table(flow: Dict[str, Any], symbols: Sequence[str]) -> Dict[str, np.ndarray]:
+    n = len(symbols)
+    t = _cols(n, "n_trades", "full", "call_pct", "total_prem", "short_dte_prem",
+              "short_dte_ratio", "short_total", "short_call_pct", "avg_vol_oi", "leaps_ratio")
+    t["call_pct"][:] = 0.5
+    t["short_call_pct"][:] = 0.5
+    n_trades, full = t["n_trades"], t["full"]
+    for i, sym in enumerate(symbols):
+        trades = flow.get(sym)
+        if not isinstance(trades, list) or not trades:
+            continue
+        n_trades[i] = len(trades)
+        if len(trades) < MIN_TRADES:
+            continue
+        call_p, put_p, short_all, short_c, short_p, leaps, vol_oi = [], [], [], [], [], [], []
+        for tr in trades:
+            pc = tr.get("put_call")
+            prem = tr.get("premium", 0)
+            if pc == "C":
+                call_p.append(prem)
+            elif pc == "P":
+                put_p.append(prem)
+            if tr.get("dte", 999) <= SHORT_DTE_DAYS:
+                short_all.append(prem)
+                if pc == "C":
+                    short_c.append(prem)
+                elif pc == "P":
+                    short_p.append(prem)
+            if tr.get("dte", 0) > 180:
+                leaps.append(prem)
+            oi = tr.get("open_interest", 0)
+            if oi > 0:
+                vol_oi.append(tr.get("volume", 0) / oi)
+        total = sum(call_p) + sum(put_p)
+        if total <= 0:
+            continue
+        short_prem = sum(short_all)
+        short_total = sum(short_c) + sum(short_p)
+        full[i] = 1
+        t["call_pct"][i] = sum(call_p) / total
+        t["total_prem"][i] = total
+        t["short_dte_prem"][i] = short_prem
+        t["short_dte_ratio"][i] = short_prem / total
+        t["short_total"][i] = short_total
+        t["short_call_pct"][i] = sum(short_c) / short_total if short_total > 0 else 0.5
+        t["avg_vol_oi"][i] = sum(vol_oi) / len(vol_oi) if vol_oi else 0
+        t["leaps_ratio"][i] = sum(leaps) / total
+    t["full"] = full.astype(bool)
+    return t
+
+
+def _oi_table(oi: Dict[str, Any], index: Dict[str, int], n: int) -> Dict[str, np.ndarray]:
+    t = _cols(n, "has", "call_chg", "put_chg", "call_pct_chg", "put_pct_chg",
+              "max_days_inc", "contracts_3d", "vol_gt_oi", "n_top", "bull_top", "bear_top")
+    for i, info in _records(oi, index):
+        t["has"][i] = 1
+        t["call_chg"][i] = _num(info.get("call_oi_change", 0))
+        t["put_chg"][i] = _num(info.get("put_oi_change", 0))
+        t["call_pct_chg"][i] = _num(info.get("call_oi_pct_change", 0))
+        t["put_pct_chg"][i] = _num(info.get("put_oi_pct_change", 0))
+        t["max_days_inc"][i] = _num(info.get("max_days_oi_increasing", 0))
+        t["contracts_3d"][i] = _num(info.get("contracts_3plus_days_oi_increase", 0))
+        t["vol_gt_oi"][i] = _num(info.get("vol_gt_oi_count", 0))
+        top = info.get("top_contracts", [])
+        if top:
+            head = top[:10]
+            t["n_top"][i] = min(len(top), 10)
+            t["bull_top"][i] = sum(1 for c in head if str(c.get("prev_direction", "")).upper() == "BULLISH")
+            t["bear_top"][i] = sum(1 for c in head if str(c.get("prev_direction", "")).upper() == "BEARISH")
+    t["has"] = t["has"].astype(bool)
+    return t
+
+
+def _gex_table(gex: Dict[str, Any], index: Dict[str, int], n: int) -> Dict[str, np.ndarray]:
+    t = _cols(n, "flip", "net_gex")
+    for i, info in _records(gex, index):
+        t["flip"][i] = 1 if info.get("gex_flip_today", False) else 0
+        t["net_gex"][i] = _num(info.get("net_gex", 0))
+    t["flip"] = t["flip"].astype(bool)
+    return t
+
+
+def _iv_table(iv: Dict[str, Any], index: Dict[str, int], n: int) -> Dict[str, np.ndarray]:
+    t = _cols(n, "inverted", "spread", "implied_move")
+    for i, info in _records(iv, index):
+        inverted = info.get("inverted", False)
+        spread = _num(info.get("term_spread", 0))
+        implied_move = _num(info.get("implied_move_pct", 0) or info.get("weekly_implied_move_pct", 0))
+        if implied_move and implied_move < 1.0:
+            implied_move *= 100.0
+        front_iv = _num(info.get("front_iv", 0) or 0)
+        back_iv = _num(info.get("back_iv", 0) or 0)
+        if not inverted and front_iv and back_iv and front_iv > back_iv * 1.15:
+            inverted = True
+            spread = front_iv - back_iv
+        t["inverted"][i] = 1 if inverted else 0
+        t["spread"][i] = spread
+        t["implied_move"][i] = implied_move
+    t["inverted"] = t["inverted"].astype(bool)
+    return t
+
+
+def _skew_table(skew: Dict[str, Any], index: Dict[str, int], n: int) -> Dict[str, np.ndarray]:
+    t = _cols(n, "reversal", "bearish_hedge", "zscore")
+    for i, info in _records(skew, index):
+        trend = str(info.get("skew_trend", "")).upper()
+        if "REVERSAL_TO_BEARISH" in trend:
+            t["reversal"][i] = BEAR
+        elif "REVERSAL_TO_BULLISH" in trend:
+            t["reversal"][i] = BULL
+        t["bearish_hedge"][i] = 1 if info.get("bearish_hedge", False) else 0
+        t["zscore"][i] = _num(info.get("skew_zscore", 0))
+    t["bearish_hedge"] = t["bearish_hedge"].astype(bool)
+    return t
+
+
+def _dp_table(dp: Dict[str, Any], index: Dict[str, int], n: int) -> Dict[str, np.ndarray]:
+    t = _cols(n, "valid", "value", "large_blocks", "above_ask", "below_bid")
+    for i, info in _records(dp, index):
+        prints = info.get("prints", [])
+        if not isinstance(prints, list) or len(prints) < 2:
+            continue
+        t["valid"][i] = 1
+        t["value"][i] = info.get("total_value", 0) or sum(p.get("value", 0) for p in prints)
+        t["large_blocks"][i] = sum(1 for p in prints if p.get("value", 0) >= 500_000)
+        t["above_ask"][i] = _num(info.get("above_ask_count", 0))
+        t["below_bid"][i] = _num(info.get("below_bid_count", 0))
+    t["valid"] = t["valid"].astype(bool)
+    return t
+
+
+def _inst_table(inst: Dict[str, Any], index: Dict[str, int], n: int) -> Dict[str, np.ndarray]:
+    t = _cols(n, "signal_count", "direction", "implied_move", "iv_oi", "dp_massive", "label")
+    for i, info in _records(inst, index):
+        signals_list = info.get("signals", [])
+        signal_count = info.get("signal_count", len(signals_list))
+        try:
+            signal_count = int(signal_count)
+        except (ValueError, TypeError):
+            signal_count = len(signals_list)
+        direction = NEUTRAL
+        sig_set = set()
+        for s in signals_list:
+            s_str = str(s).upper()
+            sig_set.add(s_str)
+            if "CALL_OI_DOMINANT" in s_str or "CALL_SWEEP" in s_str:
+                direction = BULL
+            elif "PUT_OI_DOMINANT" in s_str or "PUT_SWEEP" in s_str:
+                direction = BEAR
+            elif "VANNA_CRUSH_BULLISH" in s_str:
+                if direction != BEAR:
+                    direction = BULL
+        implied_move = 0
+        try:
+            implied_move = float(info.get("implied_move", 0) or 0)
+        except (ValueError, TypeError):
+            pass
+        label = str(info.get("conviction", "")).upper()
+        t["signal_count"][i] = signal_count
+        t["direction"][i] = direction
+        t["implied_move"][i] = implied_move
+        t["iv_oi"][i] = (any("IV_EXTREME" in s for s in sig_set)
+                         and any("OI_DOMINANT" in s for s in sig_set))
+        t["dp_massive"][i] = any("DARK_POOL_MASSIVE" in s for s in sig_set)
+        t["label"][i] = 2 if label == "HIGH" else 1 if label == "MEDIUM" else 0
+    return t
+
+
+def _insider_table(insider: Dict[str, Any], index: Dict[str, int], n: int) -> Dict[str, np.ndarray]:
+    t = _cols(n, "net_value", "total_buys")
+    for i, info in _records(insider, index):
+        t["net_value"][i] = _num(info.get("net_value", 0))
+        t["total_buys"][i] = _num(info.get("total_buys", 0))
+    return t
+
+
+def _recs_table(recs: Dict[str, Any], index: Dict[str, int], n: int) -> Dict[str, np.ndarray]:
+    t = _cols(n, "engine_count", "catalyst")
+    for i, info in _records(recs, index):
+        t["engine_count"][i] = _num(info.get("engine_count", 0))
+        t["catalyst"][i] = _num(info.get("catalyst_score", 0))
+    return t
+
+
+def _congress_table(congress: Dict[str, Any], index: Dict[str, int], n: int) -> Dict[str, np.ndarray]:
+    t = _cols(n, "action")
+    for i, info in _records(congress, index):
+        action = str(info.get("action", "")).upper()
+        if "BUY" in action or "PURCHASE" in action:
+            t["action"][i] = BULL
+        elif "SELL" in action or "SALE" in action:
+            t["action"][i] = BEAR
+    return t
+
+
+# ═══════════════════════════════════════════════════════
+# Vectorized scorers  (score column, direction column)
+# ═══════════════════════════════════════════════════════
+
+def _v_flow(f: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    cp, sdr, st, scp = f["call_pct"], f["short_dte_ratio"], f["short_total"], f["short_call_pct"]
+    short_gate = (st >= 200_000) & (sdr >= 0.30)
+    s1 = np.where(short_gate, np.select([scp >= 0.65, scp <= 0.35, sdr >= 0.50], [0.12, 0.12, 0.04], 0.0), 0.0)
+    short_dir = np.where(short_gate, np.select([scp >= 0.65, scp <= 0.35], [BULL, BEAR], NEUTRAL), NEUTRAL)
+
+    avo = f["avg_vol_oi"]
+    s2 = np.select([avo >= 3.0, avo >= 2.0], [0.08, 0.04], 0.0)
+
+    strong = np.maximum(cp, 1 - cp) >= STRONG_DIRECTIONAL_PCT
+    total_dir = np.where(cp >= STRONG_DIRECTIONAL_PCT, BULL, BEAR)
+    agree = strong & ((short_dir == total_dir) | (short_dir == NEUTRAL))
+    s3 = np.where(agree, 0.05, 0.0)
+    direction = np.where(short_dir != NEUTRAL, short_dir, np.where(agree, total_dir, NEUTRAL))
+
+    s4 = np.select([st >= 10_000_000, st >= 1_000_000, st >= 200_000], [0.08, 0.05, 0.02], 0.0)
+
+    score = np.minimum(0.0 + s1 + s2 + s3 + s4, 0.35)
+    full = f["full"]
+    return np.where(full, score, 0.0), np.where(full, direction, NEUTRAL)
+
+
+def _v_oi(o: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    call, put, cpc, ppc = o["call_chg"], o["put_chg"], o["call_pct_chg"], o["put_pct_chg"]
+
+    both = (call > 1000) & (put > 1000)
+    ratio = call / np.maximum(put, 1)
+    primary = [
+        both & (ratio > 2.5), both & (ratio < 0.40), both & (ratio > 1.7), both & (ratio < 0.59),
+        ~both & (call > 5000) & (put <= 500),
+        ~both & (put > 5000) & (call <= 500),
+        ~both & (call > 2000) & (cpc > 20) & (put < call * 0.5),
+        ~both & (put > 2000) & (ppc > 20) & (call < put * 0.5),
+    ]
+    score = 0.0 + np.select(primary, [0.10, 0.10, 0.05, 0.05, 0.10, 0.10, 0.05, 0.05], 0.0)
+    direction = np.select(primary, [BULL, BEAR, BULL, BEAR, BULL, BEAR, BULL, BEAR], NEUTRAL)
+
+    open_ = (direction == NEUTRAL) & (score == 0)
+    sec_bull = open_ & (cpc > 15) & (ppc < cpc * 0.3) & (call > 500)
+    sec_bear = open_ & ~sec_bull & (ppc > 15) & (cpc < ppc * 0.3) & (put > 500)
+    score = score + np.where(sec_bull | sec_bear, 0.05, 0.0)
+    direction = np.where(sec_bull, BULL, np.where(sec_bear, BEAR, direction))
+
+    mdi, c3d = o["max_days_inc"], o["contracts_3d"]
+    score = score + np.select([(mdi >= 5) & (c3d >= 5), (mdi >= 3) & (c3d >= 3)], [0.04, 0.02], 0.0)
+    score = score + np.where(o["vol_gt_oi"] >= 5, 0.03, 0.0)
+
+    n_top = o["n_top"]
+    top_open = (n_top > 0) & (direction == NEUTRAL) & (n_top >= 3)
+    top_bull = top_open & (o["bull_top"] >= n_top * 0.6)
+    top_bear = top_open & ~top_bull & (o["bear_top"] >= n_top * 0.6)
+    score = score + np.where(top_bull | top_bear, 0.03, 0.0)
+    direction = np.where(top_bull, BULL, np.where(top_bear, BEAR, direction))
+
+    has = o["has"]
+    return np.where(has, np.minimum(score, 0.15), 0.0), np.where(has, direction, NEUTRAL)
+
+
+def _v_gex(g: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    score = np.minimum(0.0 + np.where(g["flip"], 0.08, 0.0), 0.08)
+    net = g["net_gex"]
+    amplifier = np.where(net < -100_000, np.minimum(1.0 + np.abs(net) / 5_000_000, 1.10), 1.0)
+    return score, amplifier
+
+
+def _v_iv(v: Dict[str, np.ndarray]) -> np.ndarray:
+    inv, spread, im = v["inverted"], np.abs(v["spread"]), v["implied_move"]
+    score = 0.0 + np.select([inv & (spread > 1.0), inv & (spread > 0.3), inv], [0.08, 0.06, 0.03], 0.0)
+    score = score + np.select([im > 10.0, im > 5.0], [0.04, 0.02], 0.0)
+    return np.minimum(score, 0.10)
+
+
+def _v_skew(k: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    rev = k["reversal"]
+    hedge = (rev == NEUTRAL) & k["bearish_hedge"] & (k["zscore"] < -3.0)
+    score = 0.0 + np.select([rev != NEUTRAL, hedge], [0.05, 0.04], 0.0)
+    direction = np.where(hedge, BEAR, rev)
+    return np.minimum(score, 0.05), direction
+
+
+def _v_dp(d: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    value, above, below = d["value"], d["above_ask"], d["below_bid"]
+    score = 0.0 + np.select([(value >= 10_000_000) & (d["large_blocks"] >= 3), value >= 2_000_000],
+                            [0.04, 0.02], 0.0)
+    directional = (above + below) >= 5
+    direction = np.select([directional & (above > below * 2), directional & (below > above * 2)],
+                          [BULL, BEAR], NEUTRAL)
+    valid = d["valid"]
+    return np.where(valid, np.minimum(score, 0.04), 0.0), np.where(valid, direction, NEUTRAL)
+
+
+def _v_inst(r: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    sc, im = r["signal_count"], r["implied_move"]
+    score = 0.0 + np.select([sc >= 4, sc >= 3, sc >= 2, sc >= 1], [0.08, 0.06, 0.04, 0.02], 0.0)
+    score = score + np.select([im >= 15.0, im >= 8.0], [0.03, 0.02], 0.0)
+    score = score + np.where(r["iv_oi"] > 0, 0.02, 0.0)
+    score = score + np.where(r["dp_massive"] > 0, 0.01, 0.0)
+    score = score + np.select([r["label"] == 2, r["label"] == 1], [0.02, 0.01], 0.0)
+    return np.minimum(score, 0.12), r["direction"]
+
+
+def _v_insider(s: Dict[str, np.ndarray]) -> np.ndarray:
+    nv = s["net_value"]
+    score = 0.0 + np.select([nv > 1_000_000, nv > 100_000, (nv > 0) & (s["total_buys"] >= 3)],
+                            [0.06, 0.04, 0.02], 0.0)
+    return np.minimum(score, 0.06)
+
+
+def _v_recs(s: Dict[str, np.ndarray]) -> np.ndarray:
+    ec = s["engine_count"]
+    score = 0.0 + np.select([ec >= 3, ec >= 2], [0.04, 0.02], 0.0)
+    score = score + np.where(s["catalyst"] >= 0.80, 0.02, 0.0)
+    return np.minimum(score, 0.06)
+
+
+def _v_congress(s: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    action = s["action"]
+    score = 0.0 + np.select([action == BULL, action == BEAR], [0.04, 0.03], 0.0)
+    return np.minimum(score, 0.04), action
+
+
+# ═══════════════════════════════════════════════════════
+# Combination
+# ═══════════════════════════════════════════════════════
+
+def score_superset(symbols: Sequence[str], sources: Dict[str, Dict]) -> Dict[str, np.ndarray]:
+    """
+    Direction, tier and conviction columns for every symbol.
+
+    Mirrors _analyze_ticker_multi_source step by step; conviction is
+    before the 4-dp rounding the scalar record applies.
+    """
+    n = len(symbols)
+    index = {sym: i for i, sym in enumerate(symbols)}
+    flow = _flow_table(sources["flow"], symbols)
+    oi = _oi_table(sources["oi"], index, n)
+    dp = _dp_table(sources["dp"], index, n)
+
+    flow_s, flow_dir = _v_flow(flow)
+    oi_s, oi_dir = _v_oi(oi)
+    gex_s, gex_amp = _v_gex(_gex_table(sources["gex"], index, n))
+    iv_s = _v_iv(_iv_table(sources["iv"], index, n))
+    skew_s, skew_dir = _v_skew(_skew_table(sources["skew"], index, n))
+    dp_s, dp_dir = _v_dp(dp)
+    inst_s, inst_dir = _v_inst(_inst_table(sources["inst"], index, n))
+    insider_s = _v_insider(_insider_table(sources["insider"], index, n))
+    rec_s = _v_recs(_recs_table(sources["recs"], index, n))
+    cong_s, cong_dir = _v_congress(_congress_table(sources["congress"], index, n))
+
+    conv = 0.0 + flow_s + oi_s + gex_s + iv_s + skew_s + dp_s + inst_s + insider_s + rec_s + cong_s
+
+    voters = (flow_dir, oi_dir, skew_dir, dp_dir, inst_dir,
+              np.where(insider_s > 0.01, BULL, NEUTRAL), cong_dir)
+    bull = sum((d == BULL).astype(int) for d in voters)
+    bear = sum((d == BEAR).astype(int) for d in voters)
+    iv_on = iv_s > 0
+
+    # Convergence multiplier + GEX amplifier
+    max_dir = np.maximum(bull, bear)
+    conv = conv * np.select([max_dir >= 4, max_dir >= 3, (max_dir >= 2) & iv_on], [1.40, 1.25, 1.15], 1.0)
+    conv = np.where(gex_amp > 1.0, conv * gex_amp, conv)
+
+    # Volatility catalyst
+    conv = conv + np.select(
+        [iv_on & (oi_s > 0), iv_on & ((gex_s > 0) | (dp_s > 0) | (flow_s >= 0.10))], [0.10, 0.06], 0.0)
+
+    # ── Direction tiers ──────────────────────────────────
+    direction = np.full(n, NEUTRAL)
+    tier = np.zeros(n, dtype=int)
+
+    def assign(mask, value, t):
+        nonlocal direction, tier
+        direction = np.where(mask, value, direction)
+        tier = np.where(mask, t, tier)
+
+    has_short_flow = (flow["short_dte_prem"] >= 100_000) & (flow["short_dte_ratio"] >= 0.15)
+    scp = flow["short_call_pct"]
+    assign(has_short_flow & (scp >= 0.60), BULL, 1)
+    assign(has_short_flow & (scp <= 0.40), BEAR, 1)
+
+    t2a = (direction == NEUTRAL) & (oi_dir == BULL) & iv_on
+    assign(t2a, BULL, 2)
+    conv = np.where(t2a, conv + 0.04, conv)
+    assign((direction == NEUTRAL) & (oi_dir != NEUTRAL), oi_dir, 2)
+
+    cp = flow["call_pct"]
+    inst_prem = flow["total_prem"] >= MIN_PREMIUM_INSTITUTIONAL
+    assign((direction == NEUTRAL) & inst_prem & (cp >= 0.65) & (iv_on | (bull >= 1)), BULL, 3)
+    open_ = (direction == NEUTRAL) & inst_prem
+    assign(open_ & (cp >= 0.80), BULL, 3)
+    assign(open_ & (cp < 0.80) & ((cp <= 0.20) | ((cp <= 0.35) & (bear >= 2))), BEAR, 3)
+
+    open_ = direction == NEUTRAL
+    t4 = np.select(
+        [bull >= 3, bear >= 3, (bull == 2) & (bear == 0) & iv_on, (bear == 2) & (bull == 0) & iv_on],
+        [BULL, BEAR, BULL, BEAR], NEUTRAL)
+    assign(open_ & (t4 != NEUTRAL), t4, 4)
+
+    open_ = (direction == NEUTRAL) & (flow["n_trades"] < MIN_TRADES)
+    non_flow = oi_s + iv_s + dp_s + skew_s + inst_s
+    lean = np.where(bull >= bear, BULL, BEAR)
+    t5 = np.select(
+        [(non_flow >= 0.10) & (oi_dir != NEUTRAL),
+         (non_flow >= 0.08) & iv_on & ((bull > 0) | (bear > 0)),
+         (bull >= 2) & (bear == 0),
+         (bear >= 2) & (bull == 0)],
+        [oi_dir, lean, BULL, BEAR], NEUTRAL)
+    assign(open_ & (t5 != NEUTRAL), t5, 5)
+
+    open_ = ((direction == NEUTRAL) & oi["has"]
+             & (oi["max_days_inc"] >= 7) & (oi["contracts_3d"] >= 10))
+    t5b = np.select([dp_dir != NEUTRAL, bull > bear, bear > bull], [dp_dir, BULL, BEAR], NEUTRAL)
+    assign(open_ & (t5b != NEUTRAL), t5b, 5)
+
+    conv = conv * np.select([tier == 3, tier == 4, tier == 5], [0.85, 0.70, 0.65], 1.0)
+
+    # Flow vs accumulation conflict
+    conflict = (tier <= 2) & (flow_dir != NEUTRAL) & (oi_dir != NEUTRAL) & (flow_dir != oi_dir)
+    override = conflict & (inst_dir == oi_dir) & (inst_dir != NEUTRAL)
+    caution = conflict & ~override & (inst_dir != flow_dir) & (inst_dir != NEUTRAL)
+    direction = np.where(override, oi_dir, direction)
+    tier = np.where(override, 2, tier)
+    conv = conv * np.select([override, caution], [0.85, 0.75], 1.0)
+
+    # Conflict penalty vs source consensus
+    low_tier = tier <= 2
+    penalty = ((low_tier & (direction == BEAR) & (bull > bear + 1))
+               | (low_tier & (direction == BULL) & (bear > bull + 1)))
+    conv = np.where(penalty, conv * 0.80, conv)
+
+    # LEAPS penalty
+    leaps = (flow["n_trades"] > 0) & (flow["total_prem"] > 0) & (flow["leaps_ratio"] > 0.80) \
+        & (flow["short_dte_ratio"] < 0.10)
+    conv = np.where(leaps, conv * 0.60, conv)
+
+    # High-beta amplifier
+    high_beta = np.fromiter((s in HIGH_BETA_TICKERS for s in symbols), dtype=bool, count=n)
+    conv = np.where(high_beta & iv_on & (direction != NEUTRAL), conv * 1.15, conv)
+
+    return {
+        "direction": direction,
+        "tier": tier,
+        "conviction": np.minimum(conv, 1.0),
+        "bullish_sources": bull,
+        "bearish_sources": bear,
+    }
+
+
+def _screen(symbols: List[str], sources: Dict[str, Dict]) -> List[Dict[str, Any]]:
+    """Score all symbols, materialize survivors via the scalar analyzer (input order)."""
+    if not symbols:
+        return []
+    cols = score_superset(symbols, sources)
+    keep = (cols["direction"] != NEUTRAL) & (cols["conviction"] >= MIN_CONVICTION_THRESHOLD - _SCREEN_MARGIN)
+    return [_analyze_symbol(symbols[i], sources) for i in np.flatnonzero(keep)]
+
+
+def _screen_shard(symbols: List[str]) -> List[Dict[str, Any]]:
+    return _screen(symbols, _SHARD_SOURCES)
+
+
+def use_columnar(tickers: Sequence[str], sources: Dict[str, Dict]) -> bool:
+    """
+    True when the columnar screen is expected to beat the per-ticker path.
+
+    Coverage is the mean share of the superset with a flow / OI / GEX /
+    IV / dark-pool record — a cheap proxy for the survivor share.
+    """
+    n = len(tickers)
+    if n < COLUMNAR_MIN_TICKERS:
+        return False
+    covered = sum(min(len(sources.get(k) or ()), n) for k in _COVERAGE_SOURCES)
+    return covered / (n * len(_COVERAGE_SOURCES)) <= COLUMNAR_MAX_COVERAGE
+
+
+def analyze_superset(
+    tickers: Iterable[str],
+    sources: Dict[str, Dict],
+    workers: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Analysis records for every ticker that could pass the conviction
+    threshold, in iteration order of `tickers`.
+
+    Non-survivors are NEUTRAL or below threshold in the scalar path too,
+    so callers filter the result exactly as they filtered full output.
+    """
+    global _SHARD_SOURCES
+    symbols = list(tickers)
+    if workers > 1 and len(symbols) >= SHARD_MIN_TICKERS:
+        import multiprocessing as mp
+        from concurrent.futures import ProcessPoolExecutor
+        try:
+            ctx = mp.get_context("fork")
+        except ValueError:
+            ctx = None
+        if ctx is not None:
+            size = -(-len(symbols) // workers)
+            shards = [symbols[i:i + size] for i in range(0, len(symbols), size)]
+            _SHARD_SOURCES = sources   # inherited by forked workers
+            try:
+                with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+                    out: List[Dict[str, Any]] = []
+                    for part in pool.map(_screen_shard, shards):
+                        out.extend(part)
+                logger.debug(f"  Smart money: {len(symbols)} tickers in {len(shards)} shards")
+                return out
+            except Exception as e:
+                logger.warning(f"  ⚠️ Smart money shard mode failed ({e}) — running in-process")
+            finally:
+                _SHARD_SOURCES = None
+    return _screen(symbols, sources)
+
+
+# ═══════════════════════════════════════════════════════
+# Benchmark / parity check
+# ═══════════════════════════════════════════════════════
+
+def _synthetic_sources(n: int, seed: int = 5, density: float = 1.0) -> Tuple[List[str], Dict[str, Dict]]:
+    """Synthetic sources; density scales per-source coverage (1.0 = signal-rich)."""
+    import random
+    rng = random.Random(seed)
+
+    def covered(p: float) -> bool:
+        return rng.random() < p * density
+
+    symbols = [f"S{i:05d}" for i in range(n - 6)] + ["MSTR", "GME", "APP", "SMCI", "IONQ", "DNA"]
+    src: Dict[str, Dict] = {k: {} for k in ("flow", "dp", "forecast", "oi", "gex", "iv", "skew",
+                                             "inst", "insider", "recs", "congress")}
+    dirs = ["BULLISH", "BEARISH", "NEUTRAL", ""]
+    for sym in symbols:
+        if covered(0.7):
+            src["flow"][sym] = [{
+                "put_call": rng.choice("CCP" if rng.random() < 0.5 else "CPP"),
+                "premium": rng.choice([rng.randint(1_000, 400_000), rng.randint(100_000, 5_000_000)]),
+                "dte": rng.choice([0, 1, 3, 7, 14, 45, 200, 400]),
+                "open_interest": rng.randint(0, 5000),
+                "volume": rng.randint(0, 20000),
+            } for _ in range(rng.randint(0, 30))]
+        if covered(0.6):
+            src["oi"][sym] = {
+                "call_oi_change": rng.randint(-2000, 12000), "put_oi_change": rng.randint(-2000, 12000),
+                "call_oi_pct_change": rng.uniform(-10, 60), "put_oi_pct_change": rng.uniform(-10, 60),
+                "max_days_oi_increasing": rng.randint(0, 10),
+                "contracts_3plus_days_oi_increase": rng.randint(0, 20),
+                "vol_gt_oi_count": rng.randint(0, 8),
+                "top_contracts": [{"prev_direction": rng.choice(dirs)} for _ in range(rng.randint(0, 12))],
+            }
+        if covered(0.6):
+            src["gex"][sym] = {"net_gex": rng.uniform(-1e6, 1e6), "gex_flip_today": rng.random() < 0.1,
+                               "gex_flip_direction": rng.choice(["UP", "DOWN"])}
+        if covered(0.6):
+            src["iv"][sym] = {"inverted": rng.random() < 0.3, "term_spread": rng.uniform(-2, 2),
+                              "implied_move_pct": rng.choice([0, rng.uniform(0, 0.2), rng.uniform(1, 15)]),
+                              "front_iv": rng.uniform(0.2, 1.2), "back_iv": rng.uniform(0.2, 1.0)}
+        if covered(0.4):
+            src["skew"][sym] = {"skew_zscore": rng.uniform(-6, 6), "bearish_hedge": rng.random() < 0.3,
+                                "skew_trend": rng.choice(["REVERSAL_TO_BEARISH", "reversal_to_bullish",
+                                                          "STEADY", ""])}
+        if covered(0.5):
+            src["dp"][sym] = {
+                "prints": [{"value": rng.randint(10_000, 3_000_000)} for _ in range(rng.randint(0, 12))],
+                "total_value": rng.choice([0, rng.randint(1_000_000, 30_000_000)]),
+                "above_ask_count": rng.randint(0, 10), "below_bid_count": rng.randint(0, 10),
+            }
+        if covered(0.3):
+            src["inst"][sym] = {
+                "signals": rng.sample(["CALL_OI_DOMINANT", "PUT_SWEEP", "IV_EXTREME_INVERSION",
+                                       "DARK_POOL_MASSIVE", "VANNA_CRUSH_BULLISH", "GEX_FLIP"],
+                                      rng.randint(0, 4)),
+                "implied_move": rng.choice([0, "x", rng.uniform(0, 25)]),
+                "conviction": rng.choice(["HIGH", "medium", "LOW", ""]),
+            }
+        if covered(0.1):
+            src["insider"][sym] = {"net_value": rng.randint(-500_000, 3_000_000), "total_buys": rng.randint(0, 5)}
+        if covered(0.1):
+            src["recs"][sym] = {"engine_count": rng.randint(0, 4), "catalyst_score": rng.random()}
+        if covered(0.05):
+            src["congress"][sym] = {"action": rng.choice(["Purchase", "Sale", "Exchange"]), "politician": "X"}
+    return symbols, src
+
+
+def run_benchmark(sizes=(200, 1000, 5000), densities=(1.0, 0.3, 0.05), repeats: int = 3) -> List[Dict[str, Any]]:
+    """Time per-ticker vs columnar scan and check exact parity."""
+    import time
+    rows = []
+    for density in densities:
+        for n in sizes:
+            symbols, sources = _synthetic_sources(n, density=density)
+            t_scalar = t_screen = t_col = float("inf")
+            for _ in range(repeats):
+                t0 = time.perf_counter()
+                scalar = [_analyze_symbol(s, sources) for s in symbols]
+                t_scalar = min(t_scalar, time.perf_counter() - t0)
+                t0 = time.perf_counter()
+                cols = score_superset(symbols, sources)
+                t_screen = min(t_screen, time.perf_counter() - t0)
+                t0 = time.perf_counter()
+                columnar = analyze_superset(symbols, sources)
+                t_col = min(t_col, time.perf_counter() - t0)
+
+            names = {BULL: "BULLISH", BEAR: "BEARISH", NEUTRAL: "NEUTRAL"}
+            screen_ok = all(
+                a["direction"] == names[int(d)] and a["conviction"] == round(float(c), 4)
+                for a, d, c in zip(scalar, cols["direction"], cols["conviction"])
+            )
+
+            def passing(records):
+                return [r for r in records if r["direction"] != "NEUTRAL"
+                        and r["conviction"] >= MIN_CONVICTION_THRESHOLD]
+
+            rows.append({
+                "n": n,
+                "density": density,
+                "scalar_ms": round(t_scalar * 1000, 1),
+                "screen_ms": round(t_screen * 1000, 1),
+                "columnar_ms": round(t_col * 1000, 1),
+                "speedup": round(t_scalar / t_col, 1) if t_col > 0 else 0,
+                "survivors": len(columnar),
+                "gated_in": use_columnar(symbols, sources),
+                "identical_screen": screen_ok,
+                "identical_output": passing(scalar) == passing(columnar),
+            })
+    return rows
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Columnar smart money benchmark / parity check")
+    parser.add_argument("--bench", action="store_true", help="Run benchmark at 200 / 1k / 5k tickers")
+    parser.add_argument("--sizes", type=str, default="200,1000,5000")
+    args = parser.parse_args()
+
+    rows = run_benchmark(sizes=tuple(int(s) for s in args.sizes.split(",")))
+    print(f"{'N':>7} {'density':>7} {'scalar ms':>10} {'screen ms':>10} {'total ms':>9} "
+          f"{'speedup':>8} {'survivors':>10} {'path':>9}  parity")
+    for r in rows:
+        ok = "✅" if r["identical_screen"] and r["identical_output"] else "❌"
+        path = "columnar" if r["gated_in"] else "scalar"
+        print(f"{r['n']:>7} {r['density']:>7.2f} {r['scalar_ms']:>10.1f} {r['screen_ms']:>10.1f} "
+              f"{r['columnar_ms']:>9.1f} {r['speedup']:>7.1f}x {r['survivors']:>10} {path:>9}  {ok}")
+    sys.exit(0 if all(r["identical_screen"] and r["identical_output"] for r in rows) else 1)
@@ -50,6 +50,37 @@ SHORT_DTE_DAYS = 7
 MIN_VOL_OI_RATIO = 1.5
 MIN_CONVICTION_THRESHOLD = 0.22
 
+# Volatile names whose directional signals are more likely to produce 5%+
+# moves — amplified when IV is inverted (see _analyze_ticker_multi_source).
+HIGH_BETA_TICKERS = frozenset({
+    "MSTR", "CLSK", "MARA", "RIOT", "BITF", "WULF", "HUT", "CIFR",  # crypto
+    "QBTS", "RGTI", "IONQ", "OKLO",  # quantum/nuclear
+    "LUNR", "RKLB", "ASTS", "SPCE",  # space
+    "GME", "AMC", "DJT", "BYND",  # meme/high-short
+    "IBRX", "SAVA", "NTLA", "CRSP", "DNA", "IOVA", "NVAX", "CRWV",  # biotech
+    "SMCI", "APP", "UPST", "AFRM", "HIMS", "CVNA", "LCID", "PLUG",  # high-vol tech
+    "RDDT", "SNAP", "U", "FUBO", "PTON", "TDOC",  # volatile tech
+    "ENPH", "SEDG", "FSLR",  # solar
+    "ARM", "INOD", "HROW", "MDGL", "VKTX",  # volatile mid-cap
+})
+
+# Ticker analysis backend: the columnar scorer in smart_money_columnar.py
+# for large, sparsely covered supersets (use_columnar), the per-ticker path
+# otherwise; SMART_MONEY_SCALAR=1 always runs the per-ticker path.
+# SMART_MONEY_SHARD_WORKERS>1 shards very large supersets across processes.
+SMART_MONEY_SCALAR = os.getenv("SMART_MONEY_SCALAR", "") == "1"
+SMART_MONEY_SHARD_WORKERS = int(os.getenv("SMART_MONEY_SHARD_WORKERS", "0"))
+
+# Loaded source → TradeNova file it comes from (incremental reuse fingerprints)
+_SOURCE_FILES = {
+    "flow": "uw_flow_cache.json", "dp": "darkpool_cache.json",
+    "forecast": "tomorrows_forecast.json", "oi": "uw_oi_change_cache.json",
+    "gex": "uw_gex_cache.json", "iv": "uw_iv_term_cache.json",
+    "skew": "uw_skew_cache.json", "inst": "institutional_radar_daily.json",
+    "insider": "finviz_insider_cache.json", "recs": "final_recommendations.json",
+    "congress": "congress_trades_cache.json",
+}
+
 
 # ═══════════════════════════════════════════════════════════════════
 # MAIN ENTRY POINT
@@ -57,10 +88,17 @@ MIN_CONVICTION_THRESHOLD = 0.22
 
 def scan_smart_money(
     universe: Optional[set] = None,
+    incremental: bool = False,
 ) -> Dict[str, Any]:
     """
     Multi-source smart money scan for future movers.
 
+    Args:
+        universe: Tickers to scan besides those in the flow / OI / GEX caches
+        incremental: Reuse the last scan's analysis for tickers whose source
+            records are unchanged (see analysis/incremental_scan.py). Full
+            scans still record state for the next incremental one.
+
     Returns:
         {
             "bullish_candidates": [...],
@@ -117,35 +155,50 @@ def scan_smart_money(
     all_tickers.update(oi_data.keys())
     all_tickers.update(gex_data.keys())
 
-    bullish = []
-    bearish = []
-    scanned = 0
-
-    for sym in all_tickers:
-        trades = flow_data.get(sym, [])
-        if not isinstance(trades, list):
-            trades = []
-
-        scanned += 1
-        analysis = _analyze_ticker_multi_source(
-            sym=sym,
-            trades=trades,
-            dp_info=dp_data.get(sym),
-            forecast_info=forecast_data.get(sym),
-            oi_info=oi_data.get(sym),
-            gex_info=gex_data.get(sym),
-            iv_info=iv_data.get(sym),
-            skew_info=skew_data.get(sym),
-            inst_info=inst_radar.get(sym),
-            insider_info=insider_data.get(sym),
-            rec_info=recs_data.get(sym),
-            congress_info=congress_data.get(sym),
+    sources = {
+        "flow": flow_data, "dp": dp_data, "forecast": forecast_data,
+        "oi": oi_data, "gex": gex_data, "iv": iv_data, "skew": skew_data,
+        "inst": inst_radar, "insider": insider_data, "recs": recs_data,
+        "congress": congress_data,
+    }
+    scanned = len(all_tickers)
+    reuse = None
+    todo = all_tickers
+    try:
+        from analysis.incremental_scan import SmartMoneyReuse
+        reuse = SmartMoneyReuse(
+            {name: _TRADENOVA_DATA / fname for name, fname in _SOURCE_FILES.items()},
+            reuse=incremental,
         )
-
-        if analysis["direction"] == "BULLISH" and analysis["conviction"] >= MIN_CONVICTION_THRESHOLD:
-            bullish.append(analysis)
-        elif analysis["direction"] == "BEARISH" and analysis["conviction"] >= MIN_CONVICTION_THRESHOLD:
-            bearish.append(analysis)
+        todo = reuse.plan(all_tickers, sources)
+    except Exception as e:
+        logger.debug("  Smart money reuse state unavailable: {}".format(e))
+        reuse = None
+
+    analyses = None
+    if not SMART_MONEY_SCALAR:
+        try:
+            from engine_adapters.smart_money_columnar import analyze_superset, use_columnar
+            if use_columnar(todo, sources):
+                analyses = analyze_superset(todo, sources, workers=SMART_MONEY_SHARD_WORKERS)
+        except ImportError as e:
+            logger.debug("  Columnar smart money unavailable ({}) — scalar path".format(e))
+    if analyses is None:
+        analyses = (_analyze_symbol(sym, sources) for sym in todo)
+
+    passed = [
+        a for a in analyses
+        if a["direction"] in ("BULLISH", "BEARISH") and a["conviction"] >= MIN_CONVICTION_THRESHOLD
+    ]
+    if reuse is not None:
+        passed = reuse.merge(passed)
+        reuse.save()
+        if incremental:
+            logger.info("  ♻️ Smart Money: reused {}, analysed {} tickers".format(
+                reuse.stats["reused"], reuse.stats["recomputed"]))
+
+    bullish = [a for a in passed if a["direction"] == "BULLISH"]
+    bearish = [a for a in passed if a["direction"] == "BEARISH"]
 
     bullish.sort(key=lambda x: x["conviction"], reverse=True)
     bearish.sort(key=lambda x: x["conviction"], reverse=True)
@@ -201,8 +254,7 @@ def scan_smart_money(
         with open(prev_scan_path, "w") as f:
             json.dump(scan_output, f, indent=2, default=str)
 
-        # Append to scan history log for audit trail
-        history_path = Path.home() / "Meta Engine" / "output" / "smart_money_scan_history.jsonl"
+        # Append to scan history (analytics store) for audit trail
         history_entry = {
             "timestamp": datetime.now().isoformat(),
             "fingerprint": data_fingerprint,
@@ -211,8 +263,8 @@ def scan_smart_money(
             "top5_bull": [b["symbol"] for b in bullish[:5]],
             "top5_bear": [b["symbol"] for b in bearish[:5]],
         }
-        with open(history_path, "a") as f:
-            f.write(json.dumps(history_entry, default=str) + "\n")
+        from analytics_store import analytics_store
+        analytics_store().append_smart_money_scan(history_entry)
     except Exception:
         pass
 
@@ -248,6 +300,27 @@ def scan_smart_money(
 # MULTI-SOURCE TICKER ANALYSIS
 # ═══════════════════════════════════════════════════════════════════
 
+def _analyze_symbol(sym: str, sources: Dict[str, Dict]) -> Dict[str, Any]:
+    """_analyze_ticker_multi_source for one ticker of the loaded sources."""
+    trades = sources["flow"].get(sym, [])
+    if not isinstance(trades, list):
+        trades = []
+    return _analyze_ticker_multi_source(
+        sym=sym,
+        trades=trades,
+        dp_info=sources["dp"].get(sym),
+        forecast_info=sources["forecast"].get(sym),
+        oi_info=sources["oi"].get(sym),
+        gex_info=sources["gex"].get(sym),
+        iv_info=sources["iv"].get(sym),
+        skew_info=sources["skew"].get(sym),
+        inst_info=sources["inst"].get(sym),
+        insider_info=sources["insider"].get(sym),
+        rec_info=sources["recs"].get(sym),
+        congress_info=sources["congress"].get(sym),
+    )
+
+
 def _analyze_ticker_multi_source(
     sym: str,
     trades: List[Dict],
@@ -554,18 +627,7 @@ def _analyze_ticker_multi_source(
     # Volatile stocks with a directional signal are more likely to make 5%+
     # moves. Boost conviction for known high-beta names when IV is inverted
     # (confirming the market expects a big move).
-    HIGH_BETA = {
-        "MSTR", "CLSK", "MARA", "RIOT", "BITF", "WULF", "HUT", "CIFR",  # crypto
-        "QBTS", "RGTI", "IONQ", "OKLO",  # quantum/nuclear
-        "LUNR", "RKLB", "ASTS", "SPCE",  # space
-        "GME", "AMC", "DJT", "BYND",  # meme/high-short
-        "IBRX", "SAVA", "NTLA", "CRSP", "DNA", "IOVA", "NVAX", "CRWV",  # biotech
-        "SMCI", "APP", "UPST", "AFRM", "HIMS", "CVNA", "LCID", "PLUG",  # high-vol tech
-        "RDDT", "SNAP", "U", "FUBO", "PTON", "TDOC",  # volatile tech
-        "ENPH", "SEDG", "FSLR",  # solar
-        "ARM", "INOD", "HROW", "MDGL", "VKTX",  # volatile mid-cap
-    }
-    if sym in HIGH_BETA and iv_score > 0 and direction != "NEUTRAL":
+    if sym in HIGH_BETA_TICKERS and iv_score > 0 and direction != "NEUTRAL":
         conviction *= 1.15
         signals.append("high_beta_amplified")
 
@@ -39,6 +39,7 @@ DOES NOT TOUCH: cross_analyzer, puts_adapter, moonshot_adapter,
 import json
 import logging
 import os
+import time
 import requests
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -81,6 +82,11 @@ PRED_SIG_MIN_COUNT = 50         # >50 = active regime worth boosting
 OI_CHANGE_HIGH = 10_000         # >10K OI change = major positioning
 OI_CHANGE_MIN = 5_000           # >5K OI change = notable activity
 
+# Bar fetch (one 7-day window per symbol feeds serial mover + ATR)
+BAR_WINDOW_DAYS = 7
+BAR_FETCH_WORKERS = int(os.getenv("X_WORTHY_FETCH_WORKERS", "8"))
+BAR_CACHE_TTL_SEC = float(os.getenv("X_WORTHY_BAR_TTL_SEC", "900"))  # today's bar is live intraday
+
 
 def _load_json(path: Path) -> Dict[str, Any]:
     try:
@@ -199,28 +205,77 @@ def _fetch_polygon_bars(symbol: str, days_back: int = 7) -> list:
 
 
 # ═══════════════════════════════════════════════════════════════════════════
-# GAP 1: Serial Mover Detection
+# Shared bar windows (one request per symbol, cached per trading day)
 # ═══════════════════════════════════════════════════════════════════════════
 
-_serial_mover_cache: Dict[str, float] = {}
+# {"day": trading date, "bars": {symbol: (fetched_at, bars)}}
+_bar_cache: Dict[str, Any] = {"day": None, "bars": {}}
 
 
-def _get_serial_movers(symbols: List[str]) -> Dict[str, float]:
-    """
-    For each symbol, check if it moved >=SERIAL_MOVER_MIN_PCT in the
-    last 1-2 trading days. Returns {symbol: max_recent_abs_move_pct}.
-    Cached per session to avoid repeated API calls.
+def _trading_day() -> str:
+    from trading.nyse_calendar import is_trading_day, prev_trading_day
+    today = datetime.now().date()
+    return (today if is_trading_day(today) else prev_trading_day(today)).isoformat()
+
+
+def _get_bar_windows(symbols: List[str]) -> Dict[str, list]:
     """
-    global _serial_mover_cache
-    if _serial_mover_cache:
-        return _serial_mover_cache
+    Newest-first daily bars (BAR_WINDOW_DAYS window) for every symbol.
 
+    Missing or expired symbols are fetched concurrently under the shared
+    Polygon limiter. Entries live for BAR_CACHE_TTL_SEC and the whole cache
+    is dropped when the trading date rolls, so a warm process never serves
+    yesterday's bars. Empty fetches are not cached (retried next call).
+    """
     if not _POLYGON_KEY:
         return {}
 
+    day = _trading_day()
+    if _bar_cache["day"] != day:
+        _bar_cache["day"] = day
+        _bar_cache["bars"] = {}
+    cache = _bar_cache["bars"]
+
+    now = time.time()
+    symbols = list(dict.fromkeys(symbols))
+    stale = [s for s in symbols if s not in cache or now - cache[s][0] > BAR_CACHE_TTL_SEC]
+    if stale:
+        from concurrent.futures import ThreadPoolExecutor
+        from rate_limiter import polygon_limiter
+        limiter = polygon_limiter()
+
+        def _one(sym: str) -> Tuple[str, list]:
+            limiter.acquire()
+            return sym, _fetch_polygon_bars(sym, days_back=BAR_WINDOW_DAYS)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(BAR_FETCH_WORKERS, len(stale)))) as pool:
+            fetched = dict(pool.map(_one, stale))
+        fetched_at = time.time()
+        for sym, bars in fetched.items():
+            if bars:
+                cache[sym] = (fetched_at, bars)
+        logger.info(f"  📡 X-worthy bars: {len(stale)} fetched, "
+                    f"{len(symbols) - len(stale)} cached ({day})")
+
+    return {s: cache[s][1] for s in symbols if s in cache}
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# GAP 1: Serial Mover Detection
+# ═══════════════════════════════════════════════════════════════════════════
+
+def _get_serial_movers(symbols: List[str], bar_windows: Optional[Dict[str, list]] = None) -> Dict[str, float]:
+    """
+    For each symbol, check if it moved >=SERIAL_MOVER_MIN_PCT in the
+    last 1-2 trading days. Returns {symbol: max_recent_abs_move_pct}.
+    Reads the shared per-day bar windows (no extra API calls).
+    """
+    if bar_windows is None:
+        bar_windows = _get_bar_windows(symbols)
+
     result: Dict[str, float] = {}
     for sym in symbols:
-        bars = _fetch_polygon_bars(sym, days_back=3)
+        bars = bar_windows.get(sym, [])
         if len(bars) >= 2:
             for bar in bars[:2]:
                 o = bar.get("o", 0)
@@ -234,7 +289,6 @@ def _get_serial_movers(symbols: List[str]) -> Dict[str, float]:
                     max_move = max(day_move, abs(hi_move), abs(lo_move))
                     result[sym] = max(result.get(sym, 0), max_move)
 
-    _serial_mover_cache = result
     n_serial = sum(1 for v in result.values() if v >= SERIAL_MOVER_MIN_PCT)
     if n_serial:
         logger.info(f"  🔄 Serial movers detected: {n_serial} stocks moved ≥{SERIAL_MOVER_MIN_PCT}% recently")
@@ -245,24 +299,17 @@ def _get_serial_movers(symbols: List[str]) -> Dict[str, float]:
 # GAP 3: ATR / Volatility
 # ═══════════════════════════════════════════════════════════════════════════
 
-_atr_cache: Dict[str, float] = {}
-
-
-def _get_atr_map(symbols: List[str]) -> Dict[str, float]:
+def _get_atr_map(symbols: List[str], bar_windows: Optional[Dict[str, list]] = None) -> Dict[str, float]:
     """
     Compute 5-day average true range % for each symbol.
-    Uses bars already fetched for serial mover detection where possible.
+    Reads the same bar windows as serial mover detection.
     """
-    global _atr_cache
-    if _atr_cache:
-        return _atr_cache
-
-    if not _POLYGON_KEY:
-        return {}
+    if bar_windows is None:
+        bar_windows = _get_bar_windows(symbols)
 
     result: Dict[str, float] = {}
     for sym in symbols:
-        bars = _fetch_polygon_bars(sym, days_back=7)
+        bars = bar_windows.get(sym, [])
         if len(bars) >= 3:
             ranges = []
             for bar in bars[:5]:
@@ -274,7 +321,6 @@ def _get_atr_map(symbols: List[str]) -> Dict[str, float]:
             if ranges:
                 result[sym] = sum(ranges) / len(ranges)
 
-    _atr_cache = result
     return result
 
 
@@ -469,6 +515,128 @@ def _priority_score(
     return base + boost
 
 
+_TIER_CODES = {"same_day_1x": 0, "5x_potential": 1, "gap_play": 2, "final_rec": 3}
+
+
+def _priority_scores(
+    picks: List[Dict[str, Any]],
+    dp_data: Dict[str, Dict],
+    serial_movers: Dict[str, float],
+    atr_map: Dict[str, float],
+    inst_radar: Dict[str, Dict],
+    pred_counts: Dict[str, int],
+    oi_data: Dict[str, Dict],
+    insider_sent: Dict[str, str],
+) -> List[float]:
+    """
+    _priority_score for a whole pool in one pass.
+
+    Per-pick lookups are gathered into columns, the tier bases and every
+    boost ladder are evaluated as array selects, and the _x_* tags are
+    written back only for picks that earned them. Boosts are whole numbers,
+    so the sums equal the scalar version exactly.
+    """
+    import numpy as np
+    n = len(picks)
+    if not n:
+        return []
+
+    tier = np.empty(n, dtype=int)
+    a = np.zeros(n)
+    b = np.zeros(n)
+    moves, dp_vals, atrs, preds, ois = [], [], [], [], []
+    radar_high, radar_med, bullish = [], [], []
+    for i, pick in enumerate(picks):
+        sym = (pick.get("symbol") or "").strip()
+        t = _TIER_CODES.get(pick.get("_x_worthy_reason", "meta_only"), 4)
+        tier[i] = t
+        if t == 0:
+            a[i] = float(pick.get("_x_score_1x", 0) or 0)
+        elif t == 1:
+            a[i] = float(pick.get("_x_score_5x", 0) or 0)
+        elif t == 2:
+            a[i] = abs(float(pick.get("_x_gap_pct", 0) or 0))
+        elif t == 3:
+            a[i] = float(pick.get("_x_conviction", 0) or 0)
+            b[i] = float(pick.get("_x_est_mult", 0) or 0)
+        else:
+            a[i] = float(pick.get("score", 0) or 0)
+
+        moves.append(serial_movers.get(sym, 0))
+        dp_vals.append(float(dp_data.get(sym, {}).get("total_value", 0) or 0))
+        atrs.append(atr_map.get(sym, 0))
+        preds.append(pred_counts.get(sym, 0))
+        oi_entry = oi_data.get(sym, {})
+        ois.append(abs(int(oi_entry.get("total_oi_change", 0) or 0)) if isinstance(oi_entry, dict) else 0)
+        ir = inst_radar.get(sym, {})
+        ir_signals = set(ir.get("signals", [])) if isinstance(ir, dict) else set()
+        radar_high.append(ir_signals & INST_RADAR_HIGH_SIGNALS)
+        radar_med.append(ir_signals & INST_RADAR_MEDIUM_SIGNALS)
+        bullish.append(insider_sent.get(sym, "") == "BULLISH")
+
+    move_arr = np.asarray(moves, dtype=float)
+    dp_arr = np.asarray(dp_vals, dtype=float)
+    atr_arr = np.asarray(atrs, dtype=float)
+    pred_arr = np.asarray(preds, dtype=float)
+    oi_arr = np.asarray(ois, dtype=float)
+    has_high = np.fromiter((bool(x) for x in radar_high), bool, n)
+    has_med = np.fromiter((bool(x) for x in radar_med), bool, n) & ~has_high
+    bull_arr = np.asarray(bullish, dtype=bool)
+
+    base = np.select(
+        [tier == 0, tier == 1, tier == 2, tier == 3],
+        [2000.0 + a, 1000.0 + a, 800.0 + a * 10.0, 500.0 + a * 20.0 + b * 5.0],
+        default=a * 100.0,
+    )
+
+    serial = move_arr >= SERIAL_MOVER_MIN_PCT
+    whale = dp_arr >= DARKPOOL_WHALE_MIN
+    dp_sig = ~whale & (dp_arr >= DARKPOOL_SIGNIFICANT_MIN)
+    high_atr = atr_arr >= HIGH_ATR_MIN_PCT
+    mid_atr = ~high_atr & (atr_arr >= 3.0)
+    pred_hit = pred_arr >= PRED_SIG_MIN_COUNT
+    oi_hit = oi_arr >= OI_CHANGE_MIN
+
+    boost = (
+        np.where(serial, 200.0, 0.0)
+        + np.where(whale, 150.0, np.where(dp_sig, 75.0, 0.0))
+        + np.where(high_atr, 100.0, np.where(mid_atr, 50.0, 0.0))
+        + np.where(has_high, 125.0, np.where(has_med, 60.0, 0.0))
+        + np.where(pred_arr >= PRED_SIG_HIGH_COUNT, 100.0, np.where(pred_hit, 60.0, 0.0))
+        + np.where(oi_arr >= OI_CHANGE_HIGH, 75.0, np.where(oi_hit, 40.0, 0.0))
+        + np.where(bull_arr, 50.0, 0.0)
+    )
+
+    # Tags for _format_extras / downstream consumers
+    for i in np.flatnonzero(serial | whale | dp_sig | high_atr | mid_atr | has_high | has_med
+                            | pred_hit | oi_hit | bull_arr):
+        pick = picks[i]
+        if serial[i]:
+            pick["_x_serial_mover"] = round(moves[i], 1)
+        if whale[i]:
+            pick["_x_dp_whale"] = True
+            pick["_x_dp_value"] = dp_vals[i]
+        elif dp_sig[i]:
+            pick["_x_dp_significant"] = True
+            pick["_x_dp_value"] = dp_vals[i]
+        if high_atr[i]:
+            pick["_x_high_atr"] = round(atrs[i], 1)
+        elif mid_atr[i]:
+            pick["_x_atr"] = round(atrs[i], 1)
+        if has_high[i]:
+            pick["_x_radar_high"] = sorted(radar_high[i])
+        elif has_med[i]:
+            pick["_x_radar_med"] = sorted(radar_med[i])
+        if pred_hit[i]:
+            pick["_x_pred_count"] = preds[i]
+        if oi_hit[i]:
+            pick["_x_oi_change"] = ois[i]
+        if bull_arr[i]:
+            pick["_x_insider_bullish"] = True
+
+    return (base + boost).tolist()
+
+
 def _format_extras(pick: Dict[str, Any]) -> List[str]:
     """Build list of human-readable signal tags for logging."""
     extras = []
@@ -533,9 +701,11 @@ def select_x_worthy_3_puts_3_calls(
         all_symbols.add((rec.get("symbol") or "").strip())
     all_symbols.discard("")
 
-    # GAP 1 + 3: Fetch serial movers and ATR in one pass
-    serial_movers = _get_serial_movers(list(all_symbols))
-    atr_map = _get_atr_map(list(all_symbols))
+    # GAP 1 + 3: One bar window per symbol feeds serial movers and ATR
+    symbols = sorted(all_symbols)
+    bar_windows = _get_bar_windows(symbols)
+    serial_movers = _get_serial_movers(symbols, bar_windows)
+    atr_map = _get_atr_map(symbols, bar_windows)
 
     # ── Build PUT candidate pool ──────────────────────────────────
     seen_puts: set = set()
@@ -600,27 +770,29 @@ def select_x_worthy_3_puts_3_calls(
 
     # ── Rank with multi-signal scoring (v4) ─────────────────────
     score_args = (dp_data, serial_movers, atr_map, inst_radar, pred_counts, oi_data, insider_sent)
-    put_pool.sort(key=lambda x: -_priority_score(x, *score_args))
-    call_pool.sort(key=lambda x: -_priority_score(x, *score_args))
+    put_scores = _priority_scores(put_pool, *score_args)
+    call_scores = _priority_scores(call_pool, *score_args)
+    put_order = sorted(range(len(put_pool)), key=lambda i: -put_scores[i])
+    call_order = sorted(range(len(call_pool)), key=lambda i: -call_scores[i])
 
     # Direction balance — guarantee 3 of each
-    puts_3 = put_pool[:3]
-    calls_3 = call_pool[:3]
+    puts_3 = [put_pool[i] for i in put_order[:3]]
+    calls_3 = [call_pool[i] for i in call_order[:3]]
 
     # Log selection with all signal tags
     logger.info(f"  PUT pool: {len(put_pool)}, CALL pool: {len(call_pool)}")
-    for i, p in enumerate(puts_3, 1):
+    for i, (p, j) in enumerate(zip(puts_3, put_order), 1):
         r = p.get("_x_worthy_reason", "meta_only")
-        sc = _priority_score(p, *score_args)
+        sc = put_scores[j]
         extras = _format_extras(p)
         extra_str = f" [{', '.join(extras)}]" if extras else ""
         logger.info(
             f"  🔴 X PUT #{i}: {p.get('symbol','?'):8s} {r:14s} "
             f"pri={sc:.0f}{extra_str}"
         )
-    for i, c in enumerate(calls_3, 1):
+    for i, (c, j) in enumerate(zip(calls_3, call_order), 1):
         r = c.get("_x_worthy_reason", "meta_only")
-        sc = _priority_score(c, *score_args)
+        sc = call_scores[j]
         extras = _format_extras(c)
         extra_str = f" [{', '.join(extras)}]" if extras else ""
         logger.info(
@@ -23,6 +23,7 @@ import os
 import json
 import logging
 import fcntl
+import time
 from datetime import datetime, date
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -202,7 +203,7 @@ def _read_market_direction() -> Optional[Dict[str, Any]]:
 def _backfill_prices_from_cross(
     picks: list,
     cross_items: list,
-) -> None:
+) -> int:
     """
     ALWAYS update prices in the original pick list using the real-time
     market data from the cross-analysis step (which fetched 30-day bars
@@ -215,6 +216,9 @@ def _backfill_prices_from_cross(
     Unlike the previous version, this does NOT check for price==0 first.
     Stale non-zero prices are just as dangerous as zero prices for
     trading decisions.
+
+    Returns:
+        Number of picks whose price changed.
     """
     cross_map = {item["symbol"]: item for item in cross_items}
     updated = 0
@@ -240,6 +244,125 @@ def _backfill_prices_from_cross(
             f"  ✅ Updated prices for {updated} picks from cross-analysis "
             f"Polygon market data (most current)"
         )
+    return updated
+
+
+def _enrich_with_smart_money(puts_top10: list, moonshot_top10: list, results: Dict[str, Any],
+                             incremental: bool = False):
+    """
+    Smart Money enrichment (BOOST-ONLY — no displacement).
+
+    Direct picks from TradeNova/PutsEngine dashboards are PROTECTED.
+    Smart Money can only boost conviction of picks already in the Top 10
+    or fill empty slots; it can NEVER push a direct pick out.
+    `incremental` reuses unchanged tickers' analyses from the last scan.
+
+    Returns:
+        (puts_top10, moonshot_top10) after enrichment.
+    """
+    try:
+        from engine_adapters.smart_money_scanner import scan_smart_money
+        sm_result = scan_smart_money(incremental=incremental)
+        sm_bullish = sm_result.get("bullish_candidates", [])
+        sm_bearish = sm_result.get("bearish_candidates", [])
+
+        # Count how many direct picks we have (protected slots)
+        direct_moon_count = sum(1 for p in moonshot_top10 if p.get("_is_direct_pick"))
+        direct_puts_count = sum(1 for p in puts_top10 if p.get("_is_direct_pick"))
+        moon_open_slots = max(0, MetaConfig.TOP_N_PICKS - direct_moon_count)
+        puts_open_slots = max(0, MetaConfig.TOP_N_PICKS - direct_puts_count)
+
+        # Boost existing moonshot picks with Smart Money conviction
+        moon_syms = {p.get("symbol", "") for p in moonshot_top10}
+        sm_boosted_moon = 0
+        sm_injected_moon = 0
+        for sm in sm_bullish:
+            sym = sm.get("symbol", "")
+            if sym in moon_syms:
+                for p in moonshot_top10:
+                    if p.get("symbol") == sym:
+                        p["_smart_money_conviction"] = sm.get("conviction", 0)
+                        p["_is_smart_money_pick"] = True
+                        p["is_predictive"] = True
+                        sm_boosted_moon += 1
+                        break
+            elif moon_open_slots > 0 and sm.get("conviction", 0) >= 0.50:
+                moonshot_top10.append({
+                    "symbol": sym,
+                    "score": min(sm["conviction"] * 1.5, 1.0),
+                    "price": 0,
+                    "signals": sm.get("signals", []),
+                    "engine": "SmartMoney_Predictive",
+                    "engine_type": "smart_money_flow",
+                    "_is_smart_money_pick": True,
+                    "_smart_money_conviction": sm["conviction"],
+                    "_conviction_score": sm["conviction"],
+                    "is_predictive": True,
+                })
+                moon_syms.add(sym)
+                sm_injected_moon += 1
+                moon_open_slots -= 1
+
+        # Boost existing puts picks with Smart Money conviction
+        put_syms = {p.get("symbol", "") for p in puts_top10}
+        sm_boosted_puts = 0
+        sm_injected_puts = 0
+        for sm in sm_bearish:
+            sym = sm.get("symbol", "")
+            if sym in put_syms:
+                for p in puts_top10:
+                    if p.get("symbol") == sym:
+                        p["_smart_money_conviction"] = sm.get("conviction", 0)
+                        p["_is_smart_money_pick"] = True
+                        p["is_predictive"] = True
+                        sm_boosted_puts += 1
+                        break
+            elif puts_open_slots > 0 and sm.get("conviction", 0) >= 0.50:
+                puts_top10.append({
+                    "symbol": sym,
+                    "score": min(sm["conviction"] * 1.5, 1.0),
+                    "price": 0,
+                    "signals": sm.get("signals", []),
+                    "engine": "SmartMoney_Predictive",
+                    "engine_type": "smart_money_flow",
+                    "_is_smart_money_pick": True,
+                    "_smart_money_conviction": sm["conviction"],
+                    "_conviction_score": sm["conviction"],
+                    "is_predictive": True,
+                })
+                put_syms.add(sym)
+                sm_injected_puts += 1
+                puts_open_slots -= 1
+
+        # Truncate to TOP_N but NEVER drop direct picks
+        moonshot_top10 = moonshot_top10[:MetaConfig.TOP_N_PICKS]
+        puts_top10 = puts_top10[:MetaConfig.TOP_N_PICKS]
+
+        results["puts_top10"] = puts_top10
+        results["moonshot_top10"] = moonshot_top10
+
+        logger.info(
+            f"  🧠 Smart Money: boosted {sm_boosted_moon} calls + {sm_boosted_puts} puts | "
+            f"filled {sm_injected_moon} call slots + {sm_injected_puts} put slots"
+        )
+        logger.info(f"  📈 Final Moonshot Top 10: {', '.join(p.get('symbol','?') for p in moonshot_top10[:10])}")
+        logger.info(f"  📉 Final Puts Top 10: {', '.join(p.get('symbol','?') for p in puts_top10[:10])}")
+
+        results["smart_money_scan"] = {
+            "bullish_count": len(sm_bullish),
+            "bearish_count": len(sm_bearish),
+            "boosted_moonshots": sm_boosted_moon,
+            "boosted_puts": sm_boosted_puts,
+            "injected_moonshots": sm_injected_moon,
+            "injected_puts": sm_injected_puts,
+            "sources": sm_result.get("sources_loaded", []),
+        }
+    except Exception as e:
+        logger.warning(f"  ⚠️ Smart Money enrichment failed: {e}")
+        import traceback
+        traceback.print_exc()
+
+    return puts_top10, moonshot_top10
 
 
 def run_meta_engine(force: bool = False) -> Dict[str, Any]:
@@ -273,6 +396,151 @@ def run_meta_engine(force: bool = False) -> Dict[str, Any]:
         return _run_pipeline(now, force)
     finally:
         _release_lock(lock_fd)
+        _drain_notifications()
+
+
+OUTBOX_DRAIN_TIMEOUT_SEC = 600  # Upper bound for the drain
+OUTBOX_DRAIN_MARGIN_SEC = 60    # Kept free before the scheduler's kill
+_PROCESS_START = time.monotonic()
+
+
+def _drain_timeout() -> float:
+    """Drain budget left before the scheduler kills this run (RUN_TIMEOUT_SEC)."""
+    elapsed = time.monotonic() - _PROCESS_START
+    remaining = MetaConfig.RUN_TIMEOUT_SEC - OUTBOX_DRAIN_MARGIN_SEC - elapsed
+    return max(0.0, min(OUTBOX_DRAIN_TIMEOUT_SEC, remaining))
+
+
+def _drain_notifications():
+    """
+    Wait for queued notifications before the process exits.
+
+    The pipeline itself never waits on delivery; this only keeps the
+    subprocess alive long enough for the dispatcher to finish, and only
+    for the wall-clock budget the scheduler leaves it — a drain cut short
+    by the kill would strand jobs in flight until their lease expires.
+    Anything still outstanding after the timeout (or after a crash) is
+    resumed by the scheduler's resident dispatcher.
+    """
+    try:
+        from notifications.outbox import get_dispatcher
+        dispatcher = get_dispatcher()
+        if dispatcher is None:
+            return
+        timeout = _drain_timeout()
+        logger.info(f"📤 Waiting up to {timeout:.0f}s for queued notifications to deliver...")
+        dispatcher.drain(timeout=timeout)
+        dispatcher.stop()
+    except Exception as e:
+        logger.warning(f"  Notification drain failed: {e}")
+
+
+# Keys that only the full pipeline computes (Steps 2c/3b); an incremental
+# rescan carries them over from the day's cross_analysis.
+_RESCAN_CARRY_KEYS = ("market_direction", "weather_direction", "five_x_potential")
+_RESCAN_CARRY_ITEM_FIELDS = ("five_x_score", "five_x_type")
+
+
+def run_incremental_rescan(force: bool = False) -> Dict[str, Any]:
+    """
+    Intraday re-scan that only recomputes symbols whose inputs changed.
+
+    Reloads the direct picks, then runs Smart Money and cross-analysis in
+    incremental mode: tickers whose source records are unchanged reuse
+    their Smart Money analysis, and symbols whose pick, lens source
+    records and price are unchanged reuse their cross result (see
+    analysis/incremental_scan.py). The merged ranking replaces the day's
+    cross_analysis; market direction and 5x data are carried over from
+    the last full run. No notifications, trades or deep analysis.
+
+    Args:
+        force: If True, run even on non-trading days
+
+    Returns:
+        Dict with status, picks and incremental reuse stats
+    """
+    now = datetime.now(EST)
+    t0 = datetime.now()
+    logger.info("=" * 70)
+    logger.info("♻️  META ENGINE — INCREMENTAL RESCAN")
+    logger.info(f"   Time: {now.strftime('%B %d, %Y %I:%M:%S %p ET')}")
+    logger.info("=" * 70)
+
+    if not force and not is_trading_day():
+        logger.info("📅 Not a trading day. Use --force to run anyway.")
+        return {"status": "skipped", "reason": "not_trading_day"}
+
+    lock_fd = _acquire_lock()
+    if lock_fd is None:
+        logger.info("⏭️ Another Meta Engine run is in progress — rescan skipped.")
+        return {"status": "skipped", "reason": "concurrent_run_blocked"}
+
+    try:
+        from artifact_store import ArtifactStore
+        from engine_adapters.puts_adapter import get_top_puts_direct
+        from engine_adapters.moonshot_adapter import get_top_moonshots_direct
+        from analysis.cross_analyzer import cross_analyze, storable
+
+        store = ArtifactStore(Path(MetaConfig.OUTPUT_DIR), run_id=now.strftime('%Y%m%d_%H%M'))
+        day_stamp = now.strftime('%Y%m%d')
+        results: Dict[str, Any] = {"timestamp": now.isoformat(), "mode": "incremental"}
+
+        puts_top10 = get_top_puts_direct(top_n=MetaConfig.TOP_N_PICKS)
+        moonshot_top10 = get_top_moonshots_direct(top_n=MetaConfig.TOP_N_PICKS)
+        puts_top10, moonshot_top10 = _enrich_with_smart_money(
+            puts_top10, moonshot_top10, results, incremental=True)
+
+        cross_results = cross_analyze(
+            puts_top10=puts_top10,
+            moonshot_top10=moonshot_top10,
+            polygon_api_key=MetaConfig.POLYGON_API_KEY,
+            incremental=True,
+        )
+        _backfill_prices_from_cross(puts_top10, cross_results.get("puts_through_moonshot", []))
+        _backfill_prices_from_cross(moonshot_top10, cross_results.get("moonshot_through_puts", []))
+
+        # Merge into the previous ranking: carry over full-run-only data
+        previous = store.read("cross_analysis", day_stamp, default={}) or {}
+        for key in _RESCAN_CARRY_KEYS:
+            if key in previous:
+                cross_results[key] = previous[key]
+        prev_items = {
+            item.get("symbol"): item for item in previous.get("combined_ranking", [])
+            if isinstance(item, dict)
+        }
+        for item in cross_results.get("combined_ranking", []):
+            prev_item = prev_items.get(item.get("symbol"), {})
+            for field in _RESCAN_CARRY_ITEM_FIELDS:
+                if field in prev_item:
+                    item[field] = prev_item[field]
+
+        store.write("puts_top10", {"timestamp": now.isoformat(), "picks": puts_top10},
+                    stamp=day_stamp, latest=False)
+        store.write("moonshot_top10", {"timestamp": now.isoformat(), "picks": moonshot_top10},
+                    stamp=day_stamp, latest=False)
+        cross_file = store.write("cross_analysis", storable(cross_results), stamp=day_stamp)
+
+        elapsed = (datetime.now() - t0).total_seconds()
+        results.update({
+            "status": "completed",
+            "puts_top10": [p.get("symbol") for p in puts_top10],
+            "moonshot_top10": [p.get("symbol") for p in moonshot_top10],
+            "incremental": cross_results.get("incremental", {}),
+            "elapsed_sec": round(elapsed, 1),
+        })
+        logger.info("\n" + "=" * 70)
+        logger.info("♻️  INCREMENTAL RESCAN — COMPLETED")
+        logger.info(f"   {results['incremental'].get('reused', 0)} reused, "
+                    f"{results['incremental'].get('recomputed', 0)} recomputed "
+                    f"in {elapsed:.1f}s")
+        logger.info(f"   💾 Saved: {cross_file}")
+        logger.info("=" * 70)
+        return results
+    except Exception as e:
+        logger.error(f"Incremental rescan failed: {e}", exc_info=True)
+        return {"status": "error", "error": str(e)}
+    finally:
+        _release_lock(lock_fd)
 
 
 def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
@@ -324,6 +592,14 @@ def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
     
     output_dir = Path(MetaConfig.OUTPUT_DIR)
     output_dir.mkdir(parents=True, exist_ok=True)
+
+    # All run artifacts go through the store: one compact serialization
+    # per write, atomic *_latest links, deltas for in-place mutations,
+    # and a catalog row per artifact tagged with this run's stamp.
+    from artifact_store import ArtifactStore
+    day_stamp = now.strftime('%Y%m%d')
+    run_stamp = now.strftime('%Y%m%d_%H%M')
+    store = ArtifactStore(output_dir, run_id=run_stamp)
     
     # ================================================================
     # STEP 1: Get Top Puts — DIRECT from PutsEngine Convergence Pipeline
@@ -345,12 +621,6 @@ def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
             f"Capital preserved — this is expected on quiet days."
         )
     
-    # Save to file
-    puts_file = output_dir / f"puts_top10_{now.strftime('%Y%m%d')}.json"
-    with open(puts_file, "w") as f:
-        json.dump({"timestamp": now.isoformat(), "picks": puts_top10}, f, indent=2, default=str)
-    logger.info(f"  💾 Saved: {puts_file}")
-    
     # ================================================================
     # STEP 2: Get Top Moonshots — DIRECT from TradeNova Recommendations
     # ================================================================
@@ -371,12 +641,6 @@ def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
             f"Capital preserved — this is expected on quiet days."
         )
     
-    # Save to file
-    moon_file = output_dir / f"moonshot_top10_{now.strftime('%Y%m%d')}.json"
-    with open(moon_file, "w") as f:
-        json.dump({"timestamp": now.isoformat(), "picks": moonshot_top10}, f, indent=2, default=str)
-    logger.info(f"  💾 Saved: {moon_file}")
-    
     # ── Empty Picks Safeguard (Fix 7) ──
     try:
         from monitoring.safeguards import check_empty_picks
@@ -395,112 +659,16 @@ def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
     logger.info("\n" + "=" * 50)
     logger.info("STEP 2a: Smart Money Enrichment (boost-only)...")
     logger.info("=" * 50)
-    try:
-        from engine_adapters.smart_money_scanner import scan_smart_money
-        sm_result = scan_smart_money()
-        sm_bullish = sm_result.get("bullish_candidates", [])
-        sm_bearish = sm_result.get("bearish_candidates", [])
-
-        # Count how many direct picks we have (protected slots)
-        direct_moon_count = sum(1 for p in moonshot_top10 if p.get("_is_direct_pick"))
-        direct_puts_count = sum(1 for p in puts_top10 if p.get("_is_direct_pick"))
-        moon_open_slots = max(0, MetaConfig.TOP_N_PICKS - direct_moon_count)
-        puts_open_slots = max(0, MetaConfig.TOP_N_PICKS - direct_puts_count)
-
-        # Boost existing moonshot picks with Smart Money conviction
-        moon_syms = {p.get("symbol", "") for p in moonshot_top10}
-        sm_boosted_moon = 0
-        sm_injected_moon = 0
-        for sm in sm_bullish:
-            sym = sm.get("symbol", "")
-            if sym in moon_syms:
-                for p in moonshot_top10:
-                    if p.get("symbol") == sym:
-                        p["_smart_money_conviction"] = sm.get("conviction", 0)
-                        p["_is_smart_money_pick"] = True
-                        p["is_predictive"] = True
-                        sm_boosted_moon += 1
-                        break
-            elif moon_open_slots > 0 and sm.get("conviction", 0) >= 0.50:
-                moonshot_top10.append({
-                    "symbol": sym,
-                    "score": min(sm["conviction"] * 1.5, 1.0),
-                    "price": 0,
-                    "signals": sm.get("signals", []),
-                    "engine": "SmartMoney_Predictive",
-                    "engine_type": "smart_money_flow",
-                    "_is_smart_money_pick": True,
-                    "_smart_money_conviction": sm["conviction"],
-                    "_conviction_score": sm["conviction"],
-                    "is_predictive": True,
-                })
-                moon_syms.add(sym)
-                sm_injected_moon += 1
-                moon_open_slots -= 1
-
-        # Boost existing puts picks with Smart Money conviction
-        put_syms = {p.get("symbol", "") for p in puts_top10}
-        sm_boosted_puts = 0
-        sm_injected_puts = 0
-        for sm in sm_bearish:
-            sym = sm.get("symbol", "")
-            if sym in put_syms:
-                for p in puts_top10:
-                    if p.get("symbol") == sym:
-                        p["_smart_money_conviction"] = sm.get("conviction", 0)
-                        p["_is_smart_money_pick"] = True
-                        p["is_predictive"] = True
-                        sm_boosted_puts += 1
-                        break
-            elif puts_open_slots > 0 and sm.get("conviction", 0) >= 0.50:
-                puts_top10.append({
-                    "symbol": sym,
-                    "score": min(sm["conviction"] * 1.5, 1.0),
-                    "price": 0,
-                    "signals": sm.get("signals", []),
-                    "engine": "SmartMoney_Predictive",
-                    "engine_type": "smart_money_flow",
-                    "_is_smart_money_pick": True,
-                    "_smart_money_conviction": sm["conviction"],
-                    "_conviction_score": sm["conviction"],
-                    "is_predictive": True,
-                })
-                put_syms.add(sym)
-                sm_injected_puts += 1
-                puts_open_slots -= 1
+    puts_top10, moonshot_top10 = _enrich_with_smart_money(puts_top10, moonshot_top10, results)
 
-        # Truncate to TOP_N but NEVER drop direct picks
-        moonshot_top10 = moonshot_top10[:MetaConfig.TOP_N_PICKS]
-        puts_top10 = puts_top10[:MetaConfig.TOP_N_PICKS]
-
-        results["puts_top10"] = puts_top10
-        results["moonshot_top10"] = moonshot_top10
-
-        logger.info(
-            f"  🧠 Smart Money: boosted {sm_boosted_moon} calls + {sm_boosted_puts} puts | "
-            f"filled {sm_injected_moon} call slots + {sm_injected_puts} put slots"
-        )
-        logger.info(f"  📈 Final Moonshot Top 10: {', '.join(p.get('symbol','?') for p in moonshot_top10[:10])}")
-        logger.info(f"  📉 Final Puts Top 10: {', '.join(p.get('symbol','?') for p in puts_top10[:10])}")
-
-        with open(puts_file, "w") as f:
-            json.dump({"timestamp": now.isoformat(), "picks": puts_top10}, f, indent=2, default=str)
-        with open(moon_file, "w") as f:
-            json.dump({"timestamp": now.isoformat(), "picks": moonshot_top10}, f, indent=2, default=str)
-
-        results["smart_money_scan"] = {
-            "bullish_count": len(sm_bullish),
-            "bearish_count": len(sm_bearish),
-            "boosted_moonshots": sm_boosted_moon,
-            "boosted_puts": sm_boosted_puts,
-            "injected_moonshots": sm_injected_moon,
-            "injected_puts": sm_injected_puts,
-            "sources": sm_result.get("sources_loaded", []),
-        }
-    except Exception as e:
-        logger.warning(f"  ⚠️ Smart Money enrichment failed: {e}")
-        import traceback
-        traceback.print_exc()
+    # Save Top 10s once, after Smart Money enrichment (re-saved after
+    # cross-analysis only if the price back-fill changed anything)
+    puts_file = store.write("puts_top10", {"timestamp": now.isoformat(), "picks": puts_top10},
+                            stamp=day_stamp, latest=False)
+    moon_file = store.write("moonshot_top10", {"timestamp": now.isoformat(), "picks": moonshot_top10},
+                            stamp=day_stamp, latest=False)
+    logger.info(f"  💾 Saved: {puts_file}")
+    logger.info(f"  💾 Saved: {moon_file}")
 
     # ================================================================
     # STEP 2a-2: Coverage Validation (LOG-ONLY — no displacement)
@@ -526,6 +694,19 @@ def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
     except Exception as e:
         logger.debug(f"  Coverage validation skipped: {e}")
 
+    # Live coverage gaps seen by the resident mover monitor since the open
+    try:
+        from engine_adapters.mover_monitor import read_mover_events
+        live_gaps = [ev for ev in read_mover_events() if ev.get("coverage_gap")]
+        if live_gaps:
+            results.setdefault("coverage_validation", {})["live_gap_events"] = live_gaps[-20:]
+            logger.info(
+                f"  📡 Mover monitor: {len(live_gaps)} live coverage-gap events today "
+                f"({', '.join(sorted({ev['symbol'] for ev in live_gaps})[:8])})"
+            )
+    except Exception as e:
+        logger.debug(f"  Mover monitor events unavailable: {e}")
+
     # ================================================================
     # STEP 2b: Gap-Up Detection (Same-Day Plays)
     # ================================================================
@@ -540,15 +721,9 @@ def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
         gap_candidates = gap_up_data.get("candidates", [])
         if gap_candidates:
             logger.info(f"  🚀 {len(gap_candidates)} gap-up candidates detected")
-            # Save gap-up data
-            gap_file = output_dir / f"gap_up_alerts_{now.strftime('%Y%m%d_%H%M')}.json"
-            with open(gap_file, "w") as f:
-                json.dump(gap_up_data, f, indent=2, default=str)
+            # Save gap-up data (+ gap_up_alerts_latest link)
+            gap_file = store.write("gap_up_alerts", gap_up_data, stamp=run_stamp)
             logger.info(f"  💾 Saved: {gap_file}")
-            # Also save as latest
-            gap_latest = output_dir / "gap_up_alerts_latest.json"
-            with open(gap_latest, "w") as f:
-                json.dump(gap_up_data, f, indent=2, default=str)
         else:
             logger.info("  ℹ️ No gap-up candidates detected — quiet pre-market")
     except Exception as e:
@@ -580,15 +755,9 @@ def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
         put_5x = five_x_data.get("put_potential", [])
         if call_5x or put_5x:
             logger.info(f"  🔥 5x Potential: {len(call_5x)} calls, {len(put_5x)} puts")
-            # Save 5x potential data
-            five_x_file = output_dir / f"five_x_potential_{now.strftime('%Y%m%d_%H%M')}.json"
-            with open(five_x_file, "w") as f:
-                json.dump(five_x_data, f, indent=2, default=str)
+            # Save 5x potential data (+ five_x_potential_latest link)
+            five_x_file = store.write("five_x_potential", five_x_data, stamp=run_stamp)
             logger.info(f"  💾 Saved: {five_x_file}")
-            # Save latest
-            five_x_latest = output_dir / "five_x_potential_latest.json"
-            with open(five_x_latest, "w") as f:
-                json.dump(five_x_data, f, indent=2, default=str)
         else:
             logger.info("  ℹ️ No 5x potential candidates above threshold")
     except Exception as e:
@@ -603,7 +772,7 @@ def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
     logger.info("STEP 3: Cross-Engine Analysis...")
     logger.info("=" * 50)
     
-    from analysis.cross_analyzer import cross_analyze
+    from analysis.cross_analyzer import cross_analyze, storable
     cross_results = cross_analyze(
         puts_top10=puts_top10,
         moonshot_top10=moonshot_top10,
@@ -613,27 +782,18 @@ def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
     
     # Back-fill prices from cross-analysis market data into the original picks
     # (so the saved top10 files and report tables show real prices)
-    _backfill_prices_from_cross(puts_top10, cross_results.get("puts_through_moonshot", []))
-    _backfill_prices_from_cross(moonshot_top10, cross_results.get("moonshot_through_puts", []))
-    
-    # Re-save top10 files with enriched prices
-    with open(puts_file, "w") as f:
-        json.dump({"timestamp": now.isoformat(), "picks": puts_top10}, f, indent=2, default=str)
-    with open(moon_file, "w") as f:
-        json.dump({"timestamp": now.isoformat(), "picks": moonshot_top10}, f, indent=2, default=str)
-    
-    # Save cross-analysis
-    cross_file = output_dir / f"cross_analysis_{now.strftime('%Y%m%d')}.json"
-    with open(cross_file, "w") as f:
-        json.dump(cross_results, f, indent=2, default=str)
+    if _backfill_prices_from_cross(puts_top10, cross_results.get("puts_through_moonshot", [])):
+        store.write("puts_top10", {"timestamp": now.isoformat(), "picks": puts_top10},
+                    stamp=day_stamp, latest=False)
+    if _backfill_prices_from_cross(moonshot_top10, cross_results.get("moonshot_through_puts", [])):
+        store.write("moonshot_top10", {"timestamp": now.isoformat(), "picks": moonshot_top10},
+                    stamp=day_stamp, latest=False)
+    
+    # Save cross-analysis once; cross_analysis_latest is an atomic link to it,
+    # so the dashboard never reads partial data. Steps 3b mutations below are
+    # recorded as deltas and folded in by a single compact().
+    cross_file = store.write("cross_analysis", storable(cross_results), stamp=day_stamp)
     logger.info(f"  💾 Saved: {cross_file}")
-    # Save latest cross-analysis (always reflects most recent run)
-    # Use atomic write (write to temp then rename) so the dashboard never reads partial data
-    latest_cross_path = output_dir / "cross_analysis_latest.json"
-    latest_cross_tmp = output_dir / "cross_analysis_latest.json.tmp"
-    with open(latest_cross_tmp, "w") as f:
-        json.dump(cross_results, f, indent=2, default=str)
-    latest_cross_tmp.rename(latest_cross_path)
     
     # ================================================================
     # STEP 3b: Inject Market Direction from PutsEngine
@@ -653,13 +813,8 @@ def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
         logger.warning("  ⚠️ Market direction data not available")
         cross_results["market_direction"] = {}
     results["market_direction"] = market_direction or {}
-    
-    # Re-save cross_analysis with market direction included
-    with open(cross_file, "w") as f:
-        json.dump(cross_results, f, indent=2, default=str)
-    with open(latest_cross_tmp, "w") as f:
-        json.dump(cross_results, f, indent=2, default=str)
-    latest_cross_tmp.rename(latest_cross_path)
+    store.patch("cross_analysis", day_stamp,
+                set_keys={"market_direction": cross_results["market_direction"]})
 
     # ── Generate weather-grade market direction prediction ──
     # This saves to output/market_direction_{timeframe}_latest.json
@@ -681,6 +836,8 @@ def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
     except Exception as e:
         logger.warning(f"  ⚠️ Weather-grade market direction failed: {e}")
         cross_results["weather_direction"] = {}
+    store.patch("cross_analysis", day_stamp,
+                set_keys={"weather_direction": cross_results["weather_direction"]})
 
     # ── Inject 5x Potential into cross_results for downstream consumers ──
     if five_x_data:
@@ -699,17 +856,22 @@ def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
                     "five_x_score": c.get("five_x_score", 0),
                     "five_x_type": "PUT",
                 }
+        _ranking_updates = {}
         for item in cross_results.get("combined_ranking", []):
             sym = item.get("symbol", "")
             if sym in _five_x_sym_map:
                 item["five_x_score"] = _five_x_sym_map[sym]["five_x_score"]
                 item["five_x_type"] = _five_x_sym_map[sym]["five_x_type"]
-        # Re-save cross_analysis with 5x data
-        with open(cross_file, "w") as f:
-            json.dump(cross_results, f, indent=2, default=str)
-        with open(latest_cross_tmp, "w") as f:
-            json.dump(cross_results, f, indent=2, default=str)
-        latest_cross_tmp.rename(latest_cross_path)
+                _ranking_updates[sym] = _five_x_sym_map[sym]
+        store.patch(
+            "cross_analysis", day_stamp,
+            set_keys={"five_x_potential": five_x_data},
+            merge_items={"key": "combined_ranking", "match": "symbol",
+                         "updates": _ranking_updates},
+        )
+
+    # Fold the Step 3b deltas into cross_analysis_{date}.json (one full write)
+    store.compact("cross_analysis", day_stamp)
 
     # ================================================================
     # STEP 4: Generate 3-Sentence Summaries
@@ -755,17 +917,10 @@ def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
             })
     results["summaries"] = summaries
     
-    # Save summaries
+    # Save summaries (+ summaries_latest link, always the most recent run)
     try:
-        summary_file = output_dir / f"summaries_{now.strftime('%Y%m%d')}.json"
-        with open(summary_file, "w") as f:
-            json.dump(summaries, f, indent=2, default=str)
+        summary_file = store.write("summaries", summaries, stamp=day_stamp)
         logger.info(f"  💾 Saved: {summary_file}")
-        # Save latest summaries (always reflects most recent run)
-        latest_sum_tmp = output_dir / "summaries_latest.json.tmp"
-        with open(latest_sum_tmp, "w") as f:
-            json.dump(summaries, f, indent=2, default=str)
-        latest_sum_tmp.rename(output_dir / "summaries_latest.json")
     except Exception as e:
         logger.error(f"  Summary save failed: {e}")
     
@@ -820,56 +975,17 @@ def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
         logger.error(f"Report generation failed: {e}")
     
     # ================================================================
-    # STEP 6: Send Email (Full .md as HTML + PDF attachment)
+    # STEPS 6-8: Queue Email / Telegram / X in the notification outbox
     # ================================================================
+    # Deliveries are durable and run on the background dispatcher
+    # (per-channel workers, retry + backoff), so SMTP, Telegram pacing
+    # and X thread pacing no longer sit in front of trade execution.
+    # Results below are "queued" / False; delivery outcomes are in
+    # data/notification_outbox.db and the logs.
     logger.info("\n" + "=" * 50)
-    logger.info("STEP 6: Sending Email...")
+    logger.info("STEPS 6-8: Queueing Email, Telegram, X/Twitter...")
     logger.info("=" * 50)
-    
-    try:
-        from notifications.email_sender import send_meta_email
-        email_sent = send_meta_email(
-            summaries=summaries,
-            chart_path=chart_path,
-            report_md_path=report_md_path,
-            smtp_server=MetaConfig.SMTP_SERVER,
-            smtp_port=MetaConfig.SMTP_PORT,
-            smtp_user=MetaConfig.SMTP_USER,
-            smtp_password=MetaConfig.SMTP_PASSWORD,
-            recipient=MetaConfig.ALERT_EMAIL,
-            gap_up_data=gap_up_data,
-            five_x_data=five_x_data,
-        )
-        results["notifications"]["email"] = email_sent
-    except Exception as e:
-        logger.error(f"Email failed: {e}")
-        try:
-            from monitoring.health_alerts import alert_pipeline_crash
-            alert_pipeline_crash("Email notification", str(e))
-        except Exception:
-            pass
-    
-    # ================================================================
-    # STEP 7: Send Telegram (Summaries + Conflict Matrix ONLY)
-    # ================================================================
-    logger.info("\n" + "=" * 50)
-    logger.info("STEP 7: Sending Telegram (Summaries + Conflicts)...")
-    logger.info("=" * 50)
-    
-    try:
-        from notifications.telegram_sender import send_meta_telegram
-        tg_sent = send_meta_telegram(
-            summaries=summaries,
-            chart_path=chart_path,
-            bot_token=MetaConfig.TELEGRAM_BOT_TOKEN,
-            chat_id=MetaConfig.TELEGRAM_CHAT_ID,
-            gap_up_data=gap_up_data,
-            five_x_data=five_x_data,
-        )
-        results["notifications"]["telegram"] = tg_sent
-    except Exception as e:
-        logger.error(f"Telegram failed: {e}")
-    
+
     # Determine session label from current time (used by X poster and trading)
     # 3-session schedule: Pre-Market (8:30 AM), Morning (9:35 AM), Afternoon (3:15 PM)
     if now.hour < 12:
@@ -877,36 +993,59 @@ def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
     else:
         session_label = "PM"
 
-    # ================================================================
-    # STEP 8: Post to X/Twitter (Top 3 Puts + Top 3 Calls)
-    #  X-worthy selector: prefer 1x same-day / 5x potential from TradeNova
-    #  so posted picks have minimum 1x same-day options potential.
-    # ================================================================
-    logger.info("\n" + "=" * 50)
-    logger.info("STEP 8: Posting to X/Twitter (Top 3 each, X-worthy)...")
-    logger.info("=" * 50)
-    
-    step8_tweet_id = None
+    step8_outbox_key = None
     try:
-        from engine_adapters.x_worthy_selector import get_cross_results_for_x
-        from notifications.x_poster import post_meta_to_x, post_thread
-        cross_results_for_x = get_cross_results_for_x(cross_results, gap_up_data=gap_up_data)
-        x_posted = post_meta_to_x(
-            summaries=summaries,
-            cross_results=cross_results_for_x,
-            session_label=session_label,
-            gap_up_data=gap_up_data,
-        )
-        results["notifications"]["x_twitter"] = x_posted
-        if x_posted:
-            from notifications.x_poster import _get_x_post_id
-            scan_ts = cross_results.get("timestamp", "") if cross_results else ""
-            if scan_ts:
-                step8_tweet_id = _get_x_post_id(scan_ts, session_label)
-                if step8_tweet_id:
-                    logger.info(f"  📌 Step 8 tweet ID captured: {step8_tweet_id}")
+        from notifications.outbox import get_outbox, start_dispatcher
+        outbox = get_outbox()
+        start_dispatcher()
+
+        # STEP 6: Email (Full .md as HTML + PDF attachment)
+        if config_status["email"]["configured"]:
+            outbox.enqueue("meta_email", {
+                "summaries": summaries,
+                "chart_path": chart_path,
+                "report_md_path": report_md_path,
+                "gap_up_data": gap_up_data,
+                "five_x_data": five_x_data,
+            }, key=f"meta_email:{run_stamp}")
+            results["notifications"]["email"] = "queued"
+        else:
+            logger.info("  ⏭️ Email not configured — skipped")
+
+        # STEP 7: Telegram (Summaries + Conflict Matrix ONLY)
+        if config_status["telegram"]["configured"]:
+            outbox.enqueue("meta_telegram", {
+                "summaries": summaries,
+                "chart_path": chart_path,
+                "gap_up_data": gap_up_data,
+                "five_x_data": five_x_data,
+            }, key=f"meta_telegram:{run_stamp}")
+            results["notifications"]["telegram"] = "queued"
+        else:
+            logger.info("  ⏭️ Telegram not configured — skipped")
+
+        # STEP 8: X/Twitter (Top 3 Puts + Top 3 Calls)
+        #  X-worthy selector (run by the delivery handler): prefer 1x same-day
+        #  / 5x potential from TradeNova so posted picks have minimum 1x
+        #  same-day options potential.
+        if config_status["x_twitter"]["configured"]:
+            step8_outbox_key = f"meta_x_thread:{run_stamp}:{session_label}"
+            outbox.enqueue("meta_x_thread", {
+                "summaries": summaries,
+                "cross_results": storable(cross_results),
+                "session_label": session_label,
+                "gap_up_data": gap_up_data,
+            }, key=step8_outbox_key)
+            results["notifications"]["x_twitter"] = "queued"
+        else:
+            logger.info("  ⏭️ X/Twitter not configured — skipped")
     except Exception as e:
-        logger.error(f"X/Twitter failed: {e}")
+        logger.error(f"Notification queueing failed: {e}", exc_info=True)
+        try:
+            from monitoring.health_alerts import alert_pipeline_crash
+            alert_pipeline_crash("Notification outbox", str(e))
+        except Exception:
+            pass
     
     # ================================================================
     # STEP 9: Automated Trading (Alpaca Options)
@@ -947,7 +1086,8 @@ def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
         from _3pm_analysis import run_3pm_analysis
         deep_calls, deep_puts, deep_report = run_3pm_analysis(
             session_label=session_label,
-            step8_tweet_id=step8_tweet_id,
+            deliver_async=True,
+            step8_outbox_key=step8_outbox_key,
         )
         results["deep_options_analysis"] = {
             "status": "completed",
@@ -966,9 +1106,8 @@ def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
     results["completed_at"] = datetime.now(EST).isoformat()
     
     # Save final results
-    final_file = output_dir / f"meta_engine_run_{now.strftime('%Y%m%d_%H%M')}.json"
-    with open(final_file, "w") as f:
-        json.dump(results, f, indent=2, default=str)
+    store.write("meta_engine_run", {**results, "cross_analysis": storable(results["cross_analysis"])},
+                stamp=run_stamp, latest=False)
     
     trading_status = results.get("trading", {})
     trades_placed = trading_status.get("trades_placed", 0)
@@ -978,13 +1117,14 @@ def _run_pipeline(now: datetime, force: bool = False) -> Dict[str, Any]:
     logger.info("🏛️  META ENGINE — COMPLETED")
     logger.info(f"   Puts picks: {len(puts_top10)}")
     logger.info(f"   Moonshot picks: {len(moonshot_top10)}")
-    logger.info(f"   Email: {'✅' if results['notifications']['email'] else '❌'}")
-    logger.info(f"   Telegram: {'✅' if results['notifications']['telegram'] else '❌'}")
-    logger.info(f"   X/Twitter: {'✅' if results['notifications']['x_twitter'] else '❌'}")
+    _notif_icon = {"queued": "📤 queued", True: "✅", False: "❌"}
+    logger.info(f"   Email: {_notif_icon.get(results['notifications']['email'], '❌')}")
+    logger.info(f"   Telegram: {_notif_icon.get(results['notifications']['telegram'], '❌')}")
+    logger.info(f"   X/Twitter: {_notif_icon.get(results['notifications']['x_twitter'], '❌')}")
     logger.info(f"   Chart: {'✅' if chart_path else '❌'}")
     logger.info(f"   Trading: {'✅' if trades_placed > 0 else '⏸️'} ({trades_placed} orders)")
     logger.info(f"   Deep Options: {'✅' if deep_status.get('status') == 'completed' else '⚠️'}")
-    logger.info(f"   Output: {output_dir}")
+    logger.info(f"   Output: {output_dir} ({store.writes} writes, {store.bytes_written / 1024:.0f} KB)")
     logger.info("=" * 70)
     
     # ──────────────────────────────────────────────────────────
@@ -1006,6 +1146,11 @@ if __name__ == "__main__":
     
     parser = argparse.ArgumentParser(description="Meta Engine — Cross-Engine Analysis")
     parser.add_argument("--force", action="store_true", help="Run even on non-trading days")
+    parser.add_argument("--rescan", action="store_true",
+                        help="Incremental intraday rescan (changed symbols only, no notifications)")
     args = parser.parse_args()
     
-    run_meta_engine(force=args.force)
+    if args.rescan:
+        run_incremental_rescan(force=args.force)
+    else:
+        run_meta_engine(force=args.force)
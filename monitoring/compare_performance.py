@@ -26,6 +26,7 @@ def generate_comparison_report(days: int = 7) -> Dict[str, Any]:
     gates = monitor.analyze_selection_gates(days)
     orm = monitor.analyze_orm_scores(days)
     performance = monitor.analyze_performance_metrics(days)
+    attribution = monitor.analytics.pick_attribution(days)
     
     # Calculate improvements
     execution_improvement = execution["execution_rate"] - BASELINE_METRICS["trade_execution_rate"]
@@ -121,6 +122,7 @@ def generate_comparison_report(days: int = 7) -> Dict[str, Any]:
             "avg_winner_return": avg_winner_improvement,
             "avg_loser_return": avg_loser_improvement,
         },
+        "attribution": attribution,
         "recommendations": recommendations,
     }
     
@@ -173,6 +175,16 @@ def print_comparison_report(report: Dict[str, Any]):
     print(f"📈 ORM Scores:")
     print(f"   ORM ≥ 0.70: {report['current']['orm_ge_070_pct']:.1f}%")
     print()
+
+    # Closed-trade P&L by recurrence boost / X post
+    if report.get("attribution"):
+        print("🔁 P&L Attribution (recurrence boost × posted to X):")
+        for row in report["attribution"]:
+            print(f"   boosted={'Y' if row['recurrence_boosted'] else 'N'} "
+                  f"x={'Y' if row['posted_to_x'] else 'N'}: "
+                  f"{row['trades']} trades, {row['wins']}W/{row['losses']}L, "
+                  f"${row['total_pnl'] or 0:+,.2f}")
+        print()
     
     # Recommendations
     if report["recommendations"]:
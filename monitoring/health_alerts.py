@@ -16,7 +16,6 @@ Usage (from any module):
     send_health_alert(AlertLevel.CRITICAL, "pipeline_crash", "Meta Engine crashed: ...")
 """
 
-import json
 import logging
 import time
 from datetime import datetime
@@ -45,22 +44,23 @@ _LEVEL_EMOJI = {
 }
 
 
+# Kept in the shared analytics store (kv_state namespace
+# "health_alert_throttle"); a legacy _THROTTLE_FILE is imported on first open.
+
 def _load_throttle_state() -> dict:
     try:
-        if _THROTTLE_FILE.exists():
-            with open(_THROTTLE_FILE) as f:
-                return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        from analytics_store import analytics_store
+        return analytics_store().get_state("health_alert_throttle")
+    except Exception:
         pass
     return {}
 
 
 def _save_throttle_state(state: dict):
     try:
-        _THROTTLE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(_THROTTLE_FILE, "w") as f:
-            json.dump(state, f, indent=2, default=str)
-    except IOError as e:
+        from analytics_store import analytics_store
+        analytics_store().set_state("health_alert_throttle", state)
+    except Exception as e:
         logger.debug("Failed to save throttle state: %s", e)
 
 
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Import-Time Audit & Startup Budget
+===================================
+Tracks how long the Meta Engine entry points take to start and which
+modules they pull in at import time.
+
+Why this exists:
+  The scheduler launches meta_engine.py as a fresh subprocess three times
+  a day, plus status/check invocations from launchd and the shell. Every
+  one of those pays the full import cost before doing anything. Heavy
+  optional dependencies (matplotlib, fpdf, markdown2, tweepy, pandas,
+  alpaca/pydantic via PutsEngine) must only be imported inside the
+  pipeline stage that actually uses them.
+
+What it checks:
+  1. STARTUP BUDGET — wall time of cheap invocations (non-trading-day
+     exit, scheduler status, config check) must stay under budget.
+  2. HEAVY-MODULE GUARD — importing the entry points must not load any
+     module in HEAVY_MODULES.
+  3. STAGE IMPORT COST — per-stage import cost from `python -X importtime`,
+     so a full scan's import bill is visible stage by stage.
+
+Usage:
+    python3 monitoring/import_audit.py            # Console report
+    python3 monitoring/import_audit.py --save     # + JSON report
+    python3 monitoring/import_audit.py --top 15   # Show 15 slowest imports
+"""
+
+import json
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+_META_DIR = Path(__file__).parent.parent
+_REPORTS_DIR = _META_DIR / "monitoring" / "reports"
+
+# ═══════════════════════════════════════════════════════════════════════
+# BUDGETS — Tune only with a reason; regressions should be fixed, not
+# absorbed by raising the number.
+# ═══════════════════════════════════════════════════════════════════════
+
+STARTUP_BUDGET_MS = 300  # Non-trading-day / status invocations must exit within this
+
+# Cheap invocations that must stay within STARTUP_BUDGET_MS.
+# Each entry: (name, argv after the interpreter)
+BUDGETED_INVOCATIONS = [
+    ("meta_engine_non_trading_day", [
+        "-c",
+        "import meta_engine, datetime;"
+        "meta_engine.is_trading_day(datetime.date(2026, 1, 3))",
+    ]),
+    ("scheduler_status", ["scheduler.py", "status"]),
+    ("run_meta_engine_status", ["run_meta_engine.py", "--status"]),
+]
+
+# Modules that must never be imported just by loading an entry point.
+# They belong inside the pipeline stage that needs them.
+HEAVY_MODULES = [
+    "matplotlib", "fpdf", "markdown2", "tweepy", "pandas", "numpy",
+    "alpaca", "pydantic", "flask", "streamlit", "plotly", "apscheduler",
+    "requests",
+]
+
+ENTRY_MODULES = ["meta_engine", "scheduler", "run_meta_engine"]
+
+# Pipeline stage → modules it imports (mirrors the lazy imports in
+# meta_engine._run_pipeline). Used to show the import bill per stage.
+STAGE_MODULES = {
+    "safeguards": ["monitoring.safeguards", "monitoring.health_alerts"],
+    "puts": ["engine_adapters.puts_adapter"],
+    "moonshot": ["engine_adapters.moonshot_adapter"],
+    "smart_money": ["engine_adapters.smart_money_scanner"],
+    "coverage": ["engine_adapters.realtime_mover_scanner"],
+    "gap_up": ["engine_adapters.gap_up_detector"],
+    "five_x": ["engine_adapters.five_x_potential"],
+    "cross_analysis": ["analysis.cross_analyzer"],
+    "market_direction": ["analysis.market_direction_predictor"],
+    "summaries": ["analysis.summary_generator"],
+    "chart": ["analysis.chart_generator"],
+    "report": ["analysis.report_generator"],
+    "email": ["notifications.email_sender"],
+    "telegram": ["notifications.telegram_sender"],
+    "x_twitter": ["engine_adapters.x_worthy_selector", "notifications.x_poster"],
+    "trading": ["trading.executor"],
+    "deep_options": ["_3pm_analysis"],
+    "validation": ["monitoring.validation_monitor"],
+}
+
+
+def _python() -> str:
+    venv_python = _META_DIR / "venv" / "bin" / "python3"
+    return str(venv_python) if venv_python.exists() else sys.executable
+
+
+def _run(argv: List[str], timeout: int = 60) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [_python()] + argv,
+        cwd=str(_META_DIR),
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+
+
+def parse_importtime(stderr: str) -> Dict[str, Dict[str, int]]:
+    """
+    Parse `python -X importtime` output.
+
+    Returns:
+        {module: {"self_us": int, "cumulative_us": int}}
+    """
+    parsed: Dict[str, Dict[str, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            continue  # header line
+        module = parts[2].strip()
+        parsed[module] = {"self_us": self_us, "cumulative_us": cumulative_us}
+    return parsed
+
+
+def measure_invocation(name: str, argv: List[str], runs: int = 3) -> Dict:
+    """Best-of-N wall time for a single cheap invocation."""
+    timings = []
+    returncode = 0
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        proc = _run(argv)
+        timings.append((time.perf_counter() - t0) * 1000)
+        returncode = proc.returncode
+    best_ms = min(timings)
+    return {
+        "name": name,
+        "best_ms": round(best_ms, 1),
+        "budget_ms": STARTUP_BUDGET_MS,
+        "within_budget": best_ms <= STARTUP_BUDGET_MS,
+        "returncode": returncode,
+    }
+
+
+def check_heavy_modules(entry_modules: Optional[List[str]] = None) -> Dict[str, List[str]]:
+    """
+    Import each entry module in a fresh interpreter and report any
+    HEAVY_MODULES that got loaded as a side effect.
+    """
+    violations: Dict[str, List[str]] = {}
+    for module in entry_modules or ENTRY_MODULES:
+        code = (
+            "import sys, json\n"
+            f"import {module}\n"
+            f"heavy = {HEAVY_MODULES!r}\n"
+            "print(json.dumps(sorted(h for h in heavy if h in sys.modules)))\n"
+        )
+        proc = _run(["-c", code])
+        if proc.returncode != 0:
+            violations[module] = [f"import failed: {proc.stderr.strip().splitlines()[-1:]}"]
+            continue
+        try:
+            loaded = json.loads(proc.stdout.strip().splitlines()[-1])
+        except (ValueError, IndexError):
+            loaded = []
+        if loaded:
+            violations[module] = loaded
+    return violations
+
+
+def measure_stage_imports(top: int = 10) -> Dict[str, Dict]:
+    """Per-stage cumulative import cost (ms) and its slowest imports."""
+    stages = {}
+    for stage, modules in STAGE_MODULES.items():
+        code = "; ".join(f"import {m}" for m in modules)
+        proc = _run(["-X", "importtime", "-c", code])
+        parsed = parse_importtime(proc.stderr)
+        total_us = sum(parsed[m]["cumulative_us"] for m in modules if m in parsed)
+        slowest = sorted(parsed.items(), key=lambda kv: kv[1]["self_us"], reverse=True)[:top]
+        stages[stage] = {
+            "import_ms": round(total_us / 1000, 1),
+            "ok": proc.returncode == 0,
+            "slowest": [
+                {"module": m, "self_ms": round(v["self_us"] / 1000, 1)} for m, v in slowest
+            ],
+        }
+    return stages
+
+
+def run_audit(top: int = 10, include_stages: bool = True) -> Dict:
+    """Run the full audit and return a JSON-serializable report."""
+    invocations = [measure_invocation(name, argv) for name, argv in BUDGETED_INVOCATIONS]
+    heavy = check_heavy_modules()
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "python": _python(),
+        "startup_budget_ms": STARTUP_BUDGET_MS,
+        "invocations": invocations,
+        "heavy_module_violations": heavy,
+        "budget_ok": all(i["within_budget"] for i in invocations) and not heavy,
+    }
+    if include_stages:
+        report["stages"] = measure_stage_imports(top=top)
+    return report
+
+
+def print_report(report: Dict, top: int = 10):
+    print("=" * 60)
+    print("IMPORT-TIME AUDIT")
+    print("=" * 60)
+    print(f"\n⏱️  Startup budget: {report['startup_budget_ms']} ms")
+    for inv in report["invocations"]:
+        icon = "✅" if inv["within_budget"] else "❌"
+        print(f"  {icon} {inv['name']:32s} {inv['best_ms']:7.1f} ms")
+
+    print("\n🪶 Heavy modules loaded by entry points:")
+    if report["heavy_module_violations"]:
+        for module, loaded in report["heavy_module_violations"].items():
+            print(f"  ❌ {module}: {', '.join(loaded)}")
+    else:
+        print("  ✅ None")
+
+    stages = report.get("stages", {})
+    if stages:
+        print("\n📦 Import cost per pipeline stage:")
+        for stage, info in sorted(stages.items(), key=lambda kv: kv[1]["import_ms"], reverse=True):
+            icon = "✅" if info["ok"] else "⚠️"
+            slowest = ", ".join(s["module"] for s in info["slowest"][:3])
+            print(f"  {icon} {stage:18s} {info['import_ms']:8.1f} ms   ({slowest})")
+
+    print()
+    print("✅ Startup budget OK" if report["budget_ok"] else "❌ Startup budget EXCEEDED")
+    print()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Import-time audit for Meta Engine entry points")
+    parser.add_argument("--save", action="store_true", help="Save JSON report to monitoring/reports/")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to keep per stage")
+    parser.add_argument("--no-stages", action="store_true", help="Only check the startup budget")
+    args = parser.parse_args()
+
+    report = run_audit(top=args.top, include_stages=not args.no_stages)
+    print_report(report, top=args.top)
+
+    if args.save:
+        _REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+        out = _REPORTS_DIR / f"import_audit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        with open(out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Saved: {out}")
+
+    sys.exit(0 if report["budget_ok"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -65,18 +65,16 @@ def check_circuit_breaker() -> Tuple[bool, str]:
         return False, "MANUAL KILL SWITCH IS ON — trading halted by operator"
 
     # Check 2: Accuracy floor
-    recent_results = state.get("prediction_results", [])
     lookback_cutoff = (datetime.now() - timedelta(days=ACCURACY_LOOKBACK_DAYS)).isoformat()
-    recent = [r for r in recent_results if r.get("timestamp", "") >= lookback_cutoff]
+    n_recent, correct = _prediction_window(lookback_cutoff)
 
-    if len(recent) >= MIN_PREDICTIONS_FOR_CIRCUIT:
-        correct = sum(1 for r in recent if r.get("correct", False))
-        accuracy = correct / len(recent)
+    if n_recent >= MIN_PREDICTIONS_FOR_CIRCUIT:
+        accuracy = correct / n_recent
         if accuracy < ACCURACY_FLOOR:
             return False, (
                 "CIRCUIT BREAKER: Accuracy {:.0f}% ({}/{}) over last {} days "
                 "is below {:.0f}% floor. Trading halted."
-            ).format(accuracy * 100, correct, len(recent),
+            ).format(accuracy * 100, correct, n_recent,
                      ACCURACY_LOOKBACK_DAYS, ACCURACY_FLOOR * 100)
 
     # Check 3: Consecutive losses
@@ -88,8 +86,7 @@ def check_circuit_breaker() -> Tuple[bool, str]:
                 "LOSS PAUSE: {} consecutive losses. Paused until {}."
             ).format(consecutive_losses, pause_until)
         else:
-            state["consecutive_losses"] = 0
-            _save_state(state)
+            _update_state({"consecutive_losses": 0})
 
     # Check 4: Daily loss limit
     daily_pnl = state.get("daily_pnl_pct", 0)
@@ -104,62 +101,56 @@ def check_circuit_breaker() -> Tuple[bool, str]:
 
 def record_prediction_result(symbol: str, direction: str, conviction: float,
                              actual_move_pct: float):
-    """Record a prediction outcome for accuracy tracking."""
+    """
+    Record a prediction outcome for accuracy tracking.
+
+    Appended to the analytics store's prediction ledger (full history is
+    kept; rolling windows come from its per-day aggregates) together with
+    the consecutive-loss counters, in one transaction.
+    """
     state = _load_state()
-    results = state.setdefault("prediction_results", [])
 
     is_correct = (
         (direction == "BULLISH" and actual_move_pct > 1.0) or
         (direction == "BEARISH" and actual_move_pct < -1.0)
     )
 
-    results.append({
-        "timestamp": datetime.now().isoformat(),
-        "symbol": symbol,
-        "direction": direction,
-        "conviction": conviction,
-        "actual_move_pct": actual_move_pct,
-        "correct": is_correct,
-    })
-
-    # Keep last 100 results
-    state["prediction_results"] = results[-100:]
-
     # Track consecutive losses
+    changes = {}
     if not is_correct and abs(actual_move_pct) > 1.0:
-        state["consecutive_losses"] = state.get("consecutive_losses", 0) + 1
-        if state["consecutive_losses"] >= MAX_CONSECUTIVE_LOSSES:
+        changes["consecutive_losses"] = state.get("consecutive_losses", 0) + 1
+        if changes["consecutive_losses"] >= MAX_CONSECUTIVE_LOSSES:
             pause_until = (datetime.now() + timedelta(days=1)).isoformat()
-            state["loss_pause_until"] = pause_until
+            changes["loss_pause_until"] = pause_until
             logger.warning(
                 "CONSECUTIVE LOSS LIMIT: %d losses in a row. Pausing until %s",
-                state["consecutive_losses"], pause_until
+                changes["consecutive_losses"], pause_until
             )
     else:
-        state["consecutive_losses"] = 0
+        changes["consecutive_losses"] = 0
 
-    _save_state(state)
+    try:
+        from analytics_store import analytics_store
+        analytics_store().append_prediction(
+            datetime.now().isoformat(), symbol, direction, conviction,
+            actual_move_pct, is_correct, state_changes=changes,
+        )
+    except Exception as e:
+        logger.error("Failed to record prediction result: %s", e)
     return is_correct
 
 
 def update_daily_pnl(pnl_pct: float):
     """Update today's P&L percentage."""
-    state = _load_state()
-    today = datetime.now().strftime("%Y-%m-%d")
-
-    if state.get("pnl_date") != today:
-        state["daily_pnl_pct"] = 0
-        state["pnl_date"] = today
-
-    state["daily_pnl_pct"] = pnl_pct
-    _save_state(state)
+    _update_state({
+        "daily_pnl_pct": pnl_pct,
+        "pnl_date": datetime.now().strftime("%Y-%m-%d"),
+    })
 
 
 def set_kill_switch(on: bool):
     """Manually enable/disable the kill switch."""
-    state = _load_state()
-    state["manual_kill_switch"] = on
-    _save_state(state)
+    _update_state({"manual_kill_switch": on})
     logger.warning("KILL SWITCH %s", "ENABLED" if on else "DISABLED")
 
 
@@ -327,42 +318,43 @@ def calculate_position_size(conviction: float, account_value: float,
 def get_accuracy_report() -> Dict:
     """Generate accuracy report for monitoring."""
     state = _load_state()
-    results = state.get("prediction_results", [])
-
-    if not results:
+    try:
+        from analytics_store import analytics_store
+        by_dir = analytics_store().prediction_totals()
+    except Exception as e:
+        logger.error("Prediction ledger unavailable: %s", e)
+        by_dir = {}
+
+    total = sum(d["total"] for d in by_dir.values())
+    if not total:
         return {"status": "NO DATA", "total": 0}
 
     # Overall
-    total = len(results)
-    correct = sum(1 for r in results if r.get("correct", False))
+    correct = sum(d["correct"] for d in by_dir.values())
 
     # Last 5 days
     cutoff_5d = (datetime.now() - timedelta(days=5)).isoformat()
-    recent_5d = [r for r in results if r.get("timestamp", "") >= cutoff_5d]
-    correct_5d = sum(1 for r in recent_5d if r.get("correct", False))
+    total_5d, correct_5d = _prediction_window(cutoff_5d)
 
     # By direction
-    bull_results = [r for r in results if r.get("direction") == "BULLISH"]
-    bear_results = [r for r in results if r.get("direction") == "BEARISH"]
-    bull_correct = sum(1 for r in bull_results if r.get("correct", False))
-    bear_correct = sum(1 for r in bear_results if r.get("correct", False))
+    bull = by_dir.get("BULLISH", {})
+    bear = by_dir.get("BEARISH", {})
 
     # Average conviction of winners vs losers
-    winners = [r for r in results if r.get("correct", False)]
-    losers = [r for r in results if not r.get("correct", False) and abs(r.get("actual_move_pct", 0)) > 1]
-    avg_winner_conv = sum(r["conviction"] for r in winners) / len(winners) if winners else 0
-    avg_loser_conv = sum(r["conviction"] for r in losers) / len(losers) if losers else 0
+    n_losers = sum(d["losers"] for d in by_dir.values())
+    avg_winner_conv = sum(d["winner_conv_sum"] for d in by_dir.values()) / correct if correct else 0
+    avg_loser_conv = sum(d["loser_conv_sum"] for d in by_dir.values()) / n_losers if n_losers else 0
 
     report = {
-        "status": "OK" if not results or correct / total >= ACCURACY_FLOOR else "WARNING",
+        "status": "OK" if correct / total >= ACCURACY_FLOOR else "WARNING",
         "total": total,
         "correct": correct,
         "accuracy_pct": round(correct / total * 100, 1) if total else 0,
-        "last_5d_total": len(recent_5d),
+        "last_5d_total": total_5d,
         "last_5d_correct": correct_5d,
-        "last_5d_accuracy_pct": round(correct_5d / len(recent_5d) * 100, 1) if recent_5d else 0,
-        "bullish_accuracy_pct": round(bull_correct / len(bull_results) * 100, 1) if bull_results else 0,
-        "bearish_accuracy_pct": round(bear_correct / len(bear_results) * 100, 1) if bear_results else 0,
+        "last_5d_accuracy_pct": round(correct_5d / total_5d * 100, 1) if total_5d else 0,
+        "bullish_accuracy_pct": round(bull["correct"] / bull["total"] * 100, 1) if bull.get("total") else 0,
+        "bearish_accuracy_pct": round(bear["correct"] / bear["total"] * 100, 1) if bear.get("total") else 0,
         "avg_winner_conviction": round(avg_winner_conv, 3),
         "avg_loser_conviction": round(avg_loser_conv, 3),
         "consecutive_losses": state.get("consecutive_losses", 0),
@@ -380,20 +372,17 @@ def check_algo_decay() -> Tuple[bool, str]:
     Compares last 5 days accuracy vs last 20 days.
     If recent accuracy is significantly worse, flag it.
     """
-    state = _load_state()
-    results = state.get("prediction_results", [])
-
     cutoff_5d = (datetime.now() - timedelta(days=5)).isoformat()
     cutoff_20d = (datetime.now() - timedelta(days=20)).isoformat()
 
-    recent = [r for r in results if r.get("timestamp", "") >= cutoff_5d]
-    older = [r for r in results if cutoff_20d <= r.get("timestamp", "") < cutoff_5d]
+    n_recent, recent_correct = _prediction_window(cutoff_5d)
+    n_older, older_correct = _prediction_window(cutoff_20d, until=cutoff_5d)
 
-    if len(recent) < 5 or len(older) < 10:
+    if n_recent < 5 or n_older < 10:
         return True, "Not enough data to detect decay"
 
-    recent_acc = sum(1 for r in recent if r.get("correct")) / len(recent)
-    older_acc = sum(1 for r in older if r.get("correct")) / len(older)
+    recent_acc = recent_correct / n_recent
+    older_acc = older_correct / n_older
 
     if recent_acc < older_acc - 0.20:
         return False, (
@@ -497,20 +486,34 @@ def check_empty_picks(calls_count: int, puts_count: int,
 # STATE PERSISTENCE
 # ═══════════════════════════════════════════════════════════════════════
 
+# Kept in the shared analytics store (kv_state namespace "safeguards";
+# prediction outcomes in its append-only prediction_ledger). A legacy
+# _SAFEGUARD_STATE file is imported on first open.
+
 def _load_state() -> Dict:
     try:
-        if _SAFEGUARD_STATE.exists():
-            with open(_SAFEGUARD_STATE) as f:
-                return json.load(f)
-    except (json.JSONDecodeError, IOError):
-        logger.warning("Safeguard state file corrupted, starting fresh")
+        from analytics_store import analytics_store
+        return analytics_store().get_state("safeguards")
+    except Exception as e:
+        logger.warning("Safeguard state unreadable (%s), starting fresh", e)
     return {}
 
 
-def _save_state(state: Dict):
+def _update_state(changes: Dict):
+    """Write only the given state keys."""
     try:
-        _SAFEGUARD_STATE.parent.mkdir(parents=True, exist_ok=True)
-        with open(_SAFEGUARD_STATE, "w") as f:
-            json.dump(state, f, indent=2, default=str)
-    except IOError as e:
+        from analytics_store import analytics_store
+        analytics_store().update_state("safeguards", changes)
+    except Exception as e:
         logger.error("Failed to save safeguard state: %s", e)
+
+
+def _prediction_window(since: str, until: Optional[str] = None) -> Tuple[int, int]:
+    """(total, correct) predictions with since <= timestamp < until, from the ledger."""
+    try:
+        from analytics_store import analytics_store
+        return analytics_store().prediction_window(since, until)
+    except Exception as e:
+        logger.error("Prediction ledger unavailable: %s", e)
+        return 0, 0
+
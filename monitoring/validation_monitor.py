@@ -24,7 +24,9 @@ import pytz
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from trading.trade_db import TradeDB
+from analytics_store import analytics_store
 from config import MetaConfig
+from artifact_store import ArtifactStore
 
 EST = pytz.timezone("US/Eastern")
 
@@ -46,55 +48,45 @@ class ValidationMonitor:
 
     def __init__(self):
         self.db = TradeDB()
+        self.analytics = analytics_store()
         self.log_dir = Path(__file__).parent.parent / "logs"
         self.output_dir = Path(__file__).parent.parent / "output"
         self.reports_dir = Path(__file__).parent.parent / "monitoring" / "reports"
         self.reports_dir.mkdir(parents=True, exist_ok=True)
+        self.store = ArtifactStore(self.output_dir)
 
     def get_recent_scans(self, days: int = 7) -> List[Dict]:
-        """Get recent scan data from cross_analysis files."""
+        """Get recent scan data: catalog lookup, then load only the matching cross_analysis files."""
         scans = []
         cutoff = datetime.now(EST) - timedelta(days=days)
         
-        for cross_file in sorted(self.output_dir.glob("cross_analysis_*.json")):
+        for entry in self.store.catalog("cross_analysis", since=cutoff):
             try:
-                with open(cross_file) as f:
-                    data = json.load(f)
-                
-                ts = data.get("timestamp", "")
-                if not ts:
+                data = self.store.read(entry["name"], entry["stamp"])
+                if not isinstance(data, dict):
                     continue
-                
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00") if "Z" in ts else ts)
-                if dt.tzinfo:
-                    dt = dt.astimezone(EST)
-                else:
-                    dt = EST.localize(dt)
-                
-                if dt >= cutoff:
-                    scans.append({
-                        "file": cross_file.name,
-                        "timestamp": ts,
-                        "datetime": dt,
-                        "data": data,
-                    })
+                scans.append({
+                    "file": entry["path"].name,
+                    "timestamp": data.get("timestamp") or entry["timestamp"],
+                    "datetime": datetime.fromisoformat(entry["timestamp"]),
+                    "data": data,
+                })
             except Exception as e:
-                print(f"  ⚠️  Error loading {cross_file.name}: {e}")
+                print(f"  ⚠️  Error loading {entry['path'].name}: {e}")
         
         return sorted(scans, key=lambda x: x["datetime"])
 
+    def _trade_window(self, days: int) -> Dict[str, Any]:
+        """One store query over trades with scan dates in the last `days` (today excluded)."""
+        cutoff = (datetime.now(EST) - timedelta(days=days)).date()
+        return self.analytics.trade_outcomes(cutoff.isoformat(), (cutoff + timedelta(days=days)).isoformat())
+
     def analyze_trade_execution(self, days: int = 7) -> Dict[str, Any]:
         """Analyze trade execution rate and retry attempts."""
-        cutoff = (datetime.now(EST) - timedelta(days=days)).date()
-        
-        # Get all trades from recent period
-        all_trades = []
-        for date_offset in range(days):
-            scan_date = (cutoff + timedelta(days=date_offset)).isoformat()
-            trades = self.db.get_trades_by_date(scan_date)
-            all_trades.extend(trades)
-        
-        if not all_trades:
+        stats = self._trade_window(days)
+        total = stats["total_trades"]
+
+        if not total:
             return {
                 "total_trades": 0,
                 "execution_rate": 0.0,
@@ -104,29 +96,16 @@ class ValidationMonitor:
                 "retry_attempts": 0,
                 "vs_baseline": 0.0,
             }
-        
-        # Count by status
-        filled = sum(1 for t in all_trades if t.get("status") == "filled")
-        pending = sum(1 for t in all_trades if t.get("status") == "pending")
-        cancelled = sum(1 for t in all_trades if t.get("status") == "cancelled")
-        total = len(all_trades)
-        
-        execution_rate = (filled / total) if total > 0 else 0.0
-        
-        # Check for retry attempts in exit_reason
-        retry_attempts = sum(
-            1 for t in all_trades
-            if "retry" in str(t.get("exit_reason", "")).lower() or
-               "attempt" in str(t.get("exit_reason", "")).lower()
-        )
-        
+
+        execution_rate = stats["filled"] / total
+
         return {
             "total_trades": total,
             "execution_rate": execution_rate,
-            "filled": filled,
-            "pending": pending,
-            "cancelled": cancelled,
-            "retry_attempts": retry_attempts,
+            "filled": stats["filled"],
+            "pending": stats["pending"],
+            "cancelled": stats["cancelled"],
+            "retry_attempts": stats["retry_attempts"],
             "vs_baseline": execution_rate - BASELINE_METRICS["trade_execution_rate"],
         }
 
@@ -176,6 +155,18 @@ class ValidationMonitor:
     def analyze_orm_scores(self, days: int = 7) -> Dict[str, Any]:
         """Analyze ORM scores for recent picks."""
         scans = self.get_recent_scans(days)
+
+        # First trade per (scan_date, symbol, option_type), one query for all scans
+        trade_pnl: Dict[tuple, float] = {}
+        if scans:
+            first_date = scans[0]["datetime"].date().isoformat()
+            for r in self.analytics.execute(
+                "SELECT scan_date, symbol, option_type, pnl_pct FROM trades "
+                "WHERE scan_date >= ? ORDER BY created_at",
+                (first_date,),
+            ):
+                trade_pnl.setdefault((r["scan_date"], r["symbol"], r["option_type"]),
+                                     float(r["pnl_pct"] or 0))
         
         orm_scores = []
         orm_scores_winners = []
@@ -199,17 +190,12 @@ class ValidationMonitor:
                     
                     # Get trade data
                     scan_date = scan["datetime"].date().isoformat()
-                    trades = self.db.get_trades_by_date(scan_date)
-                    
-                    for trade in trades:
-                        if (trade.get("symbol") == symbol and
-                            trade.get("option_type") == option_type):
-                            pnl_pct = float(trade.get("pnl_pct", 0) or 0)
-                            if pnl_pct >= 50:
-                                orm_scores_winners.append(orm)
-                            elif pnl_pct < 0:
-                                orm_scores_losers.append(orm)
-                            break
+                    pnl_pct = trade_pnl.get((scan_date, symbol, option_type))
+                    if pnl_pct is not None:
+                        if pnl_pct >= 50:
+                            orm_scores_winners.append(orm)
+                        elif pnl_pct < 0:
+                            orm_scores_losers.append(orm)
         
         if not orm_scores:
             return {
@@ -234,15 +220,9 @@ class ValidationMonitor:
 
     def analyze_performance_metrics(self, days: int = 7) -> Dict[str, Any]:
         """Analyze win rate and average returns."""
-        cutoff = (datetime.now(EST) - timedelta(days=days)).date()
-        
-        all_trades = []
-        for date_offset in range(days):
-            scan_date = (cutoff + timedelta(days=date_offset)).isoformat()
-            trades = self.db.get_trades_by_date(scan_date)
-            all_trades.extend(trades)
-        
-        if not all_trades:
+        stats = self._trade_window(days)
+
+        if not stats["total_trades"]:
             return {
                 "total_trades": 0,
                 "win_rate": 0.0,
@@ -251,13 +231,12 @@ class ValidationMonitor:
                 "winners": 0,
                 "losers": 0,
             }
-        
-        # Filter to filled/closed trades only
-        executed_trades = [t for t in all_trades if t.get("status") in ["filled", "open", "closed"]]
-        
-        if not executed_trades:
+
+        # Filled/open/closed trades only
+        executed = stats["executed_trades"]
+        if not executed:
             return {
-                "total_trades": len(all_trades),
+                "total_trades": stats["total_trades"],
                 "executed_trades": 0,
                 "win_rate": 0.0,
                 "avg_winner_return": 0.0,
@@ -265,30 +244,19 @@ class ValidationMonitor:
                 "winners": 0,
                 "losers": 0,
             }
-        
-        winners = [t for t in executed_trades if float(t.get("pnl_pct", 0) or 0) >= 50]
-        losers = [t for t in executed_trades if float(t.get("pnl_pct", 0) or 0) < 0]
-        
-        win_rate = len(winners) / len(executed_trades) if executed_trades else 0.0
-        
-        avg_winner_return = (
-            sum(float(t.get("pnl_pct", 0) or 0) for t in winners) / len(winners)
-            if winners else 0.0
-        )
-        
-        avg_loser_return = (
-            sum(float(t.get("pnl_pct", 0) or 0) for t in losers) / len(losers)
-            if losers else 0.0
-        )
-        
+
+        win_rate = stats["winners"] / executed
+        avg_winner_return = stats["avg_winner_return"]
+        avg_loser_return = stats["avg_loser_return"]
+
         return {
-            "total_trades": len(all_trades),
-            "executed_trades": len(executed_trades),
+            "total_trades": stats["total_trades"],
+            "executed_trades": executed,
             "win_rate": win_rate,
             "avg_winner_return": avg_winner_return,
             "avg_loser_return": avg_loser_return,
-            "winners": len(winners),
-            "losers": len(losers),
+            "winners": stats["winners"],
+            "losers": stats["losers"],
             "vs_baseline_win_rate": win_rate - BASELINE_METRICS["win_rate"],
             "vs_baseline_avg_winner": avg_winner_return - BASELINE_METRICS["avg_winner_return"],
         }
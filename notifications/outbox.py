@@ -0,0 +1,545 @@
+"""
+Meta Engine Notification Outbox
+=================================
+Durable, SQLite-backed outbox for Email / Telegram / X deliveries.
+
+The pipeline ENQUEUES notifications and moves on; a background
+dispatcher delivers them. Scan completion (trading, deep analysis) no
+longer waits on SMTP, Telegram's 0.5 s pacing or X's 4 s thread pacing.
+
+Guarantees:
+  - Idempotency: every job has a unique key; enqueueing the same key
+    twice is a no-op (safe for --force re-runs within the same minute).
+  - Retry + backoff: failed deliveries are retried with exponential
+    backoff up to a per-channel attempt limit, then marked 'dead' and a
+    health alert is raised.
+  - Crash recovery: jobs are claimed with a lease. If the process dies
+    mid-delivery the lease expires and any dispatcher (the scheduler
+    runs a resident one) picks the job up again. Delivery is therefore
+    at-least-once — except X threads: their handlers checkpoint the
+    first tweet ID on the job as soon as it is posted, and a job with a
+    checkpoint is never posted again.
+  - Nothing to send (channel not configured, no tweets) is a completed
+    job, not a failure, so it is neither retried nor alerted on.
+  - Per-channel concurrency: each channel has its own worker pool so a
+    slow SMTP server never delays Telegram, and X threads stay serial.
+  - Ordering dependencies: a job may depend on another job's key and
+    receives its result (e.g. the deep-analysis X thread quote-tweets
+    the Step 8 thread once that thread's tweet ID is known).
+
+Database location: <Meta Engine>/data/notification_outbox.db
+
+Usage:
+    from notifications.outbox import get_outbox, start_dispatcher
+    get_outbox().enqueue("meta_email", payload, key="meta_email:20260305_0935")
+    dispatcher = start_dispatcher()
+    ...
+    dispatcher.drain(timeout=600)
+
+CLI:
+    python3 notifications/outbox.py status
+    python3 notifications/outbox.py drain
+"""
+
+import importlib.util
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_DB = Path(__file__).parent.parent / "data" / "notification_outbox.db"
+
+# Per-channel delivery policy
+CHANNELS: Dict[str, Dict[str, Any]] = {
+    "email":     {"concurrency": 2, "max_attempts": 5, "base_backoff_sec": 30},
+    "telegram":  {"concurrency": 1, "max_attempts": 5, "base_backoff_sec": 15},
+    # X threads are not idempotent on the remote side (a retry re-posts the
+    # whole thread), so keep retries to a minimum and post serially.
+    "x_twitter": {"concurrency": 1, "max_attempts": 2, "base_backoff_sec": 60},
+}
+MAX_BACKOFF_SEC = 30 * 60
+LEASE_SEC = 10 * 60  # In-flight jobs older than this are presumed crashed
+
+_CREATE_TABLES = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    idempotency_key TEXT    UNIQUE NOT NULL,
+    channel         TEXT    NOT NULL,           -- 'email' / 'telegram' / 'x_twitter'
+    kind            TEXT    NOT NULL,           -- handler name (see HANDLERS)
+    payload         TEXT    NOT NULL,           -- JSON
+    depends_on      TEXT,                       -- idempotency_key of a prerequisite job
+    status          TEXT    DEFAULT 'pending',  -- pending/in_flight/sent/dead
+    attempts        INTEGER DEFAULT 0,
+    next_attempt_at REAL    DEFAULT 0,          -- epoch seconds
+    lease_until     REAL    DEFAULT 0,          -- epoch seconds
+    worker          TEXT    DEFAULT '',
+    last_error      TEXT    DEFAULT '',
+    result          TEXT    DEFAULT '',         -- JSON
+    created_at      TEXT    DEFAULT (datetime('now')),
+    updated_at      TEXT    DEFAULT (datetime('now'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox(channel, status, next_attempt_at);
+"""
+
+
+# ═══════════════════════════════════════════════════════
+# Delivery handlers
+# ═══════════════════════════════════════════════════════
+# Each handler receives (payload, dependency_result, checkpoint) and
+# returns a truthy value on success (a dict is stored as the job result)
+# or falsy / raises on failure. {"skipped": reason} means there was
+# nothing to send. checkpoint(result) records partial progress on the job
+# (X handlers: the first tweet ID) — see OutboxDispatcher._deliver.
+# Credentials are read from MetaConfig at delivery time and are never
+# persisted in the outbox.
+
+def channel_configured(channel: str) -> bool:
+    """Whether `channel` has credentials (and, for X, tweepy) to deliver with."""
+    from config import MetaConfig
+    status = MetaConfig.validate().get(channel, {})
+    if not status.get("configured"):
+        return False
+    if channel == "x_twitter":
+        return importlib.util.find_spec("tweepy") is not None
+    return True
+
+
+def _not_configured(channel: str) -> Dict[str, str]:
+    logger.info(f"  ⏭️ {channel} not configured — nothing to send")
+    return {"skipped": f"{channel} not configured"}
+
+
+def _handle_meta_email(payload: Dict, dep: Optional[Dict], checkpoint: Callable) -> Any:
+    if not channel_configured("email"):
+        return _not_configured("email")
+    from config import MetaConfig
+    from notifications.email_sender import send_meta_email
+    return send_meta_email(
+        summaries=payload.get("summaries", {}),
+        chart_path=payload.get("chart_path"),
+        report_md_path=payload.get("report_md_path"),
+        smtp_server=MetaConfig.SMTP_SERVER,
+        smtp_port=MetaConfig.SMTP_PORT,
+        smtp_user=MetaConfig.SMTP_USER,
+        smtp_password=MetaConfig.SMTP_PASSWORD,
+        recipient=MetaConfig.ALERT_EMAIL,
+        gap_up_data=payload.get("gap_up_data"),
+        five_x_data=payload.get("five_x_data"),
+    )
+
+
+def _handle_meta_telegram(payload: Dict, dep: Optional[Dict], checkpoint: Callable) -> Any:
+    if not channel_configured("telegram"):
+        return _not_configured("telegram")
+    from config import MetaConfig
+    from notifications.telegram_sender import send_meta_telegram
+    return send_meta_telegram(
+        summaries=payload.get("summaries", {}),
+        chart_path=payload.get("chart_path"),
+        bot_token=MetaConfig.TELEGRAM_BOT_TOKEN,
+        chat_id=MetaConfig.TELEGRAM_CHAT_ID,
+        gap_up_data=payload.get("gap_up_data"),
+        five_x_data=payload.get("five_x_data"),
+    )
+
+
+def _handle_meta_x_thread(payload: Dict, dep: Optional[Dict], checkpoint: Callable) -> Any:
+    if not channel_configured("x_twitter"):
+        return _not_configured("x_twitter")
+    from engine_adapters.x_worthy_selector import get_cross_results_for_x
+    from notifications.x_poster import post_meta_to_x, _get_x_post_id
+    cross_results = payload.get("cross_results", {})
+    gap_up_data = payload.get("gap_up_data")
+    session_label = payload.get("session_label")
+    cross_results_for_x = get_cross_results_for_x(cross_results, gap_up_data=gap_up_data)
+    posted = post_meta_to_x(
+        summaries=payload.get("summaries", {}),
+        cross_results=cross_results_for_x,
+        session_label=session_label,
+        gap_up_data=gap_up_data,
+        on_first_tweet=lambda tweet_id: checkpoint({"tweet_id": tweet_id, "partial": True}),
+    )
+    if posted is None:
+        return {"skipped": "no tweets to post"}
+    if not posted:
+        return False
+    tweet_id = None
+    scan_ts = cross_results.get("timestamp", "")
+    if scan_ts:
+        tweet_id = _get_x_post_id(scan_ts, session_label)
+    return {"tweet_id": tweet_id}
+
+
+def _handle_deep_email(payload: Dict, dep: Optional[Dict], checkpoint: Callable) -> Any:
+    if not channel_configured("email"):
+        return _not_configured("email")
+    from _3pm_analysis import send_email
+    return send_email(payload.get("report_md", ""), payload.get("calls", []),
+                      payload.get("puts", []), session_label=payload.get("session_label", "PM"))
+
+
+def _handle_deep_telegram(payload: Dict, dep: Optional[Dict], checkpoint: Callable) -> Any:
+    if not channel_configured("telegram"):
+        return _not_configured("telegram")
+    from _3pm_analysis import send_telegram
+    return send_telegram(payload.get("calls", []), payload.get("puts", []),
+                         session_label=payload.get("session_label", "PM"))
+
+
+def _handle_deep_x_thread(payload: Dict, dep: Optional[Dict], checkpoint: Callable) -> Any:
+    if not channel_configured("x_twitter"):
+        return _not_configured("x_twitter")
+    from _3pm_analysis import post_to_x
+    quote_tweet_id = (dep or {}).get("tweet_id") or payload.get("quote_tweet_id")
+    return post_to_x(payload.get("calls", []), payload.get("puts", []),
+                     session_label=payload.get("session_label", ""),
+                     quote_tweet_id=quote_tweet_id,
+                     on_first_tweet=lambda tweet_id: checkpoint({"tweet_id": tweet_id, "partial": True}))
+
+
+HANDLERS: Dict[str, Dict[str, Any]] = {
+    "meta_email":      {"channel": "email",     "fn": _handle_meta_email},
+    "meta_telegram":   {"channel": "telegram",  "fn": _handle_meta_telegram},
+    "meta_x_thread":   {"channel": "x_twitter", "fn": _handle_meta_x_thread},
+    "deep_email":      {"channel": "email",     "fn": _handle_deep_email},
+    "deep_telegram":   {"channel": "telegram",  "fn": _handle_deep_telegram},
+    "deep_x_thread":   {"channel": "x_twitter", "fn": _handle_deep_x_thread},
+}
+
+
+# ═══════════════════════════════════════════════════════
+# Outbox (persistence)
+# ═══════════════════════════════════════════════════════
+
+class NotificationOutbox:
+    """SQLite-backed notification queue."""
+
+    def __init__(self, db_path: str = None):
+        self.db_path = Path(db_path) if db_path else OUTBOX_DB
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._get_conn()) as conn:
+            conn.executescript(_CREATE_TABLES)
+
+    def _get_conn(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        key: str,
+        depends_on: Optional[str] = None,
+    ) -> int:
+        """
+        Add a delivery job. Returns the job id (existing id if `key` was
+        already enqueued — the payload is NOT replaced).
+        """
+        if kind not in HANDLERS:
+            raise ValueError(f"Unknown outbox job kind: {kind}")
+        from artifact_store import dumps
+        channel = HANDLERS[kind]["channel"]
+        with closing(self._get_conn()) as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO outbox "
+                "(idempotency_key, channel, kind, payload, depends_on, next_attempt_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, channel, kind, dumps(payload).decode("utf-8"), depends_on, time.time()),
+            )
+            row = conn.execute(
+                "SELECT id, status FROM outbox WHERE idempotency_key = ?", (key,)
+            ).fetchone()
+        logger.info(f"  📤 Queued {kind} (job {row['id']}, {row['status']})")
+        return row["id"]
+
+    def claim(self, channel: str, worker: str) -> Optional[Dict]:
+        """
+        Atomically claim the next due job for `channel`.
+
+        Due = pending and past its backoff, or in_flight with an expired
+        lease (crashed worker). Jobs whose dependency is still pending or
+        in flight are skipped.
+        """
+        now = time.time()
+        conn = self._get_conn()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("""
+                SELECT o.* FROM outbox o
+                LEFT JOIN outbox d ON d.idempotency_key = o.depends_on
+                WHERE o.channel = ?
+                  AND ((o.status = 'pending' AND o.next_attempt_at <= ?)
+                       OR (o.status = 'in_flight' AND o.lease_until < ?))
+                  AND (o.depends_on IS NULL OR d.id IS NULL
+                       OR d.status IN ('sent', 'dead'))
+                ORDER BY o.next_attempt_at, o.id
+                LIMIT 1
+            """, (channel, now, now)).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE outbox SET status = 'in_flight', lease_until = ?, worker = ?, "
+                "attempts = attempts + 1, updated_at = datetime('now') WHERE id = ?",
+                (now + LEASE_SEC, worker, row["id"]),
+            )
+            dep_result = None
+            if row["depends_on"]:
+                dep = conn.execute(
+                    "SELECT result FROM outbox WHERE idempotency_key = ?", (row["depends_on"],)
+                ).fetchone()
+                if dep and dep["result"]:
+                    dep_result = json.loads(dep["result"])
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        job = dict(row)
+        job["attempts"] += 1
+        job["payload"] = json.loads(job["payload"])
+        job["dependency_result"] = dep_result
+        return job
+
+    def mark_sent(self, job_id: int, result: Any = None):
+        if not isinstance(result, dict):
+            result = {"ok": True}
+        with closing(self._get_conn()) as conn:
+            conn.execute(
+                "UPDATE outbox SET status = 'sent', result = ?, last_error = '', "
+                "updated_at = datetime('now') WHERE id = ?",
+                (json.dumps(result, default=str), job_id),
+            )
+
+    def checkpoint(self, job_id: int, result: Dict[str, Any]):
+        """Store partial progress on an unfinished job (status unchanged)."""
+        with closing(self._get_conn()) as conn:
+            conn.execute(
+                "UPDATE outbox SET result = ?, updated_at = datetime('now') WHERE id = ?",
+                (json.dumps(result, default=str), job_id),
+            )
+
+    def mark_failed(self, job: Dict, error: str) -> str:
+        """Schedule a retry with exponential backoff, or mark dead. Returns new status."""
+        policy = CHANNELS.get(job["channel"], {})
+        attempts = job["attempts"]
+        if attempts >= policy.get("max_attempts", 3):
+            status, next_at = "dead", 0
+        else:
+            delay = min(policy.get("base_backoff_sec", 30) * (2 ** (attempts - 1)), MAX_BACKOFF_SEC)
+            status, next_at = "pending", time.time() + delay
+        with closing(self._get_conn()) as conn:
+            conn.execute(
+                "UPDATE outbox SET status = ?, next_attempt_at = ?, lease_until = 0, "
+                "last_error = ?, updated_at = datetime('now') WHERE id = ?",
+                (status, next_at, error[:1000], job["id"]),
+            )
+        return status
+
+    def outstanding(self) -> int:
+        """Jobs not yet sent or dead."""
+        with closing(self._get_conn()) as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM outbox WHERE status IN ('pending', 'in_flight')"
+            ).fetchone()
+        return row[0]
+
+    def get_job(self, key: str) -> Optional[Dict]:
+        with closing(self._get_conn()) as conn:
+            row = conn.execute(
+                "SELECT id, idempotency_key, channel, kind, status, attempts, last_error, result "
+                "FROM outbox WHERE idempotency_key = ?", (key,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def status_counts(self) -> Dict[str, Dict[str, int]]:
+        with closing(self._get_conn()) as conn:
+            rows = conn.execute(
+                "SELECT channel, status, COUNT(*) AS n FROM outbox GROUP BY channel, status"
+            ).fetchall()
+        counts: Dict[str, Dict[str, int]] = {}
+        for r in rows:
+            counts.setdefault(r["channel"], {})[r["status"]] = r["n"]
+        return counts
+
+    def cleanup_old(self, keep_days: int = 30):
+        """Delete delivered/dead jobs older than keep_days."""
+        with closing(self._get_conn()) as conn:
+            conn.execute(
+                "DELETE FROM outbox WHERE status IN ('sent', 'dead') "
+                "AND created_at < datetime('now', ?)", (f"-{keep_days} days",)
+            )
+
+
+# ═══════════════════════════════════════════════════════
+# Dispatcher (background delivery)
+# ═══════════════════════════════════════════════════════
+
+class OutboxDispatcher:
+    """Per-channel worker threads that deliver outbox jobs."""
+
+    def __init__(self, outbox: Optional[NotificationOutbox] = None, poll_sec: float = 2.0):
+        self.outbox = outbox or get_outbox()
+        self.poll_sec = poll_sec
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+    def start(self) -> "OutboxDispatcher":
+        if self._threads:
+            return self
+        for channel, policy in CHANNELS.items():
+            for i in range(policy.get("concurrency", 1)):
+                t = threading.Thread(
+                    target=self._worker_loop,
+                    args=(channel, f"{self._worker_prefix}:{channel}-{i}"),
+                    daemon=True,
+                    name=f"outbox-{channel}-{i}",
+                )
+                t.start()
+                self._threads.append(t)
+        logger.info(f"  📤 Outbox dispatcher started ({len(self._threads)} workers)")
+        return self
+
+    def _worker_loop(self, channel: str, worker: str):
+        while not self._stop.is_set():
+            try:
+                job = self.outbox.claim(channel, worker)
+            except Exception as e:
+                logger.warning(f"Outbox claim failed ({channel}): {e}")
+                job = None
+            if job is None:
+                self._stop.wait(self.poll_sec)
+                continue
+            self._deliver(job)
+
+    def _deliver(self, job: Dict):
+        kind = job["kind"]
+        handler = HANDLERS.get(kind, {}).get("fn")
+        prior = json.loads(job["result"]) if job.get("result") else {}
+        if prior.get("tweet_id"):
+            # An earlier attempt (failed, or killed mid-thread) already
+            # posted this thread's first tweet — never post it twice.
+            self.outbox.mark_sent(job["id"], prior)
+            logger.info(f"  ✅ Outbox {kind} (job {job['id']}) was already posted "
+                        f"(tweet {prior['tweet_id']}) — not re-posting")
+            return
+        t0 = time.time()
+        error = ""
+        result = None
+        try:
+            if handler is None:
+                raise ValueError(f"No handler for {kind}")
+            result = handler(job["payload"], job.get("dependency_result"),
+                             partial(self.outbox.checkpoint, job["id"]))
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        elapsed = time.time() - t0
+
+        if result:
+            self.outbox.mark_sent(job["id"], result)
+            if isinstance(result, dict) and result.get("skipped"):
+                logger.info(f"  ⏭️ Outbox {kind} (job {job['id']}): {result['skipped']}")
+            else:
+                logger.info(f"  ✅ Outbox delivered {kind} (job {job['id']}, "
+                            f"attempt {job['attempts']}, {elapsed:.1f}s)")
+            return
+
+        status = self.outbox.mark_failed(job, error or "handler returned failure")
+        if status == "dead":
+            logger.error(f"  ❌ Outbox gave up on {kind} (job {job['id']}) after "
+                         f"{job['attempts']} attempts: {error}")
+            try:
+                from monitoring.health_alerts import send_health_alert, AlertLevel
+                send_health_alert(
+                    AlertLevel.WARNING,
+                    f"outbox_{job['channel']}",
+                    f"Notification delivery failed: {kind}",
+                    error or "handler returned failure",
+                )
+            except Exception:
+                pass
+        else:
+            logger.warning(f"  ⚠️ Outbox delivery failed for {kind} (job {job['id']}, "
+                           f"attempt {job['attempts']}) — will retry: {error}")
+
+    def drain(self, timeout: float = 600) -> bool:
+        """
+        Block until no pending/in-flight jobs remain or `timeout` elapses.
+        Leftover jobs stay in the outbox for the scheduler's dispatcher.
+        """
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if self.outbox.outstanding() == 0:
+                return True
+            time.sleep(self.poll_sec)
+        logger.warning(f"  ⏳ Outbox drain timed out — {self.outbox.outstanding()} "
+                       f"job(s) left for the resident dispatcher")
+        return False
+
+    def stop(self, timeout: float = 5):
+        self._stop.set()
+        for t in self._threads:
+            t.join(timeout=timeout)
+        self._threads = []
+
+
+_outbox: Optional[NotificationOutbox] = None
+_dispatcher: Optional[OutboxDispatcher] = None
+
+
+def get_outbox() -> NotificationOutbox:
+    global _outbox
+    if _outbox is None:
+        _outbox = NotificationOutbox()
+    return _outbox
+
+
+def start_dispatcher() -> OutboxDispatcher:
+    """Start (once per process) and return the background dispatcher."""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = OutboxDispatcher().start()
+    return _dispatcher
+
+
+def get_dispatcher() -> Optional[OutboxDispatcher]:
+    return _dispatcher
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)-8s | %(message)s")
+
+    parser = argparse.ArgumentParser(description="Meta Engine notification outbox")
+    parser.add_argument("action", nargs="?", default="status", choices=["status", "drain", "cleanup"])
+    parser.add_argument("--timeout", type=float, default=600, help="Drain timeout (seconds)")
+    args = parser.parse_args()
+
+    if args.action == "status":
+        counts = get_outbox().status_counts()
+        if not counts:
+            print("Outbox is empty")
+        for channel, by_status in sorted(counts.items()):
+            print(f"{channel:10s} " + "  ".join(f"{s}={n}" for s, n in sorted(by_status.items())))
+    elif args.action == "drain":
+        ok = start_dispatcher().drain(timeout=args.timeout)
+        sys.exit(0 if ok else 1)
+    elif args.action == "cleanup":
+        get_outbox().cleanup_old()
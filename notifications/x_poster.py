@@ -17,17 +17,12 @@ Uses the tweepy library for Twitter API v2.
 
 import time
 import json
-import sqlite3
 from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Path to X post tracking database
-X_POSTS_DB = Path(__file__).parent.parent / "data" / "x_posts.db"
-
 
 def _get_twitter_client():
     """Initialize and return a tweepy Client for Twitter API v2."""
@@ -252,12 +247,9 @@ def format_tweets_institutional(
     #           3) Fallback to cross_results market_direction data
     try:
         # Attempt 1: Read latest saved prediction file (already generated by meta_engine)
-        import json as _json
-        from pathlib import Path as _Path
-        latest_file = _Path(__file__).parent.parent / "output" / f"market_direction_{timeframe}_latest.json"
-        if latest_file.exists():
-            with open(latest_file, "r") as _f:
-                saved_pred = _json.load(_f)
+        from artifact_store import get_store
+        saved_pred = get_store().read(f"market_direction_{timeframe}")
+        if saved_pred:
             # Check freshness (< 4 hours)
             ts_str = saved_pred.get("timestamp", "")
             is_fresh = True
@@ -442,113 +434,64 @@ PROFIT_MILESTONES = [50, 100, 150, 200, 300, 400, 500]  # %
 
 
 def _ensure_x_posts_db():
-    """Create X posts tracking database if it doesn't exist."""
-    X_POSTS_DB.parent.mkdir(parents=True, exist_ok=True)
-    with sqlite3.connect(str(X_POSTS_DB)) as conn:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS x_posts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                scan_timestamp TEXT NOT NULL,
-                scan_date TEXT NOT NULL,
-                session_label TEXT NOT NULL,
-                first_tweet_id TEXT NOT NULL,
-                posted_at TEXT DEFAULT (datetime('now')),
-                winner_posted INTEGER DEFAULT 0,
-                winner_posted_at TEXT,
-                UNIQUE(scan_timestamp, session_label)
-            )
-        """)
-        # Add winner_posted column if it doesn't exist (for existing databases)
-        try:
-            conn.execute("ALTER TABLE x_posts ADD COLUMN winner_posted INTEGER DEFAULT 0")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        try:
-            conn.execute("ALTER TABLE x_posts ADD COLUMN winner_posted_at TEXT")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        # Create milestone_posts table to track which milestones have been posted per trade
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS milestone_posts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                trade_id TEXT NOT NULL,
-                milestone_pct INTEGER NOT NULL,
-                posted_at TEXT DEFAULT (datetime('now')),
-                tweet_id TEXT,
-                UNIQUE(trade_id, milestone_pct)
-            )
-        """)
-        conn.commit()
+    """X post tables live in the shared analytics store (created by its migrations)."""
+    from analytics_store import analytics_store
+    return analytics_store()
 
 
 def _store_x_post(scan_timestamp: str, scan_date: str, session_label: str, first_tweet_id: str):
     """Store X post ID linked to scan timestamp."""
-    _ensure_x_posts_db()
-    with sqlite3.connect(str(X_POSTS_DB)) as conn:
-        conn.execute(
-            "INSERT OR REPLACE INTO x_posts (scan_timestamp, scan_date, session_label, first_tweet_id) VALUES (?, ?, ?, ?)",
-            (scan_timestamp, scan_date, session_label, first_tweet_id)
-        )
-        conn.commit()
+    _ensure_x_posts_db().execute(
+        "INSERT OR REPLACE INTO x_posts (scan_timestamp, scan_date, session_label, first_tweet_id) VALUES (?, ?, ?, ?)",
+        (scan_timestamp, scan_date, session_label, first_tweet_id)
+    )
 
 
 def _get_x_post_id(scan_timestamp: str, session_label: str) -> Optional[str]:
     """Get stored X post ID for a specific scan."""
-    _ensure_x_posts_db()
-    with sqlite3.connect(str(X_POSTS_DB)) as conn:
-        row = conn.execute(
-            "SELECT first_tweet_id FROM x_posts WHERE scan_timestamp = ? AND session_label = ?",
-            (scan_timestamp, session_label)
-        ).fetchone()
-        return row[0] if row else None
+    rows = _ensure_x_posts_db().execute(
+        "SELECT first_tweet_id FROM x_posts WHERE scan_timestamp = ? AND session_label = ?",
+        (scan_timestamp, session_label)
+    )
+    return rows[0][0] if rows else None
 
 
 def _is_winner_already_posted(scan_timestamp: str, session_label: str) -> bool:
     """Check if winner update has already been posted for this scan."""
-    _ensure_x_posts_db()
-    with sqlite3.connect(str(X_POSTS_DB)) as conn:
-        row = conn.execute(
-            "SELECT winner_posted FROM x_posts WHERE scan_timestamp = ? AND session_label = ?",
-            (scan_timestamp, session_label)
-        ).fetchone()
-        return bool(row[0]) if row and row[0] is not None else False
+    rows = _ensure_x_posts_db().execute(
+        "SELECT winner_posted FROM x_posts WHERE scan_timestamp = ? AND session_label = ?",
+        (scan_timestamp, session_label)
+    )
+    return bool(rows[0][0]) if rows and rows[0][0] is not None else False
 
 
 def _mark_winner_posted(scan_timestamp: str, session_label: str):
     """Mark that winner update has been posted for this scan."""
-    _ensure_x_posts_db()
-    with sqlite3.connect(str(X_POSTS_DB)) as conn:
-        conn.execute(
-            "UPDATE x_posts SET winner_posted = 1, winner_posted_at = datetime('now') WHERE scan_timestamp = ? AND session_label = ?",
-            (scan_timestamp, session_label)
-        )
-        conn.commit()
+    _ensure_x_posts_db().execute(
+        "UPDATE x_posts SET winner_posted = 1, winner_posted_at = datetime('now') WHERE scan_timestamp = ? AND session_label = ?",
+        (scan_timestamp, session_label)
+    )
 
 
 def _get_posted_milestones(trade_id: str) -> set:
     """Get set of milestone percentages that have already been posted for this trade."""
-    _ensure_x_posts_db()
-    with sqlite3.connect(str(X_POSTS_DB)) as conn:
-        rows = conn.execute(
-            "SELECT milestone_pct FROM milestone_posts WHERE trade_id = ?",
-            (trade_id,)
-        ).fetchall()
-        return {row[0] for row in rows}
+    rows = _ensure_x_posts_db().execute(
+        "SELECT milestone_pct FROM milestone_posts WHERE trade_id = ?",
+        (trade_id,)
+    )
+    return {row[0] for row in rows}
 
 
 def _mark_milestone_posted(trade_id: str, milestone_pct: int, tweet_id: str = None):
     """Mark that a milestone has been posted for this trade."""
-    _ensure_x_posts_db()
-    with sqlite3.connect(str(X_POSTS_DB)) as conn:
-        conn.execute(
-            "INSERT OR REPLACE INTO milestone_posts (trade_id, milestone_pct, tweet_id) VALUES (?, ?, ?)",
-            (trade_id, milestone_pct, tweet_id)
-        )
-        conn.commit()
+    _ensure_x_posts_db().execute(
+        "INSERT OR REPLACE INTO milestone_posts (trade_id, milestone_pct, tweet_id) VALUES (?, ?, ?)",
+        (trade_id, milestone_pct, tweet_id)
+    )
 
 
-def post_thread(tweets: List[str], scan_timestamp: str = None, session_label: str = None) -> Optional[str]:
+def post_thread(tweets: List[str], scan_timestamp: str = None, session_label: str = None,
+                on_first_tweet: Optional[Callable[[str], None]] = None) -> Optional[str]:
     """
     Post a thread of tweets to X/Twitter.
     
@@ -556,6 +499,8 @@ def post_thread(tweets: List[str], scan_timestamp: str = None, session_label: st
         tweets: List of tweet texts (each max 280 chars)
         scan_timestamp: Optional timestamp of the scan (for tracking)
         session_label: Optional session label ('AM', 'PM')
+        on_first_tweet: Called with the first tweet ID as soon as it is
+            posted (the outbox records it so a retry never re-posts)
         
     Returns:
         First tweet ID if successful, None otherwise
@@ -594,6 +539,8 @@ def post_thread(tweets: List[str], scan_timestamp: str = None, session_label: st
                 previous_tweet_id = tweet_id
                 if first_tweet_id is None:
                     first_tweet_id = str(previous_tweet_id)
+                    if on_first_tweet:
+                        on_first_tweet(first_tweet_id)
                 logger.info(f"  Tweet {i+1}/{len(tweets)} posted (ID: {previous_tweet_id})")
                 
                 if i == 0:
@@ -640,7 +587,8 @@ def post_meta_to_x(
     cross_results: Dict[str, Any] = None,
     session_label: str = None,
     gap_up_data: Optional[Dict[str, Any]] = None,
-) -> bool:
+    on_first_tweet: Optional[Callable[[str], None]] = None,
+) -> Optional[bool]:
     """
     Post Meta Engine Top 3 Puts + Top 3 Calls to X/Twitter.
     
@@ -652,9 +600,10 @@ def post_meta_to_x(
         cross_results: Output from cross_analyzer.cross_analyze() (full pick data)
         session_label: Optional session label ('AM', 'PM') for tracking
         gap_up_data: Output from gap_up_detector.detect_gap_ups() (gap-up alerts)
+        on_first_tweet: See post_thread()
         
     Returns:
-        True if posted successfully
+        True if posted successfully, None if there was nothing to post
     """
     if cross_results:
         # Use the new institutional format with full pick data
@@ -667,13 +616,14 @@ def post_meta_to_x(
     
     if not tweets:
         logger.warning("No tweets to post")
-        return False
+        return None
     
     # Log what would be posted
     for i, t in enumerate(tweets):
         logger.info(f"  🐦 Tweet {i+1} ({len(t)} chars): {t[:100]}...")
     
-    result = post_thread(tweets, scan_timestamp=scan_timestamp, session_label=session_label)
+    result = post_thread(tweets, scan_timestamp=scan_timestamp, session_label=session_label,
+                         on_first_tweet=on_first_tweet)
     return result is not None
 
 
@@ -1113,18 +1063,9 @@ def check_and_post_milestones(min_profit_pct: float = 50.0) -> Dict[str, Any]:
         cache_key = (scan_date, session_label)
         if cache_key not in scan_posts:
             # Try to find scan timestamp from cross_analysis files
-            from pathlib import Path
-            import json
-            output_dir = Path(__file__).parent.parent / "output"
-            cross_file = output_dir / f"cross_analysis_{scan_date.replace('-', '')}.json"
-            scan_timestamp = None
-            if cross_file.exists():
-                try:
-                    with open(cross_file) as f:
-                        cross_data = json.load(f)
-                    scan_timestamp = cross_data.get("timestamp", "")
-                except:
-                    pass
+            from artifact_store import get_store
+            cross_data = get_store().read("cross_analysis", stamp=scan_date.replace('-', ''), default={})
+            scan_timestamp = cross_data.get("timestamp", "") if isinstance(cross_data, dict) else None
             
             if scan_timestamp:
                 original_tweet_id = _get_x_post_id(scan_timestamp, session_label)
@@ -0,0 +1,66 @@
+"""
+Meta Engine Rate Limiter
+========================
+Thread-safe token bucket shared by every concurrent fetcher that talks to
+the same API, so N worker threads together stay under the provider's
+request rate instead of each sleeping on its own schedule.
+
+  - acquire() blocks until a token is available (tokens refill
+    continuously at `rate` per second, up to `burst`)
+  - one process-wide bucket per API name (polygon_limiter())
+
+Polygon's rate is POLYGON_MAX_RPS (default 5 req/s, the paid-plan figure
+the serial loops used to approximate with sleeps).
+
+Usage:
+    from rate_limiter import polygon_limiter
+    limiter = polygon_limiter()
+    with ThreadPoolExecutor(8) as pool:
+        ...  # each task: limiter.acquire(); requests.get(...)
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+
+class RateLimiter:
+    """Token bucket: `rate` tokens/second, at most `burst` banked."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = max(float(rate), 0.001)
+        self.burst = max(int(burst if burst is not None else max(1, round(self.rate))), 1)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1):
+        """Block until `tokens` can be spent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(name: str, rate: float, burst: Optional[int] = None) -> RateLimiter:
+    """Process-wide limiter for `name` (first caller's rate wins)."""
+    with _limiters_lock:
+        if name not in _limiters:
+            _limiters[name] = RateLimiter(rate, burst)
+        return _limiters[name]
+
+
+def polygon_limiter() -> RateLimiter:
+    """Shared limiter for all Polygon REST calls."""
+    return get_limiter("polygon", float(os.getenv("POLYGON_MAX_RPS", "5")))
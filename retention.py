@@ -0,0 +1,103 @@
+"""
+Meta Engine Retention Manager
+=============================
+Nightly tiering for output/ and logs/ so directory listings, backups and
+the remaining glob-based readers stay fast as months of runs pile up.
+
+  - output/: catalogued artifacts older than META_ARTIFACT_HOT_DAYS
+    (default 14) move into one zip per day under output/archive/ via
+    ArtifactStore.archive(); they stay queryable through
+    ArtifactStore.catalog() / read(name, stamp).
+  - logs/: *.log files not modified for META_LOG_HOT_DAYS (default 7)
+    are gzip-compressed in place (foo.log -> foo.log.gz, mtime kept).
+
+Scheduled nightly by scheduler.py; also runnable by hand:
+    python retention.py              # apply configured thresholds
+    python retention.py --dry-run    # report what would be moved
+"""
+
+import gzip
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from config import MetaConfig
+
+logger = logging.getLogger("Retention")
+
+
+def compress_logs(log_dir: Path, older_than_days: int, dry_run: bool = False) -> Dict[str, int]:
+    """Gzip every *.log in `log_dir` untouched for `older_than_days`."""
+    stats = {"files": 0, "bytes_before": 0, "bytes_after": 0}
+    log_dir = Path(log_dir)
+    if not log_dir.is_dir():
+        return stats
+    cutoff = time.time() - older_than_days * 86400
+    for path in sorted(log_dir.glob("*.log")):
+        st = path.stat()
+        if st.st_mtime >= cutoff:
+            continue
+        stats["files"] += 1
+        stats["bytes_before"] += st.st_size
+        if dry_run:
+            continue
+        target = path.with_name(path.name + ".gz")
+        tmp = target.with_name(target.name + ".tmp")
+        with open(path, "rb") as src, gzip.open(tmp, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.utime(tmp, (st.st_atime, st.st_mtime))
+        os.replace(tmp, target)
+        path.unlink()
+        stats["bytes_after"] += target.stat().st_size
+    return stats
+
+
+def archive_artifacts(output_dir: Path, older_than_days: int, dry_run: bool = False) -> Dict[str, int]:
+    """Move cold catalogued artifacts into per-day zips (see ArtifactStore.archive)."""
+    from artifact_store import ArtifactStore
+
+    return ArtifactStore(output_dir).archive(older_than_days, dry_run=dry_run)
+
+
+def run_retention(
+    artifact_days: Optional[int] = None,
+    log_days: Optional[int] = None,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """Apply both tiers with the configured (or given) thresholds."""
+    artifact_days = MetaConfig.ARTIFACT_HOT_DAYS if artifact_days is None else artifact_days
+    log_days = MetaConfig.LOG_HOT_DAYS if log_days is None else log_days
+    result: Dict[str, Any] = {"dry_run": dry_run}
+    try:
+        result["artifacts"] = archive_artifacts(Path(MetaConfig.OUTPUT_DIR), artifact_days, dry_run)
+    except Exception as e:
+        logger.warning(f"⚠️ Artifact archiving failed: {e}")
+        result["artifacts"] = {"error": str(e)}
+    try:
+        result["logs"] = compress_logs(Path(MetaConfig.LOGS_DIR), log_days, dry_run)
+    except Exception as e:
+        logger.warning(f"⚠️ Log compression failed: {e}")
+        result["logs"] = {"error": str(e)}
+    logs = result["logs"]
+    if "files" in logs and not dry_run:
+        logger.info(
+            f"🗜️ Compressed {logs['files']} logs "
+            f"({logs['bytes_before'] / 1e6:.1f} MB → {logs['bytes_after'] / 1e6:.1f} MB)"
+        )
+    return result
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s")
+    parser = argparse.ArgumentParser(description="Meta Engine retention (archive artifacts, compress logs)")
+    parser.add_argument("--artifact-days", type=int, help=f"Hot window for output/ (default {MetaConfig.ARTIFACT_HOT_DAYS})")
+    parser.add_argument("--log-days", type=int, help=f"Hot window for logs/ (default {MetaConfig.LOG_HOT_DAYS})")
+    parser.add_argument("--dry-run", action="store_true", help="Report only, move nothing")
+    args = parser.parse_args()
+
+    print(run_retention(args.artifact_days, args.log_days, args.dry_run))
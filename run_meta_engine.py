@@ -10,6 +10,9 @@ Usage:
     # Force run (even on weekends/holidays):
     python run_meta_engine.py --force
     
+    # Intraday rescan — recompute only symbols whose inputs changed:
+    python run_meta_engine.py --rescan
+    
     # Run only specific steps:
     python run_meta_engine.py --scan-only       # Just get Top 10s
     python run_meta_engine.py --no-email         # Skip email
@@ -21,6 +24,9 @@ Usage:
     
     # Check configuration:
     python run_meta_engine.py --check
+    
+    # Scheduler + last run status (fast — no pipeline imports):
+    python run_meta_engine.py --status
 """
 
 import sys
@@ -134,6 +140,34 @@ def check_config():
     print()
 
 
+def print_status():
+    """
+    Print scheduler status and the most recent run artifact.
+    
+    Deliberately cheap: no engine, analysis or notification modules are
+    imported, so this stays within the startup budget tracked by
+    monitoring/import_audit.py.
+    """
+    from scheduler import status as scheduler_status
+    from config import MetaConfig
+    
+    print("\n🏛️  META ENGINE — Status")
+    print("=" * 50)
+    scheduler_status()
+    
+    from artifact_store import ArtifactStore
+    output_dir = Path(MetaConfig.OUTPUT_DIR)
+    runs = (ArtifactStore(output_dir).catalog("meta_engine_run", limit=1, newest_first=True)
+            if output_dir.exists() else [])
+    if runs:
+        last = runs[0]
+        when = datetime.fromisoformat(last["timestamp"])
+        print(f"🕒 Last run: {last['path'].name} ({when.strftime('%Y-%m-%d %I:%M %p')})")
+    else:
+        print("🕒 Last run: none found")
+    print()
+
+
 def main():
     import argparse
     
@@ -145,8 +179,10 @@ Examples:
   python run_meta_engine.py                  # Run full pipeline
   python run_meta_engine.py --force          # Force run on weekends
   python run_meta_engine.py --check          # Check configuration
+  python run_meta_engine.py --status         # Scheduler + last run status
   python run_meta_engine.py --schedule       # Start 9:35 AM scheduler
   python run_meta_engine.py --scan-only      # Only get Top 10s
+  python run_meta_engine.py --rescan         # Incremental intraday rescan
         """
     )
     
@@ -154,10 +190,14 @@ Examples:
                        help="Run even on non-trading days")
     parser.add_argument("--check", action="store_true",
                        help="Check configuration and exit")
+    parser.add_argument("--status", action="store_true",
+                       help="Show scheduler and last-run status and exit")
     parser.add_argument("--schedule", action="store_true",
                        help="Start the 9:35 AM ET scheduler daemon")
     parser.add_argument("--scan-only", action="store_true",
                        help="Only scan for Top 10s, skip notifications")
+    parser.add_argument("--rescan", action="store_true",
+                       help="Incremental rescan: recompute changed symbols only, no notifications")
     parser.add_argument("--no-email", action="store_true",
                        help="Skip sending email")
     parser.add_argument("--no-telegram", action="store_true",
@@ -171,11 +211,26 @@ Examples:
         check_config()
         return
     
+    if args.status:
+        print_status()
+        return
+    
     if args.schedule:
         from scheduler import start_scheduler
         start_scheduler()
         return
     
+    if args.rescan:
+        from meta_engine import run_incremental_rescan
+        result = run_incremental_rescan(force=args.force)
+        inc = result.get("incremental", {})
+        if result.get("status") == "completed":
+            print(f"\n♻️  Rescan completed: {inc.get('reused', 0)} reused, "
+                  f"{inc.get('recomputed', 0)} recomputed ({result.get('elapsed_sec', 0)}s)")
+        else:
+            print(f"\n⏭️  Rescan {result.get('status')}: {result.get('reason', result.get('error', ''))}")
+        return
+    
     # Run full pipeline
     from meta_engine import run_meta_engine
     
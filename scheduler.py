@@ -175,7 +175,7 @@ def _scheduled_run(session_label: str = ""):
             cwd=str(META_DIR),
             capture_output=True,
             text=True,
-            timeout=900,  # 15 minute timeout — generous for API calls
+            timeout=MetaConfig.RUN_TIMEOUT_SEC,  # 15 minutes by default — generous for API calls
         )
 
         if proc.returncode == 0:
@@ -263,6 +263,27 @@ def _start_dashboard_thread():
         logger.warning(f"  Flask dashboard skipped: {e} (non-critical)")
 
 
+def _start_outbox_dispatcher():
+    """Resume delivery of queued notifications (crashed/interrupted runs)."""
+    try:
+        from notifications.outbox import start_dispatcher
+        start_dispatcher()
+        logger.info("  📤 Notification outbox dispatcher started")
+    except Exception as e:
+        logger.warning(f"  Notification outbox dispatcher skipped: {e} (non-critical)")
+
+
+def _start_mover_monitor():
+    """Start the intraday mover monitor thread (coverage gaps between scans)."""
+    if MetaConfig.MOVER_MONITOR_POLL_SEC <= 0:
+        return
+    try:
+        from engine_adapters.mover_monitor import start_mover_monitor
+        start_mover_monitor(poll_sec=MetaConfig.MOVER_MONITOR_POLL_SEC)
+    except Exception as e:
+        logger.warning(f"  Mover monitor skipped: {e} (non-critical)")
+
+
 def _start_streamlit_dashboard():
     """Start the Streamlit trading dashboard as a subprocess (port 8511)."""
     try:
@@ -427,6 +448,8 @@ def start_scheduler():
     # Start dashboards in background
     _start_dashboard_thread()         # Flask on :5050
     _start_streamlit_dashboard()      # Streamlit on :8511
+    _start_outbox_dispatcher()        # Retries pending Email/Telegram/X
+    _start_mover_monitor()            # Live coverage-gap events
     
     # Write PID
     _write_pid()
@@ -530,6 +553,92 @@ def start_scheduler():
     )
     logger.info("  ✅ Job scheduled: Live backtest runner every 30 min (market hours)")
 
+    # ── Job 6b: Incremental intraday rescan (opt-in, market hours) ──
+    # Recomputes only symbols whose pick / lens sources / price changed
+    # since the last scan; skips itself while a full run holds the lock.
+    if MetaConfig.RESCAN_INTERVAL_MIN > 0:
+        def _run_incremental_rescan():
+            from trading.nyse_calendar import NYSE_EARLY_CLOSE, is_trading_day
+            now_et = datetime.now(EST)
+            if not is_trading_day(now_et.date()):
+                return
+            t = now_et.hour * 60 + now_et.minute
+            close = 780 if now_et.date() in NYSE_EARLY_CLOSE else 960  # 1:00 / 4:00 PM ET
+            if not (570 <= t <= close):
+                return
+            try:
+                proc = subprocess.run(
+                    [VENV_PYTHON, str(META_DIR / "meta_engine.py"), "--rescan"],
+                    cwd=str(META_DIR),
+                    capture_output=True,
+                    text=True,
+                    timeout=MetaConfig.RESCAN_INTERVAL_MIN * 60,
+                )
+                if proc.returncode != 0:
+                    logger.warning(f"Incremental rescan exited {proc.returncode}: "
+                                   f"{(proc.stderr or '')[-300:]}")
+            except Exception as e:
+                logger.warning(f"Incremental rescan failed: {e}")
+
+        scheduler.add_job(
+            _run_incremental_rescan,
+            trigger=IntervalTrigger(
+                minutes=MetaConfig.RESCAN_INTERVAL_MIN,
+                timezone=EST,
+            ),
+            id="incremental_rescan",
+            name=f"Incremental Rescan (every {MetaConfig.RESCAN_INTERVAL_MIN} min, market hours)",
+            misfire_grace_time=MetaConfig.RESCAN_INTERVAL_MIN * 60,
+            max_instances=1,
+        )
+        logger.info(f"  ✅ Job scheduled: Incremental rescan every "
+                    f"{MetaConfig.RESCAN_INTERVAL_MIN} min (market hours)")
+
+    # ── Job 6c: Nightly pick warehouse ETL (before retention archives) ──
+    def _run_warehouse_etl():
+        try:
+            from warehouse import build
+            build()
+        except Exception as e:
+            logger.warning(f"Nightly warehouse ETL failed: {e}")
+
+    wh_hour, wh_minute = map(int, MetaConfig.WAREHOUSE_TIME_ET.split(":"))
+    scheduler.add_job(
+        _run_warehouse_etl,
+        trigger=CronTrigger(
+            hour=wh_hour, minute=wh_minute,
+            timezone=EST,
+        ),
+        id="nightly_warehouse_etl",
+        name=f"Nightly Warehouse ETL ({MetaConfig.WAREHOUSE_TIME_ET} ET)",
+        misfire_grace_time=3600,
+        max_instances=1,
+    )
+    logger.info(f"  ✅ Job scheduled: Nightly warehouse ETL at {MetaConfig.WAREHOUSE_TIME_ET} ET")
+
+    # ── Job 6d: Nightly retention (archive cold artifacts, compress logs) ──
+    def _run_retention():
+        try:
+            from retention import run_retention
+            run_retention()
+        except Exception as e:
+            logger.warning(f"Nightly retention failed: {e}")
+
+    ret_hour, ret_minute = map(int, MetaConfig.RETENTION_TIME_ET.split(":"))
+    scheduler.add_job(
+        _run_retention,
+        trigger=CronTrigger(
+            hour=ret_hour, minute=ret_minute,
+            timezone=EST,
+        ),
+        id="nightly_retention",
+        name=f"Nightly Retention ({MetaConfig.RETENTION_TIME_ET} ET)",
+        misfire_grace_time=3600,
+        max_instances=1,
+    )
+    logger.info(f"  ✅ Job scheduled: Nightly retention at {MetaConfig.RETENTION_TIME_ET} ET "
+                f"(artifacts > {MetaConfig.ARTIFACT_HOT_DAYS}d, logs > {MetaConfig.LOG_HOT_DAYS}d)")
+
     # ── Job 7: Code-freshness watchdog (every 15 min) ──
     # If code changes are detected (git commit/push), the scheduler
     # self-restarts so it always runs the latest version.
@@ -567,9 +676,11 @@ def start_scheduler():
             run_start = now_et.replace(hour=start_h, minute=start_m, second=0)
             run_end = now_et.replace(hour=end_h, minute=end_m, second=0)
             if run_start <= now_et <= run_end:
+                from artifact_store import ArtifactStore
+                store = ArtifactStore(META_DIR / "output")
                 today_str = now_et.strftime('%Y%m%d')
-                puts_file = META_DIR / "output" / f"puts_top10_{today_str}.json"
-                moon_file = META_DIR / "output" / f"moonshot_top10_{today_str}.json"
+                puts_file = store.path_for("puts_top10", today_str)
+                moon_file = store.path_for("moonshot_top10", today_str)
                 if not puts_file.exists() and not moon_file.exists():
                     logger.warning(
                         f"⚠️ MISSED RUN RECOVERY: {label} run was missed "
@@ -0,0 +1,8 @@
+"""Make the Meta Engine root importable for the test suite (python -m pytest tests)."""
+
+import sys
+from pathlib import Path
+
+_META_DIR = str(Path(__file__).resolve().parent.parent)
+if _META_DIR not in sys.path:
+    sys.path.insert(0, _META_DIR)
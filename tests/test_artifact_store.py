@@ -0,0 +1,51 @@
+"""artifact_store.dumps must write the same bytes with and without orjson."""
+
+from datetime import date, datetime
+
+import pytest
+import pytz
+
+import artifact_store
+
+
+def _payload():
+    np = pytest.importorskip("numpy")
+    ts = pytz.timezone("US/Eastern").localize(datetime(2026, 3, 5, 9, 35, 12))
+    return {
+        "timestamp": ts,
+        "day": date(2026, 3, 5),
+        "puts": [
+            {"symbol": "AAA", "score": 0.8125, "note": None, "gap": float("nan"),
+             "bars": np.array([1.5, float("nan")]), "count": np.int64(3), "flag": np.bool_(True)},
+            {"symbol": "BBB", "score": float("inf"), "tags": ("a", "b"), "ratio": -float("inf")},
+        ],
+        "summary": {"n": 2, "nested": [{"x": None}, [1, 2.5, float("nan")]]},
+    }
+
+
+@pytest.fixture
+def stdlib_only(monkeypatch):
+    monkeypatch.setattr(artifact_store, "_orjson", None)
+
+
+def test_stdlib_fallback_matches_orjson(monkeypatch):
+    pytest.importorskip("orjson")
+    data = _payload()
+    fast = artifact_store.dumps(data)
+    monkeypatch.setattr(artifact_store, "_orjson", None)
+    assert artifact_store.dumps(data) == fast
+
+
+def test_non_finite_and_datetimes(stdlib_only):
+    decoded = artifact_store.loads(artifact_store.dumps(_payload()))
+    assert decoded["timestamp"] == "2026-03-05 09:35:12-05:00"
+    assert decoded["day"] == "2026-03-05"
+    aaa, bbb = decoded["puts"]
+    assert aaa["gap"] is None and aaa["bars"] == [1.5, None]
+    assert aaa["count"] == 3 and aaa["flag"] is True
+    assert bbb["score"] is None and bbb["ratio"] is None
+    assert decoded["summary"]["nested"] == [{"x": None}, [1, 2.5, None]]
+
+
+def test_loads_accepts_legacy_nan_literals():
+    assert artifact_store.loads(b'{"a":NaN,"b":[Infinity]}')["b"][0] == float("inf")
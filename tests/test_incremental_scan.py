@@ -0,0 +1,58 @@
+"""Incremental Smart Money reuse must match a full re-analysis."""
+
+import copy
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from analysis.incremental_scan import SmartMoneyReuse
+from engine_adapters.smart_money_columnar import _synthetic_sources
+from engine_adapters.smart_money_scanner import MIN_CONVICTION_THRESHOLD, _analyze_symbol
+
+
+def _passed(symbols, sources):
+    out = [_analyze_symbol(sym, sources) for sym in symbols]
+    return [a for a in out if a["direction"] != "NEUTRAL" and a["conviction"] >= MIN_CONVICTION_THRESHOLD]
+
+
+def _scan(tmp_path, symbols, sources, reuse):
+    files = {name: tmp_path / f"{name}.json" for name in sources}
+    sm = SmartMoneyReuse(files, reuse=reuse, state_file=tmp_path / "state.json")
+    todo = sm.plan(symbols, sources)
+    passed = sm.merge(_passed(todo, sources))
+    sm.save()
+    return sm, sorted(passed, key=lambda a: a["symbol"])
+
+
+def test_reuse_matches_full_scan(tmp_path):
+    symbols, sources = _synthetic_sources(300, seed=11)
+    for name in sources:
+        (tmp_path / f"{name}.json").write_text("v1")
+    _, first = _scan(tmp_path, symbols, sources, reuse=False)
+
+    # Nothing changed on disk: everything is reused
+    sm, again = _scan(tmp_path, symbols, sources, reuse=True)
+    assert sm.stats == {"reused": len(symbols), "recomputed": 0}
+    assert again == first
+
+    # One flow record and one new ticker change; only those are re-analysed
+    sources = copy.deepcopy(sources)
+    sym = next(iter(sources["flow"]))
+    sources["flow"][sym] = sources["flow"][sym][:1]
+    (tmp_path / "flow.json").write_text("v2")
+    symbols = symbols + ["NEWT"]
+    sm, inc = _scan(tmp_path, symbols, sources, reuse=True)
+    assert set(sm.plan(symbols, sources)) <= {sym, "NEWT"}
+    assert inc == sorted(_passed(symbols, sources), key=lambda a: a["symbol"])
+
+
+def test_merge_returns_copies(tmp_path):
+    symbols, sources = _synthetic_sources(100, seed=3)
+    _scan(tmp_path, symbols, sources, reuse=False)
+    _, passed = _scan(tmp_path, symbols, sources, reuse=True)
+    for a in passed:
+        a["signals"].append("FLIPPED_from_BULL_penalized")
+        a["conviction"] *= 0.7
+    _, again = _scan(tmp_path, symbols, sources, reuse=True)
+    assert not any("FLIPPED_from_BULL_penalized" in a["signals"] for a in again)
@@ -0,0 +1,41 @@
+"""Streaming indicator readings must equal a recompute over the fetched window."""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from analysis.indicator_state import IndicatorStore, _full_recompute
+from analysis.indicators import _synthetic_bars
+
+
+def test_sliding_window_matches_per_window_values(tmp_path):
+    data = _synthetic_bars(40, seed=7)
+    path = tmp_path / "state.json"
+    window = 30
+    for day in range(1, 71):
+        store = IndicatorStore(path)
+        for sym, bars in data.items():
+            if day > len(bars):
+                continue
+            lo = max(0, day - window)
+            for drift in (0.99, 1.01):
+                live = dict(bars[day - 1], c=bars[day - 1]["c"] * drift)
+                fetched = bars[lo:day - 1] + [live]
+                assert store.sync(sym, fetched).readings() == _full_recompute(fetched), (sym, day)
+            store.sync(sym, bars[lo:day])
+        store.save()
+
+
+def test_intraday_rescan_reuses_state(tmp_path):
+    data = _synthetic_bars(20, seed=1)
+    store = IndicatorStore(tmp_path / "state.json")
+    for sym, bars in data.items():
+        store.sync(sym, bars)
+    store.save()
+
+    store = IndicatorStore(tmp_path / "state.json")
+    for sym, bars in data.items():
+        live = dict(bars[-1], c=bars[-1].get("c", 0) * 1.02) if bars else None
+        window = bars[:-1] + [live] if bars else bars
+        assert store.sync(sym, window).readings() == _full_recompute(window)
+    assert store.stats["rebuilt"] == sum(1 for b in data.values() if not b)  # nothing to resume
@@ -0,0 +1,61 @@
+"""compute_all() must match the per-symbol indicator helpers bit-for-bit."""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from analysis.chart_generator import _rsi_panel
+from analysis.indicators import (
+    _rsi_chart_ref,
+    _same,
+    _synthetic_bars,
+    atr_pct_last,
+    atr_sma_last,
+    atr_wilder_last,
+    bollinger_last,
+    compute_all,
+    ema_last,
+    macd_last,
+    rsi_last,
+)
+
+
+def _scalar(bars):
+    closes = [b.get("c", 0) for b in bars]
+    return {
+        "bars": len(bars),
+        "ema9": ema_last(closes, 9),
+        "ema20": ema_last(closes, 20),
+        "rsi14": rsi_last(closes, 14),
+        "macd": macd_last(closes),
+        "bollinger": bollinger_last(closes, 20),
+        "atr14": atr_wilder_last(bars, 14),
+        "atr_sma14": atr_sma_last(bars, 14),
+        "atr_pct14": atr_pct_last(bars, 14),
+    }
+
+
+@pytest.fixture(scope="module")
+def data():
+    return _synthetic_bars(80, seed=5)
+
+
+def test_readings_match_scalar_helpers_on_every_prefix(data):
+    iset = compute_all(data)
+    for sym, bars in data.items():
+        assert _same(iset.at(sym), _scalar(bars)), sym
+        for n in range(len(bars)):
+            assert _same(iset.at(sym, n), _scalar(bars[:n])), (sym, n)
+
+
+def test_chart_rsi_matches_old_loop(data):
+    iset = compute_all(data)
+    for sym, bars in data.items():
+        closes = [b["c"] for b in bars]
+        assert _rsi_panel(iset.series(sym)["rsi14"]) == _rsi_chart_ref(closes), sym
+
+
+def test_series_cover_each_symbols_bars(data):
+    iset = compute_all(data)
+    for sym, bars in data.items():
+        assert all(len(v) == len(bars) for v in iset.series(sym).values())
@@ -0,0 +1,45 @@
+"""Columnar META-SCORE must match puts_adapter._compute_meta_score exactly."""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from engine_adapters.puts_adapter import _compute_ews_percentiles, _compute_meta_score
+from engine_adapters.puts_meta_score import _synthetic_pool, compute_meta_scores, rank_order
+
+
+def _scalar(candidates, ews, live_prices, pct, sector, earnings, pm):
+    return [
+        _compute_meta_score(c, ews, lp, pct, sector, earnings, pm)
+        for c, lp in zip(candidates, live_prices)
+    ]
+
+
+@pytest.mark.parametrize("pm", [False, True], ids=["AM", "PM"])
+@pytest.mark.parametrize("n", [1, 100, 2000])
+def test_scores_and_ranking_identical(n, pm):
+    candidates, live_prices, ews, earnings, sector = _synthetic_pool(n, seed=n)
+    pct = _compute_ews_percentiles(ews)
+    scalar = _scalar(candidates, ews, live_prices, pct, sector, earnings, pm)
+    vec = compute_meta_scores(candidates, ews, live_prices, pct, sector, earnings, pm)
+    assert vec == scalar
+    assert rank_order(vec) == sorted(range(n), key=lambda i: scalar[i], reverse=True)
+
+
+def test_sparse_and_malformed_inputs():
+    candidates = [
+        {"symbol": "AAA"},
+        {"symbol": "BBB", "tier": None, "signals": "dark_pool_violence", "price": None},
+        {"symbol": "CCC", "pre_signals": None, "_cached_price": 0, "signal_count": 12},
+        {"symbol": "DDD", "tier": "unknown", "is_dui": True, "batch": 0, "price": 12.5},
+    ]
+    ews = {"AAA": {"ipi": 0.9}, "BBB": "not-a-dict", "DDD": {"unique_footprints": 7}}
+    live_prices = [None, 10.0, None, 11.0]
+    pct = _compute_ews_percentiles({k: v for k, v in ews.items() if isinstance(v, dict)})
+    for pm in (False, True):
+        scalar = _scalar(candidates, ews, live_prices, pct, {"CCC"}, {"DDD"}, pm)
+        assert compute_meta_scores(candidates, ews, live_prices, pct, {"CCC"}, {"DDD"}, pm) == scalar
+
+
+def test_empty_pool():
+    assert compute_meta_scores([], {}, []) == []
@@ -0,0 +1,44 @@
+"""Columnar smart money screen must match _analyze_ticker_multi_source exactly."""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from engine_adapters import smart_money_columnar as smc
+from engine_adapters.smart_money_scanner import MIN_CONVICTION_THRESHOLD, _analyze_symbol
+
+_NAMES = {smc.BULL: "BULLISH", smc.BEAR: "BEARISH", smc.NEUTRAL: "NEUTRAL"}
+
+
+def _passing(records):
+    return [r for r in records
+            if r["direction"] != "NEUTRAL" and r["conviction"] >= MIN_CONVICTION_THRESHOLD]
+
+
+@pytest.mark.parametrize("density", [1.0, 0.25, 0.05])
+@pytest.mark.parametrize("n", [10, 500])
+def test_screen_and_output_identical(n, density):
+    symbols, sources = smc._synthetic_sources(n, seed=n, density=density)
+    scalar = [_analyze_symbol(s, sources) for s in symbols]
+    cols = smc.score_superset(symbols, sources)
+    for rec, d, c in zip(scalar, cols["direction"], cols["conviction"]):
+        assert (rec["direction"], rec["conviction"]) == (_NAMES[int(d)], round(float(c), 4))
+    assert _passing(smc.analyze_superset(symbols, sources)) == _passing(scalar)
+
+
+def test_shard_mode_identical(monkeypatch):
+    monkeypatch.setattr(smc, "SHARD_MIN_TICKERS", 100)
+    symbols, sources = smc._synthetic_sources(300, seed=7)
+    assert smc.analyze_superset(symbols, sources, workers=2) == smc.analyze_superset(symbols, sources)
+
+
+def test_use_columnar_only_for_large_sparse_supersets():
+    _, dense = smc._synthetic_sources(smc.COLUMNAR_MIN_TICKERS, density=1.0)
+    symbols, sparse = smc._synthetic_sources(smc.COLUMNAR_MIN_TICKERS, density=0.1)
+    assert smc.use_columnar(symbols, sparse)
+    assert not smc.use_columnar(symbols, dense)
+    assert not smc.use_columnar(symbols[:100], sparse)
+
+
+def test_empty_superset():
+    assert smc.analyze_superset([], {k: {} for k in smc._COVERAGE_SOURCES}) == []
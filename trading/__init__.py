@@ -2,8 +2,17 @@
 Meta Engine — Automated Options Trading Module
 ================================================
 Executes top 3 PUT and CALL picks via Alpaca paper trading.
-"""
 
-from .executor import execute_trades, check_and_manage_positions
+The executor (and its HTTP stack) is loaded lazily on first attribute
+access so that light consumers such as ``trading.trade_db`` or
+``trading.nyse_calendar`` don't pay for it at import time.
+"""
 
 __all__ = ["execute_trades", "check_and_manage_positions"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        from . import executor
+        return getattr(executor, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -283,6 +283,16 @@ def api_pnl_chart():
     return jsonify(db.get_daily_pnl_series())
 
 
+@app.route("/api/win-rates")
+def api_win_rates():
+    days = int(request.args.get("days", 180))
+    return jsonify({
+        "by_engine": db.get_win_rates("source_engine", days),
+        "by_session": db.get_win_rates("session", days),
+        "rolling": db.get_rolling_stats(),
+    })
+
+
 @app.route("/api/account")
 def api_account():
     try:
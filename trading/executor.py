@@ -408,6 +408,16 @@ def _execute_single_trade(
     if not symbol:
         return None
 
+    # ── Move Potential from today's MPS table (no refetch) ─
+    if pick.get("_move_potential_score") is None:
+        try:
+            from trading.move_potential import lookup_move_potential
+            cached_mps = lookup_move_potential(symbol)
+            if cached_mps:
+                pick["_move_potential_score"], pick["_move_potential_components"] = cached_mps
+        except Exception as e:
+            logger.debug(f"MPS table lookup failed for {symbol}: {e}")
+
     # ── Grade-based position sizing ───────────────────
     grade, contracts = _determine_grade(pick, force_minimum=force_minimum)
     pick["_grade"] = grade  # Store for upstream reporting
@@ -715,6 +725,10 @@ def check_and_manage_positions(db: TradeDB = None, client: AlpacaClient = None)
       • Stop loss at 50 % drawdown
       • Time stop: close 1 day before expiry
     Called on every scan run (twice daily).
+
+    DB writes are collected and applied with update_trades_bulk: one
+    commit for the order sync (step 2 must see newly filled trades) and
+    one for the whole position pass.
     """
     if db is None:
         db = TradeDB()
@@ -724,6 +738,23 @@ def check_and_manage_positions(db: TradeDB = None, client: AlpacaClient = None)
     result = {"checked": 0, "closed": 0, "errors": 0, "details": []}
 
     # 1. Sync pending orders (check if filled)
+    updates: List[Tuple[str, Dict]] = []
+    try:
+        _sync_pending_orders(db, client, updates)
+    finally:
+        db.update_trades_bulk(updates)
+
+    # 2. Check open positions for exit signals
+    updates = []
+    try:
+        _manage_open_positions(db, client, result, updates)
+    finally:
+        db.update_trades_bulk(updates)
+    return result
+
+
+def _sync_pending_orders(db: TradeDB, client: AlpacaClient, updates: List[Tuple[str, Dict]]):
+    """Queue status updates for pending entry orders that filled or died."""
     pending = db.get_pending_trades()
     for trade in pending:
         order_id = trade.get("entry_order_id", "")
@@ -734,31 +765,38 @@ def check_and_manage_positions(db: TradeDB = None, client: AlpacaClient = None)
             status = order.get("status", "")
             if status == "filled":
                 filled_price = float(order.get("filled_avg_price", 0) or 0)
-                db.update_trade(trade["trade_id"],
-                                status="open",
-                                entry_price=filled_price or trade.get("entry_price", 0),
-                                filled_at=order.get("filled_at", ""))
+                updates.append((trade["trade_id"], dict(
+                    status="open",
+                    entry_price=filled_price or trade.get("entry_price", 0),
+                    filled_at=order.get("filled_at", ""))))
                 logger.info(f"  ✅ Order filled: {trade['symbol']} @ ${filled_price:.2f}")
             elif status in ("cancelled", "expired", "rejected"):
-                db.update_trade(trade["trade_id"],
-                                status="cancelled",
-                                exit_reason=f"order_{status}")
+                updates.append((trade["trade_id"], dict(
+                    status="cancelled",
+                    exit_reason=f"order_{status}")))
                 logger.info(f"  ❌ Order {status}: {trade['symbol']}")
         except Exception as e:
             logger.debug(f"  Order check failed for {trade['trade_id']}: {e}")
 
-    # 2. Check open positions for exit signals
+
+def _manage_open_positions(
+    db: TradeDB,
+    client: AlpacaClient,
+    result: Dict,
+    updates: List[Tuple[str, Dict]],
+):
+    """Apply exit rules to open positions, queueing DB updates into `updates`."""
     open_trades = db.get_open_positions()
     if not open_trades:
         logger.info("  No open positions to manage.")
-        return result
+        return
 
     # Get live positions from Alpaca
     try:
         live_positions = {p["symbol"]: p for p in client.get_positions()}
     except Exception as e:
         logger.error(f"  Failed to get Alpaca positions: {e}")
-        return result
+        return
 
     today = date.today()
 
@@ -778,15 +816,14 @@ def check_and_manage_positions(db: TradeDB = None, client: AlpacaClient = None)
                 if exp_date < today:
                     contracts = int(trade.get("contracts", 5))
                     pnl_expired = -entry_px * contracts * 100  # Full loss of premium
-                    db.update_trade(
-                        trade["trade_id"],
+                    updates.append((trade["trade_id"], dict(
                         status="closed",
                         exit_price=0.0,
                         exit_reason="expired",
                         pnl=round(pnl_expired, 2),
                         pnl_pct=-100.0,
                         closed_at=datetime.utcnow().isoformat(),
-                    )
+                    )))
                     result["closed"] += 1
                     result["details"].append({
                         "symbol": trade["symbol"],
@@ -823,9 +860,9 @@ def check_and_manage_positions(db: TradeDB = None, client: AlpacaClient = None)
         # FEB 16 INVARIANT: Long options max loss = -100% of premium
         pnl_pct = max(pnl_pct, -100.0)
 
-        db.update_trade(trade["trade_id"],
-                        current_price=current_px, pnl=round(pnl, 2),
-                        pnl_pct=round(pnl_pct, 1))
+        updates.append((trade["trade_id"], dict(
+            current_price=current_px, pnl=round(pnl, 2),
+            pnl_pct=round(pnl_pct, 1))))
 
         # ── Exit Rules ────────────────────────────────
         exit_reason = None
@@ -845,12 +882,11 @@ def check_and_manage_positions(db: TradeDB = None, client: AlpacaClient = None)
                 
                 # Note: Alpaca API doesn't support partial closes directly
                 # We'll mark it in DB and let full close happen at 3x
-                db.update_trade(
-                    trade["trade_id"],
+                updates.append((trade["trade_id"], dict(
                     partial_profit_taken=True,
                     partial_profit_price=current_px,
                     partial_profit_pct=pnl_pct,
-                )
+                )))
                 partial_exit = True
             except Exception as e:
                 logger.error(f"  ❌ Failed to record partial profit for {occ}: {e}")
@@ -887,15 +923,14 @@ def check_and_manage_positions(db: TradeDB = None, client: AlpacaClient = None)
         if exit_reason:
             try:
                 client.close_position(occ)
-                db.update_trade(
-                    trade["trade_id"],
+                updates.append((trade["trade_id"], dict(
                     status="closed",
                     exit_price=current_px,
                     exit_reason=exit_reason,
                     pnl=round(pnl, 2),
                     pnl_pct=round(pnl_pct, 1),
                     closed_at=datetime.utcnow().isoformat(),
-                )
+                )))
                 result["closed"] += 1
                 result["details"].append({
                     "symbol": trade["symbol"],
@@ -906,8 +941,6 @@ def check_and_manage_positions(db: TradeDB = None, client: AlpacaClient = None)
                 logger.error(f"  ❌ Failed to close {occ}: {e}")
                 result["errors"] += 1
 
-    return result
-
 
 # ═══════════════════════════════════════════════════════
 # Main entry point
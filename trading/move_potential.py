@@ -13,14 +13,20 @@ Components:
   3. Catalyst Proximity  — earnings within 3 days → boosted move probability
 
 FEB 16, 2026 — Initial implementation.
+Universe engine (get_move_potential_table) — no symbol cap; concurrent,
+rate-limited fetch; vectorized scoring; one table per trading day.
 """
 
 import os
+import json
 import logging
 import requests
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from analysis.indicators import atr_pct_last
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,33 +73,7 @@ def compute_atr_pct(bars: List[Dict], period: int = 14) -> float:
     
     Returns: float (e.g., 0.04 = 4% average daily range)
     """
-    if len(bars) < period + 1:
-        return 0.0
-
-    trs = []
-    for i in range(1, len(bars)):
-        h = bars[i].get("h", 0)
-        l = bars[i].get("l", 0)
-        pc = bars[i - 1].get("c", 0)
-        if pc <= 0:
-            continue
-        tr = max(h - l, abs(h - pc), abs(l - pc))
-        trs.append(tr)
-
-    if len(trs) < period:
-        return 0.0
-
-    # EMA-style ATR
-    atr = sum(trs[:period]) / period
-    for tr in trs[period:]:
-        atr = (atr * (period - 1) + tr) / period
-
-    # Convert to percentage of latest close
-    latest_close = bars[-1].get("c", 0)
-    if latest_close <= 0:
-        return 0.0
-
-    return atr / latest_close
+    return atr_pct_last(bars, period)
 
 
 def compute_big_move_frequency(bars: List[Dict], threshold_pct: float = 3.0, lookback: int = 60) -> float:
@@ -130,9 +110,12 @@ def compute_move_potential_score(
     bars: List[Dict],
     has_earnings_catalyst: bool = False,
     period: int = 14,
+    atr_pct: Optional[float] = None,
 ) -> Tuple[float, Dict[str, float]]:
     """
     Compute the Move Potential Score (0.0-1.0) from daily bars.
+    atr_pct, when given, is the precomputed ATR% of these bars (e.g. from
+    the streaming indicator state) and skips the recompute.
     
     Components and weights:
       - ATR%            50% — realized vol is the strongest predictor
@@ -150,7 +133,8 @@ def compute_move_potential_score(
     }
 
     # 1. ATR% → normalized score
-    atr_pct = compute_atr_pct(bars, period)
+    if atr_pct is None:
+        atr_pct = compute_atr_pct(bars, period)
     components["raw_atr_pct"] = atr_pct
 
     # Normalize: 2% ATR = 0.3, 4% = 0.6, 6%+ = 0.9, 8%+ = 1.0
@@ -194,37 +178,312 @@ def compute_move_potential_score(
     return max(0.0, min(score, 1.0)), components
 
 
+# ═══════════════════════════════════════════════════════
+# Universe engine — concurrent fetch, vectorized scoring, per-day table
+# ═══════════════════════════════════════════════════════
+# Bars for every requested symbol are fetched concurrently under the
+# shared Polygon rate limiter; ATR% and big-move frequency are then
+# computed for the whole set in one NumPy pass (bit-identical to the
+# per-symbol functions above). ATR% is then taken from the live streaming
+# indicator state (analysis/indicator_state.py) for each fetched window:
+# the same value, but a refetch of an unchanged window only replays its
+# last bar; the NumPy value remains when the state is unavailable. The
+# raw components are cached per trading day in data/mps_table.json, so
+# later scans — and the executor — only fetch symbols not seen yet today.
+# The composite is recomputed on every lookup because the earnings
+# (catalyst) set can change intraday.
+#
+#     python3 -m trading.move_potential --bench
+
+MPS_TABLE_FILE = Path(__file__).parent.parent / "data" / "mps_table.json"
+MPS_FETCH_WORKERS = int(os.getenv("MPS_FETCH_WORKERS", "8"))
+MPS_BAR_DAYS = 70
+
+_table_memo: Dict[str, Dict] = {}
+
+
+def _trading_day() -> str:
+    from trading.nyse_calendar import is_trading_day, prev_trading_day
+    today = datetime.now().date()
+    return (today if is_trading_day(today) else prev_trading_day(today)).isoformat()
+
+
+def fetch_bars_concurrent(
+    symbols: List[str],
+    days: int = MPS_BAR_DAYS,
+    api_key: str = "",
+    workers: int = MPS_FETCH_WORKERS,
+    fetch=None,
+    limiter=None,
+) -> Dict[str, List[Dict]]:
+    """
+    Daily bars for every symbol, fetched by a thread pool under the Polygon
+    limiter. `fetch` / `limiter` default to _fetch_daily_bars and the
+    shared polygon_limiter() (run_benchmark swaps in a simulated fetch).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from rate_limiter import polygon_limiter
+
+    if not api_key:
+        api_key = os.getenv("POLYGON_API_KEY", "") or os.getenv("MASSIVE_API_KEY", "")
+    fetch = fetch or _fetch_daily_bars
+    limiter = limiter or polygon_limiter()
+
+    def _one(sym: str) -> Tuple[str, List[Dict]]:
+        limiter.acquire()
+        return sym, fetch(sym, days=days, api_key=api_key)
+
+    if not symbols:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(symbols)))) as pool:
+        return dict(pool.map(_one, symbols))
+
+
+def compute_raw_components(
+    bars_by_symbol: Dict[str, List[Dict]],
+    period: int = 14,
+    threshold_pct: float = 3.0,
+    lookback: int = 60,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Raw ATR% and big-move frequency for every symbol in one vectorized pass
+    (same values as compute_atr_pct / compute_big_move_frequency).
+    """
+    import numpy as np
+    from analysis.indicators import atr_pct, bars_to_matrices
+
+    symbols = list(bars_by_symbol)
+    if not symbols:
+        return {}
+    high, low, close, lengths = bars_to_matrices([bars_by_symbol[s] for s in symbols])
+    raw_atr = atr_pct(high, low, close, lengths, period)
+
+    # Big-move frequency: close-to-close returns inside the last `lookback` bars
+    big = np.zeros(len(symbols))
+    total = np.zeros(len(symbols))
+    if close.shape[1] >= 2:
+        prev, curr = close[:, :-1], close[:, 1:]
+        cols = np.arange(1, close.shape[1])[None, :]
+        start = np.maximum(lengths - lookback, 0)[:, None]
+        valid = (cols < lengths[:, None]) & (cols - 1 >= start) & (prev > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ret_pct = np.abs((curr - prev) / prev * 100)
+        total = valid.sum(axis=1)
+        big = (valid & (ret_pct >= threshold_pct)).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bmf = np.where(total > 0, big / np.maximum(total, 1), 0.0)
+
+    return {
+        sym: {"raw_atr_pct": a, "big_move_freq_raw": b, "bars": int(n)}
+        for sym, a, b, n in zip(symbols, raw_atr.tolist(), bmf.tolist(), lengths.tolist())
+    }
+
+
+def _live_atr_pct(bars_by_symbol: Dict[str, List[Dict]]) -> Dict[str, float]:
+    """ATR% of each fetched window from the live indicator state ({} if unavailable)."""
+    try:
+        from analysis.indicator_state import indicator_store
+        store = indicator_store()
+        out = {s: store.sync(s, b).readings()["atr_pct14"] for s, b in bars_by_symbol.items() if b}
+        store.save()
+        return out
+    except Exception as e:
+        logger.debug(f"Indicator state unavailable for MPS: {e}")
+        return {}
+
+
+def score_components(
+    raw_atr_pct: List[float],
+    big_move_freq: List[float],
+    catalyst: List[bool],
+) -> List[Tuple[float, Dict[str, float]]]:
+    """Vectorized compute_move_potential_score tail: normalize + weighted composite."""
+    import numpy as np
+
+    a = np.asarray(raw_atr_pct, dtype=float)
+    b = np.asarray(big_move_freq, dtype=float)
+    atr_score = np.minimum(np.select(
+        [a >= 0.08, a >= 0.06, a >= 0.04, a >= 0.02, a >= 0.01],
+        [1.0, 0.9,
+         0.6 + (a - 0.04) / 0.02 * 0.3,
+         0.3 + (a - 0.02) / 0.02 * 0.3,
+         0.1 + (a - 0.01) / 0.01 * 0.2],
+        default=a / 0.01 * 0.1,
+    ), 1.0)
+    bmf_score = np.minimum(np.select(
+        [b >= 0.30, b >= 0.15, b >= 0.05],
+        [1.0, 0.5 + (b - 0.15) / 0.15 * 0.5, 0.2 + (b - 0.05) / 0.10 * 0.3],
+        default=b / 0.05 * 0.2,
+    ), 1.0)
+    cat = np.where(np.asarray(catalyst, dtype=bool), 1.0, 0.0)
+    score = np.maximum(0.0, np.minimum(atr_score * 0.50 + bmf_score * 0.30 + cat * 0.20, 1.0))
+    return [
+        (s, {"atr_pct": ac, "big_move_freq": bc, "catalyst_boost": cc, "raw_atr_pct": ra})
+        for s, ac, bc, cc, ra in zip(score.tolist(), atr_score.tolist(), bmf_score.tolist(),
+                                     cat.tolist(), a.tolist())
+    ]
+
+
+def _load_table(day: str) -> Dict:
+    memo = _table_memo.get(day)
+    if memo is not None:
+        return memo
+    table = {"day": day, "rows": {}}
+    try:
+        if MPS_TABLE_FILE.exists():
+            with open(MPS_TABLE_FILE) as f:
+                data = json.load(f)
+            if data.get("day") == day:
+                table = data
+    except Exception as e:
+        logger.debug(f"MPS table unreadable — starting fresh: {e}")
+    _table_memo.clear()
+    _table_memo[day] = table
+    return table
+
+
+def _save_table(table: Dict):
+    try:
+        MPS_TABLE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = MPS_TABLE_FILE.with_name(MPS_TABLE_FILE.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(table, f, separators=(",", ":"))
+        os.replace(tmp, MPS_TABLE_FILE)
+    except Exception as e:
+        logger.warning(f"Failed to save MPS table: {e}")
+
+
+def get_move_potential_table(
+    symbols: List[str],
+    earnings_set: Optional[set] = None,
+    api_key: str = "",
+) -> Dict[str, Tuple[float, Dict]]:
+    """
+    Move Potential Score for every symbol, from today's table.
+
+    Symbols missing from the table (or whose bar fetch came back empty)
+    are fetched concurrently and scored in one vectorized pass; the table
+    is saved once. Returns {symbol: (score, components)}.
+    """
+    earnings_set = earnings_set or set()
+    table = _load_table(_trading_day())
+    rows = table["rows"]
+    symbols = list(dict.fromkeys(symbols))
+    missing = [s for s in symbols if rows.get(s, {}).get("bars", 0) == 0]
+    if missing:
+        bars = fetch_bars_concurrent(missing, api_key=api_key)
+        rows.update(compute_raw_components(bars))
+        for sym, atr in _live_atr_pct(bars).items():
+            rows[sym]["raw_atr_pct"] = atr
+        _save_table(table)
+        logger.info(f"  📐 MPS table: {len(missing)} symbols fetched, "
+                    f"{len(symbols) - len(missing)} reused from today")
+    for s in symbols:
+        rows[s]["catalyst"] = s in earnings_set
+    scored = score_components(
+        [rows[s]["raw_atr_pct"] for s in symbols],
+        [rows[s]["big_move_freq_raw"] for s in symbols],
+        [rows[s]["catalyst"] for s in symbols],
+    )
+    return dict(zip(symbols, scored))
+
+
+def lookup_move_potential(symbol: str) -> Optional[Tuple[float, Dict]]:
+    """Today's MPS for a symbol if an adapter already scored it (no fetch)."""
+    row = _load_table(_trading_day())["rows"].get(symbol)
+    if not row or row.get("bars", 0) == 0:
+        return None
+    return score_components([row["raw_atr_pct"]], [row["big_move_freq_raw"]],
+                            [row.get("catalyst", False)])[0]
+
+
 def batch_compute_move_potential(
     symbols: List[str],
     earnings_set: set = None,
     api_key: str = "",
-    max_symbols: int = 40,
+    max_symbols: Optional[int] = None,
 ) -> Dict[str, Tuple[float, Dict]]:
     """
     Batch-compute Move Potential Score for multiple symbols.
-    
-    Fetches daily bars from Polygon and computes score for each.
-    Limits to max_symbols to avoid excessive API calls.
-    
-    Returns: {symbol: (score, components)}
-    """
-    if not api_key:
-        api_key = os.getenv("POLYGON_API_KEY", "") or os.getenv("MASSIVE_API_KEY", "")
 
-    if earnings_set is None:
-        earnings_set = set()
+    Thin wrapper over get_move_potential_table(); max_symbols (default: no
+    cap) only trims the request.
 
-    results = {}
-    import time
+    Returns: {symbol: (score, components)}
+    """
+    if max_symbols is not None:
+        symbols = symbols[:max_symbols]
+    return get_move_potential_table(symbols, earnings_set=earnings_set, api_key=api_key)
 
-    for i, sym in enumerate(symbols[:max_symbols]):
-        bars = _fetch_daily_bars(sym, days=70, api_key=api_key)
-        has_catalyst = sym in earnings_set
-        score, components = compute_move_potential_score(bars, has_catalyst)
-        results[sym] = (score, components)
 
-        # Rate limiting — Polygon allows 5 req/sec on paid plans
-        if (i + 1) % 5 == 0:
-            time.sleep(0.25)
+# ═══════════════════════════════════════════════════════
+# Benchmark (bar fetch)
+# ═══════════════════════════════════════════════════════
 
-    return results
+def run_benchmark(
+    sizes=(40,),
+    latency_ms: float = 100.0,
+    rates=(5.0, 25.0),
+    workers: int = MPS_FETCH_WORKERS,
+) -> List[Dict]:
+    """
+    Bar fetch: the old sequential loop (one request at a time, 0.25 s pause
+    every 5 requests) vs fetch_bars_concurrent under a token bucket at each
+    of `rates` req/s. Polygon is simulated by a `latency_ms` round trip on
+    synthetic bars (no network). Scoring is not timed: it takes
+    milliseconds against seconds of fetching.
+    """
+    import time
+    from rate_limiter import RateLimiter
+    from analysis.indicators import _synthetic_bars
+
+    def fake_fetch(sym, days=MPS_BAR_DAYS, api_key=""):
+        time.sleep(latency_ms / 1000)
+        return bars[sym]
+
+    rows = []
+    for n in sizes:
+        bars = _synthetic_bars(n, max_len=MPS_BAR_DAYS)
+        symbols = list(bars)
+        t0 = time.perf_counter()
+        sequential = {}
+        for i, sym in enumerate(symbols):
+            sequential[sym] = fake_fetch(sym)
+            if (i + 1) % 5 == 0:
+                time.sleep(0.25)
+        t_seq = time.perf_counter() - t0
+        for rate in rates:
+            t0 = time.perf_counter()
+            concurrent = fetch_bars_concurrent(symbols, workers=workers, fetch=fake_fetch,
+                                               limiter=RateLimiter(rate))
+            t_conc = time.perf_counter() - t0
+            rows.append({
+                "n": n,
+                "rps": rate,
+                "sequential_s": round(t_seq, 2),
+                "concurrent_s": round(t_conc, 2),
+                "speedup": round(t_seq / t_conc, 1) if t_conc > 0 else 0,
+                "identical": concurrent == sequential,
+            })
+    return rows
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Move Potential bar-fetch benchmark")
+    parser.add_argument("--bench", action="store_true", help="Sequential vs concurrent bar fetch")
+    parser.add_argument("--sizes", type=str, default="40")
+    parser.add_argument("--rates", type=str, default="5,25", help="Limiter req/s to try")
+    parser.add_argument("--latency-ms", type=float, default=100.0, help="Simulated round trip")
+    args = parser.parse_args()
+
+    rows = run_benchmark(sizes=tuple(int(s) for s in args.sizes.split(",")),
+                         latency_ms=args.latency_ms,
+                         rates=tuple(float(r) for r in args.rates.split(",")))
+    print(f"{'N':>6} {'req/s':>6} {'sequential s':>13} {'concurrent s':>13} {'speedup':>8}  same bars")
+    for r in rows:
+        print(f"{r['n']:>6} {r['rps']:>6.0f} {r['sequential_s']:>13.2f} {r['concurrent_s']:>13.2f} "
+              f"{r['speedup']:>7.1f}x  {'✅' if r['identical'] else '❌'}")
+    sys.exit(0 if all(r["identical"] for r in rows) else 1)
@@ -8,10 +8,8 @@ Usage:
     streamlit run trading/streamlit_dashboard.py --server.port 8511
 """
 
-import json
 import os
 import sys
-import glob
 import sqlite3
 import time
 from datetime import datetime, date, timedelta
@@ -29,12 +27,15 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from dotenv import load_dotenv
+from artifact_store import ArtifactStore
 
 load_dotenv(PROJECT_ROOT / ".env")
 
-DB_PATH = PROJECT_ROOT / "data" / "trades.db"
+# Shared analytics store (TradeDB); imported after .env so META_ANALYTICS_DB applies
+from analytics_store import ANALYTICS_DB as DB_PATH
 OUTPUT_DIR = PROJECT_ROOT / "output"
 LOGS_DIR = PROJECT_ROOT / "logs"
+STORE = ArtifactStore(OUTPUT_DIR)
 EST = pytz.timezone("US/Eastern")
 
 # ── Alpaca client (lightweight) ───────────────────────
@@ -138,22 +139,29 @@ def get_closed_trades():
         return pd.DataFrame()
 
 
+@st.cache_data(ttl=10)
+def get_trade_stats():
+    """All-time closed-trade stats from the trigger-maintained analytics tables."""
+    if not DB_PATH.exists():
+        return {}
+    try:
+        from trading.trade_db import TradeDB
+        return TradeDB(str(DB_PATH)).get_summary_stats(days=36500)
+    except Exception:
+        return {}
+
+
 @st.cache_data(ttl=8)
 def load_latest_run():
-    files = sorted(glob.glob(str(OUTPUT_DIR / "meta_engine_run_*.json")))
-    if not files:
-        return {}
-    with open(files[-1]) as f:
-        return json.load(f)
+    return STORE.read("meta_engine_run", default={})
 
 
 @st.cache_data(ttl=8)
 def load_latest_cross():
-    path = OUTPUT_DIR / "cross_analysis_latest.json"
-    if path.exists():
+    path = STORE.latest_path("cross_analysis")
+    if path is not None:
         mtime = datetime.fromtimestamp(path.stat().st_mtime, tz=EST)
-        with open(path) as f:
-            data = json.load(f)
+        data = STORE.read("cross_analysis", default={})
         data["_file_mtime"] = mtime.isoformat()
         return data
     return {}
@@ -161,11 +169,7 @@ def load_latest_cross():
 
 @st.cache_data(ttl=8)
 def load_latest_summaries():
-    path = OUTPUT_DIR / "summaries_latest.json"
-    if path.exists():
-        with open(path) as f:
-            return json.load(f)
-    return {}
+    return STORE.read("summaries", default={})
 
 
 def get_market_status():
@@ -511,19 +515,11 @@ with tabs[0]:
 
     # ── Trade Statistics ──────────────────────────────
     st.markdown("#### Trade Statistics")
-    closed_df = get_closed_trades()
+    trade_stats = get_trade_stats()
 
     c1, c2, c3, c4 = st.columns(4)
-    if not closed_df.empty:
-        wins = len(closed_df[closed_df["pnl"] > 0])
-        losses = len(closed_df[closed_df["pnl"] <= 0])
-        total_closed = wins + losses
-        win_rate = (wins / total_closed * 100) if total_closed > 0 else 0
-        total_pnl = closed_df["pnl"].sum()
-    else:
-        wins = losses = total_closed = 0
-        win_rate = 0.0
-        total_pnl = 0.0
+    win_rate = float(trade_stats.get("win_rate", 0.0) or 0.0)
+    total_pnl = float(trade_stats.get("total_pnl", 0.0) or 0.0)
 
     c1.metric("Total Trades", total_trades)
     c2.metric("Win Rate", f"{win_rate:.1f}%")
@@ -685,13 +681,7 @@ with tabs[1]:
     five_x = cross.get("five_x_potential", {})
     # Also try loading from dedicated file if not in cross
     if not five_x:
-        five_x_path = OUTPUT_DIR / "five_x_potential_latest.json"
-        if five_x_path.exists():
-            try:
-                with open(five_x_path) as f:
-                    five_x = json.load(f)
-            except Exception:
-                five_x = {}
+        five_x = STORE.read("five_x_potential", default={})
 
     call_5x = five_x.get("call_potential", [])
     put_5x = five_x.get("put_potential", [])
@@ -1245,12 +1235,18 @@ with tabs[4]:
 with tabs[5]:
     st.markdown("# 📜 Recent Logs")
 
-    log_files = sorted(LOGS_DIR.glob("meta_engine_*.log"), reverse=True)
+    # Logs older than META_LOG_HOT_DAYS are gzip-compressed by retention.py
+    log_files = sorted(LOGS_DIR.glob("meta_engine_*.log*"), reverse=True)
     if log_files:
         selected_log = st.selectbox("Log file", [f.name for f in log_files])
         log_path = LOGS_DIR / selected_log
         try:
-            lines = log_path.read_text().split("\n")
+            if log_path.suffix == ".gz":
+                import gzip
+                with gzip.open(log_path, "rt") as f:
+                    lines = f.read().split("\n")
+            else:
+                lines = log_path.read_text().split("\n")
             n_lines = st.slider("Lines to show", 50, min(len(lines), 500), 100)
             st.code("\n".join(lines[-n_lines:]), language="log")
         except Exception as e:
@@ -2,20 +2,23 @@
 Meta Engine — Trade Database (SQLite)
 ======================================
 Stores all trade history for 6 months with full audit trail.
-Database location: <Meta Engine>/data/trades.db
+Database location: <Meta Engine>/data/meta_engine.db (the shared analytics
+store; a pre-existing data/trades.db is imported on first open).
 """
 
 import json
+import os
 import sqlite3
 import logging
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger("meta_engine.trading.db")
 
 DB_DIR = Path(__file__).parent.parent / "data"
-DB_PATH = DB_DIR / "trades.db"
+DB_PATH = DB_DIR / "meta_engine.db"
 
 # ═══════════════════════════════════════════════════════
 # Schema
@@ -91,21 +94,167 @@ CREATE INDEX IF NOT EXISTS idx_trades_scan_date ON trades(scan_date);
 CREATE INDEX IF NOT EXISTS idx_trades_symbol ON trades(symbol);
 """
 
+# ═══════════════════════════════════════════════════════
+# Analytics (maintained by triggers on every trades write)
+# ═══════════════════════════════════════════════════════
+# trade_stats_daily holds one row per (scan_date, source_engine, session)
+# bucket; a write to `trades` recomputes only the bucket(s) the row left
+# and entered (a few rows via idx_trades_scan_date), so aggregates never
+# drift and dashboard reads sum O(days) bucket rows instead of scanning
+# the trade history. daily_summary is refreshed the same way per date.
+_ANALYTICS_TABLES = """
+CREATE TABLE IF NOT EXISTS trade_stats_daily (
+    scan_date       TEXT    NOT NULL,
+    source_engine   TEXT    NOT NULL DEFAULT '',
+    session         TEXT    NOT NULL DEFAULT '',
+    total_trades    INTEGER DEFAULT 0,
+    open_positions  INTEGER DEFAULT 0,
+    closed_trades   INTEGER DEFAULT 0,
+    wins            INTEGER DEFAULT 0,
+    losses          INTEGER DEFAULT 0,
+    closed_pnl      REAL    DEFAULT 0,   -- SUM(pnl) of closed trades
+    total_pnl       REAL    DEFAULT 0,   -- SUM(pnl) of every trade (today_pnl)
+    PRIMARY KEY (scan_date, source_engine, session)
+) WITHOUT ROWID;
+"""
+
+_BUCKET_COLUMNS = """
+    COUNT(*),
+    SUM(CASE WHEN status IN ('open','filled') THEN 1 ELSE 0 END),
+    SUM(CASE WHEN status='closed' THEN 1 ELSE 0 END),
+    SUM(CASE WHEN status='closed' AND pnl > 0 THEN 1 ELSE 0 END),
+    SUM(CASE WHEN status='closed' AND pnl <= 0 THEN 1 ELSE 0 END),
+    SUM(CASE WHEN status='closed' THEN pnl ELSE 0 END),
+    SUM(pnl)
+"""
+
+_DAY_COLUMNS = """
+    COUNT(*),
+    SUM(CASE WHEN status='closed' AND pnl > 0 THEN 1 ELSE 0 END),
+    SUM(CASE WHEN status='closed' AND pnl <= 0 THEN 1 ELSE 0 END),
+    SUM(CASE WHEN status='closed' THEN pnl ELSE 0 END),
+    COALESCE((SELECT b.symbol FROM trades b WHERE b.scan_date = {d} AND b.status = 'closed'
+              AND b.pnl IS NOT NULL ORDER BY b.pnl DESC LIMIT 1), ''),
+    COALESCE((SELECT MAX(b.pnl) FROM trades b WHERE b.scan_date = {d} AND b.status = 'closed'), 0),
+    COALESCE((SELECT b.symbol FROM trades b WHERE b.scan_date = {d} AND b.status = 'closed'
+              AND b.pnl IS NOT NULL ORDER BY b.pnl ASC LIMIT 1), ''),
+    COALESCE((SELECT MIN(b.pnl) FROM trades b WHERE b.scan_date = {d} AND b.status = 'closed'), 0)
+"""
+
+
+def _refresh_sql(row: str) -> str:
+    """Statements recomputing the bucket and day of trades row `row` (NEW/OLD)."""
+    engine = f"COALESCE({row}.source_engine, '')"
+    return f"""
+        DELETE FROM trade_stats_daily
+         WHERE scan_date = {row}.scan_date AND source_engine = {engine}
+           AND session = {row}.session;
+        INSERT INTO trade_stats_daily
+        SELECT scan_date, COALESCE(source_engine, ''), session, {_BUCKET_COLUMNS}
+          FROM trades
+         WHERE scan_date = {row}.scan_date AND COALESCE(source_engine, '') = {engine}
+           AND session = {row}.session
+         GROUP BY 1, 2, 3;
+        DELETE FROM daily_summary WHERE date = {row}.scan_date;
+        INSERT INTO daily_summary
+            (date, total_trades, winning_trades, losing_trades, total_pnl,
+             best_trade_sym, best_trade_pnl, worst_trade_sym, worst_trade_pnl)
+        SELECT {row}.scan_date, {_DAY_COLUMNS.format(d=f"{row}.scan_date")}
+          FROM trades WHERE scan_date = {row}.scan_date
+        HAVING COUNT(*) > 0;
+    """
+
+
+_TRACKED_COLUMNS = "status, pnl, scan_date, source_engine, session, symbol"
+
+_ANALYTICS_TRIGGERS = f"""
+CREATE TRIGGER IF NOT EXISTS trg_trades_stats_ins AFTER INSERT ON trades
+BEGIN {_refresh_sql("NEW")} END;
+
+CREATE TRIGGER IF NOT EXISTS trg_trades_stats_del AFTER DELETE ON trades
+BEGIN {_refresh_sql("OLD")} END;
+
+CREATE TRIGGER IF NOT EXISTS trg_trades_stats_upd AFTER UPDATE OF {_TRACKED_COLUMNS} ON trades
+BEGIN {_refresh_sql("NEW")} END;
+
+CREATE TRIGGER IF NOT EXISTS trg_trades_stats_move AFTER UPDATE OF scan_date, source_engine, session ON trades
+WHEN OLD.scan_date IS NOT NEW.scan_date
+  OR COALESCE(OLD.source_engine, '') IS NOT COALESCE(NEW.source_engine, '')
+  OR OLD.session IS NOT NEW.session
+BEGIN {_refresh_sql("OLD")} END;
+"""
+
+_REBUILD_ANALYTICS = f"""
+DELETE FROM trade_stats_daily;
+INSERT INTO trade_stats_daily
+SELECT scan_date, COALESCE(source_engine, ''), session, {_BUCKET_COLUMNS}
+  FROM trades GROUP BY 1, 2, 3;
+DELETE FROM daily_summary;
+INSERT INTO daily_summary
+    (date, total_trades, winning_trades, losing_trades, total_pnl,
+     best_trade_sym, best_trade_pnl, worst_trade_sym, worst_trade_pnl)
+SELECT t.scan_date, {_DAY_COLUMNS.format(d="t.scan_date")}
+  FROM trades t GROUP BY t.scan_date;
+"""
+
+# Applied once per connection (connections are long-lived, see _thread_conn)
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",       # WAL + NORMAL: durable across app crashes
+    f"PRAGMA mmap_size={int(os.getenv('TRADE_DB_MMAP_MB', '64')) * 1024 * 1024}",
+    f"PRAGMA cache_size=-{int(os.getenv('TRADE_DB_CACHE_KB', '16384'))}",
+)
+_STATEMENT_CACHE = 256
+
+# ═══════════════════════════════════════════════════════
+# Connection manager
+# ═══════════════════════════════════════════════════════
+# One persistent connection per (thread, database file): no reconnect or
+# pragma round-trips per query, and sqlite3's per-connection statement
+# cache keeps the recurring SELECT / UPDATE statements prepared.
+_local = threading.local()
+_ready_paths = set()
+_ready_lock = threading.Lock()
+
+
+def _thread_conn(db_path: Path) -> sqlite3.Connection:
+    """This thread's connection to `db_path` (opened and tuned on first use)."""
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    key = str(db_path)
+    conn = conns.get(key)
+    if conn is None:
+        conn = sqlite3.connect(key, check_same_thread=False,
+                               cached_statements=_STATEMENT_CACHE)
+        conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        conns[key] = conn
+    return conn
+
 
 class TradeDB:
     """SQLite database for trade history and P&L tracking."""
 
     def __init__(self, db_path: str = None):
-        self.db_path = Path(db_path) if db_path else DB_PATH
+        if db_path:
+            self.db_path = Path(db_path)
+        else:
+            # Shared analytics store: opening it first runs its migrations
+            # and folds a legacy trades.db in before our schema is applied
+            from analytics_store import analytics_store
+            self.db_path = analytics_store().path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._ensure_tables()
+        with _ready_lock:
+            if str(self.db_path) not in _ready_paths:
+                self._ensure_tables()
+                _ready_paths.add(str(self.db_path))
 
     # ── Connection helpers ────────────────────────────────
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
-        return conn
+        """Persistent per-thread connection (`with` commits, it does not close)."""
+        return _thread_conn(self.db_path)
 
     def _ensure_tables(self):
         with self._get_conn() as conn:
@@ -132,9 +281,24 @@ class TradeDB:
                 """)
             except sqlite3.OperationalError:
                 pass  # Column already exists
+            conn.executescript(_ANALYTICS_TABLES + _ANALYTICS_TRIGGERS)
+            # Backfill aggregates for a history that predates the triggers
+            has_trades = conn.execute("SELECT 1 FROM trades LIMIT 1").fetchone()
+            has_stats = conn.execute("SELECT 1 FROM trade_stats_daily LIMIT 1").fetchone()
+            if has_trades and not has_stats:
+                conn.executescript(_REBUILD_ANALYTICS)
+                logger.info("  📊 Trade analytics backfilled from trade history")
             conn.commit()
         logger.debug(f"Trade DB ready at {self.db_path}")
 
+    def rebuild_analytics(self) -> int:
+        """Recompute trade_stats_daily + daily_summary from `trades` (backfills, repairs)."""
+        conn = self._get_conn()
+        conn.executescript("BEGIN;" + _REBUILD_ANALYTICS + "COMMIT;")
+        n = conn.execute("SELECT COUNT(*) FROM trade_stats_daily").fetchone()[0]
+        logger.info(f"  📊 Trade analytics rebuilt: {n} day/engine/session buckets")
+        return n
+
     # ── Insert / Update ───────────────────────────────────
 
     @staticmethod
@@ -191,6 +355,36 @@ class TradeDB:
             )
             conn.commit()
 
+    def update_trades_bulk(self, updates: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Apply many (trade_id, fields) updates in one transaction.
+
+        Updates to the same trade are merged in order (later fields win,
+        as with consecutive update_trade calls); trades sharing a column
+        set go through one executemany on the same prepared UPDATE.
+        Returns the number of trades updated.
+        """
+        merged: Dict[str, Dict[str, Any]] = {}
+        for trade_id, fields in updates:
+            if fields:
+                merged.setdefault(trade_id, {}).update(fields)
+        if not merged:
+            return 0
+
+        now = datetime.utcnow().isoformat()
+        groups: Dict[Tuple[str, ...], List[List[Any]]] = {}
+        for trade_id, fields in merged.items():
+            fields["updated_at"] = now
+            groups.setdefault(tuple(fields), []).append(list(fields.values()) + [trade_id])
+
+        with self._get_conn() as conn:
+            for cols, rows in groups.items():
+                set_clause = ", ".join(f"{k} = ?" for k in cols)
+                conn.executemany(
+                    f"UPDATE trades SET {set_clause} WHERE trade_id = ?", rows
+                )
+        return len(merged)
+
     # ── Queries ───────────────────────────────────────────
     def get_open_positions(self) -> List[Dict]:
         """Get all trades with status 'open' or 'filled'."""
@@ -247,19 +441,22 @@ class TradeDB:
         return [dict(r) for r in rows]
 
     # ── Aggregates ────────────────────────────────────────
+    # All read from trade_stats_daily (trigger-maintained, one row per
+    # day/engine/session), so cost scales with days, not trade count.
+
     def get_summary_stats(self, days: int = 180) -> Dict[str, Any]:
         """Compute aggregate stats for dashboard cards."""
         cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
         with self._get_conn() as conn:
             row = conn.execute("""
                 SELECT
-                    COUNT(*)                                        AS total_trades,
-                    SUM(CASE WHEN status='closed' AND pnl > 0 THEN 1 ELSE 0 END) AS wins,
-                    SUM(CASE WHEN status='closed' AND pnl <= 0 THEN 1 ELSE 0 END) AS losses,
-                    SUM(CASE WHEN status='closed' THEN pnl ELSE 0 END)            AS total_pnl,
-                    SUM(CASE WHEN status IN ('open','filled') THEN 1 ELSE 0 END)  AS open_positions,
-                    SUM(CASE WHEN scan_date = date('now') THEN pnl ELSE 0 END)    AS today_pnl
-                FROM trades WHERE scan_date >= ?
+                    SUM(total_trades)                                    AS total_trades,
+                    SUM(wins)                                            AS wins,
+                    SUM(losses)                                          AS losses,
+                    SUM(closed_pnl)                                      AS total_pnl,
+                    SUM(open_positions)                                  AS open_positions,
+                    SUM(CASE WHEN scan_date = date('now') THEN total_pnl ELSE 0 END) AS today_pnl
+                FROM trade_stats_daily WHERE scan_date >= ?
             """, (cutoff,)).fetchone()
 
         total = dict(row) if row else {}
@@ -279,11 +476,12 @@ class TradeDB:
         with self._get_conn() as conn:
             rows = conn.execute("""
                 SELECT scan_date,
-                       SUM(pnl) AS daily_pnl,
-                       COUNT(*) AS trades
-                FROM trades
-                WHERE status = 'closed' AND scan_date >= ?
+                       SUM(closed_pnl)    AS daily_pnl,
+                       SUM(closed_trades) AS trades
+                FROM trade_stats_daily
+                WHERE scan_date >= ?
                 GROUP BY scan_date
+                HAVING SUM(closed_trades) > 0
                 ORDER BY scan_date
             """, (cutoff,)).fetchall()
 
@@ -296,6 +494,62 @@ class TradeDB:
             series.append(d)
         return series
 
+    def get_win_rates(self, by: str = "source_engine", days: int = 180) -> Dict[str, Dict[str, Any]]:
+        """Closed-trade win rate and P&L per `source_engine` or `session`."""
+        if by not in ("source_engine", "session"):
+            raise ValueError(f"Unknown win-rate grouping: {by}")
+        cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
+        with self._get_conn() as conn:
+            rows = conn.execute(f"""
+                SELECT {by} AS grp, SUM(closed_trades) AS closed, SUM(wins) AS wins,
+                       SUM(losses) AS losses, SUM(closed_pnl) AS total_pnl
+                FROM trade_stats_daily
+                WHERE scan_date >= ?
+                GROUP BY {by}
+            """, (cutoff,)).fetchall()
+
+        rates = {}
+        for r in rows:
+            decided = r["wins"] + r["losses"]
+            rates[r["grp"]] = {
+                "closed": r["closed"],
+                "wins": r["wins"],
+                "losses": r["losses"],
+                "total_pnl": round(r["total_pnl"] or 0, 2),
+                "win_rate": round((r["wins"] / decided * 100), 1) if decided > 0 else 0.0,
+            }
+        return rates
+
+    def get_rolling_stats(self, windows=(7, 30, 90)) -> Dict[int, Dict[str, Any]]:
+        """Trades / wins / losses / win rate / P&L over each trailing window (days)."""
+        windows = sorted(set(int(w) for w in windows))
+        if not windows:
+            return {}
+        now = datetime.utcnow()
+        cutoffs = {w: (now - timedelta(days=w)).strftime("%Y-%m-%d") for w in windows}
+        with self._get_conn() as conn:
+            rows = conn.execute("""
+                SELECT scan_date, SUM(total_trades) AS trades, SUM(wins) AS wins,
+                       SUM(losses) AS losses, SUM(closed_pnl) AS closed_pnl
+                FROM trade_stats_daily
+                WHERE scan_date >= ?
+                GROUP BY scan_date
+            """, (cutoffs[windows[-1]],)).fetchall()
+
+        stats = {}
+        for w in windows:
+            in_window = [r for r in rows if r["scan_date"] >= cutoffs[w]]
+            wins = sum(r["wins"] for r in in_window)
+            losses = sum(r["losses"] for r in in_window)
+            stats[w] = {
+                "trades": sum(r["trades"] for r in in_window),
+                "wins": wins,
+                "losses": losses,
+                "total_pnl": round(sum(r["closed_pnl"] or 0 for r in in_window), 2),
+                "win_rate": round((wins / (wins + losses) * 100), 1) if wins + losses > 0 else 0.0,
+            }
+        return stats
+
     def cleanup_old(self, keep_days: int = 180):
         """Delete trades older than keep_days."""
         cutoff = (datetime.utcnow() - timedelta(days=keep_days)).strftime("%Y-%m-%d")
@@ -303,3 +557,19 @@ class TradeDB:
             conn.execute("DELETE FROM trades WHERE scan_date < ?", (cutoff,))
             conn.commit()
         logger.info(f"Cleaned up trades older than {cutoff}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Trade DB maintenance")
+    parser.add_argument("--rebuild-analytics", action="store_true",
+                        help="Recompute trade_stats_daily / daily_summary from the trades table")
+    parser.add_argument("--db", type=str, default=None, help="Path to the trades database")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    db = TradeDB(args.db)
+    if args.rebuild_analytics:
+        db.rebuild_analytics()
+    print(json.dumps(db.get_summary_stats(), indent=2))
@@ -0,0 +1,371 @@
+"""
+Meta Engine Pick Warehouse
+==========================
+Columnar history of every run's picks, for research queries that would
+otherwise re-read dozens of JSON artifacts and re-call Polygon.
+
+The nightly ETL flattens the cross-analysis of each catalogued run
+(meta_engine_run_{YYYYMMDD_HHMM}["cross_analysis"]) into one row per
+pick and writes Parquet partitioned by month. The per-day
+cross_analysis_{YYYYMMDD} artifact is rewritten by every run, so it is
+only used for days without a run record:
+
+    data/warehouse/picks/month=2026-03/picks.parquet
+
+Each row carries:
+  - identity: run_id, scan_date, scan_ts, session, engine, option_type,
+    rank, symbol
+  - scores: score, base_score, conviction, price, orm_score, orm_status,
+    orm_weight, move_potential, quality_tier
+  - gate decision: regime_label, regime_score, gate_decision,
+    gate_reasons
+  - orm_<factor>: one column per ORM factor
+  - feat_<name>: the moonshot pick features (_extract_pick_features)
+  - realized outcome: outcome_price, outcome_pnl_pct, direction_correct
+    (pick_outcomes), plus trade_status, trade_pnl, trade_pnl_pct and
+    trade_exit_reason from the first trade
+
+A month is rebuilt atomically, so the ETL is idempotent. By default it
+refreshes the months touched in the last WAREHOUSE_LOOKBACK_DAYS, since
+outcomes land a day or more after the pick, plus any month not yet
+built.
+
+Needs pyarrow (optional dependency, imported lazily).
+
+Usage:
+    from warehouse import query
+    rows = query(since="2026-02-01", engine="moonshot",
+                 columns=["scan_date", "symbol", "orm_score", "trade_pnl_pct"],
+                 where=[("orm_score", ">=", 0.6)])
+
+    python warehouse.py --build [--full]
+    python warehouse.py --since 2026-02-01 --symbol NVDA
+"""
+
+import logging
+import os
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger("Warehouse")
+
+_META_DIR = Path(__file__).parent
+WAREHOUSE_DIR = Path(os.getenv("META_WAREHOUSE_DIR", str(_META_DIR / "data" / "warehouse")))
+PICKS_DIR = WAREHOUSE_DIR / "picks"
+_PART_FILE = "picks.parquet"
+
+# (engine, option_type, cross_analysis key)
+_PICK_LISTS = (
+    ("puts", "put", "puts_through_moonshot"),
+    ("moonshot", "call", "moonshot_through_puts"),
+)
+
+# Warehouse column → pick key, coerced to float
+_NUMERIC_FIELDS = {
+    "score": "score",
+    "base_score": "_base_score",
+    "conviction": "_conviction_score",
+    "price": "price",
+    "orm_score": "_orm_score",
+    "orm_weight": "_orm_weight_used",
+    "move_potential": "_move_potential_score",
+    "regime_score": "_regime_score",
+}
+# Warehouse column → pick key, kept as text
+_TEXT_FIELDS = {
+    "orm_status": "_orm_status",
+    "quality_tier": "_quality_tier",
+    "regime_label": "_regime_label",
+    "gate_decision": "_regime_gate_decision",
+}
+# Present on every row (null until the outcome / trade exists)
+_OUTCOME_COLUMNS = (
+    "outcome_price", "outcome_pnl_pct", "direction_correct",
+    "trade_status", "trade_pnl", "trade_pnl_pct", "trade_exit_reason",
+)
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.dataset
+        import pyarrow.parquet
+        return pyarrow
+    except ImportError:
+        raise RuntimeError("pyarrow not installed — pip install pyarrow to use the warehouse")
+
+
+def _num(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return float(value)
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+# ═══════════════════════════════════════════════════════
+# Extract
+# ═══════════════════════════════════════════════════════
+
+def _flatten_run(entry: Dict[str, Any], data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """One row per pick of a run's cross-analysis (catalog `entry` of the run)."""
+    rows = []
+    for engine, option_type, key in _PICK_LISTS:
+        for rank, pick in enumerate(data.get(key) or [], 1):
+            if not isinstance(pick, dict) or not pick.get("symbol"):
+                continue
+            signals = pick.get("signals")
+            row: Dict[str, Any] = {
+                "run_id": entry["run_id"],
+                "scan_date": entry["day"],
+                "scan_ts": entry["timestamp"],
+                "session": entry["session"],
+                "engine": engine,
+                "option_type": option_type,
+                "rank": rank,
+                "symbol": pick["symbol"],
+                "signal_count": len(signals) if isinstance(signals, list) else None,
+                "earnings_flag": bool(pick.get("_earnings_flag", False)),
+                "data_stale": bool(pick.get("_data_stale", False)),
+                "gate_reasons": [str(r) for r in pick.get("_regime_gate_reasons") or []],
+            }
+            for column, field in _NUMERIC_FIELDS.items():
+                row[column] = _num(pick.get(field))
+            for column, field in _TEXT_FIELDS.items():
+                value = pick.get(field)
+                row[column] = str(value) if value is not None else None
+            for prefix, field in (("orm_", "_orm_factors"), ("feat_", "_features")):
+                values = pick.get(field)
+                if isinstance(values, dict):
+                    for name, value in values.items():
+                        value = _num(value)
+                        if value is not None:
+                            row[f"{prefix}{name}"] = value
+            rows.append(row)
+    return rows
+
+
+def _outcomes(start: str, end: str) -> Tuple[Dict[tuple, Dict], Dict[tuple, Dict]]:
+    """(pick_outcomes, first trade) keyed by (scan_date, symbol, option_type)."""
+    from analytics_store import analytics_store
+
+    store = analytics_store()
+    tables = {r["name"] for r in store.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ('pick_outcomes', 'trades')"
+    )}
+    outcomes: Dict[tuple, Dict] = {}
+    if "pick_outcomes" in tables:
+        for r in store.execute(
+            "SELECT scan_date, symbol, option_type, outcome_price, pnl_pct, direction_correct "
+            "FROM pick_outcomes WHERE scan_date >= ? AND scan_date < ?",
+            (start, end),
+        ):
+            outcomes[(r["scan_date"], r["symbol"], r["option_type"])] = {
+                "outcome_price": r["outcome_price"],
+                "outcome_pnl_pct": r["pnl_pct"],
+                "direction_correct": bool(r["direction_correct"]),
+            }
+    trades: Dict[tuple, Dict] = {}
+    if "trades" in tables:
+        for r in store.execute(
+            "SELECT scan_date, symbol, option_type, status, pnl, pnl_pct, exit_reason "
+            "FROM trades WHERE scan_date >= ? AND scan_date < ? ORDER BY created_at",
+            (start, end),
+        ):
+            trades.setdefault((r["scan_date"], r["symbol"], r["option_type"]), {
+                "trade_status": r["status"],
+                "trade_pnl": r["pnl"],
+                "trade_pnl_pct": r["pnl_pct"],
+                "trade_exit_reason": r["exit_reason"],
+            })
+    return outcomes, trades
+
+
+def _month_bounds(month: str) -> Tuple[date, date]:
+    first = datetime.strptime(month, "%Y-%m").date()
+    following = (first.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return first, following
+
+
+# ═══════════════════════════════════════════════════════
+# Load
+# ═══════════════════════════════════════════════════════
+
+def build_month(month: str, store=None) -> int:
+    """Rebuild one month partition ("YYYY-MM"). Returns rows written."""
+    pa = _pyarrow()
+    if store is None:
+        from artifact_store import get_store
+        store = get_store()
+
+    first, following = _month_bounds(month)
+    last = following - timedelta(days=1)
+    rows: List[Dict[str, Any]] = []
+    run_days = set()
+    for entry in store.catalog("meta_engine_run", since=first, until=last):
+        run = store.read(entry["name"], entry["stamp"])
+        cross = run.get("cross_analysis") if isinstance(run, dict) else None
+        if isinstance(cross, dict) and cross:
+            rows.extend(_flatten_run(entry, cross))
+            run_days.add(entry["day"])
+    # Days without a run record: the day's last cross_analysis write
+    for entry in store.catalog("cross_analysis", since=first, until=last):
+        if entry["day"] in run_days:
+            continue
+        data = store.read(entry["name"], entry["stamp"])
+        if isinstance(data, dict):
+            rows.extend(_flatten_run(entry, data))
+
+    part_dir = PICKS_DIR / f"month={month}"
+    part_file = part_dir / _PART_FILE
+    if not rows:
+        part_file.unlink(missing_ok=True)
+        return 0
+
+    outcomes, trades = _outcomes(first.isoformat(), following.isoformat())
+    for row in rows:
+        key = (row["scan_date"], row["symbol"], row["option_type"])
+        row.update(dict.fromkeys(_OUTCOME_COLUMNS))
+        row.update(outcomes.get(key, {}))
+        row.update(trades.get(key, {}))
+    rows.sort(key=lambda r: (r["scan_date"], r["scan_ts"], r["engine"], r["rank"]))
+
+    columns: Dict[str, None] = {}
+    for row in rows:
+        columns.update(dict.fromkeys(row))
+    table = pa.table({name: [row.get(name) for row in rows] for name in columns})
+
+    part_dir.mkdir(parents=True, exist_ok=True)
+    tmp = part_file.with_name(part_file.name + ".tmp")
+    pa.parquet.write_table(table, tmp, compression="zstd")
+    os.replace(tmp, part_file)
+    return len(rows)
+
+
+def built_months() -> List[str]:
+    if not PICKS_DIR.is_dir():
+        return []
+    return sorted(
+        p.parent.name.split("=", 1)[1]
+        for p in PICKS_DIR.glob(f"month=*/{_PART_FILE}")
+    )
+
+
+def build(full: bool = False, lookback_days: Optional[int] = None, store=None) -> Dict[str, int]:
+    """
+    Nightly ETL: refresh recent months plus any month not yet built.
+
+    Args:
+        full: Rebuild every month the artifact catalog knows about
+        lookback_days: Recent window to refresh (default WAREHOUSE_LOOKBACK_DAYS)
+
+    Returns:
+        {month: rows written}
+    """
+    from config import MetaConfig
+
+    if store is None:
+        from artifact_store import get_store
+        store = get_store()
+    if lookback_days is None:
+        lookback_days = MetaConfig.WAREHOUSE_LOOKBACK_DAYS
+
+    catalogued = sorted({e["day"][:7] for name in ("meta_engine_run", "cross_analysis")
+                         for e in store.catalog(name)})
+    if full:
+        months = catalogued
+    else:
+        today = date.today()
+        recent = {(today - timedelta(days=d)).strftime("%Y-%m") for d in range(lookback_days + 1)}
+        done = set(built_months())
+        months = [m for m in catalogued if m in recent or m not in done]
+
+    result = {month: build_month(month, store=store) for month in months}
+    logger.info(f"🏬 Warehouse refreshed {len(result)} months ({sum(result.values())} pick rows)")
+    return result
+
+
+# ═══════════════════════════════════════════════════════
+# Query
+# ═══════════════════════════════════════════════════════
+
+def query(
+    columns: Optional[List[str]] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    engine: Optional[str] = None,
+    symbol: Optional[str] = None,
+    where: Optional[Iterable[Tuple[str, str, Any]]] = None,
+    as_pandas: bool = False,
+):
+    """
+    Read picks from the warehouse.
+
+    Only the month partitions overlapping since/until are opened, and
+    only the requested columns are decoded.
+
+    Args:
+        columns: Columns to return (None = all)
+        since / until: Inclusive scan_date bounds, "YYYY-MM-DD"
+        engine: "puts" or "moonshot"
+        symbol: Single ticker
+        where: Extra filters, e.g. [("orm_score", ">=", 0.6)]
+        as_pandas: Return a DataFrame instead of a list of dicts
+    """
+    pa = _pyarrow()
+    ds = pa.dataset
+    if not built_months():
+        return [] if not as_pandas else pa.table({}).to_pandas()
+
+    dataset = ds.dataset(str(PICKS_DIR), format="parquet", partitioning="hive")
+    # Month partitions can carry different orm_/feat_ columns
+    schema = pa.unify_schemas(
+        [frag.physical_schema for frag in dataset.get_fragments()] + [dataset.partitioning.schema],
+        promote_options="permissive",
+    )
+    dataset = ds.dataset(str(PICKS_DIR), format="parquet", partitioning="hive", schema=schema)
+
+    filters = []
+    if since:
+        filters += [ds.field("month") >= since[:7], ds.field("scan_date") >= since]
+    if until:
+        filters += [ds.field("month") <= until[:7], ds.field("scan_date") <= until]
+    if engine:
+        filters.append(ds.field("engine") == engine)
+    if symbol:
+        filters.append(ds.field("symbol") == symbol.upper())
+    if where:
+        filters.append(pa.parquet.filters_to_expression(list(where)))
+    expression = None
+    for f in filters:
+        expression = f if expression is None else expression & f
+
+    table = dataset.to_table(columns=columns, filter=expression)
+    return table.to_pandas() if as_pandas else table.to_pylist()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s")
+    parser = argparse.ArgumentParser(description="Meta Engine pick warehouse")
+    parser.add_argument("--build", action="store_true", help="Run the ETL (recent + missing months)")
+    parser.add_argument("--full", action="store_true", help="With --build: rebuild every month")
+    parser.add_argument("--since", help="Query: first scan date (YYYY-MM-DD)")
+    parser.add_argument("--until", help="Query: last scan date (YYYY-MM-DD)")
+    parser.add_argument("--engine", choices=("puts", "moonshot"))
+    parser.add_argument("--symbol")
+    args = parser.parse_args()
+
+    if args.build:
+        for month, count in build(full=args.full).items():
+            print(f"  {month}: {count} picks")
+    if args.since or args.until or args.symbol or args.engine:
+        for row in query(
+            columns=["scan_date", "session", "engine", "rank", "symbol", "score",
+                     "orm_score", "gate_decision", "outcome_pnl_pct", "trade_pnl_pct"],
+            since=args.since, until=args.until, engine=args.engine, symbol=args.symbol,
+        ):
+            print("  " + "  ".join(f"{k}={v}" for k, v in row.items()))